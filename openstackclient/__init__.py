@@ -11,12 +11,24 @@
 #   under the License.
 #
 
-import pbr.version
-
 __all__ = ['__version__']
 
-version_info = pbr.version.VersionInfo('python-openstackclient')
-try:
-    __version__ = version_info.version_string()
-except AttributeError:
-    __version__ = None
+
+def __getattr__(name):
+    # NOTE: Determining the version is comparatively slow, so it is only
+    #       done when asked for. This keeps importing lightweight modules
+    #       of the package, such as the warm process client, fast.
+    if name not in ('__version__', 'version_info'):
+        raise AttributeError(
+            'module %r has no attribute %r' % (__name__, name)
+        )
+
+    import pbr.version
+
+    version_info = pbr.version.VersionInfo('python-openstackclient')
+    try:
+        version = version_info.version_string()
+    except AttributeError:
+        version = None
+    globals().update(version_info=version_info, __version__=version)
+    return globals()[name]
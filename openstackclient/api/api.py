@@ -13,6 +13,8 @@
 
 """Base API Library"""
 
+import copy
+
 from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import session as ks_session
 from osc_lib import exceptions
@@ -78,7 +80,93 @@ class KeystoneSession(object):
         return session.request(url, method, **kwargs)
 
 
-class BaseAPI(KeystoneSession):
+class FindMixin(object):
+    """Resource lookups that avoid listing whole collections repeatedly
+
+    Mixed into API classes based on this module's or osc-lib's BaseAPI to
+    replace their find_bulk(), which lists the whole collection for every
+    lookup.
+    """
+
+    # Query parameters the API can filter a listing on, by path. Each maps
+    # an attribute to a callable that converts a search value to the query
+    # parameter value, or returns None if the value can't be searched for
+    # server-side. See find_bulk()
+    _find_filters = {}
+
+    def __init__(self, *args, **kwargs):
+        super(FindMixin, self).__init__(*args, **kwargs)
+
+        # Full listings fetched by find_bulk(), by path
+        self._listing_cache = {}
+
+    def _request(self, method, url, *args, **kwargs):
+        if method not in ('GET', 'HEAD'):
+            # Resources may have changed, don't reuse listings made before
+            self._listing_cache.clear()
+        return super(FindMixin, self)._request(method, url, *args, **kwargs)
+
+    def _list_all(self, path):
+        """Return the full listing of ``path``, fetching it only once
+
+        The listing is reused by later lookups until a request that may
+        modify resources is made.
+        """
+        items = self._listing_cache.get(path)
+        if items is None:
+            items = self._unwrap_list(self.list(path))
+            self._listing_cache[path] = items
+        return items
+
+    @staticmethod
+    def _unwrap_list(items):
+        if isinstance(items, dict):
+            # strip off the enclosing dict
+            key = list(items.keys())[0]
+            items = items[key]
+        return items
+
+    def find_bulk(self, path, **kwargs):
+        """Bulk load and filter locally
+
+        Attributes the API can filter ``path`` on (see ``_find_filters``)
+        are passed as query parameters. Otherwise the full listing is
+        fetched, once for any number of lookups on the same path. Results
+        are always filtered locally for exact matches, as servers may match
+        more loosely.
+
+        :param string path:
+            The API-specific portion of the URL path
+        :param kwargs:
+            A dict of AVPs to match - logical AND
+        :returns: list of resource dicts
+        """
+
+        filters = self._find_filters.get(path, {})
+        params = {}
+        for attr, value in kwargs.items():
+            if attr in filters:
+                param = filters[attr](value)
+                if param is not None:
+                    params[attr] = param
+        if params:
+            items = self._unwrap_list(self.list(path, **params))
+        else:
+            items = self._list_all(path)
+
+        ret = []
+        for o in items:
+            try:
+                if all(o[attr] == kwargs[attr] for attr in kwargs.keys()):
+                    # callers may modify the result, keep the listing intact
+                    ret.append(copy.deepcopy(o))
+            except KeyError:
+                continue
+
+        return ret
+
+
+class BaseAPI(FindMixin, KeystoneSession):
     """Base API"""
 
     def __init__(
@@ -241,32 +329,6 @@ class BaseAPI(KeystoneSession):
             msg % {'resource': resource, 'attr': attr, 'value': value}
         )
 
-    def find_bulk(self, path, **kwargs):
-        """Bulk load and filter locally
-
-        :param string path:
-            The API-specific portion of the URL path
-        :param kwargs:
-            A dict of AVPs to match - logical AND
-        :returns: list of resource dicts
-        """
-
-        items = self.list(path)
-        if isinstance(items, dict):
-            # strip off the enclosing dict
-            key = list(items.keys())[0]
-            items = items[key]
-
-        ret = []
-        for o in items:
-            try:
-                if all(o[attr] == kwargs[attr] for attr in kwargs.keys()):
-                    ret.append(o)
-            except KeyError:
-                continue
-
-        return ret
-
     def find_one(self, path, **kwargs):
         """Find a resource by name or ID
 
@@ -18,6 +18,8 @@ from osc_lib.api import api
 from osc_lib import exceptions
 from osc_lib.i18n import _
 
+from openstackclient.api import api as osc_api
+
 
 # TODO(dtroyer): Mingrate this to osc-lib
 class InvalidValue(Exception):
@@ -26,9 +28,27 @@ class InvalidValue(Exception):
     message = "Supplied value is not valid"
 
 
-class APIv2(api.BaseAPI):
+def _server_name_filter(name):
+    """Return a server name filter that matches at least ``name``
+
+    Nova treats the name filter as a regular expression, so names that
+    don't match themselves as one can't be searched for server-side.
+    Looser matches are weeded out by find_bulk().
+    """
+    if not isinstance(name, str) or set(name) & set('^$*+?{}[]\\|()'):
+        return None
+    return name
+
+
+class APIv2(osc_api.FindMixin, api.BaseAPI):
     """Compute v2 API"""
 
+    # The nova-network resources can't be filtered; they are listed once
+    # and the listing reused instead
+    _find_filters = {
+        '/servers': {'name': _server_name_filter},
+    }
+
     def __init__(self, **kwargs):
         super(APIv2, self).__init__(**kwargs)
 
@@ -13,21 +13,136 @@
 
 """Object Store v1 API Library"""
 
+import functools
 import io
+import itertools
 import logging
 import os
 import sys
 import urllib
 
+from keystoneauth1 import exceptions as ks_exceptions
+from osc_lib import exceptions
 from osc_lib import utils
+import simplejson as json
 
 from openstackclient.api import api
+from openstackclient.common import download
+from openstackclient.common import hashing
+from openstackclient.common import parallel
+from openstackclient.i18n import _
 
 
+LOG = logging.getLogger(__name__)
+
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
 PUBLIC_CONTAINER_ACLS = [GLOBAL_READ_ACL, LIST_CONTENTS_ACL]
 
+# Largest object Swift accepts in a single PUT by default (5 GiB); larger
+# files are uploaded as a static large object
+MAX_OBJECT_SIZE = 5 * 1024**3
+
+# Segment size used for files larger than MAX_OBJECT_SIZE when no segment
+# size is requested
+DEFAULT_SEGMENT_SIZE = 1024**3
+
+# Number of segments a static large object can have when the cluster doesn't
+# publish its limit
+DEFAULT_MAX_MANIFEST_SEGMENTS = 1000
+
+# Size of the byte ranges fetched concurrently by ranged downloads
+DOWNLOAD_RANGE_SIZE = download.DEFAULT_RANGE_SIZE
+
+# Suffix of the file next to a ranged download that records the ranges
+# already fetched, so that an interrupted download can be resumed
+DOWNLOAD_STATE_SUFFIX = download.STATE_SUFFIX
+
+# Number of ranges a sharded listing is split in per worker; more ranges
+# than workers keep the workers busy when the ranges are uneven
+SHARDS_PER_WORKER = 4
+
+# Number of characters after the common prefix of the first and last names
+# of a listing used to sample the boundaries of the ranges of a sharded
+# listing
+SHARD_KEY_LENGTH = 3
+
+# Number of names sent per bulk-delete request when the cluster doesn't
+# advertise its limit (the default of Swift)
+BULK_DELETE_SIZE = 10000
+
+
+class _FileSegment(object):
+    """A sized, read-only view of a byte range of an open file
+
+    Used as a request body so that a segment is streamed from disk with a
+    known Content-Length rather than read into memory.
+    """
+
+    def __init__(self, f, offset, length, chunk_size=64 * 1024):
+        self._file = f
+        self._offset = offset
+        self._length = length
+        self._remaining = length
+        self._chunk_size = chunk_size
+        self._file.seek(offset)
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self._chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _batched(iterable, size):
+    """Yield lists of up to ``size`` items of ``iterable``"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _shard_key(name):
+    """Map the start of a name to a number ordered like names"""
+    value = 0
+    for char in name[:SHARD_KEY_LENGTH].ljust(SHARD_KEY_LENGTH, ' '):
+        value = value * 95 + min(max(ord(char) - 32, 0), 94)
+    return value
+
+
+def _shard_key_name(value):
+    """Return the name of printable ASCII characters for a shard key"""
+    chars = []
+    for _i in range(SHARD_KEY_LENGTH):
+        value, digit = divmod(value, 95)
+        chars.append(chr(digit + 32))
+    return ''.join(reversed(chars))
+
+
+def _listing_range(params, marker, end_marker):
+    """Return listing parameters restricted to names between markers"""
+    params = dict(params)
+    params.pop('marker', None)
+    params.pop('end_marker', None)
+    if marker:
+        params['marker'] = marker
+    if end_marker:
+        params['end_marker'] = end_marker
+    return params
+
 
 class APIv1(api.BaseAPI):
     """Object Store v1 API"""
@@ -35,6 +150,11 @@ class APIv1(api.BaseAPI):
     def __init__(self, **kwargs):
         super(APIv1, self).__init__(**kwargs)
 
+        # Capabilities of the cluster, see _get_info()
+        self._info = None
+        # The endpoint and the account ID parsed from it
+        self._account_id = None
+
     def container_create(
         self, container=None, public=False, storage_policy=None
     ):
@@ -83,6 +203,63 @@ class APIv1(api.BaseAPI):
         if container:
             self.delete(urllib.parse.quote(container))
 
+    def container_empty(
+        self,
+        container,
+        max_workers=1,
+    ):
+        """Delete all the objects of a container
+
+        The objects are deleted as the listing of the container is paged
+        through, so that containers of any size can be emptied. They are
+        deleted in batches through the bulk-delete middleware if the
+        cluster supports it, otherwise one by one.
+
+        :param string container:
+            name of container to empty
+        :param integer max_workers:
+            number of delete requests to run concurrently
+        :returns:
+            number of objects deleted
+        """
+
+        names = (obj['name'] for obj in self.object_iter(container))
+        bulk_delete = self._get_info().get('bulk_delete')
+        if bulk_delete is not None:
+            batch_size = (
+                bulk_delete.get('max_deletes_per_request') or BULK_DELETE_SIZE
+            )
+            batches = _batched(names, batch_size)
+            delete = functools.partial(self._bulk_delete, container)
+        else:
+            batches = ([name] for name in names)
+            delete = functools.partial(
+                self._object_delete_missing_ok, container
+            )
+
+        deleted = 0
+        failed = 0
+        for batch, errors, exc in parallel.run_concurrently(
+            delete, batches, max_workers=max_workers
+        ):
+            if exc is not None:
+                errors = [(name, exc) for name in batch]
+            for name, error in errors:
+                LOG.error(
+                    _("Failed to delete object %(object)s: %(e)s"),
+                    {'object': name, 'e': error},
+                )
+            failed += len(errors)
+            deleted += len(batch) - len(errors)
+
+        if failed:
+            msg = _(
+                "%(num)s objects of container %(container)s failed to "
+                "delete."
+            ) % {'num': failed, 'container': container}
+            raise exceptions.CommandError(msg)
+        return deleted
+
     def container_list(
         self,
         full_listing=False,
@@ -96,7 +273,7 @@ class APIv1(api.BaseAPI):
 
         :param boolean full_listing:
             if True, return a full listing, else returns a max of
-            10000 listings
+            10000 listings, see also :meth:`container_iter`
         :param integer limit:
             query return count limit
         :param string marker:
@@ -109,29 +286,19 @@ class APIv1(api.BaseAPI):
             list of container names
         """
 
-        params['format'] = 'json'
-
         if full_listing:
-            data = listing = self.container_list(
-                limit=limit,
-                marker=marker,
-                end_marker=end_marker,
-                prefix=prefix,
-                **params
-            )
-            while listing:
-                marker = listing[-1]['name']
-                listing = self.container_list(
+            return list(
+                self.container_iter(
                     limit=limit,
                     marker=marker,
                     end_marker=end_marker,
                     prefix=prefix,
+                    prefetch=False,
                     **params
                 )
-                if listing:
-                    data.extend(listing)
-            return data
+            )
 
+        params['format'] = 'json'
         if limit:
             params['limit'] = limit
         if marker:
@@ -143,19 +310,69 @@ class APIv1(api.BaseAPI):
 
         return self.list('', **params)
 
+    def container_iter(
+        self,
+        limit=None,
+        marker=None,
+        end_marker=None,
+        prefix=None,
+        prefetch=True,
+        **params
+    ):
+        """Iterate over all the containers of an account
+
+        The listing is fetched one page at a time as the containers are
+        consumed, so that memory use doesn't grow with the number of
+        containers.
+
+        :param integer limit:
+            number of containers per page
+        :param string marker:
+            query marker
+        :param string end_marker:
+            query end_marker
+        :param string prefix:
+            query prefix
+        :param boolean prefetch:
+            fetch the next page while the containers of the current one
+            are consumed
+        :returns:
+            generator of container dicts
+        """
+
+        return self._iter_listing(
+            '',
+            prefetch,
+            limit=limit,
+            marker=marker,
+            end_marker=end_marker,
+            prefix=prefix,
+            **params
+        )
+
     def container_save(
         self,
         container=None,
+        max_workers=1,
     ):
         """Save all the content from a container
 
         :param string container:
             name of container to save
+        :param integer max_workers:
+            number of objects to download concurrently
         """
 
         objects = self.object_list(container=container)
-        for object in objects:
-            self.object_save(container=container, object=object['name'])
+        for object, _result, exc in parallel.run_concurrently(
+            lambda object: self.object_save(
+                container=container, object=object['name']
+            ),
+            objects,
+            max_workers=max_workers,
+        ):
+            if exc is not None:
+                raise exc
 
     def container_set(
         self,
@@ -236,15 +453,29 @@ class APIv1(api.BaseAPI):
         container=None,
         object=None,
         name=None,
+        segment_size=None,
+        max_workers=1,
     ):
         """Create an object inside a container
 
+        Files larger than ``segment_size``, or larger than the Swift single
+        object limit if no segment size is given, are uploaded as a static
+        large object: the file is split into segments that are uploaded to
+        the ``<container>_segments`` container, up to ``max_workers`` at a
+        time, and a manifest object referencing them is created. Without a
+        ``segment_size`` the segments are made large enough for the number
+        of segments the cluster allows.
+
         :param string container:
             name of container to store object
         :param string object:
             local path to object
         :param string name:
             name of object to create
+        :param integer segment_size:
+            size in bytes of the segments of a large object
+        :param integer max_workers:
+            number of segments to upload concurrently
         :returns:
             dict of returned headers
         """
@@ -261,12 +492,42 @@ class APIv1(api.BaseAPI):
             urllib.parse.quote(container),
             urllib.parse.quote(object_name_str),
         )
-        with io.open(object, 'rb') as f:
-            response = self.create(
-                full_url,
-                method='PUT',
-                data=f,
+
+        size = os.path.getsize(object)
+        requested_segment_size = segment_size
+        if not segment_size and size > MAX_OBJECT_SIZE:
+            segment_size = DEFAULT_SEGMENT_SIZE
+        if segment_size and size > segment_size:
+            max_segments = (
+                self._get_info()
+                .get('slo', {})
+                .get('max_manifest_segments', DEFAULT_MAX_MANIFEST_SEGMENTS)
+            )
+            count = (size + segment_size - 1) // segment_size
+            if count > max_segments:
+                if requested_segment_size:
+                    msg = _(
+                        "%(object)s would be uploaded in %(count)s "
+                        "segments, more than the %(max)s the cluster "
+                        "allows; use a larger segment size"
+                    ) % {'object': object, 'count': count, 'max': max_segments}
+                    raise exceptions.CommandError(msg)
+                segment_size = (size + max_segments - 1) // max_segments
+            response = self._object_create_slo(
+                container,
+                object,
+                object_name_str,
+                size,
+                segment_size,
+                max_workers,
             )
+        else:
+            with io.open(object, 'rb') as f:
+                response = self.create(
+                    full_url,
+                    method='PUT',
+                    data=f,
+                )
         data = {
             'account': self._find_account_id(),
             'container': container,
@@ -277,6 +538,91 @@ class APIv1(api.BaseAPI):
 
         return data
 
+    def _object_create_slo(
+        self, container, path, name, size, segment_size, max_workers
+    ):
+        """Upload a file as a static large object
+
+        :returns: the response of the manifest upload
+        """
+        segment_container = container + '_segments'
+        # Follow the segment naming of python-swiftclient so that uploads
+        # of the same file can be recognised
+        segment_prefix = '%s/slo/%s/%s/%s/' % (
+            name,
+            os.path.getmtime(path),
+            size,
+            segment_size,
+        )
+        self.create(urllib.parse.quote(segment_container), method='PUT')
+
+        def _upload_segment(index):
+            offset = index * segment_size
+            length = min(segment_size, size - offset)
+            segment_name = '%s%08d' % (segment_prefix, index)
+            with io.open(path, 'rb') as f:
+                response = self.create(
+                    "%s/%s"
+                    % (
+                        urllib.parse.quote(segment_container),
+                        urllib.parse.quote(segment_name),
+                    ),
+                    method='PUT',
+                    data=_FileSegment(f, offset, length),
+                )
+            return {
+                'path': '/%s/%s' % (segment_container, segment_name),
+                'etag': response.headers.get('Etag'),
+                'size_bytes': length,
+            }
+
+        count = (size + segment_size - 1) // segment_size
+        manifest = [None] * count
+        errors = []
+
+        def _indexes():
+            for index in range(count):
+                if errors:
+                    return
+                yield index
+
+        def _upload_pending_segment(index):
+            # Segments queued before a failure are not uploaded anymore
+            if errors:
+                return None
+            return _upload_segment(index)
+
+        # Segments already being uploaded when one fails are waited for, so
+        # that they are cleaned up as well
+        for index, segment, exc in parallel.run_concurrently(
+            _upload_pending_segment, _indexes(), max_workers=max_workers
+        ):
+            if exc is not None:
+                errors.append(exc)
+            else:
+                manifest[index] = segment
+
+        if errors:
+            # Don't leave the segments uploaded so far behind
+            for segment in manifest:
+                if segment is None:
+                    continue
+                try:
+                    self.delete(urllib.parse.quote(segment['path'][1:]))
+                except Exception as e:
+                    LOG.debug(
+                        'Unable to delete segment %s: %s', segment['path'], e
+                    )
+            raise errors[0]
+
+        return self.create(
+            "%s/%s"
+            % (urllib.parse.quote(container), urllib.parse.quote(name)),
+            method='PUT',
+            params={'multipart-manifest': 'put'},
+            data=json.dumps(manifest),
+        )
+
     def object_delete(
         self,
         container=None,
@@ -315,7 +661,7 @@ class APIv1(api.BaseAPI):
             container name to get a listing for
         :param boolean full_listing:
             if True, return a full listing, else returns a max of
-            10000 listings
+            10000 listings, see also :meth:`object_iter`
         :param integer limit:
             query return count limit
         :param string marker:
@@ -333,35 +679,21 @@ class APIv1(api.BaseAPI):
         if container is None:
             return None
 
-        params['format'] = 'json'
         if full_listing:
-            data = listing = self.object_list(
-                container=container,
-                limit=limit,
-                marker=marker,
-                end_marker=end_marker,
-                prefix=prefix,
-                delimiter=delimiter,
-                **params
-            )
-            while listing:
-                if delimiter:
-                    marker = listing[-1].get('name', listing[-1].get('subdir'))
-                else:
-                    marker = listing[-1]['name']
-                listing = self.object_list(
-                    container=container,
+            return list(
+                self.object_iter(
+                    container,
                     limit=limit,
                     marker=marker,
                     end_marker=end_marker,
-                    prefix=prefix,
                     delimiter=delimiter,
+                    prefix=prefix,
+                    prefetch=False,
                     **params
                 )
-                if listing:
-                    data.extend(listing)
-            return data
+            )
 
+        params['format'] = 'json'
         if limit:
             params['limit'] = limit
         if marker:
@@ -375,29 +707,115 @@ class APIv1(api.BaseAPI):
 
         return self.list(urllib.parse.quote(container), **params)
 
+    def object_iter(
+        self,
+        container,
+        limit=None,
+        marker=None,
+        end_marker=None,
+        delimiter=None,
+        prefix=None,
+        prefetch=True,
+        max_workers=1,
+        shard_delimiter=None,
+        **params
+    ):
+        """Iterate over all the objects of a container
+
+        The listing is fetched one page at a time as the objects are
+        consumed, so that memory use doesn't grow with the number of
+        objects.
+
+        With ``max_workers`` greater than 1, the listing is split in
+        ranges of object names that are listed concurrently, see
+        :meth:`_iter_sharded`. The objects are still returned in order.
+
+        :param string container:
+            container name to get a listing for
+        :param integer limit:
+            number of objects per page
+        :param string marker:
+            query marker
+        :param string end_marker:
+            query end_marker
+        :param string delimiter:
+            string to delimit the queries on
+        :param string prefix:
+            query prefix
+        :param boolean prefetch:
+            fetch the next page while the objects of the current one are
+            consumed
+        :param integer max_workers:
+            number of ranges of the listing to fetch concurrently, ignored
+            with a delimiter
+        :param string shard_delimiter:
+            split the listing in the pseudo-directories delimited by this
+            string rather than in sampled ranges
+        :returns:
+            generator of object dicts, and of subdir dicts with a delimiter
+        """
+
+        if max_workers > 1 and not delimiter:
+            return self._iter_sharded(
+                urllib.parse.quote(container),
+                max_workers,
+                shard_delimiter,
+                limit=limit,
+                marker=marker,
+                end_marker=end_marker,
+                prefix=prefix,
+                **params
+            )
+        return self._iter_listing(
+            urllib.parse.quote(container),
+            prefetch,
+            limit=limit,
+            marker=marker,
+            end_marker=end_marker,
+            delimiter=delimiter,
+            prefix=prefix,
+            **params
+        )
+
     def object_save(
         self,
         container=None,
         object=None,
         file=None,
+        max_workers=1,
     ):
         """Save an object stored in a container
 
+        With ``max_workers`` greater than 1 the object is downloaded as
+        byte ranges fetched concurrently, see :meth:`_object_save_ranged`.
+
         :param string container:
             name of container that stores object
         :param string object:
             name of object to save
         :param string file:
             local name of object
+        :param integer max_workers:
+            number of byte ranges to download concurrently
         """
 
         if not file:
             file = object
 
+        url = "%s/%s" % (
+            urllib.parse.quote(container),
+            urllib.parse.quote(object),
+        )
+        if file != '-':
+            if len(os.path.dirname(file)) > 0:
+                os.makedirs(os.path.dirname(file), exist_ok=True)
+            if max_workers > 1:
+                self._object_save_ranged(url, file, max_workers)
+                return
+
         response = self._request(
             'GET',
-            "%s/%s"
-            % (urllib.parse.quote(container), urllib.parse.quote(object)),
+            url,
             stream=True,
         )
         if response.status_code == 200:
@@ -406,13 +824,74 @@ class APIv1(api.BaseAPI):
                     for chunk in response.iter_content(64 * 1024):
                         f.write(chunk)
             else:
-                if not os.path.exists(os.path.dirname(file)):
-                    if len(os.path.dirname(file)) > 0:
-                        os.makedirs(os.path.dirname(file))
                 with open(file, 'wb') as f:
                     for chunk in response.iter_content(64 * 1024):
                         f.write(chunk)
 
+    def _object_save_ranged(self, url, file, max_workers):
+        """Download an object as concurrently fetched byte ranges
+
+        Ranges of ``DOWNLOAD_RANGE_SIZE`` bytes are written in place into a
+        file preallocated to the object size. The ranges completed so far
+        are recorded in a state file next to ``file``, so that running the
+        download again after an interruption only fetches the missing
+        ranges, provided the object is unchanged. The data is hashed while
+        it is downloaded and checked against the object's ETag, unless the
+        object is a large object whose ETag is not the MD5 of its content.
+        """
+        response = self._request('HEAD', url)
+        size = int(response.headers.get('Content-Length', 0))
+        etag = response.headers.get('Etag')
+        # The ETag of a large object is not the MD5 of its content
+        verify = bool(etag) and not (
+            response.headers.get('X-Object-Manifest')
+            or response.headers.get('X-Static-Large-Object', '').lower()
+            == 'true'
+        )
+
+        headers = {'If-Match': etag} if etag else {}
+
+        def _fetch_range(start, end):
+            response = self._request(
+                'GET',
+                url,
+                headers=dict(headers, Range='bytes=%d-%d' % (start, end)),
+                stream=True,
+            )
+            if response.status_code != 206:
+                msg = _("Server does not support ranged downloads")
+                raise exceptions.CommandError(msg)
+            return response.iter_content(64 * 1024)
+
+        hasher = hashing.Hasher('md5') if verify else None
+        try:
+            download.download_ranges(
+                file,
+                size,
+                _fetch_range,
+                {'etag': etag},
+                max_workers=max_workers,
+                range_size=DOWNLOAD_RANGE_SIZE,
+                hasher=hasher,
+            )
+        finally:
+            if hasher is not None:
+                hasher.close()
+
+        if hasher is not None and hasher.hexdigest() != etag.strip('"'):
+            msg = _(
+                "Checksum of %(file)s does not match the object ETag: "
+                "expected %(etag)s, got %(checksum)s"
+            )
+            raise exceptions.CommandError(
+                msg
+                % {
+                    'file': file,
+                    'etag': etag.strip('"'),
+                    'checksum': hasher.hexdigest(),
+                }
+            )
+
     def object_set(
         self,
         container,
@@ -561,9 +1040,226 @@ class APIv1(api.BaseAPI):
         if headers:
             self.create("", headers=headers)
 
+    def _iter_pages(self, path, params):
+        """Yield the pages of a listing, following the markers"""
+        while True:
+            listing = self.list(path, **params)
+            if not listing:
+                return
+            yield listing
+            last = listing[-1]
+            params = dict(params, marker=last.get('name', last.get('subdir')))
+
+    def _iter_listing(self, path, prefetch, **params):
+        """Yield the entries of a listing, fetching one page at a time"""
+        params = {key: value for key, value in params.items() if value}
+        params['format'] = 'json'
+        pages = self._iter_pages(path, params)
+        if prefetch:
+            pages = parallel.prefetch(pages)
+        for listing in pages:
+            yield from listing
+
+    def _iter_sharded(self, path, max_workers, shard_delimiter, **params):
+        """Yield the entries of a listing, listing ranges concurrently
+
+        The names are split in ranges either by the pseudo-directories
+        found with ``shard_delimiter``, or by boundaries sampled between
+        the first and last names. Each range is listed with its own
+        marker walk, up to ``max_workers`` at once, and the ranges are
+        yielded in order.
+        """
+        params = {key: value for key, value in params.items() if value}
+        params['format'] = 'json'
+        if shard_delimiter:
+            shards = self._shard_by_delimiter(path, params, shard_delimiter)
+        else:
+            shards = self._shard_by_sampling(
+                path, params, max_workers * SHARDS_PER_WORKER, max_workers
+            )
+        for listing in parallel.chain_concurrently(shards, max_workers):
+            yield from listing
+
+    def _shard_by_delimiter(self, path, params, delimiter):
+        """Split a listing by pseudo-directory
+
+        :returns: a list of iterables of listing pages, one per
+            pseudo-directory and one per run of the objects outside of any
+        """
+        prefix = params.get('prefix')
+        while True:
+            query = dict(params, delimiter=delimiter)
+            if prefix:
+                query['prefix'] = prefix
+            entries = [
+                entry
+                for listing in self._iter_pages(path, query)
+                for entry in listing
+            ]
+            # Look into a lone pseudo-directory, such as a common top level
+            # directory, rather than list it as a single range
+            if len(entries) != 1 or 'subdir' not in entries[0]:
+                break
+            prefix = entries[0]['subdir']
+
+        shards = []
+        objects = []
+        for entry in entries:
+            if 'subdir' not in entry:
+                objects.append(entry)
+                continue
+            if objects:
+                shards.append([objects])
+                objects = []
+            shards.append(
+                self._iter_pages(path, dict(params, prefix=entry['subdir']))
+            )
+        if objects:
+            shards.append([objects])
+        return shards
+
+    def _shard_by_sampling(self, path, params, count, max_workers):
+        """Split a listing in ranges between sampled boundaries
+
+        Candidate names are spread evenly between the first and the last
+        names of the listing, after their common prefix. The first object
+        after each candidate is a boundary, and the ranges between the
+        boundaries are listed with markers and end markers.
+
+        :returns: a list of iterables of listing pages, alternating ranges
+            and boundary objects
+        """
+
+        def _first(query):
+            listing = self.list(path, **dict(query, limit=1))
+            return listing[0] if listing else None
+
+        first = _first(params)
+        if first is None:
+            return []
+
+        # Markers are swapped when listing in reverse
+        reverse = {
+            key: value
+            for key, value in params.items()
+            if key not in ('marker', 'end_marker')
+        }
+        reverse['reverse'] = 'true'
+        if params.get('end_marker'):
+            reverse['marker'] = params['end_marker']
+        if params.get('marker'):
+            reverse['end_marker'] = params['marker']
+        last = _first(reverse)
+        # Clusters not supporting reverse listings return the first name
+        if last is None or last['name'] <= first['name']:
+            return [self._iter_pages(path, params)]
+
+        common = os.path.commonprefix([first['name'], last['name']])
+        low = _shard_key(first['name'][len(common) :])
+        high = _shard_key(last['name'][len(common) :])
+        candidates = sorted(
+            {
+                common + _shard_key_name(low + (high - low) * i // count)
+                for i in range(1, count)
+            }
+        )
+        if params.get('marker'):
+            candidates = [max(c, params['marker']) for c in candidates]
+
+        boundaries = {}
+        for _candidate, boundary, exc in parallel.run_concurrently(
+            lambda candidate: _first(dict(params, marker=candidate)),
+            candidates,
+            max_workers=max_workers,
+        ):
+            if exc is not None:
+                raise exc
+            if boundary is not None:
+                boundaries[boundary['name']] = boundary
+
+        shards = []
+        lower = params.get('marker')
+        for name in sorted(boundaries):
+            shards.append(
+                self._iter_pages(path, _listing_range(params, lower, name))
+            )
+            shards.append([[boundaries[name]]])
+            lower = name
+        shards.append(
+            self._iter_pages(
+                path, _listing_range(params, lower, params.get('end_marker'))
+            )
+        )
+        return shards
+
+    def _get_info(self):
+        """Return the capabilities of the cluster, fetched once
+
+        Clusters that don't publish their capabilities have none.
+        """
+        if self._info is None:
+            # The info endpoint is at the root of the proxy, not under the
+            # version and account of the storage URL
+            parts = urllib.parse.urlsplit(self.endpoint)
+            path = parts.path.rstrip('/').rsplit('/', 2)[0]
+            url = urllib.parse.urlunsplit(
+                (parts.scheme, parts.netloc, path + '/info', '', '')
+            )
+            try:
+                info = self.session.request(url, 'GET').json()
+            except (ks_exceptions.ClientException, ValueError) as e:
+                LOG.debug('Unable to get the cluster capabilities: %s', e)
+                info = None
+            self._info = info if isinstance(info, dict) else {}
+        return self._info
+
+    def _bulk_delete(self, container, names):
+        """Delete objects with a single bulk-delete request
+
+        :returns: a list of (name, error) tuples for the objects that
+            could not be deleted
+        """
+        prefix = '/%s/' % container
+        body = '\n'.join(urllib.parse.quote(prefix + name) for name in names)
+        response = self._request(
+            'POST',
+            '',
+            params={'bulk-delete': ''},
+            data=body.encode('utf-8'),
+            headers={
+                'Accept': 'application/json',
+                'Content-Type': 'text/plain',
+            },
+        )
+        result = response.json()
+
+        errors = [
+            (urllib.parse.unquote(path)[len(prefix) :], status)
+            for path, status in result.get('Errors') or []
+        ]
+        status = result.get('Response Status', '')
+        if not errors and not status.startswith('2'):
+            # The whole request failed
+            reason = '%s %s' % (status, result.get('Response Body', ''))
+            errors = [(name, reason.strip()) for name in names]
+        return errors
+
+    def _object_delete_missing_ok(self, container, names):
+        """Delete objects one by one, ignoring those already gone"""
+        for name in names:
+            try:
+                self.object_delete(container=container, object=name)
+            except ks_exceptions.NotFound:
+                pass
+        return []
+
     def _find_account_id(self):
-        url_parts = urllib.parse.urlparse(self.endpoint)
-        return url_parts.path.split('/')[-1]
+        # Called for every object of a batch of uploads, so only parse the
+        # endpoint again if it changed
+        if self._account_id is None or self._account_id[0] != self.endpoint:
+            url_parts = urllib.parse.urlparse(self.endpoint)
+            self._account_id = (self.endpoint, url_parts.path.split('/')[-1])
+        return self._account_id[1]
 
     def _unset_properties(self, properties, header_tag):
         # NOTE(stevemar): As per the API, the headers have to be in the form
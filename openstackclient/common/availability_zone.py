@@ -154,8 +154,10 @@ class ListAvailabilityZone(command.Lister):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'Availability Zone', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'Availability Zone',
+                ignore_missing=False,
             )
         except Exception as e:
             LOG.debug('Network availability zone exception: ', e)
@@ -0,0 +1,556 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""On-disk caches shared between invocations of the client"""
+
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+
+from openstack import exceptions as sdk_exceptions
+from osc_lib import exceptions
+from osc_lib import utils
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # NOTE: Windows has no fcntl; fall back to unlocked writes there, the
+    #       atomic rename in _write_file() still avoids torn files.
+    fcntl = None
+
+
+LOG = logging.getLogger(__name__)
+
+# Seconds a name to ID mapping is trusted before it is looked up again
+DEFAULT_RESOURCE_CACHE_TTL = 300
+
+# Upper bound on the number of mappings kept per cloud and project
+DEFAULT_RESOURCE_CACHE_MAX_ENTRIES = 10000
+
+# Seconds the API capabilities of a cloud, such as the microversion range a
+# service supports, are trusted before they are discovered again
+DEFAULT_FEATURE_CACHE_TTL = 3600
+
+_CACHE_FORMAT_VERSION = 1
+
+# Commands named "<resource type> <action>" with one of these actions may
+# create, rename or delete resources of that type
+_CHANGING_ACTIONS = ('create', 'delete', 'set')
+
+# Context of the keys derived from an auth plugin's cache ID, so that the
+# name of a token cache file reveals nothing about its encryption key
+_TOKEN_NAME_INFO = b'openstackclient token cache name'
+_TOKEN_KEY_INFO = b'openstackclient token cache key'
+
+
+def get_cache_dir(cli_options):
+    """Return the directory used for the client's on-disk caches
+
+    This lives below the openstacksdk cache path so that clearing the SDK
+    cache also clears ours.
+    """
+    path = None
+    get_cache_path = getattr(cli_options, 'get_cache_path', None)
+    if get_cache_path is not None:
+        path = get_cache_path()
+    if not path:
+        path = os.path.join(os.path.expanduser('~'), '.cache', 'openstack')
+    return os.path.join(path, 'openstackclient')
+
+
+def make_cache_key(*parts):
+    """Build a stable, filesystem-safe key from arbitrary JSON-able parts"""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """Hold an exclusive advisory lock associated with ``path``"""
+    if fcntl is None:
+        yield
+        return
+
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_file(path):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get('version') != _CACHE_FORMAT_VERSION
+    ):
+        return None
+    return data
+
+
+def _write_file(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class FileCache(object):
+    """A persistent key/value cache backed by a JSON file
+
+    Values are grouped by namespace and must be JSON serializable. Entries
+    expire after ``ttl`` seconds and the oldest entries are evicted once
+    ``max_entries`` is exceeded.
+
+    A cache created without a ``path`` is disabled: lookups always miss
+    and nothing is written, so callers never need to special-case it.
+
+    :param path: The file backing the cache, or None to disable caching.
+    :param ttl: The lifetime of an entry in seconds.
+    :param max_entries: The maximum number of entries to keep.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        ttl=DEFAULT_RESOURCE_CACHE_TTL,
+        max_entries=DEFAULT_RESOURCE_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = None
+
+    @property
+    def enabled(self):
+        return self.path is not None and self.ttl > 0
+
+    def _load(self):
+        if self._entries is None:
+            data = _read_file(self.path) or {}
+            try:
+                self._entries = self._prune(data.get('entries', {}))
+            except (AttributeError, TypeError, ValueError):
+                # Unrecognisable content; start over
+                self._entries = {}
+        return self._entries
+
+    def _prune(self, entries):
+        """Drop expired entries and evict the oldest ones over the limit"""
+        now = time.time()
+        flat = [
+            (stamp, namespace, key, value)
+            for namespace, values in entries.items()
+            for key, (value, stamp) in values.items()
+            if now - stamp < self.ttl
+        ]
+        if len(flat) > self.max_entries:
+            flat.sort(key=lambda entry: entry[0], reverse=True)
+            del flat[self.max_entries :]
+
+        pruned = {}
+        for stamp, namespace, key, value in flat:
+            pruned.setdefault(namespace, {})[key] = [value, stamp]
+        return pruned
+
+    def _update(self, func):
+        """Apply ``func`` to the on-disk entries under the file lock
+
+        The file is re-read under the lock so that concurrent invocations
+        don't drop each other's updates.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            with _locked(self.path):
+                data = _read_file(self.path) or {}
+                try:
+                    entries = self._prune(data.get('entries', {}))
+                except (AttributeError, TypeError, ValueError):
+                    entries = {}
+                func(entries)
+                entries = self._prune(entries)
+                _write_file(
+                    self.path,
+                    {'version': _CACHE_FORMAT_VERSION, 'entries': entries},
+                )
+                self._entries = entries
+        except OSError as e:
+            # A broken cache must never break a command
+            LOG.debug('Unable to update cache %s: %s', self.path, e)
+
+    def get(self, namespace, key):
+        """Return the cached value for ``key`` or None"""
+        if not self.enabled:
+            return None
+
+        entry = self._load().get(namespace, {}).get(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def set(self, namespace, key, value):
+        """Store ``value`` for ``key``"""
+        if not self.enabled:
+            return
+
+        def _set(entries):
+            entries.setdefault(namespace, {})[key] = [value, time.time()]
+
+        self._update(_set)
+
+    def set_many(self, namespace, values):
+        """Store all items of the ``values`` dict with a single write"""
+        if not self.enabled or not values:
+            return
+
+        def _set_many(entries):
+            now = time.time()
+            namespace_entries = entries.setdefault(namespace, {})
+            for key, value in values.items():
+                namespace_entries[key] = [value, now]
+
+        self._update(_set_many)
+
+    def delete(self, namespace, key):
+        """Forget the entry for ``key``"""
+        if not self.enabled:
+            return
+
+        def _delete(entries):
+            entries.get(namespace, {}).pop(key, None)
+
+        self._update(_delete)
+
+    def invalidate(self, namespace=None):
+        """Forget all entries of a namespace, or everything"""
+        if not self.enabled:
+            return
+
+        def _invalidate(entries):
+            if namespace is None:
+                entries.clear()
+            else:
+                entries.pop(namespace, None)
+
+        self._update(_invalidate)
+
+
+def _resource_namespace(resource_type):
+    """Normalise ``'security_group'``, ``'SecurityGroup'`` etc."""
+    return re.sub('[^a-z0-9]', '', resource_type.lower())
+
+
+def _matches(resource, name_or_id):
+    """Whether ``resource`` is what ``name_or_id`` refers to"""
+    return name_or_id in (
+        getattr(resource, 'id', None),
+        getattr(resource, 'name', None),
+        getattr(resource, 'display_name', None),
+    )
+
+
+class ResourceCache(FileCache):
+    """A persistent cache of resource name to ID mappings
+
+    Mappings are namespaced by resource type (``'server'``, ``'network'``,
+    ...) and stored one file per cloud and project.
+    """
+
+    def find(self, resource_type, name_or_id, finder, stale=(), scope=None):
+        """Find a resource by name or ID, consulting the cache first
+
+        The resource is always fetched, but by its cached ID, which takes a
+        single request where a name takes up to three. A cached ID is only
+        trusted if the resource still has the name it was cached for; if
+        it was deleted (``finder`` raises one of the ``stale`` exceptions
+        or returns None) or renamed, the mapping is dropped and
+        ``name_or_id`` looked up again.
+
+        :param resource_type: The resource type, used as cache namespace.
+        :param name_or_id: The name or ID to look up.
+        :param finder: Called with a name or ID, it must return the
+            resource (anything with an ``id`` attribute), None or raise.
+        :param stale: The exception types raised by ``finder`` for an ID
+            that doesn't exist.
+        :param scope: A dict of the other criteria of the lookup, such as
+            the domain of a project, which are part of the cache key.
+        :returns: The result of ``finder``.
+        """
+        if not self.enabled:
+            return finder(name_or_id)
+
+        namespace = _resource_namespace(resource_type)
+        key = name_or_id
+        if scope:
+            key = '%s?%s' % (
+                name_or_id,
+                json.dumps(scope, sort_keys=True, default=str),
+            )
+
+        resource_id = self.get(namespace, key)
+        if resource_id is not None:
+            try:
+                resource = finder(resource_id)
+            except stale:
+                resource = None
+            if resource is not None and _matches(resource, name_or_id):
+                LOG.debug(
+                    'Resolved %s %s to %s from cache',
+                    resource_type,
+                    name_or_id,
+                    resource_id,
+                )
+                return resource
+            LOG.debug(
+                'Cached ID %s of %s %s is stale, looking it up again',
+                resource_id,
+                resource_type,
+                name_or_id,
+            )
+            self.delete(namespace, key)
+
+        resource = finder(name_or_id)
+        # Only names are worth caching, and only those the resource can be
+        # checked against later
+        if (
+            resource is not None
+            and getattr(resource, 'id', None) not in (None, name_or_id)
+            and _matches(resource, name_or_id)
+        ):
+            self.set(namespace, key, resource.id)
+        return resource
+
+    def find_resource(self, manager, name_or_id, **kwargs):
+        """Cached :func:`osc_lib.utils.find_resource`
+
+        The resource type is the name of the manager's resource class.
+        """
+        if not self.enabled:
+            return utils.find_resource(manager, name_or_id, **kwargs)
+
+        resource_class = getattr(manager, 'resource_class', None)
+        return self.find(
+            getattr(resource_class, '__name__', type(manager).__name__),
+            name_or_id,
+            lambda value: utils.find_resource(manager, value, **kwargs),
+            stale=(exceptions.CommandError,),
+            scope=kwargs,
+        )
+
+    def find_sdk_resource(self, find, name_or_id, **kwargs):
+        """Cached call of an SDK proxy ``find_*`` method
+
+        The resource type is taken from the name of the method, e.g.
+        ``'network'`` for ``find_network``. The service type of the proxy
+        is part of the key, since several services have e.g. flavors.
+        """
+        if not self.enabled:
+            return find(name_or_id, **kwargs)
+
+        scope = {k: v for k, v in kwargs.items() if k != 'ignore_missing'}
+        scope['service_type'] = getattr(
+            getattr(find, '__self__', None), 'service_type', None
+        )
+        return self.find(
+            find.__name__[len('find_') :],
+            name_or_id,
+            lambda value: find(value, **kwargs),
+            stale=(sdk_exceptions.NotFoundException,),
+            scope=scope,
+        )
+
+    def invalidate_for_command(self, command_name):
+        """Forget the mappings a command may have made stale
+
+        A ``<resource type> create|delete|set`` command invalidates the
+        namespaces of that type, including the ones named after the last
+        words of it, e.g. ``floating ip delete`` invalidates ``ip``, the
+        type of the SDK's ``find_ip``.
+
+        :param command_name: The name of the command, e.g. ``'server set'``.
+        """
+        words = (command_name or '').split()
+        if not self.enabled or len(words) < 2:
+            return
+        if words[-1] not in _CHANGING_ACTIONS:
+            return
+
+        noun = _resource_namespace(''.join(words[:-1]))
+        if not any(noun.endswith(namespace) for namespace in self._load()):
+            return
+
+        def _invalidate(entries):
+            for namespace in list(entries):
+                if noun.endswith(namespace):
+                    del entries[namespace]
+
+        self._update(_invalidate)
+
+    def find_id(self, resource_type, name_or_id, finder):
+        """Resolve ``name_or_id`` to an ID, consulting the cache first
+
+        :param resource_type: The resource type, used as cache namespace.
+        :param name_or_id: The name or ID to resolve.
+        :param finder: Called with ``name_or_id`` on a cache miss, it must
+            return the resource (anything with an ``id`` attribute) or raise.
+        :returns: The resource ID.
+        """
+        resource_id = self.get(resource_type, name_or_id)
+        if resource_id is not None:
+            LOG.debug(
+                'Resolved %s %s to %s from cache',
+                resource_type,
+                name_or_id,
+                resource_id,
+            )
+            return resource_id
+
+        resource_id = finder(name_or_id).id
+        self.set(resource_type, name_or_id, resource_id)
+        return resource_id
+
+    def call_with_id(self, resource_type, name_or_id, finder, func, stale=()):
+        """Resolve ``name_or_id`` and call ``func`` with the ID
+
+        A cached ID may no longer be valid, if the resource was deleted or
+        replaced by another one of the same name in the meantime. If
+        ``func`` fails with one of the ``stale`` exceptions for a cached
+        ID, the mapping is dropped and ``name_or_id`` resolved again once.
+
+        :param resource_type: The resource type, used as cache namespace.
+        :param name_or_id: The name or ID to resolve.
+        :param finder: See :meth:`find_id`.
+        :param func: Called with the resource ID.
+        :param stale: The exception types raised by ``func`` for an ID
+            that doesn't exist.
+        :returns: The result of ``func``.
+        """
+        resource_id = self.get(resource_type, name_or_id)
+        if resource_id is not None:
+            try:
+                return func(resource_id)
+            except stale:
+                LOG.debug(
+                    'Cached ID %s of %s %s is stale, resolving it again',
+                    resource_id,
+                    resource_type,
+                    name_or_id,
+                )
+                self.delete(resource_type, name_or_id)
+
+        return func(self.find_id(resource_type, name_or_id, finder))
+
+
+class TokenCache(object):
+    """A persistent cache of authentication states, encrypted at rest
+
+    Each state, which holds a token along with its service catalog, is
+    stored in its own file. Both the name of the file and its encryption
+    key are derived from the cache ID of the auth plugin. That ID is a
+    digest of all the auth options, secrets included, so a cache file is
+    of no use to anyone who doesn't already hold the credentials.
+
+    Writes are atomic and serialized by a file lock, so the cache can be
+    shared by concurrent invocations.
+
+    :param path: The directory holding the cache files, or None to disable
+        caching.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    @staticmethod
+    def _derive(cache_id, info):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf import hkdf
+
+        return hkdf.HKDF(
+            algorithm=hashes.SHA256(), length=32, salt=None, info=info
+        ).derive(cache_id.encode('utf-8'))
+
+    def _file(self, cache_id):
+        name = self._derive(cache_id, _TOKEN_NAME_INFO).hex()
+        return os.path.join(self.path, name + '.json')
+
+    def _fernet(self, cache_id):
+        from cryptography import fernet
+
+        key = self._derive(cache_id, _TOKEN_KEY_INFO)
+        return fernet.Fernet(base64.urlsafe_b64encode(key))
+
+    def get(self, cache_id):
+        """Return the cached state for ``cache_id`` or None"""
+        if not self.enabled or not cache_id:
+            return None
+
+        from cryptography import fernet
+
+        data = _read_file(self._file(cache_id))
+        if data is None:
+            return None
+        try:
+            return (
+                self._fernet(cache_id)
+                .decrypt(data['state'].encode('ascii'))
+                .decode('utf-8')
+            )
+        except (KeyError, AttributeError, ValueError, fernet.InvalidToken):
+            LOG.debug('Ignoring unreadable token cache entry')
+            return None
+
+    def set(self, cache_id, state):
+        """Store ``state`` for ``cache_id``, or forget it if None"""
+        if not self.enabled or not cache_id:
+            return
+
+        path = self._file(cache_id)
+        try:
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+            with _locked(path):
+                if state is None:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(path)
+                    return
+                token = self._fernet(cache_id).encrypt(state.encode('utf-8'))
+                _write_file(
+                    path,
+                    {
+                        'version': _CACHE_FORMAT_VERSION,
+                        'state': token.decode('ascii'),
+                    },
+                )
+        except OSError as e:
+            # A broken cache must never break a command
+            LOG.debug('Unable to update token cache %s: %s', self.path, e)
@@ -17,11 +17,16 @@
 
 import importlib
 import logging
+import os
 import sys
 
+from keystoneauth1 import discover
+from openstack import utils as sdk_utils
 from osc_lib import clientmanager
 from osc_lib import shell
-import stevedore
+
+from openstackclient.common import cache
+from openstackclient.common import commandindex
 
 
 LOG = logging.getLogger(__name__)
@@ -30,6 +35,23 @@ PLUGIN_MODULES = []
 
 USER_AGENT = 'python-openstackclient'
 
+# The auth options that identify the cloud and project a cache belongs to
+_CACHE_AUTH_KEYS = (
+    'auth_url',
+    'endpoint',
+    'username',
+    'user_id',
+    'user_domain_id',
+    'user_domain_name',
+    'project_id',
+    'project_name',
+    'project_domain_id',
+    'project_domain_name',
+    'domain_id',
+    'domain_name',
+    'system_scope',
+)
+
 
 class ClientManager(clientmanager.ClientManager):
     """Manages access to API clients, including authentication
@@ -45,6 +67,13 @@ class ClientManager(clientmanager.ClientManager):
     # Let the commands set this
     _auth_required = False
 
+    # Authentication states shared by the commands run by a warm process,
+    # keyed by the auth plugin's cache ID; see openstackclient.daemon
+    auth_states = None
+
+    # Seconds a shared or cached token must still be valid for to be reused
+    _MIN_AUTH_STATE_LIFE = 120
+
     def __init__(
         self,
         cli_options=None,
@@ -66,6 +95,12 @@ class ClientManager(clientmanager.ClientManager):
         # store original auth_type
         self._original_auth_type = cli_options.auth_type
 
+        self._resource_cache = None
+        self._feature_cache = None
+        self._token_cache = None
+        self._restored_auth_state = None
+        self._microversion_support = {}
+
     def setup_auth(self):
         """Set up authentication"""
 
@@ -94,7 +129,79 @@ class ClientManager(clientmanager.ClientManager):
             except TypeError as e:
                 self._fallback_load_auth_plugin(e)
 
-        return super(ClientManager, self).setup_auth()
+        super(ClientManager, self).setup_auth()
+        self._restore_auth_state()
+
+    @property
+    def auth_ref(self):
+        auth_ref = super(ClientManager, self).auth_ref
+        # The token obtained here isn't kept by the plugin, so requests
+        # made through the session would authenticate again and the token
+        # couldn't be saved in the token cache
+        if auth_ref is not None and getattr(self.auth, 'auth_ref', 0) is None:
+            self.auth.auth_ref = auth_ref
+        return auth_ref
+
+    def _get_auth_cache_id(self):
+        get_cache_id = getattr(self.auth, 'get_cache_id', None)
+        return get_cache_id() if get_cache_id else None
+
+    def _restore_auth_state(self):
+        """Reuse a token obtained by an earlier command
+
+        The token is taken from the states shared by a warm process, or
+        from the token cache.
+        """
+        if self._auth_ref:
+            return
+        cache_id = self._get_auth_cache_id()
+        if not cache_id:
+            return
+        state = None
+        if self.auth_states is not None:
+            state = self.auth_states.get(cache_id)
+        if not state:
+            state = self.token_cache.get(cache_id)
+        if not state:
+            return
+
+        try:
+            self.auth.set_auth_state(state)
+        except (KeyError, TypeError, ValueError):
+            LOG.debug('Ignoring unusable authentication state')
+            return
+
+        auth_ref = self.auth.auth_ref
+        if auth_ref and not auth_ref.will_expire_soon(
+            self._MIN_AUTH_STATE_LIFE
+        ):
+            LOG.debug('Reusing token of an earlier command')
+            self._auth_ref = auth_ref
+            self._restored_auth_state = state
+        else:
+            self.auth.set_auth_state(None)
+
+    def save_auth_state(self):
+        """Store the current token in the token cache for later commands"""
+        if not self._auth_setup_completed or not self.token_cache.enabled:
+            return
+        cache_id = self._get_auth_cache_id()
+        get_auth_state = getattr(self.auth, 'get_auth_state', None)
+        if not cache_id or get_auth_state is None:
+            return
+        state = get_auth_state()
+        if state and state != self._restored_auth_state:
+            self.token_cache.set(cache_id, state)
+            self._restored_auth_state = state
+
+    def invalidate_resource_cache(self, command_name):
+        """Forget the cached names a command may have changed
+
+        Called after every command, even a failed one may have created,
+        renamed or deleted some resources.
+        """
+        if self._auth_setup_completed:
+            self.resource_cache.invalidate_for_command(command_name)
 
     def _fallback_load_auth_plugin(self, e):
         # NOTES(RuiChen): Hack to avoid auth plugins choking on data they don't
@@ -114,6 +221,134 @@ class ClientManager(clientmanager.ClientManager):
         else:
             raise e
 
+    def _get_cache_key(self):
+        """Return a key unique to the current cloud, user and project"""
+        config = self._cli_options.config
+        auth = config.get('auth') or {}
+        return cache.make_cache_key(
+            config.get('cloud'),
+            self.region_name,
+            [auth.get(k) for k in _CACHE_AUTH_KEYS],
+        )
+
+    def _get_cache_path(self, kind):
+        """Return the cache file of a kind, or None if caching is disabled"""
+        if self._cli_options.config.get('no_resource_cache'):
+            return None
+        return os.path.join(
+            cache.get_cache_dir(self._cli_options),
+            kind,
+            self._get_cache_key() + '.json',
+        )
+
+    @property
+    def resource_cache(self):
+        """The persistent name to ID cache for the current cloud/project
+
+        Lookups check that a cached ID still refers to a resource of that
+        name, but can't tell that another resource of the same name was
+        created elsewhere since, which would make the name ambiguous. The
+        cache is thus only enabled by a non-zero ``--os-resource-cache-ttl``.
+        The ``--no-resource-cache`` global option disables it too.
+        """
+        if self._resource_cache is None:
+            ttl = self._cli_options.config.get('resource_cache_ttl') or 0
+            self._resource_cache = cache.ResourceCache(
+                self._get_cache_path('resources'), ttl=int(ttl)
+            )
+        return self._resource_cache
+
+    @property
+    def feature_cache(self):
+        """The persistent cache of API capabilities of the current cloud
+
+        Disabled by the ``--no-resource-cache`` global option.
+        """
+        if self._feature_cache is None:
+            self._feature_cache = cache.FileCache(
+                self._get_cache_path('features'),
+                ttl=cache.DEFAULT_FEATURE_CACHE_TTL,
+            )
+        return self._feature_cache
+
+    @property
+    def token_cache(self):
+        """The persistent cache of tokens and service catalogs
+
+        Disabled by the ``--no-token-cache`` global option.
+        """
+        if self._token_cache is None:
+            path = None
+            if not self._cli_options.config.get('no_token_cache'):
+                path = os.path.join(
+                    cache.get_cache_dir(self._cli_options), 'tokens'
+                )
+            self._token_cache = cache.TokenCache(path)
+        return self._token_cache
+
+    def supports_microversion(self, client, microversion):
+        """Check whether an SDK service proxy supports a microversion
+
+        Results are memoized for the lifetime of the client manager and the
+        microversion range advertised by the service is kept in the feature
+        cache, so that checks on warm runs don't need the service's version
+        document.
+
+        :param client: An SDK service proxy, e.g. ``sdk_connection.compute``.
+        :param microversion: The microversion to check, e.g. ``'2.47'``.
+        :returns: True if the microversion can be used.
+        """
+        key = (
+            client.service_type,
+            client.default_microversion,
+            str(microversion),
+        )
+        if key not in self._microversion_support:
+            self._microversion_support[key] = self._check_microversion(
+                client, microversion
+            )
+        return self._microversion_support[key]
+
+    def _check_microversion(self, client, microversion):
+        version_range = self.feature_cache.get(
+            'microversions', client.service_type
+        )
+        if version_range is None:
+            supported = sdk_utils.supports_microversion(client, microversion)
+
+            endpoint_data = client.get_endpoint_data()
+            if (
+                endpoint_data is not None
+                and endpoint_data.min_microversion
+                and endpoint_data.max_microversion
+            ):
+                self.feature_cache.set(
+                    'microversions',
+                    client.service_type,
+                    [
+                        discover.version_to_string(
+                            endpoint_data.min_microversion
+                        ),
+                        discover.version_to_string(
+                            endpoint_data.max_microversion
+                        ),
+                    ],
+                )
+            return supported
+
+        # Same logic as openstack.utils.supports_microversion
+        min_version, max_version = version_range
+        if not discover.version_between(
+            min_version, max_version, microversion
+        ):
+            return False
+        if client.default_microversion is not None:
+            return discover.version_match(
+                discover.normalize_version_number(microversion),
+                discover.normalize_version_number(client.default_microversion),
+            )
+        return True
+
     def is_network_endpoint_enabled(self):
         """Check if the network endpoint is enabled"""
 
@@ -151,21 +386,10 @@ class ClientManager(clientmanager.ClientManager):
 def get_plugin_modules(group):
     """Find plugin entry points"""
     mod_list = []
-    mgr = stevedore.ExtensionManager(group)
-    for ep in mgr:
+    for ep in commandindex.get_command_index().entry_points(group):
         LOG.debug('Found plugin %s', ep.name)
 
-        # Different versions of stevedore use different
-        # implementations of EntryPoint from other libraries, which
-        # are not API-compatible.
-        try:
-            module_name = ep.entry_point.module_name
-        except AttributeError:
-            try:
-                module_name = ep.entry_point.module
-            except AttributeError:
-                module_name = ep.entry_point.value
-
+        module_name = commandindex.module_name(ep)
         try:
             module = importlib.import_module(module_name)
         except Exception as err:
@@ -0,0 +1,378 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""An on-disk index of the commands and plugins of the client
+
+Finding the commands of a group through stevedore imports the module of
+every command in the group, so registering the command groups of all APIs
+at startup imports nearly the whole client. The index maps the command
+names of every ``openstack.*`` entry point group to the entry point, so
+that only the module of the command that is run gets imported.
+
+The index is rebuilt whenever the installed distributions change. It also
+records the one-line descriptions of the commands once they are known, so
+that listing the commands in the help doesn't import them either.
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+from importlib import metadata
+import inspect
+import json
+import logging
+import os
+import sys
+
+from cliff import command
+from cliff import help as cliff_help
+from osc_lib.command import commandmanager
+
+from openstackclient.common import cache
+
+
+LOG = logging.getLogger(__name__)
+
+# Bump to discard the indexes written by older versions of the client
+INDEX_FORMAT_VERSION = 1
+
+# The entry point groups recorded in the index
+GROUP_PREFIX = 'openstack.'
+
+_INDEX_FILE = 'command-index.json'
+
+_default_index = None
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _fingerprint(path=None):
+    """Return a digest that changes whenever distributions are installed
+
+    Installing, upgrading or removing a distribution changes the
+    modification time of its ``site-packages`` directory or of its
+    ``entry_points.txt`` file.
+    """
+    h = hashlib.sha256()
+    for value in (INDEX_FORMAT_VERSION, sys.executable, sys.prefix):
+        h.update(str(value).encode('utf-8'))
+
+    for entry in sys.path if path is None else path:
+        h.update(entry.encode('utf-8', 'surrogateescape'))
+        h.update(str(_get_mtime(entry)).encode('utf-8'))
+        for pattern in ('*.dist-info', '*.egg-info'):
+            for ep_file in sorted(
+                glob.glob(os.path.join(entry, pattern, 'entry_points.txt'))
+            ):
+                h.update(ep_file.encode('utf-8', 'surrogateescape'))
+                h.update(str(_get_mtime(ep_file)).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _build_groups():
+    groups = {}
+    seen = set()
+    for distribution in metadata.distributions():
+        dist_name = None
+        for ep in distribution.entry_points:
+            if not ep.group.startswith(GROUP_PREFIX):
+                continue
+            # Distributions found twice on sys.path, such as a package
+            # installed in a virtualenv that is also the working directory,
+            # provide the same entry points twice
+            item = (ep.group, ep.name, ep.value)
+            if item in seen:
+                continue
+            seen.add(item)
+            if dist_name is None:
+                dist_name = distribution.metadata['Name']
+            groups.setdefault(ep.group, []).append(
+                [ep.name, ep.value, dist_name]
+            )
+    return groups
+
+
+def module_name(entry_point):
+    """Return the name of the module an entry point refers to"""
+    return entry_point.value.partition(':')[0].strip()
+
+
+class CommandIndex(object):
+    """The index of the entry points of the client and its plugins
+
+    :param path: The file backing the index, or None to keep the index in
+        memory only.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._data = None
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        return data
+
+    def _write(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            cache._write_file(self.path, data)
+        except OSError as e:
+            # A broken index must never break a command
+            LOG.debug('Unable to write command index %s: %s', self.path, e)
+
+    def _load(self):
+        if self._data is not None:
+            return self._data
+
+        fingerprint = _fingerprint()
+        data = self._read() if self.path else None
+        if (
+            data is None
+            or data.get('version') != INDEX_FORMAT_VERSION
+            or data.get('fingerprint') != fingerprint
+        ):
+            LOG.debug('Rebuilding command index')
+            data = {
+                'version': INDEX_FORMAT_VERSION,
+                'fingerprint': fingerprint,
+                'groups': _build_groups(),
+                'descriptions': {},
+            }
+            if self.path:
+                self._write(data)
+        self._data = data
+        return data
+
+    def entry_points(self, group):
+        """Return the entry points of ``group``, without loading them"""
+        return [
+            metadata.EntryPoint(name, value, group)
+            for name, value, _dist in self._load()['groups'].get(group, [])
+        ]
+
+    def get_descriptions(self):
+        """Return the recorded command descriptions
+
+        :returns: A dict mapping entry point values to a list of the
+            one-line description of the command, or None for deprecated
+            commands, and the name of the distribution providing the
+            command if it isn't the client's.
+        """
+        return self._load().get('descriptions', {})
+
+    def set_descriptions(self, descriptions):
+        """Record command descriptions, see :meth:`get_descriptions`"""
+        if not descriptions:
+            return
+        data = self._load()
+        data.setdefault('descriptions', {}).update(descriptions)
+        if not self.path:
+            return
+
+        with contextlib.suppress(OSError):
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        try:
+            with cache._locked(self.path):
+                # Don't drop the descriptions recorded concurrently
+                on_disk = self._read()
+                if on_disk and on_disk.get('fingerprint') == data.get(
+                    'fingerprint'
+                ):
+                    merged = dict(on_disk.get('descriptions') or {})
+                    merged.update(data['descriptions'])
+                    data['descriptions'] = merged
+                self._write(data)
+        except OSError as e:
+            LOG.debug('Unable to update command index %s: %s', self.path, e)
+
+
+def get_command_index():
+    """Return the index shared by the client"""
+    global _default_index
+    if _default_index is None:
+        _default_index = CommandIndex(
+            os.path.join(cache.get_cache_dir(None), _INDEX_FILE)
+        )
+    return _default_index
+
+
+class CommandManager(commandmanager.CommandManager):
+    """Look commands up in the command index
+
+    Commands are only imported once they are found for a command line,
+    rather than as soon as their group is added.
+
+    :param namespace: The entry point group of the initial commands.
+    :param convert_underscores: Whether to convert underscores in the
+        entry point names to spaces.
+    :param index: The :class:`CommandIndex` to use, by default the one
+        shared by the client.
+    """
+
+    def __init__(self, namespace=None, convert_underscores=True, index=None):
+        self.index = index or get_command_index()
+        super(CommandManager, self).__init__(
+            namespace, convert_underscores=convert_underscores
+        )
+
+    def _command_name(self, entry_point):
+        if self.convert_underscores:
+            return entry_point.name.replace('_', ' ')
+        return entry_point.name
+
+    def load_commands(self, namespace):
+        self.group_list.append(namespace)
+        ignored_modules = getattr(self, 'ignored_modules', None)
+        for ep in self.index.entry_points(namespace):
+            if ignored_modules and self._is_module_ignored(
+                module_name(ep), ignored_modules
+            ):
+                LOG.debug('Skipping command %r of an ignored module', ep.name)
+                continue
+
+            cmd_name = self._command_name(ep)
+            if cmd_name in self.commands:
+                LOG.warning(
+                    'found duplicate implementations of the %(name)r '
+                    'command in the following modules: %(modules)s',
+                    {
+                        'name': cmd_name,
+                        'modules': ', '.join(
+                            [self.commands[cmd_name].value, ep.value]
+                        ),
+                    },
+                )
+            self.commands[cmd_name] = ep
+
+    def get_command_names(self, group=None):
+        if group is None:
+            return list(self.commands.keys())
+        return [
+            self._command_name(ep) for ep in self.index.entry_points(group)
+        ]
+
+
+def _help_pager(stdout):
+    try:
+        import autopage.argparse
+    except ImportError:
+        return contextlib.nullcontext(stdout), False
+
+    pager = autopage.argparse.help_pager(stdout)
+    return pager, pager.to_terminal()
+
+
+class HelpAction(cliff_help.HelpAction):
+    """Print the help listing the commands
+
+    The descriptions of the commands are taken from the command index
+    whenever possible, so that the commands don't need to be imported.
+    The commands that aren't described in the index yet are imported as
+    usual and their descriptions recorded for the next time.
+    """
+
+    def _describe(self, app, name, ep, distributions):
+        factory = ep.load()
+        kwargs = {}
+        if 'cmd_name' in inspect.getfullargspec(factory.__init__).args:
+            kwargs['cmd_name'] = name
+        cmd = factory(app, None, **kwargs)
+        if cmd.deprecated:
+            return [None, None]
+
+        one_liner = cmd.get_description().split('\n')[0].rstrip('.')
+        module = inspect.getmodule(factory)
+        dist_name = distributions.get(module.__name__.partition('.')[0])
+        app_dist_name = distributions.get(
+            type(app).__module__.partition('.')[0]
+        )
+        if dist_name == app_dist_name:
+            dist_name = None
+        return [one_liner, dist_name]
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        app = self.default
+        command_manager = app.command_manager
+        index = getattr(command_manager, 'index', None)
+        if index is None:
+            return super(HelpAction, self).__call__(
+                parser, namespace, values, option_string
+            )
+
+        descriptions = index.get_descriptions()
+        learned = {}
+        distributions = None
+        pager, color = _help_pager(app.stdout)
+        with pager as out:
+            if color:
+                import autopage.argparse
+
+                autopage.argparse.use_color_for_parser(parser, color)
+            parser.print_help(out)
+            title_hl = ('\033[4m', '\033[0m') if color else ('', '')
+            out.write('\n%sCommands%s:\n' % title_hl)
+
+            for name, ep in sorted(command_manager):
+                description = descriptions.get(ep.value)
+                if description is None:
+                    if distributions is None:
+                        distributions = getattr(
+                            command, '_get_distributions_by_modules', dict
+                        )()
+                    try:
+                        description = self._describe(
+                            app, name, ep, distributions
+                        )
+                    except Exception as e:
+                        out.write('Could not load %r: %s\n' % (ep, e))
+                        continue
+                    learned[ep.value] = description
+
+                one_liner, dist_name = description
+                if one_liner is None:
+                    # Deprecated
+                    continue
+                dist_info = ' (%s)' % dist_name if dist_name else ''
+                padded_name = '%-13s' % name
+                if color:
+                    padded_name = '\033[36m%s\033[39m' % padded_name
+                    if dist_info:
+                        dist_info = '\033[90m%s\033[39m' % dist_info
+                out.write('  %s  %s%s\n' % (padded_name, one_liner, dist_info))
+
+        index.set_descriptions(learned)
+        raise cliff_help.HelpExit()
+
+
+class HelpCommand(cliff_help.HelpCommand):
+    """print detailed help for another command"""
+
+    def take_action(self, parsed_args):
+        if parsed_args.cmd:
+            return super(HelpCommand, self).take_action(parsed_args)
+
+        action = HelpAction([], dest=argparse.SUPPRESS, default=self.app)
+        action(self.app.parser, self.app.options, None, None)
+        return 0
@@ -0,0 +1,185 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Resumable downloads of concurrently fetched byte ranges"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from osc_lib import exceptions
+
+from openstackclient.common import parallel
+from openstackclient.i18n import _
+
+
+LOG = logging.getLogger(__name__)
+
+# Size of the byte ranges fetched concurrently
+DEFAULT_RANGE_SIZE = 32 * 1024**2
+
+# Suffix of the file next to a download that records the ranges already
+# fetched, so that an interrupted download can be resumed
+STATE_SUFFIX = '.download-state'
+
+# Size of the reads used to hash downloaded data
+_READ_SIZE = 4 * 1024**2
+
+
+def _read_state(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(path, state):
+    # Write atomically so that an interruption never leaves a torn file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def download_ranges(
+    path,
+    size,
+    fetch_range,
+    identity,
+    max_workers=1,
+    range_size=DEFAULT_RANGE_SIZE,
+    hasher=None,
+    progress=None,
+):
+    """Download data into ``path`` as concurrently fetched byte ranges
+
+    Ranges of ``range_size`` bytes are written in place into a file
+    preallocated to ``size`` bytes. The ranges completed so far are
+    recorded in a state file next to ``path``, so that running the download
+    again after an interruption only fetches the missing ranges, provided
+    ``identity`` still matches. The state file is removed once the download
+    is complete.
+
+    :param path: The file to download to.
+    :param size: The size of the data in bytes.
+    :param fetch_range: Called with the first and last (inclusive) offset
+        of a range, it must return an iterable of the chunks of the range.
+    :param identity: A dict of JSON serializable values identifying the
+        version of the data, such as its checksum.
+    :param max_workers: The maximum number of ranges fetched concurrently.
+    :param range_size: The size of the ranges in bytes.
+    :param hasher: An optional :class:`~openstackclient.common.hashing.Hasher`
+        that is fed the data in order as soon as the ranges preceding it
+        have completed, so the data is hashed while it is downloaded.
+    :param progress: An optional
+        :class:`~openstackclient.common.progressbar.ProgressReporter` to
+        report the downloaded bytes to.
+    """
+    state_file = path + STATE_SUFFIX
+    state = dict(identity, size=size, range_size=range_size)
+    saved = _read_state(state_file)
+    if (
+        isinstance(saved, dict)
+        and os.path.exists(path)
+        and all(saved.get(key) == value for key, value in state.items())
+    ):
+        LOG.debug('Resuming download to %s', path)
+        state['done'] = saved.get('done', [])
+        mode = 'r+b'
+    else:
+        state['done'] = []
+        mode = 'w+b'
+
+    count = (size + range_size - 1) // range_size
+    done = set(state['done'])
+
+    if progress is not None:
+        progress.resume(
+            sum(min(range_size, size - i * range_size) for i in done)
+        )
+
+    with open(path, mode) as f:
+        f.truncate(size)
+        lock = threading.Lock()
+
+        def _write(data, offset):
+            if hasattr(os, 'pwrite'):
+                os.pwrite(f.fileno(), data, offset)
+            else:
+                with lock:
+                    f.seek(offset)
+                    f.write(data)
+
+        def _read(offset, length):
+            if hasattr(os, 'pread'):
+                return os.pread(f.fileno(), length, offset)
+            with lock:
+                f.seek(offset)
+                return f.read(length)
+
+        def _fetch(index):
+            start = index * range_size
+            end = min(start + range_size, size) - 1
+            offset = start
+            for chunk in fetch_range(start, end):
+                _write(chunk, offset)
+                offset += len(chunk)
+                if progress is not None:
+                    progress.update(len(chunk))
+            if offset != end + 1:
+                msg = _("Incomplete download of bytes %(start)s-%(end)s")
+                raise exceptions.CommandError(
+                    msg % {'start': start, 'end': end}
+                )
+
+        hashed = 0
+
+        def _hash_completed():
+            # Feed the hasher the ranges that are complete up to the first
+            # missing one, reading them back while they are still cached
+            nonlocal hashed
+            while hashed < count and hashed in done:
+                offset = hashed * range_size
+                end = min(offset + range_size, size)
+                while offset < end:
+                    data = _read(offset, min(_READ_SIZE, end - offset))
+                    hasher.update(data)
+                    offset += len(data)
+                hashed += 1
+
+        if hasher is not None:
+            _hash_completed()
+
+        for index, _result, exc in parallel.run_concurrently(
+            _fetch,
+            (i for i in range(count) if i not in done),
+            max_workers=max_workers,
+        ):
+            if exc is not None:
+                # The state file keeps the progress made so far
+                raise exc
+            done.add(index)
+            state['done'] = sorted(done)
+            _write_state(state_file, state)
+            if hasher is not None:
+                _hash_completed()
+
+    if os.path.exists(state_file):
+        os.unlink(state_file)
@@ -163,7 +163,8 @@ class ShowExtension(command.ShowOne):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
 
-        extension = client.find_extension(
+        extension = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_extension,
             parsed_args.extension,
             ignore_missing=False,
         )
@@ -0,0 +1,160 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers for checksumming data while it is transferred"""
+
+import hashlib
+import io
+import queue
+import threading
+
+
+# Size of the reads from the underlying file, a multiple of the page size
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Number of blocks a hashing worker may lag behind the reader
+_QUEUE_DEPTH = 4
+
+_STOP = object()
+
+
+class Hasher(object):
+    """Compute a digest in a worker thread
+
+    Data passed to :meth:`update` is hashed by a separate thread so that
+    hashing overlaps with whatever the caller does next, typically network
+    I/O. ``hashlib`` releases the GIL while hashing large buffers, so this
+    is real parallelism. At most ``_QUEUE_DEPTH`` blocks are queued, which
+    bounds memory use when hashing is slower than the caller.
+
+    :param algorithm: The name of a ``hashlib`` algorithm.
+    """
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self._hash = hashlib.new(algorithm)
+        self._queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+        self._thread = None
+        self._hexdigest = None
+
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            if data is _STOP:
+                return
+            self._hash.update(data)
+
+    def update(self, data):
+        """Queue ``data`` to be hashed, it must not be modified afterwards"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._queue.put(data)
+
+    def close(self):
+        """Stop the worker once it has hashed all queued data"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def hexdigest(self):
+        """Return the digest of all data passed to :meth:`update`"""
+        if self._hexdigest is None:
+            self.close()
+            self._hexdigest = self._hash.hexdigest()
+        return self._hexdigest
+
+
+class HashingReader(object):
+    """A read-only file wrapper computing digests of the data read
+
+    The wrapped file is read in blocks of ``block_size`` bytes regardless
+    of how small the reads of the consumer are, and each block is handed to
+    a :class:`Hasher` per algorithm.
+
+    Seeking is only possible before the first read, so that consumers can
+    still determine the size of the data up front.
+
+    :param fp: The file object to read from.
+    :param algorithms: The names of the ``hashlib`` algorithms to compute.
+    :param block_size: The size of the reads from ``fp``.
+    """
+
+    def __init__(self, fp, algorithms=('md5',), block_size=None):
+        self._fp = fp
+        self._block_size = block_size or DEFAULT_BLOCK_SIZE
+        self._block = b''
+        self._offset = 0
+        self._started = False
+        self._hashers = [Hasher(algorithm) for algorithm in algorithms]
+
+    def _next_block(self):
+        self._block = self._fp.read(self._block_size)
+        self._offset = 0
+        for hasher in self._hashers:
+            if self._block:
+                hasher.update(self._block)
+            else:
+                hasher.close()
+        return self._block
+
+    def read(self, size=-1):
+        self._started = True
+        if size is None or size < 0:
+            chunks = [self._block[self._offset :]]
+            while self._next_block():
+                chunks.append(self._block)
+            self._offset = len(self._block)
+            return b''.join(chunks)
+
+        if self._offset >= len(self._block) and not self._next_block():
+            return b''
+
+        if self._offset == 0 and size >= len(self._block):
+            data = self._block
+        else:
+            data = self._block[self._offset : self._offset + size]
+        self._offset += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return not self._started and self._fp.seekable()
+
+    def tell(self):
+        if self._started:
+            raise io.UnsupportedOperation('tell')
+        return self._fp.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._started:
+            raise io.UnsupportedOperation('seek')
+        return self._fp.seek(offset, whence)
+
+    def stop(self):
+        """Stop the hashing workers, leaving the wrapped file open"""
+        for hasher in self._hashers:
+            hasher.close()
+
+    def close(self):
+        self.stop()
+        self._fp.close()
+
+    def hexdigests(self):
+        """Return a dict of algorithm name to digest of the data read"""
+        return {
+            hasher.algorithm: hasher.hexdigest() for hasher in self._hashers
+        }
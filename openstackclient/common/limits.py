@@ -78,17 +78,23 @@ class ShowLimits(command.Lister):
             identity_client = self.app.client_manager.identity
             if parsed_args.domain is not None:
                 domain = identity_common.find_domain(
-                    identity_client, parsed_args.domain
+                    identity_client,
+                    parsed_args.domain,
+                    resource_cache=self.app.client_manager.resource_cache,
+                )
+                project_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.projects,
+                        parsed_args.project,
+                        domain_id=domain.id,
+                    ).id
                 )
-                project_id = utils.find_resource(
-                    identity_client.projects,
-                    parsed_args.project,
-                    domain_id=domain.id,
-                ).id
             else:
-                project_id = utils.find_resource(
-                    identity_client.projects, parsed_args.project
-                ).id
+                project_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.projects, parsed_args.project
+                    ).id
+                )
 
         compute_limits = None
         volume_limits = None
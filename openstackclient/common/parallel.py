@@ -0,0 +1,186 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers for running independent API calls concurrently"""
+
+from concurrent import futures
+import itertools
+import queue
+import threading
+
+from osc_lib.cli import parseractions
+
+from openstackclient.i18n import _
+
+
+def add_parallel_option_to_parser(parser, default=1, help=None):
+    """Add the ``--parallel`` option to the parser.
+
+    :param parser: The parser to update.
+    :param default: The default number of workers.
+    :param help: The help of the option, for commands that use the workers
+        in a specific way.
+    """
+    if help is None:
+        help = _('Number of requests to run concurrently (default: %s)') % (
+            default
+        )
+    parser.add_argument(
+        '--parallel',
+        metavar='<num-workers>',
+        type=int,
+        action=parseractions.NonNegativeAction,
+        default=default,
+        help=help,
+    )
+
+
+def run_concurrently(func, items, max_workers=1):
+    """Call ``func`` once for each of ``items``.
+
+    Results are yielded as ``(item, result, exception)`` tuples in the
+    order the calls complete and ``items`` is consumed lazily. Exceptions
+    raised by ``func`` are returned rather than raised so that callers can
+    account for errors per item.
+
+    With ``max_workers`` of 1 or less the calls are made serially in the
+    calling thread, in the order of ``items``.
+
+    :param func: A callable taking a single item.
+    :param items: An iterable of items.
+    :param max_workers: The maximum number of concurrent calls.
+    """
+    if max_workers is None or max_workers <= 1:
+        for item in items:
+            try:
+                result = func(item)
+            except Exception as e:
+                yield item, None, e
+            else:
+                yield item, result, None
+        return
+
+    items = iter(items)
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        try:
+            while True:
+                # Keep a bounded number of calls queued so that arbitrarily
+                # long (or lazily produced) item lists use constant memory
+                for item in items:
+                    pending[executor.submit(func, item)] = item
+                    if len(pending) >= max_workers * 2:
+                        break
+                if not pending:
+                    return
+
+                done, _not_done = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        yield item, None, e
+                    else:
+                        yield item, result, None
+        finally:
+            # Don't start new calls if the consumer goes away early
+            for future in pending:
+                future.cancel()
+
+
+def prefetch(iterable):
+    """Yield the items of ``iterable``, producing the next one meanwhile.
+
+    The next item is produced in a background thread while the caller
+    handles the current one, which overlaps the two when producing an item
+    is slow, such as when it is fetched from an API. Items are still
+    produced one at a time and in order.
+
+    :param iterable: An iterable of items.
+    """
+    iterator = iter(iterable)
+    done = object()
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, iterator, done)
+        while True:
+            item = future.result()
+            if item is done:
+                return
+            future = executor.submit(next, iterator, done)
+            yield item
+
+
+def chain_concurrently(iterables, max_workers=1, buffer_size=2):
+    """Yield the items of several iterables, producing them concurrently.
+
+    Items are yielded in order, all the items of the first iterable then
+    all those of the second and so on, like :func:`itertools.chain`. Up to
+    ``max_workers`` iterables are iterated at once in background threads,
+    each buffering at most ``buffer_size`` items ahead of the caller.
+
+    :param iterables: An iterable of iterables.
+    :param max_workers: The maximum number of iterables iterated at once.
+    :param buffer_size: The number of items buffered per iterable.
+    """
+    if max_workers is None or max_workers <= 1:
+        yield from itertools.chain.from_iterable(iterables)
+        return
+
+    iterables = list(iterables)
+    done = object()
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=buffer_size) for _iterable in iterables]
+
+    def _put(q, item):
+        # Give up once the caller has gone away rather than block forever
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(iterable, q):
+        try:
+            for item in iterable:
+                if not _put(q, (item, None)):
+                    return
+        except Exception as e:
+            _put(q, (done, e))
+        else:
+            _put(q, (done, None))
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    producers = []
+    try:
+        # Iterables are started in order, so the one being consumed is
+        # always running or done
+        for iterable, q in zip(iterables, queues):
+            producers.append(executor.submit(_produce, iterable, q))
+        for q in queues:
+            while True:
+                item, exc = q.get()
+                if item is done:
+                    if exc is not None:
+                        raise exc
+                    break
+                yield item
+    finally:
+        stop.set()
+        for producer in producers:
+            producer.cancel()
+        executor.shutdown(wait=True)
@@ -14,6 +14,121 @@
 #    under the License.
 
 import sys
+import threading
+import time
+
+from osc_lib import utils
+
+
+# Minimum number of seconds between two redraws of a progress bar
+DEFAULT_INTERVAL = 0.2
+
+_BAR_WIDTH = 30
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return '%d:%02d:%02d' % (hours, minutes, seconds)
+
+
+class ProgressReporter(object):
+    """Report the progress of a data transfer.
+
+    Transferred bytes are counted on every :meth:`update`, but the progress
+    line, with throughput and estimated time remaining, is redrawn at most
+    every ``interval`` seconds so that transfers done in many small chunks
+    don't spend their time formatting output. :meth:`update` may be called
+    from several threads, e.g. by concurrent range downloads.
+
+    :param total: The total number of bytes to transfer, None if unknown.
+    :param stream: The stream to write to, defaults to sys.stderr so that
+        progress never mixes with data written to stdout.
+    :param interval: The minimum number of seconds between two redraws.
+
+    :note: The progress will be displayed only if the stream is a tty.
+    """
+
+    def __init__(self, total, stream=None, interval=DEFAULT_INTERVAL):
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.done = 0
+        self._show_progress = self.stream.isatty() and total != 0
+        self._lock = threading.Lock()
+        # Bytes transferred by an earlier attempt, see resume()
+        self._resumed = 0
+        self._start = None
+        self._last_draw = None
+        self._width = 0
+        self._finished = False
+
+    def _draw(self, now, final=False):
+        elapsed = now - self._start
+        transferred = self.done - self._resumed
+        rate = transferred / elapsed if elapsed > 0 else 0
+
+        if self.total:
+            fraction = min(self.done / float(self.total), 1.0)
+            # Output something like this: [==========>             ] 49%
+            line = '[{0:<{1}}] {2:.0%}'.format(
+                '=' * int(round(fraction * (_BAR_WIDTH - 1))) + '>',
+                _BAR_WIDTH,
+                fraction,
+            )
+        else:
+            line = '%sB' % utils.format_size(self.done)
+
+        if rate:
+            line += ' %sB/s' % utils.format_size(int(rate))
+            if self.total and not final:
+                eta = max(self.total - self.done, 0) / rate
+                line += ' ETA %s' % _format_duration(eta)
+
+        # Pad with spaces to wipe out the rest of a longer previous line
+        padding = ' ' * max(self._width - len(line), 0)
+        self._width = len(line)
+        self.stream.write('\r' + line + padding)
+        self.stream.flush()
+
+    def resume(self, count):
+        """Account for ``count`` bytes transferred by an earlier attempt.
+
+        They count towards the progress but not towards the throughput.
+        """
+        with self._lock:
+            self.done += count
+            self._resumed += count
+
+    def update(self, count):
+        """Account for ``count`` more bytes transferred."""
+        with self._lock:
+            self.done += count
+            if not self._show_progress or self._finished:
+                return
+            now = time.monotonic()
+            if self._start is None:
+                self._start = now
+            if (
+                self._last_draw is None
+                or now - self._last_draw >= self.interval
+            ):
+                self._last_draw = now
+                self._draw(now)
+
+    def finish(self):
+        """Draw the final state of the progress bar and end its line."""
+        with self._lock:
+            if not self._show_progress or self._finished:
+                return
+            self._finished = True
+            now = time.monotonic()
+            if self._start is None:
+                self._start = now
+            self._draw(now, final=True)
+            # Break to a new line from the progress bar for incoming output.
+            self.stream.write('\n')
+            self.stream.flush()
 
 
 class _ProgressBarBase(object):
@@ -24,26 +139,13 @@ class _ProgressBarBase(object):
 
     :param wrapped: Object to wrap that hold data to be consumed.
     :param totalsize: The total size of the data in the wrapped object.
-
-    :note: The progress will be displayed only if sys.stdout is a tty.
+    :param reporter: The :class:`ProgressReporter` to use, by default one
+        writing to sys.stderr is created.
     """
 
-    def __init__(self, wrapped, totalsize):
+    def __init__(self, wrapped, totalsize, reporter=None):
         self._wrapped = wrapped
-        self._totalsize = float(totalsize)
-        self._show_progress = sys.stdout.isatty() and self._totalsize != 0
-        self._percent = 0
-
-    def _display_progress_bar(self, size_read):
-        if self._show_progress:
-            self._percent += size_read / self._totalsize
-            # Output something like this: [==========>             ] 49%
-            sys.stdout.write(
-                '\r[{0:<30}] {1:.0%}'.format(
-                    '=' * int(round(self._percent * 29)) + '>', self._percent
-                )
-            )
-            sys.stdout.flush()
+        self._reporter = reporter or ProgressReporter(totalsize)
 
     def __getattr__(self, attr):
         # Forward other attribute access to the wrapped object.
@@ -53,17 +155,30 @@ class _ProgressBarBase(object):
 class VerboseFileWrapper(_ProgressBarBase):
     """A file wrapper with a progress bar.
 
-    The file wrapper shows and advances a progress bar whenever the
-    wrapped file's read method is called.
+    The file wrapper advances a progress bar whenever the wrapped file's
+    read method is called.
     """
 
     def read(self, *args, **kwargs):
         data = self._wrapped.read(*args, **kwargs)
         if data:
-            self._display_progress_bar(len(data))
+            self._reporter.update(len(data))
         else:
-            if self._show_progress:
-                # Break to a new line from the progress bar for incoming
-                # output.
-                sys.stdout.write('\n')
+            self._reporter.finish()
         return data
+
+
+class VerboseIteratorWrapper(_ProgressBarBase):
+    """An iterator wrapper with a progress bar.
+
+    The iterator wrapper advances a progress bar for every chunk of data
+    the wrapped iterator yields.
+    """
+
+    def __iter__(self):
+        try:
+            for chunk in self._wrapped:
+                self._reporter.update(len(chunk))
+                yield chunk
+        finally:
+            self._reporter.finish()
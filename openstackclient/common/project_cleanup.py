@@ -94,8 +94,10 @@ class ProjectCleanup(command.Command):
         if parsed_args.auth_project:
             project_connect = sdk
         elif parsed_args.project:
-            project = sdk.identity.find_project(
-                name_or_id=parsed_args.project, ignore_missing=False
+            project = self.app.client_manager.resource_cache.find_sdk_resource(
+                sdk.identity.find_project,
+                parsed_args.project,
+                ignore_missing=False,
             )
             project_connect = sdk.connect_as_project(project)
 
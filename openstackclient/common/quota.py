@@ -23,6 +23,7 @@ import sys
 from osc_lib.command import command
 from osc_lib import utils
 
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 from openstackclient.network import common
 
@@ -105,7 +106,7 @@ def _xform_get_quota(data, value, keys):
 def get_project(app, project):
     if project is not None:
         identity_client = app.client_manager.identity
-        project = utils.find_resource(
+        project = app.client_manager.resource_cache.find_resource(
             identity_client.projects,
             project,
         )
@@ -274,8 +275,57 @@ class ListQuota(command.Lister):
             default=False,
             help=_('List network quota'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
+    def _list_quotas(
+        self, project_ids, get_quota, get_default, keys, is_not_found, workers
+    ):
+        """Return the quotas of the projects that differ from the defaults.
+
+        The quotas of up to ``workers`` projects are fetched concurrently
+        and rows are yielded as each project completes. Default quotas are
+        the same for every project, so they are only fetched once. Without
+        concurrency the quotas are all fetched before any row is returned,
+        so that errors are raised before anything is output.
+
+        :param project_ids: The IDs of the projects to list quotas for.
+        :param get_quota: Called with a project ID to get its quotas.
+        :param get_default: Called with a project ID to get the defaults.
+        :param keys: The quota names to list.
+        :param is_not_found: Called with an exception raised by
+            ``get_quota``, returns whether to skip the project.
+        :param workers: The maximum number of concurrent requests.
+        """
+        result = self._iter_quotas(
+            project_ids, get_quota, get_default, keys, is_not_found, workers
+        )
+        if workers <= 1:
+            result = list(result)
+        return result
+
+    def _iter_quotas(
+        self, project_ids, get_quota, get_default, keys, is_not_found, workers
+    ):
+        default_data = None
+        for p, data, ex in parallel.run_concurrently(
+            get_quota, project_ids, max_workers=workers
+        ):
+            if ex is not None:
+                if is_not_found(ex):
+                    # Project not found, move on to next one
+                    LOG.warning("Project %s not found: %s" % (p, ex))
+                    continue
+                raise ex
+
+            if default_data is None:
+                default_data = get_default(p)
+
+            result_data = _xform_get_quota(data, p, keys)
+            result_default = _xform_get_quota(default_data, p, keys)
+            if result_default != result_data:
+                yield from result_data
+
     def _get_detailed_quotas(self, parsed_args):
         project_info = get_project(self.app, parsed_args.project)
         project = project_info['id']
@@ -355,14 +405,13 @@ class ListQuota(command.Lister):
             )
             self.log.warning(msg)
 
-        result = []
         project_ids = []
         if parsed_args.project is None:
             for p in self.app.client_manager.identity.projects.list():
                 project_ids.append(getattr(p, 'id', ''))
         else:
             identity_client = self.app.client_manager.identity
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.project,
             )
@@ -373,34 +422,18 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             compute_client = self.app.client_manager.compute
-            for p in project_ids:
-                try:
-                    data = compute_client.quotas.get(p)
-                except Exception as ex:
-                    if (
-                        type(ex).__name__ == 'NotFound'
-                        or ex.http_status >= 400
-                        and ex.http_status <= 499
-                    ):
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    COMPUTE_QUOTAS.keys(),
-                )
-                default_data = compute_client.quotas.defaults(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    COMPUTE_QUOTAS.keys(),
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = self._list_quotas(
+                project_ids,
+                compute_client.quotas.get,
+                compute_client.quotas.defaults,
+                COMPUTE_QUOTAS.keys(),
+                lambda ex: (
+                    type(ex).__name__ == 'NotFound'
+                    or ex.http_status >= 400
+                    and ex.http_status <= 499
+                ),
+                parsed_args.parallel,
+            )
 
             columns = (
                 'id',
@@ -440,30 +473,14 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             volume_client = self.app.client_manager.volume
-            for p in project_ids:
-                try:
-                    data = volume_client.quotas.get(p)
-                except Exception as ex:
-                    if type(ex).__name__ == 'NotFound':
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    VOLUME_QUOTAS.keys(),
-                )
-                default_data = volume_client.quotas.defaults(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    VOLUME_QUOTAS.keys(),
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = self._list_quotas(
+                project_ids,
+                volume_client.quotas.get,
+                volume_client.quotas.defaults,
+                VOLUME_QUOTAS.keys(),
+                lambda ex: type(ex).__name__ == 'NotFound',
+                parsed_args.parallel,
+            )
 
             columns = (
                 'id',
@@ -494,30 +511,14 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             client = self.app.client_manager.network
-            for p in project_ids:
-                try:
-                    data = client.get_quota(p)
-                except Exception as ex:
-                    if type(ex).__name__ == 'NotFound':
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    NETWORK_KEYS,
-                )
-                default_data = client.get_quota_default(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    NETWORK_KEYS,
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = self._list_quotas(
+                project_ids,
+                client.get_quota,
+                client.get_quota_default,
+                NETWORK_KEYS,
+                lambda ex: type(ex).__name__ == 'NotFound',
+                parsed_args.parallel,
+            )
 
             columns = (
                 'id',
@@ -731,7 +732,7 @@ class SetQuota(common.NetDetectionMixin, command.Command):
                     "supported."
                 )
         else:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.project,
             ).id
@@ -993,7 +994,7 @@ class DeleteQuota(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        project = utils.find_resource(
+        project = self.app.client_manager.resource_cache.find_resource(
             identity_client.projects,
             parsed_args.project,
         )
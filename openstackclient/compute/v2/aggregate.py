@@ -18,7 +18,6 @@
 
 import logging
 
-from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -69,8 +68,10 @@ class AddAggregateHost(command.ShowOne):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         aggregate = compute_client.add_host_to_aggregate(
@@ -150,8 +151,10 @@ class DeleteAggregate(command.Command):
         result = 0
         for a in parsed_args.aggregate:
             try:
-                aggregate = compute_client.find_aggregate(
-                    a, ignore_missing=False
+                aggregate = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        compute_client.find_aggregate, a, ignore_missing=False
+                    )
                 )
                 compute_client.delete_aggregate(
                     aggregate.id, ignore_missing=False
@@ -246,8 +249,10 @@ class RemoveAggregateHost(command.ShowOne):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         aggregate = compute_client.remove_host_from_aggregate(
@@ -302,8 +307,10 @@ class SetAggregate(command.Command):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         kwargs = {}
@@ -347,8 +354,10 @@ class ShowAggregate(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         # Remove availability_zone from metadata because Nova doesn't
@@ -387,8 +396,10 @@ class UnsetAggregate(command.Command):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         properties = {key: None for key in parsed_args.properties}
@@ -423,21 +434,27 @@ class CacheImageForAggregate(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        if not sdk_utils.supports_microversion(compute_client, '2.81'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.81'
+        ):
             msg = _(
                 'This operation requires server support for '
                 'API microversion 2.81'
             )
             raise exceptions.CommandError(msg)
 
-        aggregate = compute_client.find_aggregate(
-            parsed_args.aggregate, ignore_missing=False
+        aggregate = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_aggregate,
+            parsed_args.aggregate,
+            ignore_missing=False,
         )
 
         images = []
         for img in parsed_args.image:
-            image = self.app.client_manager.sdk_connection.image.find_image(
-                img, ignore_missing=False
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                self.app.client_manager.sdk_connection.image.find_image,
+                img,
+                ignore_missing=False,
             )
             images.append(image.id)
 
@@ -58,8 +58,10 @@ class ShowConsoleLog(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
-            name_or_id=parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         output = compute_client.get_server_console_output(
@@ -132,8 +134,10 @@ class ShowConsoleURL(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         data = compute_client.create_console(
@@ -18,7 +18,6 @@
 import logging
 
 from openstack import exceptions as sdk_exceptions
-from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -169,7 +168,9 @@ class CreateFlavor(command.ShowOne):
         }
 
         if parsed_args.description:
-            if not sdk_utils.supports_microversion(compute_client, '2.55'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.55'
+            ):
                 msg = _(
                     'The --description parameter requires server support for '
                     'API microversion 2.55'
@@ -186,6 +187,7 @@ class CreateFlavor(command.ShowOne):
                     identity_client,
                     parsed_args.project,
                     parsed_args.project_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
                 compute_client.flavor_add_tenant_access(flavor.id, project_id)
             except Exception as e:
@@ -228,7 +230,11 @@ class DeleteFlavor(command.Command):
         result = 0
         for f in parsed_args.flavor:
             try:
-                flavor = compute_client.find_flavor(f, ignore_missing=False)
+                flavor = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        compute_client.find_flavor, f, ignore_missing=False
+                    )
+                )
                 compute_client.delete_flavor(flavor.id)
             except Exception as e:
                 result += 1
@@ -425,14 +431,19 @@ class SetFlavor(command.Command):
         identity_client = self.app.client_manager.identity
 
         try:
-            flavor = compute_client.find_flavor(
-                parsed_args.flavor, get_extra_specs=True, ignore_missing=False
+            flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_flavor,
+                parsed_args.flavor,
+                get_extra_specs=True,
+                ignore_missing=False,
             )
         except sdk_exceptions.ResourceNotFound as e:
             raise exceptions.CommandError(e.message)
 
         if parsed_args.description:
-            if not sdk_utils.supports_microversion(compute_client, '2.55'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.55'
+            ):
                 msg = _(
                     'The --description parameter requires server support for '
                     'API microversion 2.55'
@@ -473,6 +484,7 @@ class SetFlavor(command.Command):
                         identity_client,
                         parsed_args.project,
                         parsed_args.project_domain,
+                        resource_cache=self.app.client_manager.resource_cache,
                     ).id
                     compute_client.flavor_add_tenant_access(
                         flavor.id, project_id
@@ -501,8 +513,11 @@ class ShowFlavor(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        flavor = compute_client.find_flavor(
-            parsed_args.flavor, get_extra_specs=True, ignore_missing=False
+        flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_flavor,
+            parsed_args.flavor,
+            get_extra_specs=True,
+            ignore_missing=False,
         )
 
         access_projects = None
@@ -573,8 +588,11 @@ class UnsetFlavor(command.Command):
         identity_client = self.app.client_manager.identity
 
         try:
-            flavor = compute_client.find_flavor(
-                parsed_args.flavor, get_extra_specs=True, ignore_missing=False
+            flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_flavor,
+                parsed_args.flavor,
+                get_extra_specs=True,
+                ignore_missing=False,
             )
         except sdk_exceptions.ResourceNotFound as e:
             raise exceptions.CommandError(_(e.message))
@@ -600,6 +618,7 @@ class UnsetFlavor(command.Command):
                     identity_client,
                     parsed_args.project,
                     parsed_args.project_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
                 compute_client.flavor_remove_tenant_access(
                     flavor.id, project_id
@@ -19,7 +19,6 @@ import json
 import re
 
 from novaclient import exceptions as nova_exceptions
-from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.command import command
 from osc_lib import exceptions
@@ -29,11 +28,11 @@ from openstackclient.common import pagination
 from openstackclient.i18n import _
 
 
-def _get_hypervisor_columns(item, client):
+def _get_hypervisor_columns(item, client, client_manager):
     column_map = {'name': 'hypervisor_hostname'}
     hidden_columns = ['location', 'servers']
 
-    if sdk_utils.supports_microversion(client, '2.88'):
+    if client_manager.supports_microversion(client, '2.88'):
         hidden_columns.extend(
             [
                 'current_workload',
@@ -99,7 +98,9 @@ class ListHypervisor(command.Lister):
             raise exceptions.CommandError(msg)
 
         if parsed_args.marker:
-            if not sdk_utils.supports_microversion(compute_client, '2.33'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.33'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.33 or greater is required to '
                     'support the --marker option'
@@ -108,7 +109,9 @@ class ListHypervisor(command.Lister):
             list_opts['marker'] = parsed_args.marker
 
         if parsed_args.limit:
-            if not sdk_utils.supports_microversion(compute_client, '2.33'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.33'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.33 or greater is required to '
                     'support the --limit option'
@@ -129,7 +132,9 @@ class ListHypervisor(command.Lister):
         columns = ('id', 'name', 'hypervisor_type', 'host_ip', 'state')
 
         if parsed_args.long:
-            if not sdk_utils.supports_microversion(compute_client, '2.88'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.88'
+            ):
                 column_headers += (
                     'vCPUs Used',
                     'vCPUs',
@@ -165,8 +170,10 @@ class ShowHypervisor(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        hypervisor = compute_client.find_hypervisor(
-            parsed_args.hypervisor, ignore_missing=False
+        hypervisor = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_hypervisor,
+            parsed_args.hypervisor,
+            ignore_missing=False,
         ).copy()
 
         # Some of the properties in the hypervisor object need to be processed
@@ -202,7 +209,9 @@ class ShowHypervisor(command.ShowOne):
             hypervisor['aggregates'] = member_of
 
         try:
-            if sdk_utils.supports_microversion(compute_client, '2.88'):
+            if self.app.client_manager.supports_microversion(
+                compute_client, '2.88'
+            ):
                 uptime = hypervisor['uptime'] or ''
                 del hypervisor['uptime']
             else:
@@ -230,12 +239,14 @@ class ShowHypervisor(command.ShowOne):
         hypervisor['service_host'] = service_details['host']
         del hypervisor['service_details']
 
-        if not sdk_utils.supports_microversion(compute_client, '2.28'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.28'
+        ):
             # microversion 2.28 transformed this to a JSON blob rather than a
             # string; on earlier fields, do this manually
             hypervisor['cpu_info'] = json.loads(hypervisor['cpu_info'] or '{}')
         display_columns, columns = _get_hypervisor_columns(
-            hypervisor, compute_client
+            hypervisor, compute_client, self.app.client_manager
         )
         data = utils.get_dict_properties(
             hypervisor,
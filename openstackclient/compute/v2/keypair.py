@@ -22,7 +22,6 @@ import os
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
-from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
@@ -168,7 +167,9 @@ class CreateKeypair(command.ShowOne):
                     )
 
         if parsed_args.type:
-            if not sdk_utils.supports_microversion(compute_client, '2.2'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.2'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.2 or greater is required to '
                     'support the --type option'
@@ -178,7 +179,9 @@ class CreateKeypair(command.ShowOne):
             kwargs['key_type'] = parsed_args.type
 
         if parsed_args.user:
-            if not sdk_utils.supports_microversion(compute_client, '2.10'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.10'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.10 or greater is required to '
                     'support the --user option'
@@ -189,6 +192,7 @@ class CreateKeypair(command.ShowOne):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         keypair = compute_client.create_keypair(**kwargs)
@@ -238,7 +242,9 @@ class DeleteKeypair(command.Command):
         result = 0
 
         if parsed_args.user:
-            if not sdk_utils.supports_microversion(compute_client, '2.10'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.10'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.10 or greater is required to '
                     'support the --user option'
@@ -249,6 +255,7 @@ class DeleteKeypair(command.Command):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         for n in parsed_args.name:
@@ -307,7 +314,9 @@ class ListKeypair(command.Lister):
         kwargs = {}
 
         if parsed_args.marker:
-            if not sdk_utils.supports_microversion(compute_client, '2.35'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.35'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.35 or greater is required '
                     'to support the --marker option'
@@ -317,7 +326,9 @@ class ListKeypair(command.Lister):
             kwargs['marker'] = parsed_args.marker
 
         if parsed_args.limit:
-            if not sdk_utils.supports_microversion(compute_client, '2.35'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.35'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.35 or greater is required '
                     'to support the --limit option'
@@ -327,7 +338,9 @@ class ListKeypair(command.Lister):
             kwargs['limit'] = parsed_args.limit
 
         if parsed_args.project:
-            if not sdk_utils.supports_microversion(compute_client, '2.10'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.10'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.10 or greater is required to '
                     'support the --project option'
@@ -347,6 +360,7 @@ class ListKeypair(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             users = identity_client.users.list(tenant_id=project)
 
@@ -355,7 +369,9 @@ class ListKeypair(command.Lister):
                 kwargs['user_id'] = user.id
                 data.extend(compute_client.keypairs(**kwargs))
         elif parsed_args.user:
-            if not sdk_utils.supports_microversion(compute_client, '2.10'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.10'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.10 or greater is required to '
                     'support the --user option'
@@ -366,6 +382,7 @@ class ListKeypair(command.Lister):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
             kwargs['user_id'] = user.id
 
@@ -375,7 +392,9 @@ class ListKeypair(command.Lister):
 
         columns = ("Name", "Fingerprint")
 
-        if sdk_utils.supports_microversion(compute_client, '2.2'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.2'
+        ):
             columns += ("Type",)
 
         return (
@@ -418,7 +437,9 @@ class ShowKeypair(command.ShowOne):
         kwargs = {}
 
         if parsed_args.user:
-            if not sdk_utils.supports_microversion(compute_client, '2.10'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.10'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.10 or greater is required to '
                     'support the --user option'
@@ -429,10 +450,14 @@ class ShowKeypair(command.ShowOne):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
-        keypair = compute_client.find_keypair(
-            parsed_args.name, **kwargs, ignore_missing=False
+        keypair = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_keypair,
+            parsed_args.name,
+            **kwargs,
+            ignore_missing=False
         )
 
         if not parsed_args.public_key:
@@ -16,17 +16,20 @@
 """Compute v2 Server action implementations"""
 
 import argparse
+import datetime
+import functools
 import getpass
 import io
+import itertools
 import json
 import logging
 import os
+import time
 
 from cliff import columns as cliff_columns
 import iso8601
 from novaclient import api_versions
 from openstack import exceptions as sdk_exceptions
-from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -34,6 +37,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.common import pagination
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common as network_common
@@ -42,6 +46,25 @@ LOG = logging.getLogger(__name__)
 
 IMAGE_STRING_FOR_BFV = 'N/A (booted from volume)'
 
+# Polling intervals, in seconds, used when waiting for servers
+_WAIT_INITIAL_INTERVAL = 2
+_WAIT_MAX_INTERVAL = 15
+
+# Number of servers resolved and output at a time by "server list --stream"
+_LIST_STREAM_BATCH_SIZE = 1000
+
+# How far back to look for changes when listing servers while waiting, to
+# allow for clock skew between the client and the server
+_WAIT_CLOCK_SKEW = datetime.timedelta(minutes=5)
+
+# Number of image IDs per "id=in:" image listing. An ID is 36 characters so
+# this keeps the query string around 3.7k characters, well below the 8190
+# character default URL limit of Apache
+_IMAGE_LOOKUP_CHUNK_SIZE = 100
+
+# Number of image listings run concurrently when resolving image names
+_IMAGE_LOOKUP_WORKERS = 4
+
 
 class PowerStateColumn(cliff_columns.FormattableColumn):
     """Generate a formatted string of a server's power state."""
@@ -314,6 +337,252 @@ def boolenv(*vars, default=False):
     return default
 
 
+def _call_with_server_id(client_manager, name_or_id, func, **kwargs):
+    """Resolve a server name or ID and call ``func`` with the server ID.
+
+    Lookups are served from the client manager's resource cache where
+    possible. If ``func`` fails with NotFoundException for a cached ID, the
+    server was deleted or replaced since, so the name is resolved again
+    once.
+    Lookups across all projects bypass the cache since names are only
+    meaningful within a project.
+
+    :param client_manager: The client manager.
+    :param name_or_id: The server name or ID.
+    :param func: A callable taking the server ID.
+    :param kwargs: Additional arguments to pass to ``find_server``.
+    :returns: The result of ``func``.
+    """
+    compute_client = client_manager.sdk_connection.compute
+
+    def _find(server):
+        try:
+            return compute_client.find_server(
+                server, ignore_missing=False, **kwargs
+            )
+        except sdk_exceptions.HttpException as exc:
+            if 'all_projects' in kwargs and exc.status_code == 403:
+                msg = _("Policy doesn't allow passing all-projects")
+                raise exceptions.Forbidden(msg)
+            raise
+
+    if kwargs.get('all_projects'):
+        return func(_find(name_or_id).id)
+
+    return client_manager.resource_cache.call_with_id(
+        'server',
+        name_or_id,
+        _find,
+        func,
+        stale=(sdk_exceptions.NotFoundException,),
+    )
+
+
+def _batched(iterable, size):
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _find_image_names(client_manager, image_client, image_ids, one_by_one):
+    """Resolve image IDs to image names.
+
+    Names are served from the client manager's resource cache where
+    possible. The remaining images are either fetched one by one or listed
+    in chunks of ``_IMAGE_LOOKUP_CHUNK_SIZE`` IDs, with up to
+    ``_IMAGE_LOOKUP_WORKERS`` listings running concurrently. Image names
+    are not crucial, so failed lookups are logged and skipped.
+
+    :param client_manager: The client manager.
+    :param image_client: An SDK image client.
+    :param image_ids: The IDs of the images to resolve.
+    :param one_by_one: Fetch each image individually instead of listing
+        them.
+    :returns: A dict of image ID to image name for the images found.
+    """
+    resource_cache = client_manager.resource_cache
+    names = {}
+    missing = []
+    for image_id in image_ids:
+        name = resource_cache.get('image_name', image_id)
+        if name is not None:
+            names[image_id] = name
+        else:
+            missing.append(image_id)
+
+    found = {}
+    if one_by_one:
+        for image_id in missing:
+            try:
+                found[image_id] = image_client.get_image(image_id).name
+            except Exception as e:
+                LOG.debug('Unable to get image %s: %s', image_id, e)
+    elif missing:
+        # some deployments can have *loads* of images so we only want to
+        # list the ones we care about. It would be better to only return
+        # the *fields* we care about (name) but glance doesn't support that
+        def _list_images(chunk):
+            return list(image_client.images(id=f"in:{','.join(chunk)}"))
+
+        for chunk, images, exc in parallel.run_concurrently(
+            _list_images,
+            _batched(missing, _IMAGE_LOOKUP_CHUNK_SIZE),
+            max_workers=_IMAGE_LOOKUP_WORKERS,
+        ):
+            if exc is not None:
+                LOG.debug('Unable to list %d images: %s', len(chunk), exc)
+                continue
+            for image in images:
+                found[image.id] = image.name
+
+    resource_cache.set_many('image_name', found)
+    names.update(found)
+    return names
+
+
+def _wait_for_servers(
+    compute_client,
+    server_ids,
+    success_status=('active',),
+    error_status=('error',),
+    wait_for_delete=False,
+    all_projects=False,
+    timeout=None,
+    callback=None,
+):
+    """Wait for one or more servers to reach a status or be deleted.
+
+    Rather than polling each server in turn, a single listing of the
+    servers changed since the wait started is fetched per poll interval and
+    used to check every pending server. A lone pending server is fetched
+    directly. The interval grows from ``_WAIT_INITIAL_INTERVAL`` to
+    ``_WAIT_MAX_INTERVAL`` while the servers are still busy.
+
+    :param compute_client: An SDK compute client.
+    :param server_ids: The IDs of the servers to wait for.
+    :param success_status: The statuses signalling completion.
+    :param error_status: The statuses signalling failure.
+    :param wait_for_delete: Wait for the servers to go away instead.
+    :param all_projects: Whether the servers may belong to other projects.
+    :param timeout: Give up after this many seconds; None to wait forever.
+    :param callback: Called after each poll with the average progress of
+        the servers, as a percentage.
+    :returns: The IDs of the servers that failed or timed out.
+    """
+    pending = list(dict.fromkeys(server_ids))
+    total = len(pending)
+    progress = {}
+    failed = []
+    since = datetime.datetime.now(datetime.timezone.utc) - _WAIT_CLOCK_SKEW
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = _WAIT_INITIAL_INTERVAL
+
+    while pending:
+        if len(pending) > 1:
+            changed = {
+                s.id: s
+                for s in compute_client.servers(
+                    details=True,
+                    all_projects=all_projects,
+                    changes_since=since.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                )
+            }
+        else:
+            changed = {}
+
+        for server_id in list(pending):
+            server = changed.get(server_id)
+            if server is None:
+                # Not in the listing (or not listed at all): look it up
+                try:
+                    server = compute_client.get_server(server_id)
+                except sdk_exceptions.NotFoundException:
+                    server = None
+
+            status = (getattr(server, 'status', None) or '').lower()
+            if wait_for_delete and (server is None or status == 'deleted'):
+                done = True
+            elif server is None:
+                LOG.error(_('Server %s disappeared while waiting'), server_id)
+                failed.append(server_id)
+                done = True
+            elif status in error_status:
+                LOG.error(
+                    _('Server %(server)s went to status %(status)s'),
+                    {'server': server_id, 'status': status},
+                )
+                failed.append(server_id)
+                done = True
+            else:
+                done = not wait_for_delete and status in success_status
+
+            if done:
+                pending.remove(server_id)
+                progress[server_id] = 100
+            else:
+                progress[server_id] = getattr(server, 'progress', None) or 0
+                LOG.debug(
+                    'Server %s is %s, progress %s%%',
+                    server_id,
+                    status,
+                    progress[server_id],
+                )
+
+        if callback:
+            callback(int(sum(progress.values()) / total))
+
+        if not pending:
+            break
+
+        if deadline is not None and time.monotonic() >= deadline:
+            for server_id in pending:
+                LOG.error(_('Timed out waiting for server %s'), server_id)
+            failed.extend(pending)
+            break
+
+        time.sleep(interval)
+        interval = min(interval * 1.5, _WAIT_MAX_INTERVAL)
+
+    return failed
+
+
+def _run_for_servers(parsed_args, func, verb):
+    """Call ``func`` for each server in ``parsed_args.server``.
+
+    Servers are handled concurrently if ``--parallel`` was given. Failures
+    are logged per server and reported together once every server has been
+    handled, following the rules in doc/source/command-errors.rst.
+
+    :param parsed_args: The parsed arguments of the command.
+    :param func: A callable taking a server name or ID.
+    :param verb: The action, used in error messages.
+    """
+    ret = 0
+    for server, result, exc in parallel.run_concurrently(
+        func, parsed_args.server, max_workers=parsed_args.parallel
+    ):
+        if exc is not None:
+            msg = _(
+                "Failed to %(verb)s server with name or ID "
+                "'%(server)s': %(e)s"
+            ) % {'verb': verb, 'server': server, 'e': exc}
+            LOG.error(msg)
+            ret += 1
+
+    if ret:
+        total = len(parsed_args.server)
+        msg = _("%(num)s of %(total)s servers failed to %(verb)s.") % {
+            'num': ret,
+            'total': total,
+            'verb': verb,
+        }
+        raise exceptions.CommandError(msg)
+
+
 class AddFixedIP(command.ShowOne):
     _description = _("Add fixed IP address to server")
 
@@ -348,12 +617,16 @@ class AddFixedIP(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         if parsed_args.tag:
-            if not sdk_utils.supports_microversion(compute_client, '2.49'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.49'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.49 or greater is required to '
                     'support the --tag option'
@@ -362,8 +635,10 @@ class AddFixedIP(command.ShowOne):
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            net_id = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_network,
+                parsed_args.network,
+                ignore_missing=False,
             ).id
         else:
             net_id = parsed_args.network
@@ -396,7 +671,9 @@ class AddFixedIP(command.ShowOne):
         )
 
         if parsed_args.tag:
-            if sdk_utils.supports_microversion(compute_client, '2.49'):
+            if self.app.client_manager.supports_microversion(
+                compute_client, '2.49'
+            ):
                 columns += ('tag',)
                 column_headers += ('Tag',)
 
@@ -444,11 +721,12 @@ class AddFloatingIP(network_common.NetworkAndComputeCommand):
         compute_client = self.app.client_manager.compute
 
         attrs = {}
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.ip_address,
             ignore_missing=False,
         )
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -535,14 +813,18 @@ class AddPort(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            port_id = network_client.find_port(
-                parsed_args.port, ignore_missing=False
+            port_id = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_port,
+                parsed_args.port,
+                ignore_missing=False,
             ).id
         else:
             port_id = parsed_args.port
@@ -550,7 +832,9 @@ class AddPort(command.Command):
         kwargs = {'port_id': port_id}
 
         if parsed_args.tag:
-            if not sdk_utils.supports_microversion(compute_client, '2.49'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.49'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.49 or greater is required to '
                     'support the --tag option'
@@ -589,14 +873,18 @@ class AddNetwork(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            net_id = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_network,
+                parsed_args.network,
+                ignore_missing=False,
             ).id
         else:
             net_id = parsed_args.network
@@ -604,7 +892,9 @@ class AddNetwork(command.Command):
         kwargs = {'net_id': net_id}
 
         if parsed_args.tag:
-            if not sdk_utils.supports_microversion(compute_client, '2.49'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.49'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.49 or greater is required to '
                     'support the --tag option'
@@ -636,7 +926,7 @@ class AddServerSecurityGroup(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -705,11 +995,13 @@ with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
         compute_client = self.app.client_manager.sdk_connection.compute
         volume_client = self.app.client_manager.sdk_connection.volume
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
-        volume = volume_client.find_volume(
+        volume = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_volume,
             parsed_args.volume,
             ignore_missing=False,
         )
@@ -717,7 +1009,9 @@ with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
         kwargs = {"volumeId": volume.id, "device": parsed_args.device}
 
         if parsed_args.tag:
-            if not sdk_utils.supports_microversion(compute_client, '2.49'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.49'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.49 or greater is required to '
                     'support the --tag option'
@@ -727,7 +1021,9 @@ with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
             kwargs['tag'] = parsed_args.tag
 
         if parsed_args.enable_delete_on_termination:
-            if not sdk_utils.supports_microversion(compute_client, '2.79'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.79'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.79 or greater is required to '
                     'support the --enable-delete-on-termination option.'
@@ -737,7 +1033,9 @@ with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
             kwargs['delete_on_termination'] = True
 
         if parsed_args.disable_delete_on_termination:
-            if not sdk_utils.supports_microversion(compute_client, '2.79'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.79'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.79 or greater is required to '
                     'support the --disable-delete-on-termination option.'
@@ -753,10 +1051,14 @@ with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
 
         columns = ('id', 'server id', 'volume id', 'device')
         column_headers = ('ID', 'Server ID', 'Volume ID', 'Device')
-        if sdk_utils.supports_microversion(compute_client, '2.49'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.49'
+        ):
             columns += ('tag',)
             column_headers += ('Tag',)
-        if sdk_utils.supports_microversion(compute_client, '2.79'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.79'
+        ):
             columns += ('delete_on_termination',)
             column_headers += ('Delete On Termination',)
 
@@ -1439,8 +1741,10 @@ class CreateServer(command.ShowOne):
         # Lookup parsed_args.image
         image = None
         if parsed_args.image:
-            image = image_client.find_image(
-                parsed_args.image, ignore_missing=False
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image,
+                parsed_args.image,
+                ignore_missing=False,
             )
 
         if not image and parsed_args.image_properties:
@@ -1510,7 +1814,7 @@ class CreateServer(command.ShowOne):
                 msg = _('--volume is not allowed with --boot-from-volume')
                 raise exceptions.CommandError(msg)
 
-            volume = utils.find_resource(
+            volume = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volumes,
                 parsed_args.volume,
             ).id
@@ -1522,12 +1826,12 @@ class CreateServer(command.ShowOne):
                 msg = _('--snapshot is not allowed with --boot-from-volume')
                 raise exceptions.CommandError(msg)
 
-            snapshot = utils.find_resource(
+            snapshot = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volume_snapshots,
                 parsed_args.snapshot,
             ).id
 
-        flavor = utils.find_resource(
+        flavor = self.app.client_manager.resource_cache.find_resource(
             compute_client.flavors, parsed_args.flavor
         )
 
@@ -1652,16 +1956,20 @@ class CreateServer(command.ShowOne):
             # The 'uuid' field isn't necessarily a UUID yet; let's validate it
             # just in case
             if mapping['source_type'] == 'volume':
-                volume_id = utils.find_resource(
-                    volume_client.volumes,
-                    mapping['uuid'],
-                ).id
+                volume_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volumes,
+                        mapping['uuid'],
+                    ).id
+                )
                 mapping['uuid'] = volume_id
             elif mapping['source_type'] == 'snapshot':
-                snapshot_id = utils.find_resource(
-                    volume_client.volume_snapshots,
-                    mapping['uuid'],
-                ).id
+                snapshot_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_snapshots,
+                        mapping['uuid'],
+                    ).id
+                )
                 mapping['uuid'] = snapshot_id
             elif mapping['source_type'] == 'image':
                 # NOTE(mriedem): In case --image is specified with the same
@@ -1675,10 +1983,13 @@ class CreateServer(command.ShowOne):
                 # one specified by --image, then the compute service will
                 # create a volume from the image and attach it to the
                 # server as a non-root volume.
-                image_id = image_client.find_image(
-                    mapping['uuid'],
-                    ignore_missing=False,
-                ).id
+                image_id = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        image_client.find_image,
+                        mapping['uuid'],
+                        ignore_missing=False,
+                    ).id
+                )
                 mapping['uuid'] = image_id
 
             block_device_mapping_v2.append(mapping)
@@ -1803,16 +2114,19 @@ class CreateServer(command.ShowOne):
 
                 if self.app.client_manager.is_network_endpoint_enabled():
                     network_client = self.app.client_manager.network
+                    resource_cache = self.app.client_manager.resource_cache
 
                     if nic['net-id']:
-                        net = network_client.find_network(
+                        net = resource_cache.find_sdk_resource(
+                            network_client.find_network,
                             nic['net-id'],
                             ignore_missing=False,
                         )
                         nic['net-id'] = net.id
 
                     if nic['port-id']:
-                        port = network_client.find_port(
+                        port = resource_cache.find_sdk_resource(
+                            network_client.find_port,
                             nic['port-id'],
                             ignore_missing=False,
                         )
@@ -1845,8 +2159,10 @@ class CreateServer(command.ShowOne):
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
             for each_sg in parsed_args.security_group:
-                sg = network_client.find_security_group(
-                    each_sg, ignore_missing=False
+                sg = self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_security_group,
+                    each_sg,
+                    ignore_missing=False,
                 )
                 # Use security group ID to avoid multiple security group have
                 # same name in neutron networking backend
@@ -2020,7 +2336,9 @@ class CreateServerDump(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for name_or_id in parsed_args.server:
-            server = compute_client.find_server(name_or_id)
+            server = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_server, name_or_id
+            )
             server.trigger_crash_dump(compute_client)
 
 
@@ -2063,8 +2381,9 @@ class DeleteServer(command.Command):
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.compute
+        server_ids = []
         for server in parsed_args.server:
-            server_obj = utils.find_resource(
+            server_obj = self.app.client_manager.resource_cache.find_resource(
                 compute_client.servers,
                 server,
                 all_tenants=parsed_args.all_projects,
@@ -2074,17 +2393,23 @@ class DeleteServer(command.Command):
                 compute_client.servers.force_delete(server_obj.id)
             else:
                 compute_client.servers.delete(server_obj.id)
+            server_ids.append(server_obj.id)
 
-            if parsed_args.wait:
-                if not utils.wait_for_delete(
-                    compute_client.servers,
-                    server_obj.id,
-                    callback=_show_progress,
-                ):
-                    msg = _('Error deleting server: %s')
-                    LOG.error(msg, server_obj.id)
-                    self.app.stdout.write(_('Error deleting server\n'))
-                    raise SystemExit
+        if parsed_args.wait:
+            failed = _wait_for_servers(
+                self.app.client_manager.sdk_connection.compute,
+                server_ids,
+                wait_for_delete=True,
+                all_projects=parsed_args.all_projects,
+                timeout=300,
+                callback=_show_progress,
+            )
+            if failed:
+                msg = _('Error deleting server: %s')
+                for server_id in failed:
+                    LOG.error(msg, server_id)
+                self.app.stdout.write(_('Error deleting server\n'))
+                raise SystemExit
 
 
 def percent_type(x):
@@ -2372,6 +2697,17 @@ class ListServer(command.Lister):
             ),
         )
         pagination.add_marker_pagination_option_to_parser(parser)
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            default=False,
+            help=_(
+                'Resolve names and output servers in batches as they are '
+                'retrieved rather than after retrieving all servers. This '
+                'bounds memory use for very large listings. The '
+                '"Host Status" column is shown based on the first batch.'
+            ),
+        )
         parser.add_argument(
             '--changes-before',
             metavar='<changes-before>',
@@ -2440,6 +2776,9 @@ class ListServer(command.Lister):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
+        supports_microversion = functools.partial(
+            self.app.client_manager.supports_microversion, compute_client
+        )
         identity_client = self.app.client_manager.identity
         image_client = self.app.client_manager.image
 
@@ -2449,6 +2788,7 @@ class ListServer(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             parsed_args.all_projects = True
 
@@ -2458,13 +2798,16 @@ class ListServer(command.Lister):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         # Nova only supports list servers searching by flavor ID. So if a
         # flavor name is given, map it to ID.
         flavor_id = None
         if parsed_args.flavor:
-            flavor = compute_client.find_flavor(parsed_args.flavor)
+            flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_flavor, parsed_args.flavor
+            )
             if flavor is None:
                 msg = _('Unable to find flavor: %s') % parsed_args.flavor
                 raise exceptions.CommandError(msg)
@@ -2474,10 +2817,13 @@ class ListServer(command.Lister):
         # image name is given, map it to ID.
         image_id = None
         if parsed_args.image:
-            image_id = image_client.find_image(
-                parsed_args.image,
-                ignore_missing=False,
-            ).id
+            image_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    image_client.find_image,
+                    parsed_args.image,
+                    ignore_missing=False,
+                ).id
+            )
 
         search_opts = {
             'reservation_id': parsed_args.reservation_id,
@@ -2530,7 +2876,7 @@ class ListServer(command.Lister):
             search_opts['power_state'] = power_state
 
         if parsed_args.tags:
-            if not sdk_utils.supports_microversion(compute_client, '2.26'):
+            if not supports_microversion('2.26'):
                 msg = _(
                     '--os-compute-api-version 2.26 or greater is required to '
                     'support the --tag option'
@@ -2540,7 +2886,7 @@ class ListServer(command.Lister):
             search_opts['tags'] = ','.join(parsed_args.tags)
 
         if parsed_args.not_tags:
-            if not sdk_utils.supports_microversion(compute_client, '2.26'):
+            if not supports_microversion('2.26'):
                 msg = _(
                     '--os-compute-api-version 2.26 or greater is required to '
                     'support the --not-tag option'
@@ -2550,7 +2896,7 @@ class ListServer(command.Lister):
             search_opts['not-tags'] = ','.join(parsed_args.not_tags)
 
         if parsed_args.locked:
-            if not sdk_utils.supports_microversion(compute_client, '2.73'):
+            if not supports_microversion('2.73'):
                 msg = _(
                     '--os-compute-api-version 2.73 or greater is required to '
                     'support the --locked option'
@@ -2559,7 +2905,7 @@ class ListServer(command.Lister):
 
             search_opts['locked'] = True
         elif parsed_args.unlocked:
-            if not sdk_utils.supports_microversion(compute_client, '2.73'):
+            if not supports_microversion('2.73'):
                 msg = _(
                     '--os-compute-api-version 2.73 or greater is required to '
                     'support the --unlocked option'
@@ -2575,7 +2921,7 @@ class ListServer(command.Lister):
         LOG.debug('search options: %s', search_opts)
 
         if search_opts['changes-before']:
-            if not sdk_utils.supports_microversion(compute_client, '2.66'):
+            if not supports_microversion('2.66'):
                 msg = _('--os-compute-api-version 2.66 or later is required')
                 raise exceptions.CommandError(msg)
 
@@ -2639,7 +2985,7 @@ class ListServer(command.Lister):
         # microversion 2.47 puts the embedded flavor into the server response
         # body but omits the id, so if not present we just expose the original
         # flavor name in the output
-        if sdk_utils.supports_microversion(compute_client, '2.47'):
+        if supports_microversion('2.47'):
             columns += ('flavor_name',)
             column_headers += ('Flavor',)
         else:
@@ -2720,62 +3066,153 @@ class ListServer(command.Lister):
             if parsed_args.deleted:
                 marker_id = parsed_args.marker
             else:
-                marker_id = compute_client.find_server(parsed_args.marker).id
+                marker_id = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        compute_client.find_server, parsed_args.marker
+                    ).id
+                )
             search_opts['marker'] = marker_id
 
-        data = list(compute_client.servers(**search_opts))
-
+        # Name lookups are shared between batches so that each image and
+        # flavor is only looked up once, and the flavors are listed at most
+        # once even if that fails or returns nothing
         images = {}
         flavors = {}
+        flavors_listed = False
+
+        def _populate_names(batch):
+            nonlocal flavors_listed
+            if self._populate_names(
+                compute_client,
+                image_client,
+                parsed_args,
+                batch,
+                images,
+                flavors,
+                image_filtered=bool(image_id),
+                flavor_filtered=bool(flavor_id),
+                list_flavors=not flavors_listed,
+            ):
+                flavors_listed = True
+            return batch
+
+        servers = compute_client.servers(**search_opts)
+        if parsed_args.stream:
+            batches = (
+                _populate_names(batch)
+                for batch in _batched(servers, _LIST_STREAM_BATCH_SIZE)
+            )
+            first_batch = next(batches, [])
+            batches = itertools.chain([first_batch], batches)
+        else:
+            first_batch = _populate_names(list(servers))
+            batches = [first_batch]
+
+        # The host_status field contains the status of the compute host the
+        # server is on. It is only returned by the API when the nova-api
+        # policy allows. Users can look at the host_status field when, for
+        # example, their server has status ACTIVE but is unresponsive. The
+        # host_status field can indicate a possible problem on the host
+        # it's on, providing useful information to a user in this
+        # situation.
+        if supports_microversion('2.16') and parsed_args.long:
+            if any([s.host_status is not None for s in first_batch]):
+                columns += ('Host Status',)
+                column_headers += ('Host Status',)
+
+        table = (
+            column_headers,
+            (
+                utils.get_item_properties(
+                    s,
+                    columns,
+                    mixed_case_fields=(
+                        'task_state',
+                        'power_state',
+                        'availability_zone',
+                        'host',
+                    ),
+                    formatters={
+                        'power_state': PowerStateColumn,
+                        'addresses': AddressesColumn,
+                        'metadata': format_columns.DictColumn,
+                        'security_groups_name': format_columns.ListColumn,
+                        'hypervisor_hostname': HostColumn,
+                    },
+                )
+                for batch in batches
+                for s in batch
+            ),
+        )
+        return table
+
+    def _populate_names(
+        self,
+        compute_client,
+        image_client,
+        parsed_args,
+        data,
+        images,
+        flavors,
+        image_filtered=False,
+        flavor_filtered=False,
+        list_flavors=True,
+    ):
+        """Populate name attributes of a batch of servers.
+
+        :param data: The servers to update.
+        :param images: A dict of image ID to image name, extended with the
+            images of this batch.
+        :param flavors: A dict of flavor ID to flavor, extended with the
+            flavors of this batch.
+        :param image_filtered: Whether the listing was filtered by image, in
+            which case images are looked up one by one.
+        :param flavor_filtered: Whether the listing was filtered by flavor,
+            in which case flavors are looked up one by one.
+        :param list_flavors: Whether all flavors may be listed, which is only
+            needed once per command.
+        :returns: True if all flavors were listed for this batch.
+        """
+        supports_microversion = functools.partial(
+            self.app.client_manager.supports_microversion, compute_client
+        )
+
+        flavors_listed = False
         if data and not parsed_args.no_name_lookup:
             # partial responses from down cells will not have an image
             # attribute so we use getattr
             image_ids = {
                 s.image['id']
                 for s in data
-                if getattr(s, 'image', None) and s.image.get('id')
+                if getattr(s, 'image', None)
+                and s.image.get('id')
+                and s.image['id'] not in images
             }
 
-            # create a dict that maps image_id to image object, which is used
+            # create a dict that maps image_id to image name, which is used
             # to display the "Image Name" column. Note that 'image.id' can be
             # empty for BFV instances and 'image' can be missing entirely if
             # there are infra failures
-            if parsed_args.name_lookup_one_by_one or image_id:
-                for image_id in image_ids:
-                    # "Image Name" is not crucial, so we swallow any exceptions
-                    try:
-                        images[image_id] = image_client.get_image(image_id)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    # some deployments can have *loads* of images so we only
-                    # want to list the ones we care about. It would be better
-                    # to only retrun the *fields* we care about (name) but
-                    # glance doesn't support that
-                    # NOTE(stephenfin): This could result in super long URLs
-                    # but it seems unlikely to cause issues. Apache supports
-                    # URL lengths of up to 8190 characters by default, which
-                    # should allow for more than 220 unique image ID (different
-                    # servers are likely use the same image ID) in the filter.
-                    # Who'd need more than that in a single command?
-                    images_list = image_client.images(
-                        id=f"in:{','.join(image_ids)}"
-                    )
-                    for i in images_list:
-                        images[i.id] = i
-                except Exception:
-                    pass
+            images.update(
+                _find_image_names(
+                    self.app.client_manager,
+                    image_client,
+                    image_ids,
+                    parsed_args.name_lookup_one_by_one or image_filtered,
+                )
+            )
 
             # create a dict that maps flavor_id to flavor object, which is used
             # to display the "Flavor Name" column. Note that 'flavor.id' is not
             # present on microversion 2.47 or later and 'flavor' won't be
             # present if there are infra failures
-            if parsed_args.name_lookup_one_by_one or flavor_id:
+            if parsed_args.name_lookup_one_by_one or flavor_filtered:
                 for f_id in set(
                     s.flavor['id']
                     for s in data
-                    if s.flavor and s.flavor.get('id')
+                    if s.flavor
+                    and s.flavor.get('id')
+                    and s.flavor['id'] not in flavors
                 ):
                     # "Flavor Name" is not crucial, so we swallow any
                     # exceptions
@@ -2783,7 +3220,8 @@ class ListServer(command.Lister):
                         flavors[f_id] = compute_client.find_flavor(f_id)
                     except Exception:
                         pass
-            else:
+            elif list_flavors:
+                flavors_listed = True
                 try:
                     flavors_list = compute_client.flavors(is_public=None)
                     for i in flavors_list:
@@ -2793,8 +3231,10 @@ class ListServer(command.Lister):
 
         # Populate image_name, image_id, flavor_name and flavor_id attributes
         # of server objects so that we can display those columns.
+        supports_v269 = supports_microversion('2.69')
+        supports_v247 = supports_microversion('2.47')
         for s in data:
-            if sdk_utils.supports_microversion(compute_client, '2.69'):
+            if supports_v269:
                 # NOTE(tssurya): From 2.69, we will have the keys 'flavor'
                 # and 'image' missing in the server response during
                 # infrastructure failure situations.
@@ -2804,9 +3244,9 @@ class ListServer(command.Lister):
                     continue
 
             if 'id' in s.image and s.image.id is not None:
-                image = images.get(s.image['id'])
-                if image:
-                    s.image_name = image.name
+                image_name = images.get(s.image['id'])
+                if image_name:
+                    s.image_name = image_name
                 s.image_id = s.image['id']
             else:
                 # NOTE(melwitt): An server booted from a volume will have no
@@ -2816,7 +3256,7 @@ class ListServer(command.Lister):
                 s.image_name = IMAGE_STRING_FOR_BFV
                 s.image_id = IMAGE_STRING_FOR_BFV
 
-            if not sdk_utils.supports_microversion(compute_client, '2.47'):
+            if not supports_v247:
                 flavor = flavors.get(s.flavor['id'])
                 if flavor:
                     s.flavor_name = flavor.name
@@ -2831,45 +3271,7 @@ class ListServer(command.Lister):
             else:
                 s.security_groups_name = []
 
-        # The host_status field contains the status of the compute host the
-        # server is on. It is only returned by the API when the nova-api
-        # policy allows. Users can look at the host_status field when, for
-        # example, their server has status ACTIVE but is unresponsive. The
-        # host_status field can indicate a possible problem on the host
-        # it's on, providing useful information to a user in this
-        # situation.
-        if (
-            sdk_utils.supports_microversion(compute_client, '2.16')
-            and parsed_args.long
-        ):
-            if any([s.host_status is not None for s in data]):
-                columns += ('Host Status',)
-                column_headers += ('Host Status',)
-
-        table = (
-            column_headers,
-            (
-                utils.get_item_properties(
-                    s,
-                    columns,
-                    mixed_case_fields=(
-                        'task_state',
-                        'power_state',
-                        'availability_zone',
-                        'host',
-                    ),
-                    formatters={
-                        'power_state': PowerStateColumn,
-                        'addresses': AddressesColumn,
-                        'metadata': format_columns.DictColumn,
-                        'security_groups_name': format_columns.ListColumn,
-                        'hypervisor_hostname': HostColumn,
-                    },
-                )
-                for s in data
-            ),
-        )
-        return table
+        return flavors_listed
 
 
 class LockServer(command.Command):
@@ -2896,6 +3298,7 @@ A non-admin user will not be able to execute actions."""
                 '(supported by --os-compute-api-version 2.73 or above)'
             ),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -2903,7 +3306,9 @@ A non-admin user will not be able to execute actions."""
 
         kwargs = {}
         if parsed_args.reason:
-            if not sdk_utils.supports_microversion(compute_client, '2.73'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.73'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.73 or greater is required to '
                     'use the --reason option'
@@ -2912,11 +3317,14 @@ A non-admin user will not be able to execute actions."""
 
             kwargs['locked_reason'] = parsed_args.reason
 
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server, ignore_missing=False
-            ).id
-            compute_client.lock_server(server_id, **kwargs)
+        def _lock(server):
+            _call_with_server_id(
+                self.app.client_manager,
+                server,
+                functools.partial(compute_client.lock_server, **kwargs),
+            )
+
+        _run_for_servers(parsed_args, _lock, 'lock')
 
 
 # FIXME(dtroyer): Here is what I want, how with argparse/cliff?
@@ -3025,7 +3433,7 @@ revert to release the new server and restart the old one."""
 
         compute_client = self.app.client_manager.compute
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -3102,10 +3510,10 @@ revert to release the new server and restart the old one."""
             server.migrate(**kwargs)
 
         if parsed_args.wait:
-            if utils.wait_for_status(
-                compute_client.servers.get,
-                server.id,
-                success_status=['active', 'verify_resize'],
+            if not _wait_for_servers(
+                self.app.client_manager.sdk_connection.compute,
+                [server.id],
+                success_status=('active', 'verify_resize'),
                 callback=_show_progress,
             ):
                 self.app.stdout.write(_('Complete\n'))
@@ -3126,16 +3534,18 @@ class PauseServer(command.Command):
             nargs='+',
             help=_('Server(s) to pause (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.pause_server(server_id)
+
+        def _pause(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.pause_server
+            )
+
+        _run_for_servers(parsed_args, _pause, 'pause')
 
 
 class RebootServer(command.Command):
@@ -3179,7 +3589,8 @@ class RebootServer(command.Command):
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.sdk_connection.compute
-        server_id = compute_client.find_server(
+        server_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         ).id
@@ -3387,7 +3798,7 @@ class RebuildServer(command.ShowOne):
         compute_client = self.app.client_manager.compute
         image_client = self.app.client_manager.image
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers, parsed_args.server
         )
 
@@ -3396,8 +3807,10 @@ class RebuildServer(command.ShowOne):
         # it is not trivial to fetch the current image and probably better
         # to error out in this case and ask user to supply the image.
         if parsed_args.image:
-            image = image_client.find_image(
-                parsed_args.image, ignore_missing=False
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image,
+                parsed_args.image,
+                ignore_missing=False,
             )
         else:
             if not server.image:
@@ -3675,7 +4088,7 @@ host."""
         if compute_client.api_version <= api_versions.APIVersion('2.13'):
             kwargs['on_shared_storage'] = parsed_args.shared_storage
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers, parsed_args.server
         )
 
@@ -3719,7 +4132,7 @@ class RemoveFixedIP(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers, parsed_args.server
         )
 
@@ -3746,7 +4159,8 @@ class RemoveFloatingIP(network_common.NetworkAndComputeCommand):
 
     def take_action_network(self, client, parsed_args):
         attrs = {}
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.ip_address,
             ignore_missing=False,
         )
@@ -3781,14 +4195,18 @@ class RemovePort(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            port_id = network_client.find_port(
-                parsed_args.port, ignore_missing=False
+            port_id = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_port,
+                parsed_args.port,
+                ignore_missing=False,
             ).id
         else:
             port_id = parsed_args.port
@@ -3820,14 +4238,18 @@ class RemoveNetwork(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            net_id = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_network,
+                parsed_args.network,
+                ignore_missing=False,
             ).id
         else:
             net_id = parsed_args.network
@@ -3860,7 +4282,7 @@ class RemoveServerSecurityGroup(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -3897,11 +4319,13 @@ volume from a server with status ``SHELVED`` or ``SHELVED_OFFLOADED``."""
         compute_client = self.app.client_manager.sdk_connection.compute
         volume_client = self.app.client_manager.sdk_connection.volume
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
-        volume = volume_client.find_volume(
+        volume = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_volume,
             parsed_args.volume,
             ignore_missing=False,
         )
@@ -3952,9 +4376,11 @@ server booted from a volume."""
 
         image = None
         if parsed_args.image:
-            image = image_client.find_image(parsed_args.image)
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image, parsed_args.image
+            )
 
-        utils.find_resource(
+        self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         ).rescue(image=image, password=parsed_args.password)
@@ -4016,12 +4442,12 @@ release the new server and restart the old one."""
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.compute
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
         if parsed_args.flavor:
-            flavor = utils.find_resource(
+            flavor = self.app.client_manager.resource_cache.find_resource(
                 compute_client.flavors,
                 parsed_args.flavor,
             )
@@ -4034,10 +4460,10 @@ release the new server and restart the old one."""
                 )
             compute_client.servers.resize(server, flavor)
             if parsed_args.wait:
-                if utils.wait_for_status(
-                    compute_client.servers.get,
-                    server.id,
-                    success_status=['active', 'verify_resize'],
+                if not _wait_for_servers(
+                    self.app.client_manager.sdk_connection.compute,
+                    [server.id],
+                    success_status=('active', 'verify_resize'),
                     callback=_show_progress,
                 ):
                     self.app.stdout.write(_('Complete\n'))
@@ -4081,7 +4507,7 @@ Confirm (verify) success of resize operation and release the old server."""
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -4130,7 +4556,7 @@ one."""
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -4171,16 +4597,18 @@ class RestoreServer(command.Command):
             nargs='+',
             help=_('Server(s) to restore (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.restore_server(server_id)
+
+        def _restore(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.restore_server
+            )
+
+        _run_for_servers(parsed_args, _restore, 'restore')
 
 
 class ResumeServer(command.Command):
@@ -4194,16 +4622,18 @@ class ResumeServer(command.Command):
             nargs='+',
             help=_('Server(s) to resume (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.resume_server(server_id)
+
+        def _resume(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.resume_server
+            )
+
+        _run_for_servers(parsed_args, _resume, 'resume')
 
 
 class SetServer(command.Command):
@@ -4299,7 +4729,7 @@ class SetServer(command.Command):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -4417,11 +4847,16 @@ class ShelveServer(command.Command):
 
         compute_client = self.app.client_manager.sdk_connection.compute
 
+        server_ids = []
         for server in parsed_args.servers:
-            server_obj = compute_client.find_server(
-                server,
-                ignore_missing=False,
+            server_obj = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    compute_client.find_server,
+                    server,
+                    ignore_missing=False,
+                )
             )
+            server_ids.append(server_obj.id)
             if server_obj.status.lower() in ('shelved', 'shelved_offloaded'):
                 continue
 
@@ -4432,30 +4867,25 @@ class ShelveServer(command.Command):
         if not parsed_args.wait and not parsed_args.offload:
             return
 
-        for server in parsed_args.servers:
-            # We use osc-lib's wait_for_status since that allows for a callback
-            # TODO(stephenfin): We should wait for these in parallel using e.g.
-            # https://review.opendev.org/c/openstack/osc-lib/+/762503/
-            if not utils.wait_for_status(
-                compute_client.get_server,
-                server_obj.id,
-                success_status=('shelved', 'shelved_offloaded'),
-                callback=_show_progress,
-            ):
-                LOG.error(_('Error shelving server: %s'), server_obj.id)
+        failed = _wait_for_servers(
+            compute_client,
+            server_ids,
+            success_status=('shelved', 'shelved_offloaded'),
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
+                LOG.error(_('Error shelving server: %s'), server_id)
                 self.app.stdout.write(
-                    _('Error shelving server: %s\n') % server_obj.id
+                    _('Error shelving server: %s\n') % server_id
                 )
-                raise SystemExit
+            raise SystemExit
 
         if not parsed_args.offload:
             return
 
-        for server in parsed_args.servers:
-            server_obj = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            )
+        for server_id in server_ids:
+            server_obj = compute_client.get_server(server_id)
             if server_obj.status.lower() == 'shelved_offloaded':
                 continue
 
@@ -4464,24 +4894,22 @@ class ShelveServer(command.Command):
         if not parsed_args.wait:
             return
 
-        for server in parsed_args.servers:
-            # We use osc-lib's wait_for_status since that allows for a callback
-            # TODO(stephenfin): We should wait for these in parallel using e.g.
-            # https://review.opendev.org/c/openstack/osc-lib/+/762503/
-            if not utils.wait_for_status(
-                compute_client.get_server,
-                server_obj.id,
-                success_status=('shelved_offloaded',),
-                callback=_show_progress,
-            ):
+        failed = _wait_for_servers(
+            compute_client,
+            server_ids,
+            success_status=('shelved_offloaded',),
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
                 LOG.error(
                     _('Error offloading shelved server %s'),
-                    server_obj.id,
+                    server_id,
                 )
                 self.app.stdout.write(
-                    _('Error offloading shelved server: %s\n') % server_obj.id
+                    _('Error offloading shelved server: %s\n') % server_id
                 )
-                raise SystemExit
+            raise SystemExit
 
 
 class ShowServer(command.ShowOne):
@@ -4522,8 +4950,10 @@ information for the server."""
         compute_client = self.app.client_manager.sdk_connection.compute
 
         # Find by name or ID, then get the full details of the server
-        server = compute_client.find_server(
-            parsed_args.server, ignore_missing=False
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
+            parsed_args.server,
+            ignore_missing=False,
         )
         server = compute_client.get_server(server)
 
@@ -4533,7 +4963,9 @@ information for the server."""
 
         topology = None
         if parsed_args.topology:
-            if not sdk_utils.supports_microversion(compute_client, '2.78'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.78'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.78 or greater is required to '
                     'support the --topology option'
@@ -4657,7 +5089,7 @@ class SshServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
 
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -4737,24 +5169,22 @@ class StartServer(command.Command):
                 '(can be specified using the ALL_PROJECTS envvar)'
             ),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            try:
-                server_id = compute_client.find_server(
-                    server,
-                    ignore_missing=False,
-                    details=False,
-                    all_projects=parsed_args.all_projects,
-                ).id
-            except sdk_exceptions.HttpException as exc:
-                if exc.status_code == 403:
-                    msg = _("Policy doesn't allow passing all-projects")
-                    raise exceptions.Forbidden(msg)
 
-            compute_client.start_server(server_id)
+        def _start(server):
+            _call_with_server_id(
+                self.app.client_manager,
+                server,
+                compute_client.start_server,
+                details=False,
+                all_projects=parsed_args.all_projects,
+            )
+
+        _run_for_servers(parsed_args, _start, 'start')
 
 
 class StopServer(command.Command):
@@ -4777,24 +5207,22 @@ class StopServer(command.Command):
                 '(can be specified using the ALL_PROJECTS envvar)'
             ),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            try:
-                server_id = compute_client.find_server(
-                    server,
-                    ignore_missing=False,
-                    details=False,
-                    all_projects=parsed_args.all_projects,
-                ).id
-            except sdk_exceptions.HttpException as exc:
-                if exc.status_code == 403:
-                    msg = _("Policy doesn't allow passing all-projects")
-                    raise exceptions.Forbidden(msg)
 
-            compute_client.stop_server(server_id)
+        def _stop(server):
+            _call_with_server_id(
+                self.app.client_manager,
+                server,
+                compute_client.stop_server,
+                details=False,
+                all_projects=parsed_args.all_projects,
+            )
+
+        _run_for_servers(parsed_args, _stop, 'stop')
 
 
 class SuspendServer(command.Command):
@@ -4808,16 +5236,18 @@ class SuspendServer(command.Command):
             nargs='+',
             help=_('Server(s) to suspend (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.suspend_server(server_id)
+
+        def _suspend(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.suspend_server
+            )
+
+        _run_for_servers(parsed_args, _suspend, 'suspend')
 
 
 class UnlockServer(command.Command):
@@ -4831,16 +5261,18 @@ class UnlockServer(command.Command):
             nargs='+',
             help=_('Server(s) to unlock (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.unlock_server(server_id)
+
+        def _unlock(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.unlock_server
+            )
+
+        _run_for_servers(parsed_args, _unlock, 'unlock')
 
 
 class UnpauseServer(command.Command):
@@ -4854,16 +5286,18 @@ class UnpauseServer(command.Command):
             nargs='+',
             help=_('Server(s) to unpause (name or ID)'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
-            compute_client.unpause_server(server_id)
+
+        def _unpause(server):
+            _call_with_server_id(
+                self.app.client_manager, server, compute_client.unpause_server
+            )
+
+        _run_for_servers(parsed_args, _unpause, 'unpause')
 
 
 class UnrescueServer(command.Command):
@@ -4880,7 +5314,7 @@ class UnrescueServer(command.Command):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        utils.find_resource(
+        self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         ).unrescue()
@@ -4932,7 +5366,7 @@ class UnsetServer(command.Command):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -5023,7 +5457,9 @@ class UnshelveServer(command.Command):
         kwargs = {}
 
         if parsed_args.availability_zone:
-            if not sdk_utils.supports_microversion(compute_client, '2.77'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.77'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.77 or greater is required '
                     'to support the --availability-zone option'
@@ -5033,7 +5469,9 @@ class UnshelveServer(command.Command):
             kwargs['availability_zone'] = parsed_args.availability_zone
 
         if parsed_args.host:
-            if not sdk_utils.supports_microversion(compute_client, '2.91'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.91'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.91 or greater is required '
                     'to support the --host option'
@@ -5043,7 +5481,9 @@ class UnshelveServer(command.Command):
             kwargs['host'] = parsed_args.host
 
         if parsed_args.no_availability_zone:
-            if not sdk_utils.supports_microversion(compute_client, '2.91'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.91'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.91 or greater is required '
                     'to support the --no-availability-zone option'
@@ -5052,10 +5492,14 @@ class UnshelveServer(command.Command):
 
             kwargs['availability_zone'] = None
 
+        server_ids = []
         for server in parsed_args.server:
-            server_obj = compute_client.find_server(
-                server,
-                ignore_missing=False,
+            server_obj = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    compute_client.find_server,
+                    server,
+                    ignore_missing=False,
+                )
             )
 
             if server_obj.status.lower() not in (
@@ -5065,16 +5509,19 @@ class UnshelveServer(command.Command):
                 continue
 
             compute_client.unshelve_server(server_obj.id, **kwargs)
+            server_ids.append(server_obj.id)
 
-            if parsed_args.wait:
-                if not utils.wait_for_status(
-                    compute_client.get_server,
-                    server_obj.id,
-                    success_status=('active', 'shutoff'),
-                    callback=_show_progress,
-                ):
-                    LOG.error(_('Error unshelving server %s'), server_obj.id)
+        if parsed_args.wait:
+            failed = _wait_for_servers(
+                compute_client,
+                server_ids,
+                success_status=('active', 'shutoff'),
+                callback=_show_progress,
+            )
+            if failed:
+                for server_id in failed:
+                    LOG.error(_('Error unshelving server %s'), server_id)
                     self.app.stdout.write(
-                        _('Error unshelving server: %s\n') % server_obj.id
+                        _('Error unshelving server: %s\n') % server_id
                     )
-                    raise SystemExit
+                raise SystemExit
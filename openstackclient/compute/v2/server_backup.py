@@ -73,7 +73,9 @@ class CreateServerBackup(command.ShowOne):
 
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(parsed_args.server)
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server, parsed_args.server
+        )
 
         # Set sane defaults as this API wants all mouths to be fed
         if parsed_args.name is None:
@@ -97,7 +99,9 @@ class CreateServerBackup(command.ShowOne):
         )
 
         image_client = self.app.client_manager.image
-        image = image_client.find_image(backup_name, ignore_missing=False)
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image, backup_name, ignore_missing=False
+        )
 
         if parsed_args.wait:
             if utils.wait_for_status(
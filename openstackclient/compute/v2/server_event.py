@@ -21,7 +21,6 @@ import uuid
 from cliff import columns
 import iso8601
 from openstack import exceptions as sdk_exceptions
-from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
@@ -87,11 +86,11 @@ class ServerActionEventColumn(columns.FormattableColumn):
         return events
 
 
-def _get_server_event_columns(item, client):
+def _get_server_event_columns(item, client, client_manager):
     column_map = {}
     hidden_columns = ['name', 'server_id', 'links', 'location']
 
-    if not sdk_utils.supports_microversion(client, '2.58'):
+    if not client_manager.supports_microversion(client, '2.58'):
         # updated_at was introduced in 2.58
         hidden_columns.append('updated_at')
 
@@ -153,7 +152,9 @@ class ListServerEvent(command.Lister):
         kwargs = {}
 
         if parsed_args.marker:
-            if not sdk_utils.supports_microversion(compute_client, '2.58'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.58'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.58 or greater is required to '
                     'support the --marker option'
@@ -163,7 +164,9 @@ class ListServerEvent(command.Lister):
             kwargs['marker'] = parsed_args.marker
 
         if parsed_args.limit:
-            if not sdk_utils.supports_microversion(compute_client, '2.58'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.58'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.58 or greater is required to '
                     'support the --limit option'
@@ -174,7 +177,9 @@ class ListServerEvent(command.Lister):
             kwargs['paginated'] = False
 
         if parsed_args.changes_since:
-            if not sdk_utils.supports_microversion(compute_client, '2.58'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.58'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.58 or greater is required to '
                     'support the --changes-since option'
@@ -190,7 +195,9 @@ class ListServerEvent(command.Lister):
             kwargs['changes_since'] = parsed_args.changes_since
 
         if parsed_args.changes_before:
-            if not sdk_utils.supports_microversion(compute_client, '2.66'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.66'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.66 or greater is required to '
                     'support the --changes-before option'
@@ -206,9 +213,13 @@ class ListServerEvent(command.Lister):
             kwargs['changes_before'] = parsed_args.changes_before
 
         try:
-            server_id = compute_client.find_server(
-                parsed_args.server, ignore_missing=False
-            ).id
+            server_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    compute_client.find_server,
+                    parsed_args.server,
+                    ignore_missing=False,
+                ).id
+            )
         except sdk_exceptions.ResourceNotFound:
             # If we fail to find the resource, it is possible the server is
             # deleted. Try once more using the <server> arg directly if it is a
@@ -278,10 +289,13 @@ class ShowServerEvent(command.ShowOne):
         compute_client = self.app.client_manager.sdk_connection.compute
 
         try:
-            server_id = compute_client.find_server(
-                parsed_args.server,
-                ignore_missing=False,
-            ).id
+            server_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    compute_client.find_server,
+                    parsed_args.server,
+                    ignore_missing=False,
+                ).id
+            )
         except sdk_exceptions.ResourceNotFound:
             # If we fail to find the resource, it is possible the server is
             # deleted. Try once more using the <server> arg directly if it is a
@@ -299,6 +313,7 @@ class ShowServerEvent(command.ShowOne):
         column_headers, columns = _get_server_event_columns(
             server_action,
             compute_client,
+            self.app.client_manager,
         )
 
         return (
@@ -17,7 +17,6 @@
 
 import logging
 
-from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -37,11 +36,11 @@ _formatters = {
 }
 
 
-def _get_server_group_columns(item, client):
+def _get_server_group_columns(item, client, client_manager):
     column_map = {'member_ids': 'members'}
     hidden_columns = ['metadata', 'location']
 
-    if sdk_utils.supports_microversion(client, '2.64'):
+    if client_manager.supports_microversion(client, '2.64'):
         hidden_columns.append('policies')
     else:
         hidden_columns.append('policy')
@@ -96,7 +95,9 @@ class CreateServerGroup(command.ShowOne):
         compute_client = self.app.client_manager.sdk_connection.compute
 
         if parsed_args.policy in ('soft-affinity', 'soft-anti-affinity'):
-            if not sdk_utils.supports_microversion(compute_client, '2.15'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.15'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.15 or greater is required to '
                     'support the %s policy'
@@ -104,14 +105,18 @@ class CreateServerGroup(command.ShowOne):
                 raise exceptions.CommandError(msg % parsed_args.policy)
 
         if parsed_args.rules:
-            if not sdk_utils.supports_microversion(compute_client, '2.64'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.64'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.64 or greater is required to '
                     'support the --rule option'
                 )
                 raise exceptions.CommandError(msg)
 
-        if not sdk_utils.supports_microversion(compute_client, '2.64'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.64'
+        ):
             kwargs = {
                 'name': parsed_args.name,
                 'policies': [parsed_args.policy],
@@ -130,6 +135,7 @@ class CreateServerGroup(command.ShowOne):
         display_columns, columns = _get_server_group_columns(
             server_group,
             compute_client,
+            self.app.client_manager,
         )
         data = utils.get_item_properties(
             server_group,
@@ -157,7 +163,11 @@ class DeleteServerGroup(command.Command):
         result = 0
         for group in parsed_args.server_group:
             try:
-                group_obj = compute_client.find_server_group(group)
+                group_obj = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        compute_client.find_server_group, group
+                    )
+                )
                 compute_client.delete_server_group(group_obj.id)
             # Catch all exceptions in order to avoid to block the next deleting
             except Exception as e:
@@ -211,7 +221,9 @@ class ListServerGroup(command.Lister):
         data = compute_client.server_groups(**kwargs)
 
         policy_key = 'Policies'
-        if sdk_utils.supports_microversion(compute_client, '2.64'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.64'
+        ):
             policy_key = 'Policy'
 
         columns = (
@@ -263,10 +275,13 @@ class ShowServerGroup(command.ShowOne):
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
-        group = compute_client.find_server_group(parsed_args.server_group)
+        group = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server_group, parsed_args.server_group
+        )
         display_columns, columns = _get_server_group_columns(
             group,
             compute_client,
+            self.app.client_manager,
         )
         data = utils.get_item_properties(
             group, columns, formatters=_formatters
@@ -75,7 +75,8 @@ class CreateServerImage(command.ShowOne):
         compute_client = self.app.client_manager.sdk_connection.compute
         image_client = self.app.client_manager.image
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
@@ -104,7 +105,9 @@ class CreateServerImage(command.ShowOne):
                 )
                 raise exceptions.CommandError
 
-        image = image_client.find_image(image_id, ignore_missing=False)
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image, image_id, ignore_missing=False
+        )
 
         if self.app.client_manager._api_version['image'] == '1':
             info = {}
@@ -14,7 +14,6 @@
 
 import uuid
 
-from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
@@ -130,17 +129,23 @@ class ListMigration(command.Lister):
         ]
 
         # Insert migrations UUID after ID
-        if sdk_utils.supports_microversion(compute_client, "2.59"):
+        if self.app.client_manager.supports_microversion(
+            compute_client, "2.59"
+        ):
             column_headers.insert(0, "UUID")
             columns.insert(0, "uuid")
 
-        if sdk_utils.supports_microversion(compute_client, "2.23"):
+        if self.app.client_manager.supports_microversion(
+            compute_client, "2.23"
+        ):
             column_headers.insert(0, "Id")
             columns.insert(0, "id")
             column_headers.insert(len(column_headers) - 2, "Type")
             columns.insert(len(columns) - 2, "migration_type")
 
-        if sdk_utils.supports_microversion(compute_client, "2.80"):
+        if self.app.client_manager.supports_microversion(
+            compute_client, "2.80"
+        ):
             if parsed_args.project:
                 column_headers.insert(len(column_headers) - 2, "Project")
                 columns.insert(len(columns) - 2, "project_id")
@@ -166,7 +171,9 @@ class ListMigration(command.Lister):
             search_opts['status'] = parsed_args.status
 
         if parsed_args.server:
-            server = compute_client.find_server(parsed_args.server)
+            server = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_server, parsed_args.server
+            )
             if server is None:
                 msg = _('Unable to find server: %s') % parsed_args.server
                 raise exceptions.CommandError(msg)
@@ -180,7 +187,9 @@ class ListMigration(command.Lister):
             search_opts['migration_type'] = migration_type
 
         if parsed_args.marker:
-            if not sdk_utils.supports_microversion(compute_client, "2.59"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.59"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'support the --marker option'
@@ -189,7 +198,9 @@ class ListMigration(command.Lister):
             search_opts['marker'] = parsed_args.marker
 
         if parsed_args.limit:
-            if not sdk_utils.supports_microversion(compute_client, "2.59"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.59"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'support the --limit option'
@@ -199,7 +210,9 @@ class ListMigration(command.Lister):
             search_opts['paginated'] = False
 
         if parsed_args.changes_since:
-            if not sdk_utils.supports_microversion(compute_client, "2.59"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.59"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'support the --changes-since option'
@@ -208,7 +221,9 @@ class ListMigration(command.Lister):
             search_opts['changes_since'] = parsed_args.changes_since
 
         if parsed_args.changes_before:
-            if not sdk_utils.supports_microversion(compute_client, "2.66"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.66"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.66 or greater is required to '
                     'support the --changes-before option'
@@ -217,7 +232,9 @@ class ListMigration(command.Lister):
             search_opts['changes_before'] = parsed_args.changes_before
 
         if parsed_args.project:
-            if not sdk_utils.supports_microversion(compute_client, "2.80"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.80"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.80 or greater is required to '
                     'support the --project option'
@@ -228,10 +245,13 @@ class ListMigration(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         if parsed_args.user:
-            if not sdk_utils.supports_microversion(compute_client, "2.80"):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, "2.80"
+            ):
                 msg = _(
                     '--os-compute-api-version 2.80 or greater is required to '
                     'support the --user option'
@@ -242,6 +262,7 @@ class ListMigration(command.Lister):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         migrations = list(compute_client.migrations(**search_opts))
@@ -284,7 +305,9 @@ class ShowMigration(command.ShowOne):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        if not sdk_utils.supports_microversion(compute_client, '2.24'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.24'
+        ):
             msg = _(
                 '--os-compute-api-version 2.24 or greater is required to '
                 'support the server migration show command'
@@ -298,14 +321,17 @@ class ShowMigration(command.ShowOne):
                 msg = _('The <migration> argument must be an ID or UUID')
                 raise exceptions.CommandError(msg)
 
-            if not sdk_utils.supports_microversion(compute_client, '2.59'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.59'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'retrieve server migrations by UUID'
                 )
                 raise exceptions.CommandError(msg)
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
@@ -364,11 +390,15 @@ class ShowMigration(command.ShowOne):
             'updated_at',
         )
 
-        if sdk_utils.supports_microversion(compute_client, '2.59'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.59'
+        ):
             column_headers += ('UUID',)
             columns += ('uuid',)
 
-        if sdk_utils.supports_microversion(compute_client, '2.80'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.80'
+        ):
             column_headers += ('User ID', 'Project ID')
             columns += ('user_id', 'project_id')
 
@@ -399,7 +429,9 @@ class AbortMigration(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        if not sdk_utils.supports_microversion(compute_client, '2.24'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.24'
+        ):
             msg = _(
                 '--os-compute-api-version 2.24 or greater is required to '
                 'support the server migration abort command'
@@ -413,14 +445,17 @@ class AbortMigration(command.Command):
                 msg = _('The <migration> argument must be an ID or UUID')
                 raise exceptions.CommandError(msg)
 
-            if not sdk_utils.supports_microversion(compute_client, '2.59'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.59'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'abort server migrations by UUID'
                 )
                 raise exceptions.CommandError(msg)
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
@@ -464,7 +499,9 @@ class ForceCompleteMigration(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        if not sdk_utils.supports_microversion(compute_client, '2.22'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.22'
+        ):
             msg = _(
                 '--os-compute-api-version 2.22 or greater is required to '
                 'support the server migration force complete command'
@@ -478,14 +515,17 @@ class ForceCompleteMigration(command.Command):
                 msg = _('The <migration> argument must be an ID or UUID')
                 raise exceptions.CommandError(msg)
 
-            if not sdk_utils.supports_microversion(compute_client, '2.59'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.59'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.59 or greater is required to '
                     'abort server migrations by UUID'
                 )
                 raise exceptions.CommandError(msg)
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
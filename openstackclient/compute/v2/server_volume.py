@@ -14,7 +14,6 @@
 
 """Compute v2 Server action implementations"""
 
-from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
@@ -36,7 +35,8 @@ class ListServerVolume(command.Lister):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        server = compute_client.find_server(
+        server = self.app.client_manager.resource_cache.find_sdk_resource(
+            compute_client.find_server,
             parsed_args.server,
             ignore_missing=False,
         )
@@ -45,7 +45,9 @@ class ListServerVolume(command.Lister):
         columns = ()
         column_headers = ()
 
-        if not sdk_utils.supports_microversion(compute_client, '2.89'):
+        if not self.app.client_manager.supports_microversion(
+            compute_client, '2.89'
+        ):
             columns += ('id',)
             column_headers += ('ID',)
 
@@ -60,15 +62,21 @@ class ListServerVolume(command.Lister):
             'Volume ID',
         )
 
-        if sdk_utils.supports_microversion(compute_client, '2.70'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.70'
+        ):
             columns += ('tag',)
             column_headers += ('Tag',)
 
-        if sdk_utils.supports_microversion(compute_client, '2.79'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.79'
+        ):
             columns += ('delete_on_termination',)
             column_headers += ('Delete On Termination?',)
 
-        if sdk_utils.supports_microversion(compute_client, '2.89'):
+        if self.app.client_manager.supports_microversion(
+            compute_client, '2.89'
+        ):
             columns += ('attachment_id', 'bdm_id')
             column_headers += ('Attachment ID', 'BlockDeviceMapping UUID')
 
@@ -118,7 +126,9 @@ class SetServerVolume(command.Command):
         volume_client = self.app.client_manager.sdk_connection.volume
 
         if parsed_args.delete_on_termination is not None:
-            if not sdk_utils.supports_microversion(compute_client, '2.85'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.85'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.85 or greater is required to '
                     'support the -delete-on-termination or '
@@ -126,11 +136,13 @@ class SetServerVolume(command.Command):
                 )
                 raise exceptions.CommandError(msg)
 
-            server = compute_client.find_server(
+            server = self.app.client_manager.resource_cache.find_sdk_resource(
+                compute_client.find_server,
                 parsed_args.server,
                 ignore_missing=False,
             )
-            volume = volume_client.find_volume(
+            volume = self.app.client_manager.resource_cache.find_sdk_resource(
+                volume_client.find_volume,
                 parsed_args.volume,
                 ignore_missing=False,
             )
@@ -17,7 +17,6 @@
 
 import logging
 
-from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
@@ -130,7 +129,9 @@ deployment."""
         if parsed_args.long:
             columns += ("disabled_reason",)
             column_headers += ("Disabled Reason",)
-            if sdk_utils.supports_microversion(compute_client, '2.11'):
+            if self.app.client_manager.supports_microversion(
+                compute_client, '2.11'
+            ):
                 columns += ("is_forced_down",)
                 column_headers += ("Forced Down",)
 
@@ -237,7 +238,7 @@ class SetService(command.Command):
         # PUT /os-services/{service_id} API for updating nova-compute
         # services. If 2.53+ is used we need to find the nova-compute
         # service using the --host and --service (binary) values.
-        requires_service_id = sdk_utils.supports_microversion(
+        requires_service_id = self.app.client_manager.supports_microversion(
             compute_client, '2.53'
         )
         service_id = None
@@ -280,7 +281,9 @@ class SetService(command.Command):
         if parsed_args.up:
             force_down = False
         if force_down is not None:
-            if not sdk_utils.supports_microversion(compute_client, '2.11'):
+            if not self.app.client_manager.supports_microversion(
+                compute_client, '2.11'
+            ):
                 msg = _(
                     '--os-compute-api-version 2.11 or later is ' 'required'
                 )
@@ -17,14 +17,23 @@
 
 import datetime
 import functools
+import logging
 
 from cliff import columns as cliff_columns
+from keystoneauth1 import exceptions as ks_exc
 from osc_lib.command import command
 from osc_lib import utils
 
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 
 
+LOG = logging.getLogger(__name__)
+
+# Maximum number of projects looked up concurrently
+_PROJECT_LOOKUP_WORKERS = 8
+
+
 # TODO(stephenfin): This exists in a couple of places and should be moved to a
 # common module
 class ProjectColumn(cliff_columns.FormattableColumn):
@@ -55,7 +64,9 @@ class ProjectColumn(cliff_columns.FormattableColumn):
 
 class CountColumn(cliff_columns.FormattableColumn):
     def human_readable(self):
-        return len(self._value) if self._value is not None else None
+        if self._value is None or isinstance(self._value, int):
+            return self._value
+        return len(self._value)
 
 
 class FloatColumn(cliff_columns.FormattableColumn):
@@ -89,20 +100,78 @@ def _get_usage_list_marker(usage_list):
     return marker
 
 
-def _merge_usage(usage, next_usage):
-    usage.server_usages.extend(next_usage.server_usages)
-    usage.total_hours += next_usage.total_hours
-    usage.total_memory_mb_usage += next_usage.total_memory_mb_usage
-    usage.total_vcpus_usage += next_usage.total_vcpus_usage
-    usage.total_local_gb_usage += next_usage.total_local_gb_usage
+class _UsageTotals(object):
+    """The usage of a single project, accumulated over API pages
 
+    The usage API pages by server, so a project may show up on several
+    pages. Unless ``keep_server_usages`` is set the per-server records are
+    only counted, which bounds memory use by the number of projects rather
+    than by the number of servers.
+    """
 
-def _merge_usage_list(usages, next_usage_list):
+    def __init__(self, project_id, keep_server_usages=True):
+        self.project_id = project_id
+        self.server_usages = [] if keep_server_usages else 0
+        self.total_hours = 0
+        self.total_memory_mb_usage = 0
+        self.total_vcpus_usage = 0
+        self.total_local_gb_usage = 0
+
+    def add(self, usage):
+        server_usages = usage.server_usages or []
+        if isinstance(self.server_usages, list):
+            self.server_usages.extend(server_usages)
+        else:
+            self.server_usages += len(server_usages)
+        self.total_hours += usage.total_hours or 0
+        self.total_memory_mb_usage += usage.total_memory_mb_usage or 0
+        self.total_vcpus_usage += usage.total_vcpus_usage or 0
+        self.total_local_gb_usage += usage.total_local_gb_usage or 0
+
+
+def _merge_usage_list(usages, next_usage_list, keep_server_usages=True):
+    """Merge usage records into per-project totals as they arrive
+
+    :param usages: A dict of project ID to ``_UsageTotals``, updated in
+        place and returned.
+    :param next_usage_list: An iterable of usage records, typically the
+        lazily paged result of the usage API.
+    :param keep_server_usages: Whether to retain the per-server records
+        or only count them.
+    """
     for next_usage in next_usage_list:
-        if next_usage.project_id in usages:
-            _merge_usage(usages[next_usage.project_id], next_usage)
+        totals = usages.get(next_usage.project_id)
+        if totals is None:
+            totals = _UsageTotals(next_usage.project_id, keep_server_usages)
+            usages[next_usage.project_id] = totals
+        totals.add(next_usage)
+    return usages
+
+
+def _find_projects(identity_client, project_ids):
+    """Look up the given projects concurrently
+
+    Projects that can't be retrieved are left out, they are shown by ID.
+
+    :param identity_client: The identity client.
+    :param project_ids: The IDs of the projects to look up.
+    :returns: A dict of project ID to project.
+    """
+    projects = {}
+    for project_id, project, exc in parallel.run_concurrently(
+        identity_client.projects.get,
+        project_ids,
+        max_workers=_PROJECT_LOOKUP_WORKERS,
+    ):
+        if exc is None:
+            projects[project_id] = project
+        elif isinstance(exc, ks_exc.Forbidden):
+            # The remaining lookups would be refused as well
+            LOG.debug('Not allowed to look up projects: %s', exc)
+            break
         else:
-            usages[next_usage.project_id] = next_usage
+            LOG.debug('Unable to look up project %s: %s', project_id, exc)
+    return projects
 
 
 class ListUsage(command.Lister):
@@ -128,14 +197,6 @@ class ListUsage(command.Lister):
         return parser
 
     def take_action(self, parsed_args):
-        def _format_project(project):
-            if not project:
-                return ""
-            if project in project_cache.keys():
-                return project_cache[project].name
-            else:
-                return project
-
         compute_client = self.app.client_manager.sdk_connection.compute
         columns = (
             "project_id",
@@ -167,24 +228,25 @@ class ListUsage(command.Lister):
         else:
             end = now + datetime.timedelta(days=1)
 
-        usage_list = list(
+        # The table formatter only shows the number of servers, anything
+        # else gets the per-server records
+        keep_server_usages = parsed_args.formatter != 'table'
+        usages = _merge_usage_list(
+            {},
             compute_client.usages(
                 start=start,
                 end=end,
                 detailed=True,
-            )
+            ),
+            keep_server_usages=keep_server_usages,
         )
 
-        # Cache the project list
-        project_cache = {}
-        try:
-            for p in self.app.client_manager.identity.projects.list():
-                project_cache[p.id] = p
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        # Only look up the projects that actually have usage
+        project_cache = _find_projects(
+            self.app.client_manager.identity, list(usages)
+        )
 
-        if parsed_args.formatter == 'table' and len(usage_list) > 0:
+        if parsed_args.formatter == 'table' and usages:
             self.app.stdout.write(
                 _("Usage from %(start)s to %(end)s: \n")
                 % {
@@ -201,7 +263,7 @@ class ListUsage(command.Lister):
                     columns,
                     formatters=_formatters(project_cache),
                 )
-                for s in usage_list
+                for s in usages.values()
             ),
         )
 
@@ -253,7 +315,7 @@ class ShowUsage(command.ShowOne):
             end = now + datetime.timedelta(days=1)
 
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.project,
             ).id
@@ -0,0 +1,463 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Warm process mode for the OpenStack command-line client
+
+``openstack-daemon`` starts a server on a Unix socket that has already
+imported the client, its plugins and all command modules. ``openstack-warm``
+is a drop-in replacement for ``openstack`` that hands its arguments,
+environment, working directory and standard streams to that server, which
+runs the command in a forked child, so that the startup cost is paid once.
+Tokens obtained by one command are reused by the following ones with the
+same credentials.
+
+When no server is running ``openstack-warm`` runs the command itself.
+
+This module is imported by the thin client, so it must only import from
+the standard library at module scope.
+"""
+
+import argparse
+import array
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+# Environment variable overriding the path of the server socket
+SOCKET_ENV = 'OS_CLIENT_DAEMON_SOCKET'
+
+# The program name the commands run by the server report
+PROG_NAME = 'openstack'
+
+_HEADER = struct.Struct('!I')
+_STATUS = struct.Struct('!i')
+
+# Upper bound on the size of a request, mostly the environment
+_MAX_REQUEST_SIZE = 16 * 1024**2
+
+# The standard streams passed from the client to the server
+_STREAMS = (0, 1, 2)
+
+# Seconds between checks for finished commands and idleness
+_POLL_INTERVAL = 1.0
+
+
+def get_socket_path():
+    """Return the path of the server socket"""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'openstack'
+    )
+    return os.path.join(runtime_dir, 'openstackclient.sock')
+
+
+def _recv_exact(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise EOFError('connection closed')
+        data.extend(chunk)
+    return bytes(data)
+
+
+def forward(argv, path=None):
+    """Run a command on the server
+
+    :param argv: The command line arguments.
+    :param path: The path of the server socket.
+    :returns: The exit status of the command, or None if there is no
+        server to run it or the standard streams can't be passed to it.
+    """
+    try:
+        for fd in _STREAMS:
+            os.fstat(fd)
+    except OSError:
+        # e.g. stdin closed by the caller
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path or get_socket_path())
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        request = json.dumps(
+            {'argv': argv, 'cwd': os.getcwd(), 'env': dict(os.environ)}
+        ).encode('utf-8')
+        try:
+            sock.sendmsg(
+                [_HEADER.pack(len(request))],
+                [
+                    (
+                        socket.SOL_SOCKET,
+                        socket.SCM_RIGHTS,
+                        array.array('i', _STREAMS),
+                    )
+                ],
+            )
+            sock.sendall(request)
+            (pid,) = _STATUS.unpack(_recv_exact(sock, _STATUS.size))
+        except (OSError, EOFError):
+            # The server went away before it started running the command
+            return None
+
+        def _forward_signal(signum, frame):
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                pass
+
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(signum, _forward_signal)
+
+        try:
+            (status,) = _STATUS.unpack(_recv_exact(sock, _STATUS.size))
+        except (OSError, EOFError):
+            sys.stderr.write('The command was interrupted\n')
+            return 1
+        return status
+
+
+def main(argv=None):
+    """Run a command on the server, or in this process if there is none"""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    status = forward(argv)
+    if status is not None:
+        return status
+
+    from openstackclient import shell
+
+    return shell.main(argv)
+
+
+def _iter_entry_points():
+    from importlib import metadata
+
+    for distribution in metadata.distributions():
+        yield from distribution.entry_points
+
+
+class Server(object):
+    """Serve commands from a warm process
+
+    Each command runs in a child forked from the server, so it starts with
+    everything already imported and can't affect the server or other
+    commands. Children report the tokens they obtained back to the server
+    so that later commands can reuse them.
+
+    :param path: The path of the socket to listen on.
+    :param idle_timeout: Seconds without requests after which the server
+        exits, or None to run until interrupted.
+    """
+
+    def __init__(self, path, idle_timeout=None):
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.auth_states = {}
+        self._selector = selectors.DefaultSelector()
+        self._children = set()
+
+    def warm_up(self):
+        """Import the client, its plugins and all command modules"""
+        # cliff names the program after sys.argv[0] once, when it is
+        # imported, so commands would report themselves as openstack-daemon
+        sys.argv[0] = PROG_NAME
+        from cliff import app as cliff_app
+
+        cliff_app.App.NAME = PROG_NAME
+
+        from openstackclient.common import clientmanager
+        from openstackclient import shell
+
+        clientmanager.ClientManager.auth_states = self.auth_states
+
+        # Fill the in-memory entry point caches used by the shell
+        shell.OpenStackShell()
+
+        count = 0
+        for entry_point in _iter_entry_points():
+            if not entry_point.group.startswith('openstack.'):
+                continue
+            try:
+                entry_point.load()
+            except Exception as e:
+                LOG.debug('Unable to load %s: %s', entry_point, e)
+            else:
+                count += 1
+        LOG.info('Loaded %d commands and plugins', count)
+
+    def _listen(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                # A stale socket left behind by a server that died
+                os.unlink(self.path)
+            else:
+                raise RuntimeError(
+                    'A server is already listening on %s' % self.path
+                )
+            finally:
+                probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the user running the server may connect to it
+        umask = os.umask(0o177)
+        try:
+            sock.bind(self.path)
+        finally:
+            os.umask(umask)
+        sock.listen(16)
+        return sock
+
+    def _is_peer_allowed(self, conn):
+        if not hasattr(socket, 'SO_PEERCRED'):
+            # Rely on the permissions of the socket
+            return True
+        creds = conn.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')
+        )
+        _pid, uid, _gid = struct.unpack('3i', creds)
+        return uid == os.getuid()
+
+    def serve_forever(self):
+        """Accept and run commands until interrupted or idle"""
+        listener = self._listen()
+        LOG.info('Listening on %s', self.path)
+        self._selector.register(listener, selectors.EVENT_READ)
+        last_active = time.monotonic()
+        try:
+            while True:
+                events = self._selector.select(timeout=_POLL_INTERVAL)
+                self._reap_children()
+                if events or self._children:
+                    last_active = time.monotonic()
+                elif (
+                    self.idle_timeout is not None
+                    and time.monotonic() - last_active >= self.idle_timeout
+                ):
+                    LOG.info(
+                        'Exiting after %s idle seconds', self.idle_timeout
+                    )
+                    return
+                for key, _mask in events:
+                    if key.fileobj is listener:
+                        self._accept(listener)
+                    else:
+                        self._read_report(key)
+        finally:
+            self._selector.close()
+            listener.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def _accept(self, listener):
+        conn, _addr = listener.accept()
+        if not self._is_peer_allowed(conn):
+            LOG.warning('Rejected connection from another user')
+            conn.close()
+            return
+
+        report_read, report_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # The child must never return into the server loop
+            status = 1
+            try:
+                os.close(report_read)
+                listener.close()
+                self._run_child(conn, report_write)
+                status = 0
+            except Exception:
+                LOG.exception('Unable to run command')
+            finally:
+                os._exit(status)
+
+        conn.close()
+        os.close(report_write)
+        os.set_blocking(report_read, False)
+        self._children.add(pid)
+        self._selector.register(report_read, selectors.EVENT_READ, [])
+
+    def _read_report(self, key):
+        try:
+            data = os.read(key.fd, 65536)
+        except BlockingIOError:
+            return
+        if data:
+            key.data.append(data)
+            return
+
+        self._selector.unregister(key.fd)
+        os.close(key.fd)
+        try:
+            report = json.loads(b''.join(key.data) or b'{}')
+            self.auth_states.update(report.get('auth_states', {}))
+        except (AttributeError, ValueError):
+            LOG.debug('Ignoring malformed report from a command')
+
+    def _reap_children(self):
+        for pid in list(self._children):
+            try:
+                done, _status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                self._children.discard(pid)
+
+    def _receive_request(self, conn):
+        fds = array.array('i')
+        data, ancdata, _flags, _addr = conn.recvmsg(
+            _HEADER.size, socket.CMSG_SPACE(len(_STREAMS) * fds.itemsize)
+        )
+        for level, kind, payload in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                payload = payload[: len(payload) - len(payload) % fds.itemsize]
+                fds.frombytes(payload)
+        if len(data) < _HEADER.size:
+            data += _recv_exact(conn, _HEADER.size - len(data))
+
+        (size,) = _HEADER.unpack(data)
+        if len(fds) != len(_STREAMS) or size > _MAX_REQUEST_SIZE:
+            raise ValueError('Malformed request')
+        request = json.loads(_recv_exact(conn, size).decode('utf-8'))
+        return request, list(fds)
+
+    def _run_child(self, conn, report_fd):
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(signum, signal.SIG_DFL)
+
+        # The command configures logging for itself, as it would when run
+        # by itself, so drop the server's handlers
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        root_logger.setLevel(logging.WARNING)
+
+        request, fds = self._receive_request(conn)
+        conn.sendall(_STATUS.pack(os.getpid()))
+
+        # Take over the standard streams of the client
+        for target, fd in zip(_STREAMS, fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, 'r')
+        sys.stdout = open(1, 'w', buffering=1 if os.isatty(1) else -1)
+        sys.stderr = open(2, 'w', buffering=1)
+
+        sys.argv = [PROG_NAME] + request['argv']
+        os.environ.clear()
+        os.environ.update(request['env'])
+        os.chdir(request['cwd'])
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        from openstackclient import shell
+
+        app = shell.OpenStackShell()
+        try:
+            status = app.run(request['argv'])
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else 1
+        except KeyboardInterrupt:
+            status = 130
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        conn.sendall(_STATUS.pack(status or 0))
+        conn.close()
+        self._report(app, report_fd)
+
+    def _report(self, app, report_fd):
+        auth_states = {}
+        client_manager = getattr(app, 'client_manager', None)
+        auth = getattr(client_manager, 'auth', None)
+        if auth is not None and hasattr(auth, 'get_auth_state'):
+            cache_id = auth.get_cache_id()
+            state = auth.get_auth_state()
+            if cache_id and state and self.auth_states.get(cache_id) != state:
+                auth_states[cache_id] = state
+
+        data = json.dumps({'auth_states': auth_states}).encode('utf-8')
+        with os.fdopen(report_fd, 'wb') as f:
+            f.write(data)
+
+
+def server_main(argv=None):
+    """Run the server in the foreground"""
+    parser = argparse.ArgumentParser(
+        prog='openstack-daemon',
+        description='Serve OpenStack client commands from a warm process '
+        'for openstack-warm.',
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='<path>',
+        default=get_socket_path(),
+        help='Path of the socket to listen on (Env: %s)' % SOCKET_ENV,
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        metavar='<seconds>',
+        type=float,
+        default=None,
+        help='Exit after this many seconds without commands',
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        default=False,
+        help='Log debug messages',
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s %(message)s',
+    )
+
+    server = Server(args.socket, idle_timeout=args.idle_timeout)
+    server.warm_up()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        LOG.error('%s', e)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(server_main())
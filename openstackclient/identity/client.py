@@ -15,7 +15,6 @@
 
 import logging
 
-from keystoneclient.v2_0 import client as identity_client_v2
 from osc_lib import utils
 
 from openstackclient.i18n import _
@@ -72,12 +71,26 @@ def build_option_parser(parser):
     return parser
 
 
-class IdentityClientv2(identity_client_v2.Client):
-    """Tweak the earlier client class to deal with some changes"""
+def __getattr__(name):
+    # NOTE: keystoneclient's v2 client is only imported once it is used, so
+    #       that loading this plugin at startup stays cheap
+    if name != 'IdentityClientv2':
+        raise AttributeError(
+            'module %r has no attribute %r' % (__name__, name)
+        )
+
+    from keystoneclient.v2_0 import client as identity_client_v2
+
+    class IdentityClientv2(identity_client_v2.Client):
+        """Tweak the earlier client class to deal with some changes"""
+
+        def __getattr__(self, name):
+            # Map v3 'projects' back to v2 'tenants'
+            if name == "projects":
+                return self.tenants
+            else:
+                raise AttributeError(name)
 
-    def __getattr__(self, name):
-        # Map v3 'projects' back to v2 'tenants'
-        if name == "projects":
-            return self.tenants
-        else:
-            raise AttributeError(name)
+    IdentityClientv2.__qualname__ = name
+    globals()[name] = IdentityClientv2
+    return IdentityClientv2
@@ -150,63 +150,101 @@ def _get_token_resource(client, resource, parsed_name, parsed_domain=None):
         return parsed_name
 
 
-def _get_domain_id_if_requested(identity_client, domain_name_or_id):
+def _get_domain_id_if_requested(
+    identity_client, domain_name_or_id, resource_cache=None
+):
     if not domain_name_or_id:
         return None
-    domain = find_domain(identity_client, domain_name_or_id)
+    domain = find_domain(
+        identity_client, domain_name_or_id, resource_cache=resource_cache
+    )
     return domain.id
 
 
-def find_domain(identity_client, name_or_id):
+def find_domain(identity_client, name_or_id, resource_cache=None):
     return _find_identity_resource(
-        identity_client.domains, name_or_id, domains.Domain
+        identity_client.domains,
+        name_or_id,
+        domains.Domain,
+        resource_cache=resource_cache,
     )
 
 
-def find_group(identity_client, name_or_id, domain_name_or_id=None):
-    domain_id = _get_domain_id_if_requested(identity_client, domain_name_or_id)
+def find_group(
+    identity_client, name_or_id, domain_name_or_id=None, resource_cache=None
+):
+    domain_id = _get_domain_id_if_requested(
+        identity_client, domain_name_or_id, resource_cache
+    )
     if not domain_id:
         return _find_identity_resource(
-            identity_client.groups, name_or_id, groups.Group
+            identity_client.groups,
+            name_or_id,
+            groups.Group,
+            resource_cache=resource_cache,
         )
     else:
         return _find_identity_resource(
             identity_client.groups,
             name_or_id,
             groups.Group,
+            resource_cache=resource_cache,
             domain_id=domain_id,
         )
 
 
-def find_project(identity_client, name_or_id, domain_name_or_id=None):
-    domain_id = _get_domain_id_if_requested(identity_client, domain_name_or_id)
+def find_project(
+    identity_client, name_or_id, domain_name_or_id=None, resource_cache=None
+):
+    domain_id = _get_domain_id_if_requested(
+        identity_client, domain_name_or_id, resource_cache
+    )
     if not domain_id:
         return _find_identity_resource(
-            identity_client.projects, name_or_id, projects.Project
+            identity_client.projects,
+            name_or_id,
+            projects.Project,
+            resource_cache=resource_cache,
         )
     else:
         return _find_identity_resource(
             identity_client.projects,
             name_or_id,
             projects.Project,
+            resource_cache=resource_cache,
             domain_id=domain_id,
         )
 
 
-def find_user(identity_client, name_or_id, domain_name_or_id=None):
-    domain_id = _get_domain_id_if_requested(identity_client, domain_name_or_id)
+def find_user(
+    identity_client, name_or_id, domain_name_or_id=None, resource_cache=None
+):
+    domain_id = _get_domain_id_if_requested(
+        identity_client, domain_name_or_id, resource_cache
+    )
     if not domain_id:
         return _find_identity_resource(
-            identity_client.users, name_or_id, users.User
+            identity_client.users,
+            name_or_id,
+            users.User,
+            resource_cache=resource_cache,
         )
     else:
         return _find_identity_resource(
-            identity_client.users, name_or_id, users.User, domain_id=domain_id
+            identity_client.users,
+            name_or_id,
+            users.User,
+            resource_cache=resource_cache,
+            domain_id=domain_id,
         )
 
 
 def _find_identity_resource(
-    identity_client_manager, name_or_id, resource_type, **kwargs
+    identity_client_manager,
+    name_or_id,
+    resource_type,
+    resource_cache=None,
+    **kwargs,
 ):
     """Find a specific identity resource.
 
@@ -227,14 +265,20 @@ def _find_identity_resource(
     :type name_or_id: string
     :param resource_type: class that represents the resource type
     :type resource_type: `keystoneclient.base.Resource`
+    :param resource_cache: the cache of resource names to look it up in
+    :type resource_cache: `openstackclient.common.cache.ResourceCache`
 
     :returns: the resource in question
     :rtype: `keystoneclient.base.Resource`
 
     """
 
+    find_resource = utils.find_resource
+    if resource_cache is not None:
+        find_resource = resource_cache.find_resource
+
     try:
-        identity_resource = utils.find_resource(
+        identity_resource = find_resource(
             identity_client_manager, name_or_id, **kwargs
         )
         if identity_resource is not None:
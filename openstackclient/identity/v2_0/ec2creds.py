@@ -55,7 +55,7 @@ class CreateEC2Creds(command.ShowOne):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             ).id
@@ -63,7 +63,7 @@ class CreateEC2Creds(command.ShowOne):
             # Get the project from the current auth
             project = self.app.client_manager.auth_ref.project_id
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             ).id
@@ -104,7 +104,7 @@ class DeleteEC2Creds(command.Command):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             ).id
@@ -150,7 +150,7 @@ class ListEC2Creds(command.Lister):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             ).id
@@ -196,7 +196,7 @@ class ShowEC2Creds(command.ShowOne):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             ).id
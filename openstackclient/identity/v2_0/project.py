@@ -91,7 +91,7 @@ class CreateProject(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.tenants,
                     parsed_args.name,
                 )
@@ -123,9 +123,11 @@ class DeleteProject(command.Command):
         errors = 0
         for project in parsed_args.projects:
             try:
-                project_obj = utils.find_resource(
-                    identity_client.tenants,
-                    project,
+                project_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.tenants,
+                        project,
+                    )
                 )
                 identity_client.tenants.delete(project_obj.id)
             except Exception as e:
@@ -234,7 +236,7 @@ class SetProject(command.Command):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
 
-        project = utils.find_resource(
+        project = self.app.client_manager.resource_cache.find_resource(
             identity_client.tenants,
             parsed_args.project,
         )
@@ -277,7 +279,7 @@ class ShowProject(command.ShowOne):
 
         info = {}
         try:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             )
@@ -342,7 +344,7 @@ class UnsetProject(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        project = utils.find_resource(
+        project = self.app.client_manager.resource_cache.find_resource(
             identity_client.tenants,
             parsed_args.project,
         )
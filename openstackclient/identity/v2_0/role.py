@@ -54,12 +54,16 @@ class AddRole(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        role = utils.find_resource(identity_client.roles, parsed_args.role)
-        project = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
+            identity_client.roles, parsed_args.role
+        )
+        project = self.app.client_manager.resource_cache.find_resource(
             identity_client.tenants,
             parsed_args.project,
         )
-        user = utils.find_resource(identity_client.users, parsed_args.user)
+        user = self.app.client_manager.resource_cache.find_resource(
+            identity_client.users, parsed_args.user
+        )
         role = identity_client.roles.add_user_role(
             user.id,
             role.id,
@@ -94,7 +98,7 @@ class CreateRole(command.ShowOne):
             role = identity_client.roles.create(parsed_args.role_name)
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                role = utils.find_resource(
+                role = self.app.client_manager.resource_cache.find_resource(
                     identity_client.roles,
                     parsed_args.role_name,
                 )
@@ -126,9 +130,11 @@ class DeleteRole(command.Command):
         errors = 0
         for role in parsed_args.roles:
             try:
-                role_obj = utils.find_resource(
-                    identity_client.roles,
-                    role,
+                role_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.roles,
+                        role,
+                    )
                 )
                 identity_client.roles.delete(role_obj.id)
             except Exception as e:
@@ -198,12 +204,16 @@ class RemoveRole(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        role = utils.find_resource(identity_client.roles, parsed_args.role)
-        project = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
+            identity_client.roles, parsed_args.role
+        )
+        project = self.app.client_manager.resource_cache.find_resource(
             identity_client.tenants,
             parsed_args.project,
         )
-        user = utils.find_resource(identity_client.users, parsed_args.user)
+        user = self.app.client_manager.resource_cache.find_resource(
+            identity_client.users, parsed_args.user
+        )
         identity_client.roles.remove_user_role(user.id, role.id, project.id)
 
 
@@ -221,7 +231,9 @@ class ShowRole(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        role = utils.find_resource(identity_client.roles, parsed_args.role)
+        role = self.app.client_manager.resource_cache.find_resource(
+            identity_client.roles, parsed_args.role
+        )
 
         info = {}
         info.update(role._info)
@@ -63,25 +63,25 @@ class ListRoleAssignment(command.Lister):
 
         user = None
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             )
         elif parsed_args.authuser:
             if auth_ref:
-                user = utils.find_resource(
+                user = self.app.client_manager.resource_cache.find_resource(
                     identity_client.users, auth_ref.user_id
                 )
 
         project = None
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.project,
             )
         elif parsed_args.authproject:
             if auth_ref:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects, auth_ref.project_id
                 )
 
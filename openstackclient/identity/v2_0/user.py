@@ -108,7 +108,7 @@ class CreateUser(command.ShowOne):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.project:
-            project_id = utils.find_resource(
+            project_id = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             ).id
@@ -139,7 +139,7 @@ class CreateUser(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                user = utils.find_resource(
+                user = self.app.client_manager.resource_cache.find_resource(
                     identity_client.users,
                     parsed_args.name,
                 )
@@ -177,9 +177,11 @@ class DeleteUser(command.Command):
         errors = 0
         for user in parsed_args.users:
             try:
-                user_obj = utils.find_resource(
-                    identity_client.users,
-                    user,
+                user_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.users,
+                        user,
+                    )
                 )
                 identity_client.users.delete(user_obj.id)
             except Exception as e:
@@ -224,7 +226,7 @@ class ListUser(command.Lister):
         formatters = {}
         project = None
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             )
@@ -353,7 +355,7 @@ class SetUser(command.Command):
                 )
             )
 
-        user = utils.find_resource(
+        user = self.app.client_manager.resource_cache.find_resource(
             identity_client.users,
             parsed_args.user,
         )
@@ -365,7 +367,7 @@ class SetUser(command.Command):
             )
 
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             )
@@ -405,7 +407,7 @@ class ShowUser(command.ShowOne):
 
         info = {}
         try:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             )
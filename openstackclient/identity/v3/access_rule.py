@@ -86,7 +86,10 @@ class ListAccessRule(command.Lister):
         identity_client = self.app.client_manager.identity
         if parsed_args.user:
             user_id = common.find_user(
-                identity_client, parsed_args.user, parsed_args.user_domain
+                identity_client,
+                parsed_args.user,
+                parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
         else:
             user_id = None
@@ -186,8 +186,10 @@ class DeleteApplicationCredential(command.Command):
         errors = 0
         for ac in parsed_args.application_credential:
             try:
-                app_cred = utils.find_resource(
-                    identity_client.application_credentials, ac
+                app_cred = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.application_credentials, ac
+                    )
                 )
                 identity_client.application_credentials.delete(app_cred.id)
             except Exception as e:
@@ -226,7 +228,10 @@ class ListApplicationCredential(command.Lister):
         identity_client = self.app.client_manager.identity
         if parsed_args.user:
             user_id = common.find_user(
-                identity_client, parsed_args.user, parsed_args.user_domain
+                identity_client,
+                parsed_args.user,
+                parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
         else:
             user_id = None
@@ -260,7 +265,7 @@ class ShowApplicationCredential(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        app_cred = utils.find_resource(
+        app_cred = self.app.client_manager.resource_cache.find_resource(
             identity_client.application_credentials,
             parsed_args.application_credential,
         )
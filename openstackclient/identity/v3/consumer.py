@@ -66,8 +66,10 @@ class DeleteConsumer(command.Command):
         result = 0
         for i in parsed_args.consumer:
             try:
-                consumer = utils.find_resource(
-                    identity_client.oauth1.consumers, i
+                consumer = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.oauth1.consumers, i
+                    )
                 )
                 identity_client.oauth1.consumers.delete(consumer.id)
             except Exception as e:
@@ -126,7 +128,7 @@ class SetConsumer(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        consumer = utils.find_resource(
+        consumer = self.app.client_manager.resource_cache.find_resource(
             identity_client.oauth1.consumers, parsed_args.consumer
         )
         kwargs = {}
@@ -152,7 +154,7 @@ class ShowConsumer(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        consumer = utils.find_resource(
+        consumer = self.app.client_manager.resource_cache.find_resource(
             identity_client.oauth1.consumers, parsed_args.consumer
         )
 
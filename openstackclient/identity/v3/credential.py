@@ -61,11 +61,11 @@ class CreateCredential(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        user_id = utils.find_resource(
+        user_id = self.app.client_manager.resource_cache.find_resource(
             identity_client.users, parsed_args.user
         ).id
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, parsed_args.project
             ).id
         else:
@@ -145,6 +145,7 @@ class ListCredential(command.Lister):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             kwargs["user_id"] = user_id
 
@@ -208,12 +209,12 @@ class SetCredential(command.Command):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
 
-        user_id = utils.find_resource(
+        user_id = self.app.client_manager.resource_cache.find_resource(
             identity_client.users, parsed_args.user
         ).id
 
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, parsed_args.project
             ).id
         else:
@@ -242,7 +243,7 @@ class ShowCredential(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        credential = utils.find_resource(
+        credential = self.app.client_manager.resource_cache.find_resource(
             identity_client.credentials, parsed_args.credential
         )
 
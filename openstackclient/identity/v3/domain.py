@@ -81,7 +81,7 @@ class CreateDomain(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                domain = utils.find_resource(
+                domain = self.app.client_manager.resource_cache.find_resource(
                     identity_client.domains, parsed_args.name
                 )
                 LOG.info(_('Returning existing domain %s'), domain.name)
@@ -110,7 +110,9 @@ class DeleteDomain(command.Command):
         result = 0
         for i in parsed_args.domain:
             try:
-                domain = utils.find_resource(identity_client.domains, i)
+                domain = self.app.client_manager.resource_cache.find_resource(
+                    identity_client.domains, i
+                )
                 identity_client.domains.delete(domain.id)
             except Exception as e:
                 result += 1
@@ -207,7 +209,7 @@ class SetDomain(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        domain = utils.find_resource(
+        domain = self.app.client_manager.resource_cache.find_resource(
             identity_client.domains, parsed_args.domain
         )
         kwargs = {}
@@ -247,7 +249,9 @@ class ShowDomain(command.ShowOne):
             identity_client, 'domain', parsed_args.domain
         )
 
-        domain = utils.find_resource(identity_client.domains, domain_str)
+        domain = self.app.client_manager.resource_cache.find_resource(
+            identity_client.domains, domain_str
+        )
 
         domain._info.pop('links')
         return zip(*sorted(domain._info.items()))
@@ -37,17 +37,19 @@ def _determine_ec2_user(parsed_args, client_manager):
     user_domain = None
     if parsed_args.user_domain:
         user_domain = common.find_domain(
-            client_manager.identity, parsed_args.user_domain
+            client_manager.identity,
+            parsed_args.user_domain,
+            resource_cache=client_manager.resource_cache,
         )
     if parsed_args.user:
         if user_domain is not None:
-            user = utils.find_resource(
+            user = client_manager.resource_cache.find_resource(
                 client_manager.identity.users,
                 parsed_args.user,
                 domain_id=user_domain.id,
             ).id
         else:
-            user = utils.find_resource(
+            user = client_manager.resource_cache.find_resource(
                 client_manager.identity.users, parsed_args.user
             ).id
     else:
@@ -89,18 +91,20 @@ class CreateEC2Creds(command.ShowOne):
         project_domain = None
         if parsed_args.project_domain:
             project_domain = common.find_domain(
-                identity_client, parsed_args.project_domain
+                identity_client,
+                parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
 
         if parsed_args.project:
             if project_domain is not None:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects,
                     parsed_args.project,
                     domain_id=project_domain.id,
                 ).id
             else:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects, parsed_args.project
                 ).id
         else:
@@ -60,10 +60,15 @@ class AddProjectToEndpoint(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.identity
 
-        endpoint = utils.find_resource(client.endpoints, parsed_args.endpoint)
+        endpoint = self.app.client_manager.resource_cache.find_resource(
+            client.endpoints, parsed_args.endpoint
+        )
 
         project = common.find_project(
-            client, parsed_args.project, parsed_args.project_domain
+            client,
+            parsed_args.project,
+            parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         client.endpoint_filter.add_endpoint_to_project(
@@ -151,9 +156,11 @@ class DeleteEndpoint(command.Command):
         result = 0
         for i in parsed_args.endpoint:
             try:
-                endpoint_id = utils.find_resource(
-                    identity_client.endpoints, i
-                ).id
+                endpoint_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.endpoints, i
+                    ).id
+                )
                 identity_client.endpoints.delete(endpoint_id)
             except Exception as e:
                 result += 1
@@ -213,7 +220,7 @@ class ListEndpoint(command.Lister):
 
         endpoint = None
         if parsed_args.endpoint:
-            endpoint = utils.find_resource(
+            endpoint = self.app.client_manager.resource_cache.find_resource(
                 identity_client.endpoints, parsed_args.endpoint
             )
         project = None
@@ -222,6 +229,7 @@ class ListEndpoint(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
 
         if endpoint:
@@ -306,10 +314,15 @@ class RemoveProjectFromEndpoint(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.identity
 
-        endpoint = utils.find_resource(client.endpoints, parsed_args.endpoint)
+        endpoint = self.app.client_manager.resource_cache.find_resource(
+            client.endpoints, parsed_args.endpoint
+        )
 
         project = common.find_project(
-            client, parsed_args.project, parsed_args.project_domain
+            client,
+            parsed_args.project,
+            parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         client.endpoint_filter.delete_endpoint_from_project(
@@ -365,7 +378,7 @@ class SetEndpoint(command.Command):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        endpoint = utils.find_resource(
+        endpoint = self.app.client_manager.resource_cache.find_resource(
             identity_client.endpoints, parsed_args.endpoint
         )
 
@@ -406,7 +419,7 @@ class ShowEndpoint(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        endpoint = utils.find_resource(
+        endpoint = self.app.client_manager.resource_cache.find_resource(
             identity_client.endpoints, parsed_args.endpoint
         )
 
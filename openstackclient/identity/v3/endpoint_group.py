@@ -80,12 +80,15 @@ class AddProjectToEndpointGroup(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.identity
 
-        endpointgroup = utils.find_resource(
+        endpointgroup = self.app.client_manager.resource_cache.find_resource(
             client.endpoint_groups, parsed_args.endpointgroup
         )
 
         project = common.find_project(
-            client, parsed_args.project, parsed_args.project_domain
+            client,
+            parsed_args.project,
+            parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         client.endpoint_filter.add_endpoint_group_to_project(
@@ -151,9 +154,11 @@ class DeleteEndpointGroup(command.Command):
         result = 0
         for i in parsed_args.endpointgroup:
             try:
-                endpoint_id = utils.find_resource(
-                    identity_client.endpoint_groups, i
-                ).id
+                endpoint_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.endpoint_groups, i
+                    ).id
+                )
                 identity_client.endpoint_groups.delete(endpoint_id)
             except Exception as e:
                 result += 1
@@ -201,13 +206,18 @@ class ListEndpointGroup(command.Lister):
 
         endpointgroup = None
         if parsed_args.endpointgroup:
-            endpointgroup = utils.find_resource(
-                client.endpoint_groups, parsed_args.endpointgroup
+            endpointgroup = (
+                self.app.client_manager.resource_cache.find_resource(
+                    client.endpoint_groups, parsed_args.endpointgroup
+                )
             )
         project = None
         if parsed_args.project:
             project = common.find_project(
-                client, parsed_args.project, parsed_args.domain
+                client,
+                parsed_args.project,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
 
         if endpointgroup:
@@ -261,12 +271,15 @@ class RemoveProjectFromEndpointGroup(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.identity
 
-        endpointgroup = utils.find_resource(
+        endpointgroup = self.app.client_manager.resource_cache.find_resource(
             client.endpoint_groups, parsed_args.endpointgroup
         )
 
         project = common.find_project(
-            client, parsed_args.project, parsed_args.project_domain
+            client,
+            parsed_args.project,
+            parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         client.endpoint_filter.delete_endpoint_group_from_project(
@@ -304,7 +317,7 @@ class SetEndpointGroup(command.Command, _FiltersReader):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        endpointgroup = utils.find_resource(
+        endpointgroup = self.app.client_manager.resource_cache.find_resource(
             identity_client.endpoint_groups, parsed_args.endpointgroup
         )
 
@@ -334,7 +347,7 @@ class ShowEndpointGroup(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        endpoint_group = utils.find_resource(
+        endpoint_group = self.app.client_manager.resource_cache.find_resource(
             identity_client.endpoint_groups, parsed_args.endpointgroup
         )
 
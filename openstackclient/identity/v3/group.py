@@ -56,14 +56,20 @@ class AddUserToGroup(command.Command):
         identity_client = self.app.client_manager.identity
 
         group_id = common.find_group(
-            identity_client, parsed_args.group, parsed_args.group_domain
+            identity_client,
+            parsed_args.group,
+            parsed_args.group_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
         result = 0
         for i in parsed_args.user:
             try:
                 user_id = common.find_user(
-                    identity_client, i, parsed_args.user_domain
+                    identity_client,
+                    i,
+                    parsed_args.user_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
                 identity_client.users.add_to_group(user_id, group_id)
             except Exception as e:
@@ -112,10 +118,16 @@ class CheckUserInGroup(command.Command):
         identity_client = self.app.client_manager.identity
 
         user_id = common.find_user(
-            identity_client, parsed_args.user, parsed_args.user_domain
+            identity_client,
+            parsed_args.user,
+            parsed_args.user_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
         group_id = common.find_group(
-            identity_client, parsed_args.group, parsed_args.group_domain
+            identity_client,
+            parsed_args.group,
+            parsed_args.group_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
         try:
@@ -169,7 +181,11 @@ class CreateGroup(command.ShowOne):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain).id
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            ).id
 
         try:
             group = identity_client.groups.create(
@@ -179,7 +195,7 @@ class CreateGroup(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                group = utils.find_resource(
+                group = self.app.client_manager.resource_cache.find_resource(
                     identity_client.groups, parsed_args.name, domain_id=domain
                 )
                 LOG.info(_('Returning existing group %s'), group.name)
@@ -215,7 +231,10 @@ class DeleteGroup(command.Command):
         for group in parsed_args.groups:
             try:
                 group_obj = common.find_group(
-                    identity_client, group, parsed_args.domain
+                    identity_client,
+                    group,
+                    parsed_args.domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
                 identity_client.groups.delete(group_obj.id)
             except Exception as e:
@@ -266,13 +285,18 @@ class ListGroup(command.Lister):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain).id
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            ).id
 
         if parsed_args.user:
             user = common.find_user(
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
         else:
             user = None
@@ -327,14 +351,20 @@ class RemoveUserFromGroup(command.Command):
         identity_client = self.app.client_manager.identity
 
         group_id = common.find_group(
-            identity_client, parsed_args.group, parsed_args.group_domain
+            identity_client,
+            parsed_args.group,
+            parsed_args.group_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
         result = 0
         for i in parsed_args.user:
             try:
                 user_id = common.find_user(
-                    identity_client, i, parsed_args.user_domain
+                    identity_client,
+                    i,
+                    parsed_args.user_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
                 identity_client.users.remove_from_group(user_id, group_id)
             except Exception as e:
@@ -390,7 +420,10 @@ class SetGroup(command.Command):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
         group = common.find_group(
-            identity_client, parsed_args.group, parsed_args.domain
+            identity_client,
+            parsed_args.group,
+            parsed_args.domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
         kwargs = {}
         if parsed_args.name:
@@ -425,6 +458,7 @@ class ShowGroup(command.ShowOne):
             identity_client,
             parsed_args.group,
             domain_name_or_id=parsed_args.domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         group._info.pop('links')
@@ -113,7 +113,9 @@ class CreateIdentityProvider(command.ShowOne):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         # TODO(pas-ha) actually check for 3.14 microversion
@@ -336,7 +338,7 @@ class ShowIdentityProvider(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        idp = utils.find_resource(
+        idp = self.app.client_manager.resource_cache.find_resource(
             identity_client.federation.identity_providers,
             parsed_args.identity_provider,
             id=parsed_args.identity_provider,
@@ -70,7 +70,9 @@ class CreateLimit(command.ShowOne):
         identity_client = self.app.client_manager.identity
 
         project = common_utils.find_project(
-            identity_client, parsed_args.project
+            identity_client,
+            parsed_args.project,
+            resource_cache=self.app.client_manager.resource_cache,
         )
         service = common_utils.find_service(
             identity_client, parsed_args.service
@@ -142,7 +144,7 @@ class ListLimit(command.Lister):
             )
         region = None
         if parsed_args.region:
-            region = utils.find_resource(
+            region = self.app.client_manager.resource_cache.find_resource(
                 identity_client.regions, parsed_args.region
             )
             val = getattr(parsed_args, 'region', None)
@@ -160,7 +162,7 @@ class ListLimit(command.Lister):
                 )
         project = None
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, parsed_args.project
             )
 
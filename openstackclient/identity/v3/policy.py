@@ -185,7 +185,7 @@ class ShowPolicy(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        policy = utils.find_resource(
+        policy = self.app.client_manager.resource_cache.find_resource(
             identity_client.policies, parsed_args.policy
         )
 
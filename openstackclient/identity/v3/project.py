@@ -89,11 +89,15 @@ class CreateProject(command.ShowOne):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain).id
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            ).id
 
         parent = None
         if parsed_args.parent:
-            parent = utils.find_resource(
+            parent = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.parent,
             ).id
@@ -129,7 +133,7 @@ class CreateProject(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects,
                     parsed_args.name,
                     domain_id=domain,
@@ -165,17 +169,27 @@ class DeleteProject(command.Command):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
         errors = 0
         for project in parsed_args.projects:
             try:
                 if domain is not None:
-                    project_obj = utils.find_resource(
-                        identity_client.projects, project, domain_id=domain.id
+                    project_obj = (
+                        self.app.client_manager.resource_cache.find_resource(
+                            identity_client.projects,
+                            project,
+                            domain_id=domain.id,
+                        )
                     )
                 else:
-                    project_obj = utils.find_resource(
-                        identity_client.projects, project
+                    project_obj = (
+                        self.app.client_manager.resource_cache.find_resource(
+                            identity_client.projects, project
+                        )
                     )
                 identity_client.projects.delete(project_obj.id)
             except Exception as e:
@@ -253,25 +267,29 @@ class ListProject(command.Lister):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             kwargs['domain'] = domain_id
 
         if parsed_args.parent:
             parent_id = common.find_project(
-                identity_client, parsed_args.parent
+                identity_client,
+                parsed_args.parent,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             kwargs['parent'] = parent_id
 
         if parsed_args.user:
             if parsed_args.domain:
-                user_id = utils.find_resource(
+                user_id = self.app.client_manager.resource_cache.find_resource(
                     identity_client.users,
                     parsed_args.user,
                     domain_id=domain_id,
                 ).id
             else:
-                user_id = utils.find_resource(
+                user_id = self.app.client_manager.resource_cache.find_resource(
                     identity_client.users, parsed_args.user
                 ).id
 
@@ -363,7 +381,10 @@ class SetProject(command.Command):
         identity_client = self.app.client_manager.identity
 
         project = common.find_project(
-            identity_client, parsed_args.project, parsed_args.domain
+            identity_client,
+            parsed_args.project,
+            parsed_args.domain,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         kwargs = {}
@@ -422,12 +443,16 @@ class ShowProject(command.ShowOne):
         )
 
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
-            project = utils.find_resource(
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, project_str, domain_id=domain.id
             )
         else:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, project_str
             )
 
@@ -187,7 +187,7 @@ class ShowRegion(command.ShowOne):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
 
-        region = utils.find_resource(
+        region = self.app.client_manager.resource_cache.find_resource(
             identity_client.regions, parsed_args.region
         )
 
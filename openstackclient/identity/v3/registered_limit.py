@@ -63,7 +63,7 @@ class CreateRegisteredLimit(command.ShowOne):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
 
-        service = utils.find_resource(
+        service = self.app.client_manager.resource_cache.find_resource(
             identity_client.services, parsed_args.service
         )
         region = None
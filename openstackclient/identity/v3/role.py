@@ -64,7 +64,10 @@ def _add_identity_and_resource_options_to_parser(parser):
 
 
 def _process_identity_and_resource_options(
-    parsed_args, identity_client_manager, validate_actor_existence=True
+    parsed_args,
+    identity_client_manager,
+    validate_actor_existence=True,
+    resource_cache=None,
 ):
     def _find_user():
         try:
@@ -72,6 +75,7 @@ def _process_identity_and_resource_options(
                 identity_client_manager,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=resource_cache,
             ).id
         except exceptions.CommandError:
             if not validate_actor_existence:
@@ -84,6 +88,7 @@ def _process_identity_and_resource_options(
                 identity_client_manager,
                 parsed_args.group,
                 parsed_args.group_domain,
+                resource_cache=resource_cache,
             ).id
         except exceptions.CommandError:
             if not validate_actor_existence:
@@ -99,6 +104,7 @@ def _process_identity_and_resource_options(
         kwargs['domain'] = common.find_domain(
             identity_client_manager,
             parsed_args.domain,
+            resource_cache=resource_cache,
         ).id
     elif parsed_args.user and parsed_args.project:
         kwargs['user'] = _find_user()
@@ -106,6 +112,7 @@ def _process_identity_and_resource_options(
             identity_client_manager,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=resource_cache,
         ).id
     elif parsed_args.group and parsed_args.system:
         kwargs['group'] = _find_group()
@@ -115,6 +122,7 @@ def _process_identity_and_resource_options(
         kwargs['domain'] = common.find_domain(
             identity_client_manager,
             parsed_args.domain,
+            resource_cache=resource_cache,
         ).id
     elif parsed_args.group and parsed_args.project:
         kwargs['group'] = _find_group()
@@ -122,6 +130,7 @@ def _process_identity_and_resource_options(
             identity_client_manager,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=resource_cache,
         ).id
     kwargs['os_inherit_extension_inherited'] = parsed_args.inherited
     return kwargs
@@ -162,14 +171,18 @@ class AddRole(command.Command):
         domain_id = None
         if parsed_args.role_domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.role_domain
+                identity_client,
+                parsed_args.role_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
-        role = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
             identity_client.roles, parsed_args.role, domain_id=domain_id
         )
 
         kwargs = _process_identity_and_resource_options(
-            parsed_args, self.app.client_manager.identity
+            parsed_args,
+            self.app.client_manager.identity,
+            resource_cache=self.app.client_manager.resource_cache,
         )
 
         identity_client.roles.grant(role.id, **kwargs)
@@ -209,7 +222,9 @@ class CreateRole(command.ShowOne):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         options = common.get_immutable_options(parsed_args)
@@ -224,7 +239,7 @@ class CreateRole(command.ShowOne):
 
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                role = utils.find_resource(
+                role = self.app.client_manager.resource_cache.find_resource(
                     identity_client.roles,
                     parsed_args.name,
                     domain_id=domain_id,
@@ -261,13 +276,17 @@ class DeleteRole(command.Command):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
         errors = 0
         for role in parsed_args.roles:
             try:
-                role_obj = utils.find_resource(
-                    identity_client.roles, role, domain_id=domain_id
+                role_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.roles, role, domain_id=domain_id
+                    )
                 )
                 identity_client.roles.delete(role_obj.id)
             except Exception as e:
@@ -308,6 +327,7 @@ class ListRole(command.Lister):
             domain = common.find_domain(
                 identity_client,
                 parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
             columns = ('ID', 'Name', 'Domain')
             data = identity_client.roles.list(domain_id=domain.id)
@@ -365,9 +385,11 @@ class RemoveRole(command.Command):
         domain_id = None
         if parsed_args.role_domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.role_domain
+                identity_client,
+                parsed_args.role_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
-        role = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
             identity_client.roles, parsed_args.role, domain_id=domain_id
         )
 
@@ -375,6 +397,7 @@ class RemoveRole(command.Command):
             parsed_args,
             self.app.client_manager.identity,
             validate_actor_existence=False,
+            resource_cache=self.app.client_manager.resource_cache,
         )
         identity_client.roles.revoke(role.id, **kwargs)
 
@@ -413,11 +436,13 @@ class SetRole(command.Command):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         options = common.get_immutable_options(parsed_args)
-        role = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
             identity_client.roles, parsed_args.role, domain_id=domain_id
         )
 
@@ -452,10 +477,12 @@ class ShowRole(command.ShowOne):
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
-        role = utils.find_resource(
+        role = self.app.client_manager.resource_cache.find_resource(
             identity_client.roles, parsed_args.role, domain_id=domain_id
         )
 
@@ -14,7 +14,6 @@
 """Identity v3 Assignment action implementations"""
 
 from osc_lib.command import command
-from osc_lib import utils
 
 from openstackclient.i18n import _
 from openstackclient.identity import common
@@ -107,10 +106,12 @@ class ListRoleAssignment(command.Lister):
         role_domain_id = None
         if parsed_args.role_domain:
             role_domain_id = common.find_domain(
-                identity_client, parsed_args.role_domain
+                identity_client,
+                parsed_args.role_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
         if parsed_args.role:
-            role = utils.find_resource(
+            role = self.app.client_manager.resource_cache.find_resource(
                 identity_client.roles,
                 parsed_args.role,
                 domain_id=role_domain_id,
@@ -122,10 +123,15 @@ class ListRoleAssignment(command.Lister):
                 identity_client,
                 parsed_args.user,
                 parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
         elif parsed_args.authuser:
             if auth_ref:
-                user = common.find_user(identity_client, auth_ref.user_id)
+                user = common.find_user(
+                    identity_client,
+                    auth_ref.user_id,
+                    resource_cache=self.app.client_manager.resource_cache,
+                )
 
         system = None
         if parsed_args.system:
@@ -136,6 +142,7 @@ class ListRoleAssignment(command.Lister):
             domain = common.find_domain(
                 identity_client,
                 parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
 
         project = None
@@ -146,11 +153,14 @@ class ListRoleAssignment(command.Lister):
                     identity_client, 'project', parsed_args.project
                 ),
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
         elif parsed_args.authproject:
             if auth_ref:
                 project = common.find_project(
-                    identity_client, auth_ref.project_id
+                    identity_client,
+                    auth_ref.project_id,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
 
         group = None
@@ -159,6 +169,7 @@ class ListRoleAssignment(command.Lister):
                 identity_client,
                 parsed_args.group,
                 parsed_args.group_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
 
         include_names = True if parsed_args.names else False
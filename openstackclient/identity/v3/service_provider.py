@@ -223,10 +223,12 @@ class ShowServiceProvider(command.ShowOne):
 
     def take_action(self, parsed_args):
         service_client = self.app.client_manager.identity
-        service_provider = utils.find_resource(
-            service_client.federation.service_providers,
-            parsed_args.service_provider,
-            id=parsed_args.service_provider,
+        service_provider = (
+            self.app.client_manager.resource_cache.find_resource(
+                service_client.federation.service_providers,
+                parsed_args.service_provider,
+                id=parsed_args.service_provider,
+            )
         )
 
         service_provider._info.pop('links', None)
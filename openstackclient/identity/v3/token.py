@@ -17,7 +17,6 @@
 
 from osc_lib.command import command
 from osc_lib import exceptions
-from osc_lib import utils
 
 from openstackclient.i18n import _
 from openstackclient.identity import common
@@ -53,7 +52,7 @@ class AuthorizeRequestToken(command.ShowOne):
         # NOTE(stevemar): We want a list of role ids
         roles = []
         for role in parsed_args.role:
-            role_id = utils.find_resource(
+            role_id = self.app.client_manager.resource_cache.find_resource(
                 identity_client.roles,
                 role,
             ).id
@@ -152,14 +151,18 @@ class CreateRequestToken(command.ShowOne):
         identity_client = self.app.client_manager.identity
 
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
-            project = utils.find_resource(
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects,
                 parsed_args.project,
                 domain_id=domain.id,
             )
         else:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.projects, parsed_args.project
             )
 
@@ -100,19 +100,28 @@ class CreateTrust(command.ShowOne):
         # pointless, and trusts are immutable, so let's enforce it at the
         # client level.
         trustor_id = common.find_user(
-            identity_client, parsed_args.trustor, parsed_args.trustor_domain
+            identity_client,
+            parsed_args.trustor,
+            parsed_args.trustor_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
         trustee_id = common.find_user(
-            identity_client, parsed_args.trustee, parsed_args.trustee_domain
+            identity_client,
+            parsed_args.trustee,
+            parsed_args.trustee_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
         project_id = common.find_project(
-            identity_client, parsed_args.project, parsed_args.project_domain
+            identity_client,
+            parsed_args.project,
+            parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
         role_ids = []
         for role in parsed_args.role:
             try:
-                role_id = utils.find_resource(
+                role_id = self.app.client_manager.resource_cache.find_resource(
                     identity_client.roles,
                     role,
                 ).id
@@ -165,7 +174,11 @@ class DeleteTrust(command.Command):
         errors = 0
         for trust in parsed_args.trust:
             try:
-                trust_obj = utils.find_resource(identity_client.trusts, trust)
+                trust_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        identity_client.trusts, trust
+                    )
+                )
                 identity_client.trusts.delete(trust_obj.id)
             except Exception as e:
                 errors += 1
@@ -244,7 +257,11 @@ class ListTrust(command.Lister):
 
         if parsed_args.authuser:
             if auth_ref:
-                user = common.find_user(identity_client, auth_ref.user_id)
+                user = common.find_user(
+                    identity_client,
+                    auth_ref.user_id,
+                    resource_cache=self.app.client_manager.resource_cache,
+                )
                 # We need two calls here as we want trusts with
                 # either the trustor or the trustee set to current user
                 # using a single call would give us trusts with both
@@ -259,6 +276,7 @@ class ListTrust(command.Lister):
                     identity_client,
                     parsed_args.trustor,
                     parsed_args.trustor_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
 
             trustee = None
@@ -267,6 +285,7 @@ class ListTrust(command.Lister):
                     identity_client,
                     parsed_args.trustor,
                     parsed_args.trustor_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
 
             data = self.app.client_manager.identity.trusts.list(
@@ -310,7 +329,9 @@ class ShowTrust(command.ShowOne):
 
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
-        trust = utils.find_resource(identity_client.trusts, parsed_args.trust)
+        trust = self.app.client_manager.resource_cache.find_resource(
+            identity_client.trusts, parsed_args.trust
+        )
 
         trust._info.pop('roles_links', None)
         trust._info.pop('links', None)
@@ -23,12 +23,16 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 from openstackclient.identity import common
 
 
 LOG = logging.getLogger(__name__)
 
+# Number of users fetched concurrently when listing the users of a project
+_USER_LOOKUP_WORKERS = 8
+
 
 def _get_options_for_user(identity_client, parsed_args):
     options = {}
@@ -228,12 +232,15 @@ class CreateUser(command.ShowOne):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         domain_id = None
         if parsed_args.domain:
             domain_id = common.find_domain(
-                identity_client, parsed_args.domain
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         enabled = True
@@ -264,7 +271,7 @@ class CreateUser(command.ShowOne):
             )
         except ks_exc.Conflict:
             if parsed_args.or_show:
-                user = utils.find_resource(
+                user = self.app.client_manager.resource_cache.find_resource(
                     identity_client.users,
                     parsed_args.name,
                     domain_id=domain_id,
@@ -300,16 +307,26 @@ class DeleteUser(command.Command):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
         errors = 0
         for user in parsed_args.users:
             try:
                 if domain is not None:
-                    user_obj = utils.find_resource(
-                        identity_client.users, user, domain_id=domain.id
+                    user_obj = (
+                        self.app.client_manager.resource_cache.find_resource(
+                            identity_client.users, user, domain_id=domain.id
+                        )
                     )
                 else:
-                    user_obj = utils.find_resource(identity_client.users, user)
+                    user_obj = (
+                        self.app.client_manager.resource_cache.find_resource(
+                            identity_client.users, user
+                        )
+                    )
                 identity_client.users.delete(user_obj.id)
             except Exception as e:
                 errors += 1
@@ -330,6 +347,29 @@ class DeleteUser(command.Command):
             raise exceptions.CommandError(msg)
 
 
+def _get_users(identity_client, user_ids):
+    """Fetch users by ID, yielding them as they are retrieved.
+
+    Up to ``_USER_LOOKUP_WORKERS`` users are fetched concurrently. Users
+    that no longer exist, for example because they were deleted since
+    their IDs were collected, are skipped.
+
+    :param identity_client: The identity client.
+    :param user_ids: The IDs of the users to fetch.
+    """
+    for user_id, user, exc in parallel.run_concurrently(
+        identity_client.users.get,
+        user_ids,
+        max_workers=_USER_LOOKUP_WORKERS,
+    ):
+        if exc is not None:
+            if isinstance(exc, ks_exc.NotFound):
+                LOG.warning(_("User %s not found, skipping"), user_id)
+                continue
+            raise exc
+        yield user
+
+
 class ListUser(command.Lister):
     _description = _("List users")
 
@@ -364,23 +404,30 @@ class ListUser(command.Lister):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain).id
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            ).id
 
         group = None
         if parsed_args.group:
             group = common.find_group(
-                identity_client, parsed_args.group, parsed_args.domain
+                identity_client,
+                parsed_args.group,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         if parsed_args.project:
             if domain is not None:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects,
                     parsed_args.project,
                     domain_id=domain,
                 ).id
             else:
-                project = utils.find_resource(
+                project = self.app.client_manager.resource_cache.find_resource(
                     identity_client.projects,
                     parsed_args.project,
                 ).id
@@ -397,12 +444,7 @@ class ListUser(command.Lister):
                 if hasattr(assignment, 'user'):
                     user_ids.add(assignment.user['id'])
 
-            # NOTE(stevemar): Call find_resource once we have unique IDs, so
-            # it's fewer trips to the Identity API, then collect the data.
-            data = []
-            for user_id in user_ids:
-                user = utils.find_resource(identity_client.users, user_id)
-                data.append(user)
+            data = _get_users(identity_client, user_ids)
 
         else:
             data = identity_client.users.list(
@@ -524,12 +566,16 @@ class SetUser(command.Command):
             identity_client, 'user', parsed_args.user, parsed_args.domain
         )
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
-            user = utils.find_resource(
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users, user_str, domain_id=domain.id
             )
         else:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             )
@@ -548,6 +594,7 @@ class SetUser(command.Command):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             kwargs['default_project'] = project_id
         kwargs['enabled'] = user.enabled
@@ -652,12 +699,18 @@ class ShowUser(command.ShowOne):
             identity_client, 'user', parsed_args.user, parsed_args.domain
         )
         if parsed_args.domain:
-            domain = common.find_domain(identity_client, parsed_args.domain)
-            user = utils.find_resource(
+            domain = common.find_domain(
+                identity_client,
+                parsed_args.domain,
+                resource_cache=self.app.client_manager.resource_cache,
+            )
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users, user_str, domain_id=domain.id
             )
         else:
-            user = utils.find_resource(identity_client.users, user_str)
+            user = self.app.client_manager.resource_cache.find_resource(
+                identity_client.users, user_str
+            )
 
         user._info.pop('links')
         return zip(*sorted(user._info.items()))
@@ -304,9 +304,11 @@ class CreateImage(command.ShowOne):
         if not parsed_args.location and not parsed_args.copy_from:
             if parsed_args.volume:
                 volume_client = self.app.client_manager.volume
-                source_volume = utils.find_resource(
-                    volume_client.volumes,
-                    parsed_args.volume,
+                source_volume = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volumes,
+                        parsed_args.volume,
+                    )
                 )
                 response, body = volume_client.volumes.upload_to_image(
                     source_volume.id,
@@ -374,7 +376,11 @@ class DeleteImage(command.Command):
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
         for image in parsed_args.images:
-            image_obj = image_client.find_image(image)
+            image_obj = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    image_client.find_image, image
+                )
+            )
             image_client.delete_image(image_obj.id)
 
 
@@ -528,7 +534,9 @@ class SaveImage(command.Command):
 
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
-        image = image_client.find_image(parsed_args.image)
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image, parsed_args.image
+        )
 
         output_file = parsed_args.file
         if output_file is None:
@@ -719,14 +727,18 @@ class SetImage(command.Command):
 
         # Wrap the call to catch exceptions in order to close files
         try:
-            image = image_client.find_image(parsed_args.image)
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image, parsed_args.image
+            )
 
             if not parsed_args.location and not parsed_args.copy_from:
                 if parsed_args.volume:
                     volume_client = self.app.client_manager.volume
-                    source_volume = utils.find_resource(
-                        volume_client.volumes,
-                        parsed_args.volume,
+                    source_volume = (
+                        self.app.client_manager.resource_cache.find_resource(
+                            volume_client.volumes,
+                            parsed_args.volume,
+                        )
                     )
                     volume_client.volumes.upload_to_image(
                         source_volume.id,
@@ -800,7 +812,9 @@ class ShowImage(command.ShowOne):
 
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
-        image = image_client.find_image(parsed_args.image)
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image, parsed_args.image
+        )
 
         if parsed_args.human_readable:
             _formatters['size'] = HumanReadableSizeColumn
@@ -123,9 +123,12 @@ class QueueCachedImage(command.Command):
         failures = 0
         for image in parsed_args.images:
             try:
-                image_obj = image_client.find_image(
-                    image,
-                    ignore_missing=False,
+                image_obj = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        image_client.find_image,
+                        image,
+                        ignore_missing=False,
+                    )
                 )
                 image_client.queue_image(image_obj.id)
             except Exception as e:
@@ -163,9 +166,12 @@ class DeleteCachedImage(command.Command):
         image_client = self.app.client_manager.image
         for image in parsed_args.images:
             try:
-                image_obj = image_client.find_image(
-                    image,
-                    ignore_missing=False,
+                image_obj = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        image_client.find_image,
+                        image,
+                        ignore_missing=False,
+                    )
                 )
                 image_client.cache_delete_image(image_obj.id)
             except Exception as e:
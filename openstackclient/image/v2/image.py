@@ -31,7 +31,10 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import download
+from openstackclient.common import hashing
 from openstackclient.common import pagination
+from openstackclient.common import parallel
 from openstackclient.common import progressbar
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
@@ -60,6 +63,10 @@ DISK_CHOICES = [
 ]
 MEMBER_STATUS_CHOICES = ["accepted", "pending", "rejected", "all"]
 
+# Digests of uploaded image data computed client side, glance computes the
+# md5 'checksum' and, by default, a sha512 'os_hash_value'
+UPLOAD_HASH_ALGORITHMS = ('md5', 'sha512')
+
 
 LOG = logging.getLogger(__name__)
 
@@ -135,6 +142,142 @@ def _get_member_columns(item):
     )
 
 
+def _validate_image_data(image_client, image, digests):
+    """Compare the digests of uploaded image data with glance's
+
+    Glance only computes its digests once the image is active, images that
+    are still being imported can't be validated and are returned as is.
+    If the digests don't match the image is deleted, like the SDK does
+    when it validates checksums itself.
+
+    :param image_client: The image client.
+    :param image: The image the data was uploaded to.
+    :param digests: A dict of hash algorithm to digest of the data.
+    :returns: The refreshed image.
+    """
+    image = image_client.get_image(image.id)
+
+    mismatched = []
+    if image.checksum and image.checksum != digests.get('md5'):
+        mismatched.append('checksum')
+    if (
+        image.hash_value
+        and image.hash_algo in digests
+        and image.hash_value != digests[image.hash_algo]
+    ):
+        mismatched.append('os_hash_value')
+
+    if mismatched:
+        LOG.debug('Deleting image %s after failed upload', image.id)
+        image_client.delete_image(image.id)
+        msg = _(
+            "Image checksum verification failed: %(fields)s of the "
+            "uploaded data does not match the local data"
+        )
+        raise exceptions.CommandError(msg % {'fields': ', '.join(mismatched)})
+
+    return image
+
+
+def _get_image_hasher(image):
+    """Return a hasher to verify downloaded image data with
+
+    The image's ``os_hash_value`` is used, or its ``checksum`` if there is
+    none.
+
+    :param image: The image being downloaded.
+    :returns: A tuple of the hash algorithm, the expected digest and a
+        :class:`~openstackclient.common.hashing.Hasher`, which is None if
+        the data cannot be verified.
+    """
+    if image.hash_algo and image.hash_value:
+        algorithm, expected = image.hash_algo, image.hash_value
+    else:
+        algorithm, expected = 'md5', image.checksum
+
+    hasher = None
+    if expected:
+        try:
+            hasher = hashing.Hasher(algorithm)
+        except ValueError:
+            LOG.warning(
+                _(
+                    "Unable to verify the data of image %(image)s, hash "
+                    "algorithm %(algorithm)s is not supported"
+                ),
+                {'image': image.id, 'algorithm': algorithm},
+            )
+    return algorithm, expected, hasher
+
+
+def _check_image_hash(hasher, algorithm, expected, filename):
+    """Raise CommandError if the downloaded data doesn't match the image"""
+    if hasher is not None and hasher.hexdigest() != expected:
+        msg = _(
+            "%(algorithm)s hash of %(file)s does not match the image: "
+            "expected %(expected)s, got %(actual)s"
+        )
+        raise exceptions.CommandError(
+            msg
+            % {
+                'algorithm': algorithm,
+                'file': filename or '<stdout>',
+                'expected': expected,
+                'actual': hasher.hexdigest(),
+            }
+        )
+
+
+def _save_image_ranged(
+    image_client, image, filename, max_workers, progress=None
+):
+    """Download image data as concurrently fetched byte ranges
+
+    The data is checked against the image's ``os_hash_value``, or its
+    ``checksum`` if there is none, while it is downloaded. An interrupted
+    download is resumed by saving the same image to the same file again.
+
+    :param image_client: The image client.
+    :param image: The image to download.
+    :param filename: The file to save the image data to.
+    :param max_workers: The maximum number of ranges fetched concurrently.
+    :param progress: An optional
+        :class:`~openstackclient.common.progressbar.ProgressReporter`.
+    """
+    algorithm, expected, hasher = _get_image_hasher(image)
+
+    def _fetch_range(start, end):
+        response = image_client.get(
+            '/images/%s/file' % image.id,
+            headers={'Range': 'bytes=%d-%d' % (start, end)},
+            stream=True,
+        )
+        sdk_exceptions.raise_from_response(response)
+        if response.status_code != 206:
+            msg = _("Image service does not support ranged downloads")
+            raise exceptions.CommandError(msg)
+        return response.iter_content(64 * 1024)
+
+    try:
+        download.download_ranges(
+            filename,
+            image.size,
+            _fetch_range,
+            {'image': image.id, 'checksum': expected},
+            max_workers=max_workers,
+            range_size=download.DEFAULT_RANGE_SIZE,
+            hasher=hasher,
+            progress=progress,
+        )
+    finally:
+        if hasher is not None:
+            hasher.close()
+        if progress is not None:
+            progress.finish()
+
+    _check_image_hash(hasher, algorithm, expected, filename)
+
+
 def get_data_from_stdin():
     # distinguish cases where:
     # (1) stdin is not valid (as in cron jobs):
@@ -189,9 +332,11 @@ class AddProjectToImage(command.ShowOne):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -456,6 +601,7 @@ class CreateImage(command.ShowOne):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         if parsed_args.use_import:
@@ -481,20 +627,20 @@ class CreateImage(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        if parsed_args.progress and parsed_args.filename:
-            # NOTE(stephenfin): we only show a progress bar if the user
-            # requested it *and* we're reading from a file (not stdin)
-            filesize = os.path.getsize(parsed_args.filename)
-            if filesize is not None:
-                kwargs['validate_checksum'] = False
-                kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-            else:
-                kwargs['data'] = fp
-        elif parsed_args.filename:
-            kwargs['filename'] = parsed_args.filename
-        elif fp:
+        data = None
+        if fp is not None:
+            source = fp
+            if parsed_args.progress and parsed_args.filename:
+                # NOTE(stephenfin): we only show a progress bar if the user
+                # requested it *and* we're reading from a file (not stdin)
+                filesize = os.path.getsize(parsed_args.filename)
+                source = progressbar.VerboseFileWrapper(fp, filesize)
+            # The SDK can only validate checksums of data it can hash before
+            # uploading, which means reading everything twice. Hash the data
+            # while it is uploaded instead and validate it ourselves.
+            data = hashing.HashingReader(source, UPLOAD_HASH_ALGORITHMS)
             kwargs['validate_checksum'] = False
-            kwargs['data'] = fp
+            kwargs['data'] = data
 
         # sign an image using a given local private key file
         if parsed_args.sign_key_path or parsed_args.sign_cert_id:
@@ -552,10 +698,19 @@ class CreateImage(command.ShowOne):
             if signer.padding_method:
                 kwargs['img_signature_key_type'] = signer.padding_method
 
-        image = image_client.create_image(**kwargs)
-
-        if parsed_args.filename:
-            fp.close()
+        try:
+            image = image_client.create_image(**kwargs)
+        finally:
+            if parsed_args.filename:
+                fp.close()
+            if data is not None:
+                # Don't leave the hashing workers behind if the upload fails
+                data.stop()
+
+        if data is not None:
+            image = _validate_image_data(
+                image_client, image, data.hexdigests()
+            )
 
         return _format_image(image)
 
@@ -591,7 +746,7 @@ class CreateImage(command.ShowOne):
                 # version
                 LOG.warning(msg % opt_name)
 
-        source_volume = utils.find_resource(
+        source_volume = self.app.client_manager.resource_cache.find_resource(
             volume_client.volumes,
             parsed_args.volume,
         )
@@ -668,9 +823,12 @@ class DeleteImage(command.Command):
         image_client = self.app.client_manager.image
         for image in parsed_args.images:
             try:
-                image_obj = image_client.find_image(
-                    image,
-                    ignore_missing=False,
+                image_obj = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        image_client.find_image,
+                        image,
+                        ignore_missing=False,
+                    )
                 )
             except sdk_exceptions.ResourceNotFound as e:
                 msg = _("Unable to process request: %(e)s") % {'e': e}
@@ -837,7 +995,10 @@ class ListImage(command.Lister):
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
         if parsed_args.marker:
-            kwargs['marker'] = image_client.find_image(
+            kwargs[
+                'marker'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image,
                 parsed_args.marker,
                 ignore_missing=False,
             ).id
@@ -855,6 +1016,7 @@ class ListImage(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             kwargs['owner'] = project_id
         if parsed_args.is_hidden:
@@ -937,7 +1099,8 @@ class ListImageProjects(command.Lister):
         image_client = self.app.client_manager.image
         columns = ("Image ID", "Member ID", "Status")
 
-        image_id = image_client.find_image(
+        image_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         ).id
@@ -982,9 +1145,11 @@ class RemoveProjectImage(command.Command):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=self.app.client_manager.resource_cache,
         ).id
 
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -1008,20 +1173,92 @@ class SaveImage(command.Command):
             metavar="<image>",
             help=_("Image to save (name or ID)"),
         )
+        parallel.add_parallel_option_to_parser(
+            parser,
+            help=_(
+                'Download the image as byte ranges fetched by up to '
+                '<num-workers> concurrent requests. The download is '
+                'checked against the image hash and can be resumed by '
+                'running the command again if interrupted. Requires '
+                '--file (default: 1)'
+            ),
+        )
+        parser.add_argument(
+            "--progress",
+            action="store_true",
+            default=False,
+            help=_("Show download progress bar"),
+        )
         return parser
 
     def take_action(self, parsed_args):
+        if parsed_args.parallel > 1 and not parsed_args.filename:
+            msg = _("--parallel requires --file")
+            raise exceptions.CommandError(msg)
+
         image_client = self.app.client_manager.image
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
 
+        progress = None
+        if parsed_args.progress:
+            progress = progressbar.ProgressReporter(image.size)
+
+        if parsed_args.parallel > 1:
+            if image.size:
+                _save_image_ranged(
+                    image_client,
+                    image,
+                    parsed_args.filename,
+                    parsed_args.parallel,
+                    progress=progress,
+                )
+                return
+            LOG.warning(
+                _(
+                    "The size of image %s is unknown, downloading it as a "
+                    "single stream"
+                ),
+                image.id,
+            )
+
         output_file = parsed_args.filename
         if output_file is None:
             output_file = getattr(sys.stdout, "buffer", sys.stdout)
 
-        image_client.download_image(image.id, stream=True, output=output_file)
+        if progress is None:
+            image_client.download_image(
+                image.id, stream=True, output=output_file
+            )
+            return
+
+        # The SDK only verifies the data it writes to output itself, so
+        # check it here while reporting progress
+        algorithm, expected, hasher = _get_image_hasher(image)
+        response = image_client.download_image(image.id, stream=True)
+        chunks = progressbar.VerboseIteratorWrapper(
+            response.iter_content(64 * 1024), image.size, reporter=progress
+        )
+        try:
+            if parsed_args.filename:
+                with open(output_file, 'wb') as f:
+                    for chunk in chunks:
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        f.write(chunk)
+            else:
+                for chunk in chunks:
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    output_file.write(chunk)
+        finally:
+            if hasher is not None:
+                hasher.close()
+
+        _check_image_hash(hasher, algorithm, expected, parsed_args.filename)
 
 
 class SetImage(command.Command):
@@ -1262,7 +1499,8 @@ class SetImage(command.Command):
                     % deadopt
                 )
 
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -1272,6 +1510,7 @@ class SetImage(command.Command):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         # handle activation status changes
@@ -1388,7 +1627,8 @@ class ShowImage(command.ShowOne):
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
 
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -1433,7 +1673,8 @@ class UnsetImage(command.Command):
 
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -1547,7 +1788,8 @@ class StageImage(command.Command):
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
 
-        image = image_client.find_image(
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image,
             parsed_args.image,
             ignore_missing=False,
         )
@@ -1777,7 +2019,9 @@ class ImportImage(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-        image = image_client.find_image(parsed_args.image)
+        image = self.app.client_manager.resource_cache.find_sdk_resource(
+            image_client.find_image, parsed_args.image
+        )
 
         if not image.container_format and not image.disk_format:
             msg = _(
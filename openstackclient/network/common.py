@@ -13,13 +13,16 @@
 
 import abc
 import contextlib
+import inspect
 import logging
+import threading
 
 import openstack.exceptions
 from osc_lib.cli import parseractions
 from osc_lib.command import command
 from osc_lib import exceptions
 
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 from openstackclient.network import utils
 
@@ -39,6 +42,10 @@ _NET_TYPE_NEUTRON = 'neutron'
 _NET_TYPE_COMPUTE = 'nova-network'
 _QUALIFIER_FMT = "%s\n\n*%s*"
 
+# The number of names or IDs looked up per filtered listing, which keeps
+# the query strings to a reasonable length
+_FIND_CHUNK_SIZE = 100
+
 
 @contextlib.contextmanager
 def check_missing_extension_if_error(client_manager, attrs):
@@ -51,7 +58,9 @@ def check_missing_extension_if_error(client_manager, attrs):
     except openstack.exceptions.HttpException:
         for opt, ext in _required_opt_extensions_map.items():
             if opt in attrs:
-                client_manager.find_extension(ext, ignore_missing=False)
+                client_manager.resource_cache.find_sdk_resource(
+                    client_manager.find_extension, ext, ignore_missing=False
+                )
         raise
 
 
@@ -197,22 +206,105 @@ class NetworkAndComputeDelete(NetworkAndComputeCommand, metaclass=abc.ABCMeta):
     following the rules in doc/source/command-errors.rst.
     """
 
+    # The name of the network proxy method listing the resources, and the
+    # attributes a name or ID given on the command line may match, in
+    # order of precedence. When set, the resources to delete are looked up
+    # with filtered listings rather than one by one.
+    network_list_method = None
+    network_find_attrs = ('id', 'name')
+
+    def __init__(self, *args, **kwargs):
+        super(NetworkAndComputeDelete, self).__init__(*args, **kwargs)
+        self._local = threading.local()
+        self._found = {}
+
+    @property
+    def r(self):
+        """The name or ID of the resource being deleted by this thread"""
+        return getattr(self._local, 'r', None)
+
+    @r.setter
+    def r(self, value):
+        self._local.r = value
+
+    def get_parser(self, prog_name):
+        parser = super(NetworkAndComputeDelete, self).get_parser(prog_name)
+        parallel.add_parallel_option_to_parser(parser)
+        return parser
+
+    def find_network_resources(self, client, names):
+        """Look the resources to delete up in one pass
+
+        Names matching more than one resource are left out, so that they
+        are reported by the usual lookup.
+
+        :param client: The network proxy.
+        :param names: The names or IDs of the resources.
+        :returns: A dict mapping the names found to their resource.
+        """
+        list_resources = getattr(client, self.network_list_method)
+        found = {}
+        remaining = list(dict.fromkeys(names))
+        for attr in self.network_find_attrs:
+            matches = {}
+            for start in range(0, len(remaining), _FIND_CHUNK_SIZE):
+                chunk = remaining[start : start + _FIND_CHUNK_SIZE]
+                for obj in list_resources(**{attr: chunk}):
+                    matches.setdefault(getattr(obj, attr), []).append(obj)
+            for name in remaining:
+                if len(matches.get(name, ())) == 1:
+                    found[name] = matches[name][0]
+            remaining = [name for name in remaining if name not in found]
+            if not remaining:
+                break
+        return found
+
+    def find_network_resource(self, find):
+        """Return the resource to delete
+
+        :param find: The network proxy method finding a resource by name
+            or ID, used unless the resource was found in one pass.
+        """
+        obj = self._found.get(self.r)
+        if obj is None:
+            obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                find, self.r, ignore_missing=False
+            )
+        return obj
+
     def take_action(self, parsed_args):
         ret = 0
         resources = getattr(parsed_args, self.resource, [])
 
-        for r in resources:
-            self.r = r
-            try:
-                if self.app.client_manager.is_network_endpoint_enabled():
-                    self.take_action_network(
-                        self.app.client_manager.network, parsed_args
-                    )
-                else:
-                    self.take_action_compute(
-                        self.app.client_manager.compute, parsed_args
+        if self.app.client_manager.is_network_endpoint_enabled():
+            client = self.app.client_manager.network
+            action = self.take_action_network
+            if self.network_list_method and len(resources) > 1:
+                try:
+                    self._found = self.find_network_resources(
+                        client, resources
                     )
-            except Exception as e:
+                except openstack.exceptions.SDKException as e:
+                    # Fall back to looking the resources up one by one
+                    LOG.debug('Unable to find %ss: %s', self.resource, e)
+        else:
+            client = self.app.client_manager.compute
+            action = self.take_action_compute
+
+        def _delete(r):
+            self.r = r
+            action(client, parsed_args)
+
+        max_workers = getattr(parsed_args, 'parallel', 1)
+        if not isinstance(inspect.getattr_static(type(self), 'r'), property):
+            # A subclass shadowing the thread-local resource can only
+            # delete one resource at a time
+            max_workers = 1
+
+        for r, _result, e in parallel.run_concurrently(
+            _delete, resources, max_workers=max_workers
+        ):
+            if e is not None:
                 msg = _(
                     "Failed to delete %(resource)s with name or ID "
                     "'%(name_or_id)s': %(e)s"
@@ -51,6 +51,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -124,7 +125,9 @@ class DeleteAddressGroup(command.Command):
 
         for group in parsed_args.address_group:
             try:
-                obj = client.find_address_group(group, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_address_group, group, ignore_missing=False
+                )
                 client.delete_address_group(obj)
             except Exception as e:
                 result += 1
@@ -192,6 +195,7 @@ class ListAddressGroup(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
         data = client.address_groups(**attrs)
@@ -241,8 +245,10 @@ class SetAddressGroup(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_address_group(
-            parsed_args.address_group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_address_group,
+            parsed_args.address_group,
+            ignore_missing=False,
         )
         attrs = {}
         if parsed_args.name is not None:
@@ -276,8 +282,10 @@ class ShowAddressGroup(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_address_group(
-            parsed_args.address_group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_address_group,
+            parsed_args.address_group,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters={})
@@ -309,8 +317,10 @@ class UnsetAddressGroup(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_address_group(
-            parsed_args.address_group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_address_group,
+            parsed_args.address_group,
+            ignore_missing=False,
         )
         if parsed_args.address:
             client.remove_addresses_from_address_group(
@@ -50,6 +50,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -129,7 +130,9 @@ class DeleteAddressScope(command.Command):
 
         for scope in parsed_args.address_scope:
             try:
-                obj = client.find_address_scope(scope, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_address_scope, scope, ignore_missing=False
+                )
                 client.delete_address_scope(obj)
             except Exception as e:
                 result += 1
@@ -226,6 +229,7 @@ class ListAddressScope(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
         data = client.address_scopes(**attrs)
@@ -274,8 +278,10 @@ class SetAddressScope(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_address_scope(
-            parsed_args.address_scope, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_address_scope,
+            parsed_args.address_scope,
+            ignore_missing=False,
         )
         attrs = {}
         if parsed_args.name is not None:
@@ -305,8 +311,10 @@ class ShowAddressScope(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_address_scope(
-            parsed_args.address_scope, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_address_scope,
+            parsed_args.address_scope,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters={})
@@ -242,8 +242,10 @@ class DeleteDefaultSecurityGroupRule(command.Command):
         client = self.app.client_manager.sdk_connection.network
         for r in parsed_args.rule:
             try:
-                obj = client.find_default_security_group_rule(
-                    r, ignore_missing=False
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_default_security_group_rule,
+                    r,
+                    ignore_missing=False,
                 )
                 client.delete_default_security_group_rule(obj)
             except Exception as e:
@@ -386,8 +388,10 @@ class ShowDefaultSecurityGroupRule(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.sdk_connection.network
-        obj = client.find_default_security_group_rule(
-            parsed_args.rule, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_default_security_group_rule,
+            parsed_args.rule,
+            ignore_missing=False,
         )
         # necessary for old rules that have None in this field
         if not obj['remote_ip_prefix']:
@@ -45,19 +45,25 @@ def _get_attrs(client_manager, parsed_args):
 
     # Name of a network could be empty string.
     if parsed_args.network is not None:
-        network = network_client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_network,
+            parsed_args.network,
+            ignore_missing=False,
         )
         attrs['floating_network_id'] = network.id
 
     if parsed_args.subnet:
-        subnet = network_client.find_subnet(
-            parsed_args.subnet, ignore_missing=False
+        subnet = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_subnet,
+            parsed_args.subnet,
+            ignore_missing=False,
         )
         attrs['subnet_id'] = subnet.id
 
     if parsed_args.port:
-        port = network_client.find_port(parsed_args.port, ignore_missing=False)
+        port = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_port, parsed_args.port, ignore_missing=False
+        )
         attrs['port_id'] = port.id
 
     if parsed_args.floating_ip_address:
@@ -67,8 +73,12 @@ def _get_attrs(client_manager, parsed_args):
         attrs['fixed_ip_address'] = parsed_args.fixed_ip_address
 
     if parsed_args.qos_policy:
-        attrs['qos_policy_id'] = network_client.find_qos_policy(
-            parsed_args.qos_policy, ignore_missing=False
+        attrs[
+            'qos_policy_id'
+        ] = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_qos_policy,
+            parsed_args.qos_policy,
+            ignore_missing=False,
         ).id
 
     if parsed_args.description is not None:
@@ -80,6 +90,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -211,7 +222,8 @@ class DeleteFloatingIP(common.NetworkAndComputeDelete):
 
     # Used by base class to find resources in parsed_args.
     resource = 'floating_ip'
-    r = None
+    network_list_method = 'ips'
+    network_find_attrs = ('id', 'floating_ip_address')
 
     def update_parser_common(self, parser):
         parser.add_argument(
@@ -223,10 +235,7 @@ class DeleteFloatingIP(common.NetworkAndComputeDelete):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_ip(
-            self.r,
-            ignore_missing=False,
-        )
+        obj = self.find_network_resource(client.find_ip)
         client.delete_ip(obj)
 
     def take_action_compute(self, client, parsed_args):
@@ -361,13 +370,17 @@ class ListFloatingIP(common.NetworkAndComputeLister):
         query = {}
 
         if parsed_args.network is not None:
-            network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            network = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_network,
+                parsed_args.network,
+                ignore_missing=False,
             )
             query['floating_network_id'] = network.id
         if parsed_args.port is not None:
-            port = network_client.find_port(
-                parsed_args.port, ignore_missing=False
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_port,
+                parsed_args.port,
+                ignore_missing=False,
             )
             query['port_id'] = port.id
         if parsed_args.fixed_ip_address is not None:
@@ -381,11 +394,14 @@ class ListFloatingIP(common.NetworkAndComputeLister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
             query['project_id'] = project.id
         if parsed_args.router is not None:
-            router = network_client.find_router(
-                parsed_args.router, ignore_missing=False
+            router = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_router,
+                parsed_args.router,
+                ignore_missing=False,
             )
             query['router_id'] = router.id
 
@@ -484,12 +500,15 @@ class SetFloatingIP(common.NeutronCommandWithExtraArgs):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         attrs = {}
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
         if parsed_args.port:
-            port = client.find_port(parsed_args.port, ignore_missing=False)
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.port, ignore_missing=False
+            )
             attrs['port_id'] = port.id
 
         if parsed_args.fixed_ip_address:
@@ -499,8 +518,12 @@ class SetFloatingIP(common.NeutronCommandWithExtraArgs):
             attrs['description'] = parsed_args.description
 
         if parsed_args.qos_policy:
-            attrs['qos_policy_id'] = client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
+            attrs[
+                'qos_policy_id'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_qos_policy,
+                parsed_args.qos_policy,
+                ignore_missing=False,
             ).id
 
         if 'no_qos_policy' in parsed_args and parsed_args.no_qos_policy:
@@ -529,7 +552,8 @@ class ShowFloatingIP(common.NetworkAndComputeShowOne):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
@@ -572,7 +596,8 @@ class UnsetFloatingIP(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
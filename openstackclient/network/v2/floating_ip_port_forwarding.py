@@ -169,7 +169,8 @@ class CreateFloatingIPPortForwarding(
     def take_action(self, parsed_args):
         attrs = {}
         client = self.app.client_manager.network
-        floating_ip = client.find_ip(
+        floating_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
@@ -177,7 +178,9 @@ class CreateFloatingIPPortForwarding(
         validate_and_assign_port_ranges(parsed_args, attrs)
 
         if parsed_args.port:
-            port = client.find_port(parsed_args.port, ignore_missing=False)
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.port, ignore_missing=False
+            )
             attrs['internal_port_id'] = port.id
         attrs['internal_ip_address'] = parsed_args.internal_ip_address
         attrs['protocol'] = parsed_args.protocol
@@ -222,7 +225,8 @@ class DeleteFloatingIPPortForwarding(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        floating_ip = client.find_ip(
+        floating_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
@@ -321,7 +325,9 @@ class ListFloatingIPPortForwarding(command.Lister):
         query = {}
 
         if parsed_args.port:
-            port = client.find_port(parsed_args.port, ignore_missing=False)
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.port, ignore_missing=False
+            )
             query['internal_port_id'] = port.id
         external_port = parsed_args.external_protocol_port
         if external_port:
@@ -334,7 +340,8 @@ class ListFloatingIPPortForwarding(command.Lister):
         if parsed_args.protocol is not None:
             query['protocol'] = parsed_args.protocol
 
-        obj = client.find_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
@@ -424,14 +431,17 @@ class SetFloatingIPPortForwarding(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        floating_ip = client.find_ip(
+        floating_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
 
         attrs = {}
         if parsed_args.port:
-            port = client.find_port(parsed_args.port, ignore_missing=False)
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.port, ignore_missing=False
+            )
             attrs['internal_port_id'] = port.id
 
         if parsed_args.internal_ip_address:
@@ -478,7 +488,8 @@ class ShowFloatingIPPortForwarding(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        floating_ip = client.find_ip(
+        floating_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ip,
             parsed_args.floating_ip,
             ignore_missing=False,
         )
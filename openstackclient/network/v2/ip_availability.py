@@ -86,6 +86,7 @@ class ListIPAvailability(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             filters['project_id'] = project_id
         data = client.network_ip_availabilities(**filters)
@@ -115,11 +116,13 @@ class ShowIPAvailability(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        network_id = client.find_network(
-            parsed_args.network, ignore_missing=False
+        network_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         ).id
-        obj = client.find_network_ip_availability(
-            network_id, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network_ip_availability,
+            network_id,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
@@ -32,8 +32,10 @@ def _get_columns(item):
     )
 
 
-def _get_attrs(client, parsed_args):
-    router = client.find_router(parsed_args.router, ignore_missing=False)
+def _get_attrs(client, parsed_args, resource_cache):
+    router = resource_cache.find_sdk_resource(
+        client.find_router, parsed_args.router, ignore_missing=False
+    )
     attrs = {'router_id': router.id}
     if parsed_args.helper:
         attrs['helper'] = parsed_args.helper
@@ -83,7 +85,9 @@ class CreateConntrackHelper(command.ShowOne):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
 
-        attrs = _get_attrs(client, parsed_args)
+        attrs = _get_attrs(
+            client, parsed_args, self.app.client_manager.resource_cache
+        )
         obj = client.create_conntrack_helper(attrs.pop('router_id'), **attrs)
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters={})
@@ -114,7 +118,9 @@ class DeleteConntrackHelper(command.Command):
         client = self.app.client_manager.network
         result = 0
 
-        router = client.find_router(parsed_args.router, ignore_missing=False)
+        router = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         for ct_helper in parsed_args.conntrack_helper_id:
             try:
                 client.delete_conntrack_helper(
@@ -186,7 +192,9 @@ class ListConntrackHelper(command.Lister):
             'Protocol',
             'Port',
         )
-        attrs = _get_attrs(client, parsed_args)
+        attrs = _get_attrs(
+            client, parsed_args, self.app.client_manager.resource_cache
+        )
         data = client.conntrack_helpers(attrs.pop('router_id'), **attrs)
 
         return (
@@ -240,7 +248,9 @@ class SetConntrackHelper(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        attrs = _get_attrs(client, parsed_args)
+        attrs = _get_attrs(
+            client, parsed_args, self.app.client_manager.resource_cache
+        )
         if attrs:
             client.update_conntrack_helper(
                 parsed_args.conntrack_helper_id,
@@ -269,7 +279,9 @@ class ShowConntrackHelper(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        router = client.find_router(parsed_args.router, ignore_missing=False)
+        router = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         obj = client.get_conntrack_helper(
             parsed_args.conntrack_helper_id, router.id
         )
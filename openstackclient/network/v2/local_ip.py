@@ -49,18 +49,23 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
     if parsed_args.network:
-        network = network_client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_network,
+            parsed_args.network,
+            ignore_missing=False,
         )
         attrs['network_id'] = network.id
     if parsed_args.local_ip_address:
         attrs['local_ip_address'] = parsed_args.local_ip_address
     if parsed_args.local_port:
-        port = network_client.find_port(
-            parsed_args.local_port, ignore_missing=False
+        port = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_port,
+            parsed_args.local_port,
+            ignore_missing=False,
         )
         attrs['local_port_id'] = port.id
     if parsed_args.ip_mode:
@@ -135,7 +140,9 @@ class DeleteLocalIP(command.Command):
 
         for lip in parsed_args.local_ip:
             try:
-                obj = client.find_local_ip(lip, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_local_ip, lip, ignore_missing=False
+                )
                 client.delete_local_ip(obj)
             except Exception as e:
                 result += 1
@@ -177,7 +184,9 @@ class SetLocalIP(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_local_ip(parsed_args.local_ip, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_local_ip, parsed_args.local_ip, ignore_missing=False
+        )
         attrs = {}
         if parsed_args.name is not None:
             attrs['name'] = parsed_args.name
@@ -263,16 +272,17 @@ class ListLocalIP(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
         if parsed_args.network is not None:
-            network = client.find_network(
-                parsed_args.network, ignore_missing=False
+            network = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_network, parsed_args.network, ignore_missing=False
             )
             attrs['network_id'] = network.id
         if parsed_args.local_port:
-            port = client.find_port(
-                parsed_args.local_port, ignore_missing=False
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.local_port, ignore_missing=False
             )
             attrs['local_port_id'] = port.id
         if parsed_args.local_ip_address:
@@ -309,7 +319,9 @@ class ShowLocalIP(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_local_ip(parsed_args.local_ip, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_local_ip, parsed_args.local_ip, ignore_missing=False
+        )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters={})
 
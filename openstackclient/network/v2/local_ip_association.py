@@ -66,11 +66,14 @@ class CreateLocalIPAssociation(command.ShowOne):
         client = self.app.client_manager.network
 
         attrs = {}
-        port = client.find_port(parsed_args.fixed_port, ignore_missing=False)
+        port = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.fixed_port, ignore_missing=False
+        )
         attrs['fixed_port_id'] = port.id
         if parsed_args.fixed_ip:
             attrs['fixed_ip'] = parsed_args.fixed_ip
-        local_ip = client.find_local_ip(
+        local_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_local_ip,
             parsed_args.local_ip,
             ignore_missing=False,
         )
@@ -103,7 +106,8 @@ class DeleteLocalIPAssociation(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        local_ip = client.find_local_ip(
+        local_ip = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_local_ip,
             parsed_args.local_ip,
             ignore_missing=False,
         )
@@ -185,13 +189,14 @@ class ListLocalIPAssociation(command.Lister):
             'Host',
         )
         attrs = {}
-        obj = client.find_local_ip(
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_local_ip,
             parsed_args.local_ip,
             ignore_missing=False,
         )
         if parsed_args.fixed_port:
-            port = client.find_port(
-                parsed_args.fixed_port, ignore_missing=False
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.fixed_port, ignore_missing=False
             )
             attrs['fixed_port_id'] = port.id
         if parsed_args.fixed_ip:
@@ -78,7 +78,8 @@ class CreateNDPProxy(command.ShowOne):
     def take_action(self, parsed_args):
         attrs = {'name': parsed_args.name}
         client = self.app.client_manager.network
-        router = client.find_router(
+        router = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router,
             parsed_args.router,
             ignore_missing=False,
         )
@@ -87,7 +88,9 @@ class CreateNDPProxy(command.ShowOne):
         if parsed_args.ip_address:
             attrs['ip_address'] = parsed_args.ip_address
 
-        port = client.find_port(parsed_args.port, ignore_missing=False)
+        port = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         attrs['port_id'] = port.id
 
         if parsed_args.description is not None:
@@ -118,7 +121,9 @@ class DeleteNDPProxy(command.Command):
 
         for ndp_proxy in parsed_args.ndp_proxy:
             try:
-                obj = client.find_ndp_proxy(ndp_proxy, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_ndp_proxy, ndp_proxy, ignore_missing=False
+                )
                 client.delete_ndp_proxy(obj)
             except Exception as e:
                 result += 1
@@ -191,12 +196,14 @@ class ListNDPProxy(command.Lister):
         query = {}
 
         if parsed_args.router:
-            router = client.find_router(
-                parsed_args.router, ignore_missing=False
+            router = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
             )
             query['router_id'] = router.id
         if parsed_args.port:
-            port = client.find_port(parsed_args.port, ignore_missing=False)
+            port = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_port, parsed_args.port, ignore_missing=False
+            )
             query['port_id'] = port.id
         if parsed_args.ip_address is not None:
             query['ip_address'] = parsed_args.ip_address
@@ -205,6 +212,7 @@ class ListNDPProxy(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             query['project_id'] = project_id
         if parsed_args.name:
@@ -256,8 +264,8 @@ class SetNDPProxy(command.Command):
         if parsed_args.name is not None:
             attrs['name'] = parsed_args.name
 
-        obj = client.find_ndp_proxy(
-            parsed_args.ndp_proxy, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ndp_proxy, parsed_args.ndp_proxy, ignore_missing=False
         )
         client.update_ndp_proxy(obj, **attrs)
 
@@ -276,8 +284,8 @@ class ShowNDPProxy(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_ndp_proxy(
-            parsed_args.ndp_proxy, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_ndp_proxy, parsed_args.ndp_proxy, ignore_missing=False
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
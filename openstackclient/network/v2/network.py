@@ -96,6 +96,7 @@ def _get_attrs_network(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -132,8 +133,10 @@ def _get_attrs_network(client_manager, parsed_args):
         attrs['provider:segmentation_id'] = parsed_args.segmentation_id
     if parsed_args.qos_policy is not None:
         network_client = client_manager.network
-        _qos_policy = network_client.find_qos_policy(
-            parsed_args.qos_policy, ignore_missing=False
+        _qos_policy = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_qos_policy,
+            parsed_args.qos_policy,
+            ignore_missing=False,
         )
         attrs['qos_policy_id'] = _qos_policy.id
     if 'no_qos_policy' in parsed_args and parsed_args.no_qos_policy:
@@ -400,7 +403,7 @@ class DeleteNetwork(common.NetworkAndComputeDelete):
 
     # Used by base class to find resources in parsed_args.
     resource = 'network'
-    r = None
+    network_list_method = 'networks'
 
     def update_parser_common(self, parser):
         parser.add_argument(
@@ -413,7 +416,7 @@ class DeleteNetwork(common.NetworkAndComputeDelete):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_network(self.r, ignore_missing=False)
+        obj = self.find_network_resource(client.find_network)
         client.delete_network(obj)
 
     def take_action_compute(self, client, parsed_args):
@@ -623,6 +626,7 @@ class ListNetwork(common.NetworkAndComputeLister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             )
             args['project_id'] = project.id
 
@@ -795,7 +799,9 @@ class SetNetwork(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_network(parsed_args.network, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
+        )
 
         attrs = _get_attrs_network(self.app.client_manager, parsed_args)
         attrs.update(
@@ -823,7 +829,9 @@ class ShowNetwork(common.NetworkAndComputeShowOne):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_network(parsed_args.network, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
+        )
         display_columns, columns = _get_columns_network(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
         return (display_columns, data)
@@ -850,7 +858,9 @@ class UnsetNetwork(common.NeutronUnsetCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_network(parsed_args.network, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
+        )
 
         attrs = self._parse_extra_properties(parsed_args.extra_properties)
         if attrs:
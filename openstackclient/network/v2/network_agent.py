@@ -82,8 +82,8 @@ class AddNetworkToAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         )
         if parsed_args.dhcp:
             try:
@@ -119,7 +119,9 @@ class AddRouterToAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        router = client.find_router(parsed_args.router, ignore_missing=False)
+        router = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         if parsed_args.l3:
             client.add_router_to_agent(agent, router)
 
@@ -257,16 +259,16 @@ class ListNetworkAgent(command.Lister):
         filters = {}
 
         if parsed_args.network is not None:
-            network = client.find_network(
-                parsed_args.network, ignore_missing=False
+            network = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_network, parsed_args.network, ignore_missing=False
             )
             data = client.network_hosting_dhcp_agents(network)
         elif parsed_args.router is not None:
             if parsed_args.long:
                 columns += ('ha_state',)
                 column_headers += ('HA State',)
-            router = client.find_router(
-                parsed_args.router, ignore_missing=False
+            router = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
             )
             data = client.routers_hosting_l3_agents(router)
         else:
@@ -314,8 +316,8 @@ class RemoveNetworkFromAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         )
         if parsed_args.dhcp:
             try:
@@ -353,7 +355,9 @@ class RemoveRouterFromAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        router = client.find_router(parsed_args.router, ignore_missing=False)
+        router = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         if parsed_args.l3:
             client.remove_router_from_agent(agent, router)
 
@@ -51,6 +51,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
     if parsed_args.check_resources:
@@ -53,6 +53,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -76,11 +77,15 @@ class AddNetworkFlavorToProfile(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj_flavor = client.find_flavor(
-            parsed_args.flavor, ignore_missing=False
+        obj_flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_flavor, parsed_args.flavor, ignore_missing=False
         )
-        obj_service_profile = client.find_service_profile(
-            parsed_args.service_profile, ignore_missing=False
+        obj_service_profile = (
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_service_profile,
+                parsed_args.service_profile,
+                ignore_missing=False,
+            )
         )
         client.associate_flavor_with_service_profile(
             obj_flavor, obj_service_profile
@@ -162,7 +167,9 @@ class DeleteNetworkFlavor(command.Command):
 
         for flavor in parsed_args.flavor:
             try:
-                obj = client.find_flavor(flavor, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_flavor, flavor, ignore_missing=False
+                )
                 client.delete_flavor(obj)
             except Exception as e:
                 result += 1
@@ -229,11 +236,15 @@ class RemoveNetworkFlavorFromProfile(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj_flavor = client.find_flavor(
-            parsed_args.flavor, ignore_missing=False
+        obj_flavor = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_flavor, parsed_args.flavor, ignore_missing=False
         )
-        obj_service_profile = client.find_service_profile(
-            parsed_args.service_profile, ignore_missing=False
+        obj_service_profile = (
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_service_profile,
+                parsed_args.service_profile,
+                ignore_missing=False,
+            )
         )
         client.disassociate_flavor_from_service_profile(
             obj_flavor, obj_service_profile
@@ -270,7 +281,9 @@ class SetNetworkFlavor(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_flavor(parsed_args.flavor, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_flavor, parsed_args.flavor, ignore_missing=False
+        )
         attrs = {}
         if parsed_args.name is not None:
             attrs['name'] = parsed_args.name
@@ -300,7 +313,9 @@ class ShowNetworkFlavor(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_flavor(parsed_args.flavor, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_flavor, parsed_args.flavor, ignore_missing=False
+        )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
         return display_columns, data
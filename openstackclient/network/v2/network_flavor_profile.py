@@ -53,6 +53,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -145,8 +146,10 @@ class DeleteNetworkFlavorProfile(command.Command):
 
         for flavor_profile in parsed_args.flavor_profile:
             try:
-                obj = client.find_service_profile(
-                    flavor_profile, ignore_missing=False
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_service_profile,
+                    flavor_profile,
+                    ignore_missing=False,
                 )
                 client.delete_service_profile(obj)
             except Exception as e:
@@ -248,8 +251,10 @@ class SetNetworkFlavorProfile(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_service_profile(
-            parsed_args.flavor_profile, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_service_profile,
+            parsed_args.flavor_profile,
+            ignore_missing=False,
         )
         attrs = _get_attrs(self.app.client_manager, parsed_args)
         attrs.update(
@@ -273,8 +278,10 @@ class ShowNetworkFlavorProfile(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_service_profile(
-            parsed_args.flavor_profile, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_service_profile,
+            parsed_args.flavor_profile,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
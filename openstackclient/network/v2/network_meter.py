@@ -47,6 +47,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
     if parsed_args.share:
@@ -134,7 +135,9 @@ class DeleteMeter(command.Command):
 
         for meter in parsed_args.meter:
             try:
-                obj = client.find_metering_label(meter, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_metering_label, meter, ignore_missing=False
+                )
                 client.delete_metering_label(obj)
             except Exception as e:
                 result += 1
@@ -195,8 +198,8 @@ class ShowMeter(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_metering_label(
-            parsed_args.meter, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_metering_label, parsed_args.meter, ignore_missing=False
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
@@ -59,6 +59,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -127,8 +128,8 @@ class CreateMeterRule(command.ShowOne, common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        _meter = client.find_metering_label(
-            parsed_args.meter, ignore_missing=False
+        _meter = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_metering_label, parsed_args.meter, ignore_missing=False
         )
         parsed_args.meter = _meter.id
         attrs = _get_attrs(self.app.client_manager, parsed_args)
@@ -163,7 +164,9 @@ class DeleteMeterRule(command.Command):
 
         for id in parsed_args.meter_rule_id:
             try:
-                obj = client.find_metering_label_rule(id, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_metering_label_rule, id, ignore_missing=False
+                )
                 client.delete_metering_label_rule(obj)
             except Exception as e:
                 result += 1
@@ -232,8 +235,10 @@ class ShowMeterRule(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_metering_label_rule(
-            parsed_args.meter_rule_id, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_metering_label_rule,
+            parsed_args.meter_rule_id,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
@@ -71,6 +71,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -159,7 +160,9 @@ class DeleteNetworkQosPolicy(command.Command):
 
         for policy in parsed_args.policy:
             try:
-                obj = client.find_qos_policy(policy, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_qos_policy, policy, ignore_missing=False
+                )
                 client.delete_qos_policy(obj)
             except Exception as e:
                 result += 1
@@ -284,7 +287,9 @@ class SetNetworkQosPolicy(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_qos_policy(parsed_args.policy, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_qos_policy, parsed_args.policy, ignore_missing=False
+        )
         attrs = _get_attrs(self.app.client_manager, parsed_args)
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties)
@@ -306,7 +311,9 @@ class ShowNetworkQosPolicy(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_qos_policy(parsed_args.policy, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_qos_policy, parsed_args.policy, ignore_missing=False
+        )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
         return (display_columns, data)
@@ -103,10 +103,12 @@ def _check_type_parameters(attrs, type, is_create):
         raise exceptions.CommandError(msg)
 
 
-def _get_attrs(network_client, parsed_args, is_create=False):
+def _get_attrs(network_client, parsed_args, resource_cache, is_create=False):
     attrs = {}
-    qos = network_client.find_qos_policy(
-        parsed_args.qos_policy, ignore_missing=False
+    qos = resource_cache.find_sdk_resource(
+        network_client.find_qos_policy,
+        parsed_args.qos_policy,
+        ignore_missing=False,
     )
     attrs['qos_policy_id'] = qos.id
     if not is_create:
@@ -270,7 +272,12 @@ class CreateNetworkQosRule(
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
         try:
-            attrs = _get_attrs(network_client, parsed_args, is_create=True)
+            attrs = _get_attrs(
+                network_client,
+                parsed_args,
+                self.app.client_manager.resource_cache,
+                is_create=True,
+            )
             attrs.update(
                 self._parse_extra_properties(parsed_args.extra_properties)
             )
@@ -306,8 +313,10 @@ class DeleteNetworkQosRule(command.Command):
         network_client = self.app.client_manager.network
         rule_id = parsed_args.id
         try:
-            qos = network_client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
+            qos = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_qos_policy,
+                parsed_args.qos_policy,
+                ignore_missing=False,
             )
             rule_type = _find_rule_type(qos, rule_id)
             if not rule_type:
@@ -358,8 +367,10 @@ class ListNetworkQosRule(command.Lister):
             'DSCP mark',
             'Direction',
         )
-        qos = client.find_qos_policy(
-            parsed_args.qos_policy, ignore_missing=False
+        qos = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_qos_policy,
+            parsed_args.qos_policy,
+            ignore_missing=False,
         )
         data = qos.rules
         return (
@@ -389,13 +400,19 @@ class SetNetworkQosRule(common.NeutronCommandWithExtraArgs):
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
         try:
-            qos = network_client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
+            qos = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_qos_policy,
+                parsed_args.qos_policy,
+                ignore_missing=False,
             )
             rule_type = _find_rule_type(qos, parsed_args.id)
             if not rule_type:
                 raise Exception('Rule not found')
-            attrs = _get_attrs(network_client, parsed_args)
+            attrs = _get_attrs(
+                network_client,
+                parsed_args,
+                self.app.client_manager.resource_cache,
+            )
             attrs.update(
                 self._parse_extra_properties(parsed_args.extra_properties)
             )
@@ -435,8 +452,10 @@ class ShowNetworkQosRule(command.ShowOne):
         network_client = self.app.client_manager.network
         rule_id = parsed_args.id
         try:
-            qos = network_client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
+            qos = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_qos_policy,
+                parsed_args.qos_policy,
+                ignore_missing=False,
             )
             rule_type = _find_rule_type(qos, rule_id)
             if not rule_type:
@@ -43,28 +43,40 @@ def _get_attrs(client_manager, parsed_args):
 
     network_client = client_manager.network
     if parsed_args.type == 'network':
-        object_id = network_client.find_network(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_network,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
     if parsed_args.type == 'qos_policy':
-        object_id = network_client.find_qos_policy(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_qos_policy,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
     if parsed_args.type == 'security_group':
-        object_id = network_client.find_security_group(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_security_group,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
     if parsed_args.type == 'address_scope':
-        object_id = network_client.find_address_scope(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_address_scope,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
     if parsed_args.type == 'subnetpool':
-        object_id = network_client.find_subnet_pool(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_subnet_pool,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
     if parsed_args.type == 'address_group':
-        object_id = network_client.find_address_group(
-            parsed_args.rbac_object, ignore_missing=False
+        object_id = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_address_group,
+            parsed_args.rbac_object,
+            ignore_missing=False,
         ).id
 
     attrs['object_id'] = object_id
@@ -75,6 +87,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.target_project,
             parsed_args.target_project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
     elif parsed_args.target_all_projects:
         project_id = '*'
@@ -84,6 +97,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -197,7 +211,9 @@ class DeleteNetworkRBAC(command.Command):
 
         for rbac in parsed_args.rbac_policy:
             try:
-                obj = client.find_rbac_policy(rbac, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_rbac_policy, rbac, ignore_missing=False
+                )
                 client.delete_rbac_policy(obj)
             except Exception as e:
                 result += 1
@@ -292,6 +308,7 @@ class ListNetworkRBAC(command.Lister):
                 project_id = identity_common.find_project(
                     identity_client,
                     parsed_args.target_project,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
             query['target_project_id'] = project_id
 
@@ -342,8 +359,10 @@ class SetNetworkRBAC(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_rbac_policy(
-            parsed_args.rbac_policy, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_rbac_policy,
+            parsed_args.rbac_policy,
+            ignore_missing=False,
         )
         attrs = {}
         if parsed_args.target_project:
@@ -352,6 +371,7 @@ class SetNetworkRBAC(common.NeutronCommandWithExtraArgs):
                 identity_client,
                 parsed_args.target_project,
                 parsed_args.target_project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['target_tenant'] = project_id
         attrs.update(
@@ -374,8 +394,10 @@ class ShowNetworkRBAC(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_rbac_policy(
-            parsed_args.rbac_policy, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_rbac_policy,
+            parsed_args.rbac_policy,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
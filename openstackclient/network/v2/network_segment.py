@@ -86,8 +86,10 @@ class CreateNetworkSegment(
         client = self.app.client_manager.network
         attrs = {}
         attrs['name'] = parsed_args.name
-        attrs['network_id'] = client.find_network(
-            parsed_args.network, ignore_missing=False
+        attrs[
+            'network_id'
+        ] = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         ).id
         attrs['network_type'] = parsed_args.network_type
         if parsed_args.description is not None:
@@ -124,8 +126,8 @@ class DeleteNetworkSegment(command.Command):
         result = 0
         for network_segment in parsed_args.network_segment:
             try:
-                obj = client.find_segment(
-                    network_segment, ignore_missing=False
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_segment, network_segment, ignore_missing=False
                 )
                 client.delete_segment(obj)
             except Exception as e:
@@ -172,8 +174,12 @@ class ListNetworkSegment(command.Lister):
 
         filters = {}
         if parsed_args.network:
-            _network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            _network = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_network,
+                    parsed_args.network,
+                    ignore_missing=False,
+                )
             )
             filters = {'network_id': _network.id}
         data = network_client.segments(**filters)
@@ -233,8 +239,10 @@ class SetNetworkSegment(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_segment(
-            parsed_args.network_segment, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_segment,
+            parsed_args.network_segment,
+            ignore_missing=False,
         )
         attrs = {}
         if parsed_args.description is not None:
@@ -261,8 +269,10 @@ class ShowNetworkSegment(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_segment(
-            parsed_args.network_segment, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_segment,
+            parsed_args.network_segment,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
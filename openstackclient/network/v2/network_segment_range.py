@@ -175,8 +175,10 @@ class CreateNetworkSegmentRange(
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'network-segment-range', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'network-segment-range',
+                ignore_missing=False,
             )
         except Exception as e:
             msg = _(
@@ -218,6 +220,7 @@ class CreateNetworkSegmentRange(
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             if project_id:
                 attrs['project_id'] = project_id
@@ -267,8 +270,10 @@ class DeleteNetworkSegmentRange(command.Command):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'network-segment-range', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'network-segment-range',
+                ignore_missing=False,
             )
         except Exception as e:
             msg = _(
@@ -280,8 +285,10 @@ class DeleteNetworkSegmentRange(command.Command):
         result = 0
         for network_segment_range in parsed_args.network_segment_range:
             try:
-                obj = network_client.find_network_segment_range(
-                    network_segment_range, ignore_missing=False
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_network_segment_range,
+                    network_segment_range,
+                    ignore_missing=False,
                 )
                 network_client.delete_network_segment_range(obj)
             except Exception as e:
@@ -343,8 +350,10 @@ class ListNetworkSegmentRange(command.Lister):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'network-segment-range', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'network-segment-range',
+                ignore_missing=False,
             )
         except Exception as e:
             msg = _(
@@ -452,8 +461,10 @@ class SetNetworkSegmentRange(common.NeutronCommandWithExtraArgs):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'network-segment-range', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'network-segment-range',
+                ignore_missing=False,
             )
         except Exception as e:
             msg = _(
@@ -468,8 +479,10 @@ class SetNetworkSegmentRange(common.NeutronCommandWithExtraArgs):
             msg = _("--minimum and --maximum are both required")
             raise exceptions.CommandError(msg)
 
-        obj = network_client.find_network_segment_range(
-            parsed_args.network_segment_range, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            network_client.find_network_segment_range,
+            parsed_args.network_segment_range,
+            ignore_missing=False,
         )
         attrs = {}
         if parsed_args.name:
@@ -500,8 +513,10 @@ class ShowNetworkSegmentRange(command.ShowOne):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension(
-                'network-segment-range', ignore_missing=False
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_extension,
+                'network-segment-range',
+                ignore_missing=False,
             )
         except Exception as e:
             msg = _(
@@ -510,8 +525,10 @@ class ShowNetworkSegmentRange(command.ShowOne):
             ) % {'e': e}
             raise exceptions.CommandError(msg)
 
-        obj = network_client.find_network_segment_range(
-            parsed_args.network_segment_range, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            network_client.find_network_segment_range,
+            parsed_args.network_segment_range,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns)
@@ -26,6 +26,7 @@ from osc_lib import exceptions
 from osc_lib import utils as osc_utils
 
 from openstackclient.i18n import _
+from openstackclient.identity import common as identity_common
 
 LOG = logging.getLogger(__name__)
 
@@ -114,7 +115,11 @@ class DeleteNetworkTrunk(command.Command):
         result = 0
         for trunk in parsed_args.trunk:
             try:
-                trunk_id = client.find_trunk(trunk).id
+                trunk_id = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        client.find_trunk, trunk
+                    ).id
+                )
                 client.delete_trunk(trunk_id)
             except Exception as e:
                 result += 1
@@ -214,7 +219,9 @@ class SetNetworkTrunk(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        trunk_id = client.find_trunk(parsed_args.trunk)
+        trunk_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_trunk, parsed_args.trunk
+        )
         attrs = _get_attrs_for_trunk(self.app.client_manager, parsed_args)
         try:
             client.update_trunk(trunk_id, **attrs)
@@ -250,7 +257,9 @@ class ShowNetworkTrunk(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        trunk_id = client.find_trunk(parsed_args.trunk).id
+        trunk_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_trunk, parsed_args.trunk
+        ).id
         obj = client.get_trunk(trunk_id)
         display_columns, columns = _get_columns(obj)
         data = osc_utils.get_dict_properties(
@@ -274,7 +283,9 @@ class ListNetworkSubport(command.Lister):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        trunk_id = client.find_trunk(parsed_args.trunk)
+        trunk_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_trunk, parsed_args.trunk
+        )
         data = client.get_trunk_subports(trunk_id)
         headers = ('Port', 'Segmentation Type', 'Segmentation ID')
         columns = ('port_id', 'segmentation_type', 'segmentation_id')
@@ -316,7 +327,9 @@ class UnsetNetworkTrunk(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         attrs = _get_attrs_for_subports(self.app.client_manager, parsed_args)
-        trunk_id = client.find_trunk(parsed_args.trunk)
+        trunk_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_trunk, parsed_args.trunk
+        )
         client.delete_trunk_subports(trunk_id, attrs)
 
 
@@ -345,9 +358,9 @@ def _get_attrs_for_trunk(client_manager, parsed_args):
     if parsed_args.disable:
         attrs['admin_state_up'] = False
     if 'parent_port' in parsed_args and parsed_args.parent_port is not None:
-        port_id = client_manager.network.find_port(parsed_args.parent_port)[
-            'id'
-        ]
+        port_id = client_manager.resource_cache.find_sdk_resource(
+            client_manager.network.find_port, parsed_args.parent_port
+        )['id']
         attrs['port_id'] = port_id
     if 'add_subports' in parsed_args and parsed_args.add_subports is not None:
         attrs[SUB_PORTS] = _format_subports(
@@ -357,10 +370,11 @@ def _get_attrs_for_trunk(client_manager, parsed_args):
     # "trunk set" command doesn't support setting project.
     if 'project' in parsed_args and parsed_args.project is not None:
         identity_client = client_manager.identity
-        project_id = identity_utils.find_project(
+        project_id = identity_common.find_project(
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['tenant_id'] = project_id
 
@@ -372,7 +386,9 @@ def _format_subports(client_manager, subports):
     for subport in subports:
         subport_attrs = {}
         if subport.get('port'):
-            port_id = client_manager.network.find_port(subport['port'])['id']
+            port_id = client_manager.resource_cache.find_sdk_resource(
+                client_manager.network.find_port, subport['port']
+            )['id']
             subport_attrs['port_id'] = port_id
         if subport.get('segmentation-id'):
             try:
@@ -401,7 +417,9 @@ def _get_attrs_for_subports(client_manager, parsed_args):
     ):
         subports_list = []
         for subport in parsed_args.unset_subports:
-            port_id = client_manager.network.find_port(subport)['id']
+            port_id = client_manager.resource_cache.find_sdk_resource(
+                client_manager.network.find_port, subport
+            )['id']
             subports_list.append({'port_id': port_id})
         attrs = subports_list
     return attrs
@@ -166,6 +166,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -179,8 +180,12 @@ def _get_attrs(client_manager, parsed_args):
         attrs['qos_policy_id'] = None
 
     if parsed_args.qos_policy:
-        attrs['qos_policy_id'] = client_manager.network.find_qos_policy(
-            parsed_args.qos_policy, ignore_missing=False
+        attrs[
+            'qos_policy_id'
+        ] = client_manager.resource_cache.find_sdk_resource(
+            client_manager.network.find_qos_policy,
+            parsed_args.qos_policy,
+            ignore_missing=False,
         ).id
 
     if (
@@ -230,8 +235,10 @@ def _prepare_fixed_ips(client_manager, parsed_args):
             if 'subnet' in ip_spec:
                 subnet_name_id = ip_spec['subnet']
                 if subnet_name_id:
-                    _subnet = client.find_subnet(
-                        subnet_name_id, ignore_missing=False
+                    _subnet = client_manager.resource_cache.find_sdk_resource(
+                        client.find_subnet,
+                        subnet_name_id,
+                        ignore_missing=False,
                     )
                     ip_spec['subnet_id'] = _subnet.id
                     del ip_spec['subnet']
@@ -260,8 +267,8 @@ def _prepare_filter_fixed_ips(client_manager, parsed_args):
         if 'subnet' in ip_spec:
             subnet_name_id = ip_spec['subnet']
             if subnet_name_id:
-                _subnet = client.find_subnet(
-                    subnet_name_id, ignore_missing=False
+                _subnet = client_manager.resource_cache.find_sdk_resource(
+                    client.find_subnet, subnet_name_id, ignore_missing=False
                 )
                 ips.append('subnet_id=%s' % _subnet.id)
 
@@ -565,8 +572,8 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        _network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        _network = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         )
         parsed_args.network = _network.id
         _prepare_fixed_ips(self.app.client_manager, parsed_args)
@@ -582,7 +589,9 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
 
         if parsed_args.security_group:
             attrs['security_group_ids'] = [
-                client.find_security_group(sg, ignore_missing=False).id
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_security_group, sg, ignore_missing=False
+                ).id
                 for sg in parsed_args.security_group
             ]
         elif parsed_args.no_security_group:
@@ -597,15 +606,21 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
             attrs["extra_dhcp_opts"] = _convert_extra_dhcp_options(parsed_args)
 
         if parsed_args.qos_policy:
-            attrs['qos_policy_id'] = client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
+            attrs[
+                'qos_policy_id'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_qos_policy,
+                parsed_args.qos_policy,
+                ignore_missing=False,
             ).id
 
         if parsed_args.hint:
             _validate_port_hints(parsed_args.hint)
             expanded_hints = _expand_port_hint_aliases(parsed_args.hint)
             try:
-                client.find_extension('port-hints', ignore_missing=False)
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_extension, 'port-hints', ignore_missing=False
+                )
             except Exception as e:
                 msg = _('Not supported by Network API: %(e)s') % {'e': e}
                 raise exceptions.CommandError(msg)
@@ -616,8 +631,10 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
                 in expanded_hints['openvswitch']['other_config']
             ):
                 try:
-                    client.find_extension(
-                        'port-hint-ovs-tx-steering', ignore_missing=False
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        client.find_extension,
+                        'port-hint-ovs-tx-steering',
+                        ignore_missing=False,
                     )
                 except Exception as e:
                     msg = _('Not supported by Network API: %(e)s') % {'e': e}
@@ -625,7 +642,9 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
             attrs['hints'] = expanded_hints
 
         set_tags_in_post = bool(
-            client.find_extension('tag-ports-during-bulk-creation')
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_extension, 'tag-ports-during-bulk-creation'
+            )
         )
         if set_tags_in_post:
             if parsed_args.no_tag:
@@ -671,7 +690,9 @@ class DeletePort(command.Command):
 
         for port in parsed_args.port:
             try:
-                obj = client.find_port(port, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_port, port, ignore_missing=False
+                )
                 client.delete_port(obj)
             except Exception as e:
                 result += 1
@@ -810,21 +831,25 @@ class ListPort(command.Lister):
         if parsed_args.device_id is not None:
             filters['device_id'] = parsed_args.device_id
         if parsed_args.router:
-            _router = network_client.find_router(
-                parsed_args.router, ignore_missing=False
+            _router = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_router,
+                parsed_args.router,
+                ignore_missing=False,
             )
             filters['device_id'] = _router.id
         if parsed_args.server:
             compute_client = self.app.client_manager.compute
-            server = utils.find_resource(
+            server = self.app.client_manager.resource_cache.find_resource(
                 compute_client.servers, parsed_args.server
             )
             filters['device_id'] = server.id
         if parsed_args.host:
             filters['binding:host_id'] = parsed_args.host
         if parsed_args.network:
-            network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            network = self.app.client_manager.resource_cache.find_sdk_resource(
+                network_client.find_network,
+                parsed_args.network,
+                ignore_missing=False,
             )
             filters['network_id'] = network.id
         if parsed_args.mac_address:
@@ -834,6 +859,7 @@ class ListPort(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             filters['project_id'] = project_id
         if parsed_args.name:
@@ -1016,7 +1042,9 @@ class SetPort(common.NeutronCommandWithExtraArgs):
         client = self.app.client_manager.network
 
         _prepare_fixed_ips(self.app.client_manager, parsed_args)
-        obj = client.find_port(parsed_args.port, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         attrs = _get_attrs(self.app.client_manager, parsed_args)
 
         if parsed_args.no_binding_profile:
@@ -1048,7 +1076,9 @@ class SetPort(common.NeutronCommandWithExtraArgs):
                     id for id in obj.security_group_ids
                 ]
             attrs['security_group_ids'].extend(
-                client.find_security_group(sg, ignore_missing=False).id
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_security_group, sg, ignore_missing=False
+                ).id
                 for sg in parsed_args.security_group
             )
 
@@ -1073,7 +1103,9 @@ class SetPort(common.NeutronCommandWithExtraArgs):
             _validate_port_hints(parsed_args.hint)
             expanded_hints = _expand_port_hint_aliases(parsed_args.hint)
             try:
-                client.find_extension('port-hints', ignore_missing=False)
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_extension, 'port-hints', ignore_missing=False
+                )
             except Exception as e:
                 msg = _('Not supported by Network API: %(e)s') % {'e': e}
                 raise exceptions.CommandError(msg)
@@ -1084,8 +1116,10 @@ class SetPort(common.NeutronCommandWithExtraArgs):
                 in expanded_hints['openvswitch']['other_config']
             ):
                 try:
-                    client.find_extension(
-                        'port-hint-ovs-tx-steering', ignore_missing=False
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        client.find_extension,
+                        'port-hint-ovs-tx-steering',
+                        ignore_missing=False,
                     )
                 except Exception as e:
                     msg = _('Not supported by Network API: %(e)s') % {'e': e}
@@ -1118,7 +1152,9 @@ class ShowPort(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_port(parsed_args.port, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
         return (display_columns, data)
@@ -1216,7 +1252,9 @@ class UnsetPort(common.NeutronUnsetCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_port(parsed_args.port, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         # SDK ignores update() if it receives a modified obj and attrs
         # To handle the same tmp_obj is created in all take_action of
         # Unset* classes
@@ -1243,10 +1281,11 @@ class UnsetPort(common.NeutronUnsetCommandWithExtraArgs):
                 raise exceptions.CommandError(msg)
             attrs['binding:profile'] = tmp_binding_profile
         if parsed_args.security_group_ids:
+            resource_cache = self.app.client_manager.resource_cache
             try:
                 for sg in parsed_args.security_group_ids:
-                    sg_id = client.find_security_group(
-                        sg, ignore_missing=False
+                    sg_id = resource_cache.find_sdk_resource(
+                        client.find_security_group, sg, ignore_missing=False
                     ).id
                     tmp_secgroups.remove(sg_id)
             except ValueError:
@@ -111,13 +111,16 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
     if parsed_args.external_gateway:
         gateway_info = {}
         n_client = client_manager.network
-        network = n_client.find_network(
-            parsed_args.external_gateway, ignore_missing=False
+        network = client_manager.resource_cache.find_sdk_resource(
+            n_client.find_network,
+            parsed_args.external_gateway,
+            ignore_missing=False,
         )
         gateway_info['network_id'] = network.id
         if parsed_args.disable_snat:
@@ -130,8 +133,12 @@ def _get_attrs(client_manager, parsed_args):
                 if ip_spec.get('subnet', False):
                     subnet_name_id = ip_spec.pop('subnet')
                     if subnet_name_id:
-                        subnet = n_client.find_subnet(
-                            subnet_name_id, ignore_missing=False
+                        subnet = (
+                            client_manager.resource_cache.find_sdk_resource(
+                                n_client.find_subnet,
+                                subnet_name_id,
+                                ignore_missing=False,
+                            )
                         )
                         ip_spec['subnet_id'] = subnet.id
                 if ip_spec.get('ip-address', False):
@@ -163,9 +170,13 @@ class AddPortToRouter(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        port = client.find_port(parsed_args.port, ignore_missing=False)
+        port = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         client.add_interface_to_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             port_id=port.id,
         )
 
@@ -189,9 +200,13 @@ class AddSubnetToRouter(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        subnet = client.find_subnet(parsed_args.subnet, ignore_missing=False)
+        subnet = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet, parsed_args.subnet, ignore_missing=False
+        )
         client.add_interface_to_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             subnet_id=subnet.id,
         )
 
@@ -235,7 +250,9 @@ class AddExtraRoutesToRouter(command.ShowOne):
                 route['nexthop'] = route.pop('gateway')
         client = self.app.client_manager.network
         router_obj = client.add_extra_routes_to_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             body={'router': {'routes': parsed_args.routes}},
         )
         display_columns, columns = _get_columns(router_obj)
@@ -286,7 +303,9 @@ class RemoveExtraRoutesFromRouter(command.ShowOne):
                 route['nexthop'] = route.pop('gateway')
         client = self.app.client_manager.network
         router_obj = client.remove_extra_routes_from_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             body={'router': {'routes': parsed_args.routes}},
         )
         display_columns, columns = _get_columns(router_obj)
@@ -472,7 +491,9 @@ class DeleteRouter(command.Command):
 
         for router in parsed_args.router:
             try:
-                obj = client.find_router(router, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_router, router, ignore_missing=False
+                )
                 client.delete_router(obj)
             except Exception as e:
                 result += 1
@@ -569,6 +590,7 @@ class ListRouter(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             args['project_id'] = project_id
 
@@ -606,7 +628,9 @@ class ListRouter(command.Lister):
             )
             # availability zone will be available only when
             # router_availability_zone extension is enabled
-            if client.find_extension("router_availability_zone"):
+            if self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_extension, "router_availability_zone"
+            ):
                 columns = columns + ('availability_zones',)
                 column_headers = column_headers + ('Availability zones',)
             columns = columns + ('tags',)
@@ -658,9 +682,13 @@ class RemovePortFromRouter(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        port = client.find_port(parsed_args.port, ignore_missing=False)
+        port = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_port, parsed_args.port, ignore_missing=False
+        )
         client.remove_interface_from_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             port_id=port.id,
         )
 
@@ -686,9 +714,13 @@ class RemoveSubnetFromRouter(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        subnet = client.find_subnet(parsed_args.subnet, ignore_missing=False)
+        subnet = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet, parsed_args.subnet, ignore_missing=False
+        )
         client.remove_interface_from_router(
-            client.find_router(parsed_args.router, ignore_missing=False),
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_router, parsed_args.router, ignore_missing=False
+            ),
             subnet_id=subnet.id,
         )
 
@@ -836,7 +868,9 @@ class SetRouter(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_router(parsed_args.router, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
 
         # Get the common attributes.
         attrs = _get_attrs(self.app.client_manager, parsed_args)
@@ -885,9 +919,13 @@ class SetRouter(common.NeutronCommandWithExtraArgs):
                     attrs['external_gateway_info'] = {}
                 attrs['external_gateway_info']['network_id'] = original_net_id
         if parsed_args.qos_policy:
-            check_qos_id = client.find_qos_policy(
-                parsed_args.qos_policy, ignore_missing=False
-            ).id
+            check_qos_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_qos_policy,
+                    parsed_args.qos_policy,
+                    ignore_missing=False,
+                ).id
+            )
             attrs['external_gateway_info']['qos_policy_id'] = check_qos_id
 
         if 'no_qos_policy' in parsed_args and parsed_args.no_qos_policy:
@@ -920,7 +958,9 @@ class ShowRouter(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_router(parsed_args.router, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         interfaces_info = []
         filters = {}
         filters['device_id'] = obj.id
@@ -983,7 +1023,9 @@ class UnsetRouter(common.NeutronUnsetCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_router(parsed_args.router, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_router, parsed_args.router, ignore_missing=False
+        )
         tmp_routes = copy.deepcopy(obj.routes)
         tmp_external_gateway_info = copy.deepcopy(obj.external_gateway_info)
         attrs = {}
@@ -162,6 +162,7 @@ class CreateSecurityGroup(
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
         attrs.update(
@@ -196,7 +197,7 @@ class DeleteSecurityGroup(common.NetworkAndComputeDelete):
 
     # Used by base class to find resources in parsed_args.
     resource = 'group'
-    r = None
+    network_list_method = 'security_groups'
 
     def update_parser_common(self, parser):
         parser.add_argument(
@@ -208,7 +209,7 @@ class DeleteSecurityGroup(common.NetworkAndComputeDelete):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_security_group(self.r, ignore_missing=False)
+        obj = self.find_network_resource(client.find_security_group)
         client.delete_security_group(obj)
 
     def take_action_compute(self, client, parsed_args):
@@ -269,6 +270,7 @@ class ListSecurityGroup(common.NetworkAndComputeLister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             filters['project_id'] = project_id
 
@@ -359,8 +361,8 @@ class SetSecurityGroup(
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_security_group(
-            parsed_args.group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_security_group, parsed_args.group, ignore_missing=False
         )
         attrs = {}
         if parsed_args.name is not None:
@@ -412,8 +414,8 @@ class ShowSecurityGroup(common.NetworkAndComputeShowOne):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_security_group(
-            parsed_args.group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_security_group, parsed_args.group, ignore_missing=False
         )
         display_columns, property_columns = _get_columns(obj)
         data = utils.get_item_properties(
@@ -445,8 +447,8 @@ class UnsetSecurityGroup(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_security_group(
-            parsed_args.group, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_security_group, parsed_args.group, ignore_missing=False
         )
 
         # tags is a subresource and it needs to be updated separately.
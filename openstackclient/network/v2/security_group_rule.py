@@ -201,9 +201,13 @@ class CreateSecurityGroupRule(
 
     def take_action_network(self, client, parsed_args):
         # Get the security group ID to hold the rule.
-        security_group_id = client.find_security_group(
-            parsed_args.group, ignore_missing=False
-        ).id
+        security_group_id = (
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_security_group,
+                parsed_args.group,
+                ignore_missing=False,
+            ).id
+        )
 
         # Build the create attributes.
         attrs = {}
@@ -258,12 +262,20 @@ class CreateSecurityGroupRule(
             attrs['port_range_max'] = parsed_args.icmp_code
 
         if parsed_args.remote_group is not None:
-            attrs['remote_group_id'] = client.find_security_group(
-                parsed_args.remote_group, ignore_missing=False
+            attrs[
+                'remote_group_id'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_security_group,
+                parsed_args.remote_group,
+                ignore_missing=False,
             ).id
         elif parsed_args.remote_address_group is not None:
-            attrs['remote_address_group_id'] = client.find_address_group(
-                parsed_args.remote_address_group, ignore_missing=False
+            attrs[
+                'remote_address_group_id'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                client.find_address_group,
+                parsed_args.remote_address_group,
+                ignore_missing=False,
             ).id
         elif parsed_args.remote_ip is not None:
             attrs['remote_ip_prefix'] = parsed_args.remote_ip
@@ -278,6 +290,7 @@ class CreateSecurityGroupRule(
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
 
@@ -327,7 +340,8 @@ class DeleteSecurityGroupRule(common.NetworkAndComputeDelete):
 
     # Used by base class to find resources in parsed_args.
     resource = 'rule'
-    r = None
+    network_list_method = 'security_group_rules'
+    network_find_attrs = ('id',)
 
     def update_parser_common(self, parser):
         parser.add_argument(
@@ -339,7 +353,7 @@ class DeleteSecurityGroupRule(common.NetworkAndComputeDelete):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_security_group_rule(self.r, ignore_missing=False)
+        obj = self.find_network_resource(client.find_security_group_rule)
         client.delete_security_group_rule(obj)
 
     def take_action_compute(self, client, parsed_args):
@@ -489,9 +503,13 @@ class ListSecurityGroupRule(common.NetworkAndComputeLister):
             # NOTE(rtheis): Unfortunately, the security group resource
             # does not contain security group rules resources. So use
             # the security group ID in a query to get the resources.
-            security_group_id = client.find_security_group(
-                parsed_args.group, ignore_missing=False
-            ).id
+            security_group_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_security_group,
+                    parsed_args.group,
+                    ignore_missing=False,
+                ).id
+            )
             query = {'security_group_id': security_group_id}
         else:
             columns = columns + ('security_group_id',)
@@ -577,8 +595,10 @@ class ShowSecurityGroupRule(common.NetworkAndComputeShowOne):
         return parser
 
     def take_action_network(self, client, parsed_args):
-        obj = client.find_security_group_rule(
-            parsed_args.rule, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_security_group_rule,
+            parsed_args.rule,
+            ignore_missing=False,
         )
         # necessary for old rules that have None in this field
         if not obj['remote_ip_prefix']:
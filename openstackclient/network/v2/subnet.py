@@ -203,14 +203,17 @@ def _get_attrs(client_manager, parsed_args, is_create=True):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=client_manager.resource_cache,
             ).id
             attrs['project_id'] = project_id
-        attrs['network_id'] = client.find_network(
-            parsed_args.network, ignore_missing=False
+        attrs['network_id'] = client_manager.resource_cache.find_sdk_resource(
+            client.find_network, parsed_args.network, ignore_missing=False
         ).id
         if parsed_args.subnet_pool is not None:
-            subnet_pool = client.find_subnet_pool(
-                parsed_args.subnet_pool, ignore_missing=False
+            subnet_pool = client_manager.resource_cache.find_sdk_resource(
+                client.find_subnet_pool,
+                parsed_args.subnet_pool,
+                ignore_missing=False,
             )
             attrs['subnetpool_id'] = subnet_pool.id
         if parsed_args.use_prefix_delegation:
@@ -229,8 +232,10 @@ def _get_attrs(client_manager, parsed_args, is_create=True):
             attrs['ipv6_address_mode'] = parsed_args.ipv6_address_mode
 
     if parsed_args.network_segment is not None:
-        attrs['segment_id'] = client.find_segment(
-            parsed_args.network_segment, ignore_missing=False
+        attrs['segment_id'] = client_manager.resource_cache.find_sdk_resource(
+            client.find_segment,
+            parsed_args.network_segment,
+            ignore_missing=False,
         ).id
     if 'gateway' in parsed_args and parsed_args.gateway is not None:
         gateway = parsed_args.gateway.lower()
@@ -443,7 +448,9 @@ class DeleteSubnet(command.Command):
 
         for subnet in parsed_args.subnet:
             try:
-                obj = client.find_subnet(subnet, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_subnet, subnet, ignore_missing=False
+                )
                 client.delete_subnet(obj)
             except Exception as e:
                 result += 1
@@ -577,12 +584,17 @@ class ListSubnet(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             filters['project_id'] = project_id
         if parsed_args.network:
-            network_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
-            ).id
+            network_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_network,
+                    parsed_args.network,
+                    ignore_missing=False,
+                ).id
+            )
             filters['network_id'] = network_id
         if parsed_args.gateway:
             filters['gateway_ip'] = parsed_args.gateway
@@ -591,9 +603,13 @@ class ListSubnet(command.Lister):
         if parsed_args.subnet_range:
             filters['cidr'] = parsed_args.subnet_range
         if parsed_args.subnet_pool:
-            subnetpool_id = network_client.find_subnet_pool(
-                parsed_args.subnet_pool, ignore_missing=False
-            ).id
+            subnetpool_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_subnet_pool,
+                    parsed_args.subnet_pool,
+                    ignore_missing=False,
+                ).id
+            )
             filters['subnetpool_id'] = subnetpool_id
         _tag.get_tag_filtering_args(parsed_args, filters)
         data = network_client.subnets(**filters)
@@ -701,7 +717,9 @@ class SetSubnet(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_subnet(parsed_args.subnet, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet, parsed_args.subnet, ignore_missing=False
+        )
         attrs = _get_attrs(
             self.app.client_manager, parsed_args, is_create=False
         )
@@ -745,8 +763,10 @@ class ShowSubnet(command.ShowOne):
         return parser
 
     def take_action(self, parsed_args):
-        obj = self.app.client_manager.network.find_subnet(
-            parsed_args.subnet, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            self.app.client_manager.network.find_subnet,
+            parsed_args.subnet,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
@@ -821,7 +841,9 @@ class UnsetSubnet(common.NeutronUnsetCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_subnet(parsed_args.subnet, ignore_missing=False)
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet, parsed_args.subnet, ignore_missing=False
+        )
 
         attrs = {}
         if parsed_args.gateway:
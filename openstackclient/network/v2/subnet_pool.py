@@ -65,8 +65,12 @@ def _get_attrs(client_manager, parsed_args):
         attrs['max_prefixlen'] = parsed_args.max_prefix_length
 
     if parsed_args.address_scope is not None:
-        attrs['address_scope_id'] = network_client.find_address_scope(
-            parsed_args.address_scope, ignore_missing=False
+        attrs[
+            'address_scope_id'
+        ] = client_manager.resource_cache.find_sdk_resource(
+            network_client.find_address_scope,
+            parsed_args.address_scope,
+            ignore_missing=False,
         ).id
     if 'no_address_scope' in parsed_args and parsed_args.no_address_scope:
         attrs['address_scope_id'] = None
@@ -88,6 +92,7 @@ def _get_attrs(client_manager, parsed_args):
             identity_client,
             parsed_args.project,
             parsed_args.project_domain,
+            resource_cache=client_manager.resource_cache,
         ).id
         attrs['project_id'] = project_id
 
@@ -241,7 +246,9 @@ class DeleteSubnetPool(command.Command):
 
         for pool in parsed_args.subnet_pool:
             try:
-                obj = client.find_subnet_pool(pool, ignore_missing=False)
+                obj = self.app.client_manager.resource_cache.find_sdk_resource(
+                    client.find_subnet_pool, pool, ignore_missing=False
+                )
                 client.delete_subnet_pool(obj)
             except Exception as e:
                 result += 1
@@ -344,13 +351,18 @@ class ListSubnetPool(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
             filters['project_id'] = project_id
         if parsed_args.name is not None:
             filters['name'] = parsed_args.name
         if parsed_args.address_scope:
-            address_scope = network_client.find_address_scope(
-                parsed_args.address_scope, ignore_missing=False
+            address_scope = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    network_client.find_address_scope,
+                    parsed_args.address_scope,
+                    ignore_missing=False,
+                )
             )
             filters['address_scope_id'] = address_scope.id
         _tag.get_tag_filtering_args(parsed_args, filters)
@@ -440,8 +452,10 @@ class SetSubnetPool(common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_subnet_pool(
-            parsed_args.subnet_pool, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet_pool,
+            parsed_args.subnet_pool,
+            ignore_missing=False,
         )
 
         attrs = _get_attrs(self.app.client_manager, parsed_args)
@@ -474,8 +488,10 @@ class ShowSubnetPool(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_subnet_pool(
-            parsed_args.subnet_pool, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet_pool,
+            parsed_args.subnet_pool,
+            ignore_missing=False,
         )
         display_columns, columns = _get_columns(obj)
         data = utils.get_item_properties(obj, columns, formatters=_formatters)
@@ -497,8 +513,10 @@ class UnsetSubnetPool(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_subnet_pool(
-            parsed_args.subnet_pool, ignore_missing=False
+        obj = self.app.client_manager.resource_cache.find_sdk_resource(
+            client.find_subnet_pool,
+            parsed_args.subnet_pool,
+            ignore_missing=False,
         )
         # tags is a subresource and it needs to be updated separately.
         _tag.update_tags_for_unset(client, obj, parsed_args)
@@ -23,6 +23,7 @@ from osc_lib.command import command
 from osc_lib import utils
 
 from openstackclient.common import pagination
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 
 LOG = logging.getLogger(__name__)
@@ -99,19 +100,16 @@ class DeleteContainer(command.Command):
             nargs="+",
             help=_('Container(s) to delete'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         for container in parsed_args.containers:
             if parsed_args.recursive:
-                objs = self.app.client_manager.object_store.object_list(
-                    container=container
+                self.app.client_manager.object_store.container_empty(
+                    container,
+                    max_workers=parsed_args.parallel,
                 )
-                for obj in objs:
-                    self.app.client_manager.object_store.object_delete(
-                        container=container,
-                        object=obj['name'],
-                    )
             self.app.client_manager.object_store.container_delete(
                 container=container,
             )
@@ -162,10 +160,13 @@ class ListContainer(command.Lister):
             kwargs['end_marker'] = parsed_args.end_marker
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
-        if parsed_args.all:
-            kwargs['full_listing'] = True
 
-        data = self.app.client_manager.object_store.container_list(**kwargs)
+        object_store = self.app.client_manager.object_store
+        if parsed_args.all:
+            # Output the containers as the pages of the listing arrive
+            data = object_store.container_iter(**kwargs)
+        else:
+            data = object_store.container_list(**kwargs)
 
         return (
             columns,
@@ -190,11 +191,13 @@ class SaveContainer(command.Command):
             metavar='<container>',
             help=_('Container to save'),
         )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
     def take_action(self, parsed_args):
         self.app.client_manager.object_store.container_save(
             container=parsed_args.container,
+            max_workers=parsed_args.parallel,
         )
 
 
@@ -16,6 +16,7 @@
 """Object v1 action implementations"""
 
 import logging
+import os
 
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
@@ -24,6 +25,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.common import pagination
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 
 
@@ -44,7 +46,10 @@ class CreateObject(command.Lister):
             'objects',
             metavar='<filename>',
             nargs="+",
-            help=_('Local filename(s) to upload'),
+            help=_(
+                'Local filename(s) to upload, the files of directories '
+                'are uploaded recursively'
+            ),
         )
         parser.add_argument(
             '--name',
@@ -54,18 +59,33 @@ class CreateObject(command.Lister):
                 'Can only be used when uploading a single object'
             ),
         )
+        parser.add_argument(
+            '--segment-size',
+            metavar='<size>',
+            type=int,
+            action=parseractions.NonNegativeAction,
+            help=_(
+                'Upload files larger than <size> bytes as a static large '
+                'object made of segments of <size> bytes (files larger '
+                'than 5 GiB are always segmented)'
+            ),
+        )
+        parallel.add_parallel_option_to_parser(parser)
         return parser
 
-    def take_action(self, parsed_args):
-        if parsed_args.name:
-            if len(parsed_args.objects) > 1:
-                msg = _(
-                    'Attempting to upload multiple objects and '
-                    'using --name is not permitted'
-                )
-                raise exceptions.CommandError(msg)
-        results = []
-        for obj in parsed_args.objects:
+    def _iter_files(self, paths):
+        """Yield the files to upload, looking into directories"""
+        for path in paths:
+            if os.path.isdir(path):
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    for name in sorted(files):
+                        yield os.path.join(root, name)
+            else:
+                yield path
+
+    def _check_name_length(self, files):
+        for obj in files:
             if len(obj) > 1024:
                 LOG.warning(
                     _(
@@ -74,25 +94,70 @@ class CreateObject(command.Lister):
                     ),
                     len(obj),
                 )
-            data = self.app.client_manager.object_store.object_create(
+            yield obj
+
+    def take_action(self, parsed_args):
+        if parsed_args.name:
+            if len(parsed_args.objects) > 1 or os.path.isdir(
+                parsed_args.objects[0]
+            ):
+                msg = _(
+                    'Attempting to upload multiple objects and '
+                    'using --name is not permitted'
+                )
+                raise exceptions.CommandError(msg)
+
+        # Share the workers between files and segments so that at most
+        # --parallel uploads run at once: a single file uploads its segments
+        # concurrently, several files are uploaded concurrently with their
+        # segments uploaded one at a time
+        if len(parsed_args.objects) == 1 and not os.path.isdir(
+            parsed_args.objects[0]
+        ):
+            file_workers, segment_workers = 1, parsed_args.parallel
+        else:
+            file_workers, segment_workers = parsed_args.parallel, 1
+
+        def _upload(obj):
+            return self.app.client_manager.object_store.object_create(
                 container=parsed_args.container,
                 object=obj,
                 name=parsed_args.name,
+                segment_size=parsed_args.segment_size,
+                max_workers=segment_workers,
             )
-            results.append(data)
 
         columns = ("object", "container", "etag")
-        return (
-            columns,
-            (
-                utils.get_dict_properties(
-                    s,
-                    columns,
-                    formatters={},
-                )
-                for s in results
-            ),
-        )
+
+        def _results():
+            # Files are found and uploaded as the results are consumed, and
+            # each file is listed as soon as it is uploaded
+            total = 0
+            failed = 0
+            files = self._check_name_length(
+                self._iter_files(parsed_args.objects)
+            )
+            for obj, data, exc in parallel.run_concurrently(
+                _upload, files, max_workers=file_workers
+            ):
+                total += 1
+                if exc is not None:
+                    LOG.error(
+                        _("Failed to upload %(object)s: %(e)s"),
+                        {'object': obj, 'e': exc},
+                    )
+                    failed += 1
+                    continue
+                yield utils.get_dict_properties(data, columns, formatters={})
+
+            if failed:
+                msg = _("%(num)s of %(total)s objects failed to upload.") % {
+                    'num': failed,
+                    'total': total,
+                }
+                raise exceptions.CommandError(msg)
+
+        return columns, _results()
 
 
 class DeleteObject(command.Command):
@@ -159,6 +224,23 @@ class ListObject(command.Lister):
             default=False,
             help=_('List all objects in container (default is 10000)'),
         )
+        parallel.add_parallel_option_to_parser(
+            parser,
+            help=_(
+                'With --all, split the listing in ranges of object names '
+                'listed by up to <num-workers> concurrent requests. Objects '
+                'are still listed in order (default: 1)'
+            ),
+        )
+        parser.add_argument(
+            '--shard-delimiter',
+            metavar='<delimiter>',
+            help=_(
+                'With --all and --parallel, split the listing by the '
+                'pseudo-directories delimited by <delimiter> rather than '
+                'by sampled ranges of names'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -184,12 +266,30 @@ class ListObject(command.Lister):
             kwargs['end_marker'] = parsed_args.end_marker
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
-        if parsed_args.all:
-            kwargs['full_listing'] = True
 
-        data = self.app.client_manager.object_store.object_list(
-            container=parsed_args.container, **kwargs
-        )
+        if not parsed_args.all and (
+            parsed_args.parallel > 1 or parsed_args.shard_delimiter
+        ):
+            msg = _("--parallel and --shard-delimiter require --all")
+            raise exceptions.CommandError(msg)
+        if parsed_args.shard_delimiter and parsed_args.parallel <= 1:
+            msg = _("--shard-delimiter requires --parallel")
+            raise exceptions.CommandError(msg)
+        if parsed_args.delimiter and parsed_args.parallel > 1:
+            msg = _("--parallel can't be used with --delimiter")
+            raise exceptions.CommandError(msg)
+
+        object_store = self.app.client_manager.object_store
+        if parsed_args.all:
+            # Output the objects as the pages of the listing arrive
+            if parsed_args.parallel > 1:
+                kwargs['max_workers'] = parsed_args.parallel
+                kwargs['shard_delimiter'] = parsed_args.shard_delimiter
+            data = object_store.object_iter(parsed_args.container, **kwargs)
+        else:
+            data = object_store.object_list(
+                container=parsed_args.container, **kwargs
+            )
 
         return (
             columns,
@@ -227,6 +327,15 @@ class SaveObject(command.Command):
             metavar="<object>",
             help=_("Object to save"),
         )
+        parallel.add_parallel_option_to_parser(
+            parser,
+            help=_(
+                'Download the object as byte ranges fetched by up to '
+                '<num-workers> concurrent requests. The download is '
+                'checked against the object ETag and can be resumed by '
+                'running the command again if interrupted (default: 1)'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -234,6 +343,7 @@ class SaveObject(command.Command):
             container=parsed_args.container,
             object=parsed_args.object,
             file=parsed_args.file,
+            max_workers=parsed_args.parallel,
         )
 
 
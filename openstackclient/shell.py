@@ -16,15 +16,18 @@
 
 """Command-line interface to the OpenStack APIs"""
 
+import argparse
 import sys
 import warnings
 
 from osc_lib.api import auth
-from osc_lib.command import commandmanager
 from osc_lib import shell
+from osc_lib import utils
 
 import openstackclient
 from openstackclient.common import clientmanager
+from openstackclient.common import commandindex
+from openstackclient.i18n import _
 
 
 DEFAULT_DOMAIN = 'default'
@@ -35,10 +38,13 @@ class OpenStackShell(shell.OpenStackShell):
         super(OpenStackShell, self).__init__(
             description=__doc__.strip(),
             version=openstackclient.__version__,
-            command_manager=commandmanager.CommandManager('openstack.cli'),
+            command_manager=commandindex.CommandManager('openstack.cli'),
             deferred_help=True,
         )
 
+        # List the commands without importing them
+        self.command_manager.add_command('help', commandindex.HelpCommand)
+
         self.api_version = {}
 
         # Assume TLS host certificate verification is enabled
@@ -52,6 +58,34 @@ class OpenStackShell(shell.OpenStackShell):
         parser = super(OpenStackShell, self).build_option_parser(
             description, version
         )
+        parser.add_argument(
+            '--os-resource-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=utils.env('OS_RESOURCE_CACHE_TTL'),
+            help=_(
+                'Seconds to remember resolved resource names, the cache is '
+                'disabled by default (Env: OS_RESOURCE_CACHE_TTL)'
+            ),
+        )
+        parser.add_argument(
+            '--no-resource-cache',
+            action='store_true',
+            default=False,
+            help=_(
+                'Do not use or update the on-disk resource name and API '
+                'capability caches'
+            ),
+        )
+        parser.add_argument(
+            '--no-token-cache',
+            action='store_true',
+            default=False,
+            help=_(
+                'Do not use or update the on-disk cache of tokens and '
+                'service catalogs'
+            ),
+        )
         parser = clientmanager.build_plugin_option_parser(parser)
         parser = auth.build_auth_plugins_option_parser(parser)
         return parser
@@ -131,6 +165,13 @@ class OpenStackShell(shell.OpenStackShell):
         # }
         self.command_manager.add_command_group('openstack.extension')
 
+    def print_help_if_requested(self):
+        if self.deferred_help and self.options.deferred_help:
+            action = commandindex.HelpAction(
+                [], argparse.SUPPRESS, default=self
+            )
+            action(self.parser, self.options, None, None)
+
     def initialize_app(self, argv):
         super(OpenStackShell, self).initialize_app(argv)
 
@@ -141,6 +182,17 @@ class OpenStackShell(shell.OpenStackShell):
             pw_func=shell.prompt_for_password,
         )
 
+    def clean_up(self, cmd, result, err):
+        super(OpenStackShell, self).clean_up(cmd, result, err)
+
+        # Let the next commands reuse the token
+        client_manager = getattr(self, 'client_manager', None)
+        if client_manager is not None:
+            client_manager.save_auth_state()
+            client_manager.invalidate_resource_cache(
+                getattr(cmd, 'cmd_name', None)
+            )
+
 
 def main(argv=None):
     if argv is None:
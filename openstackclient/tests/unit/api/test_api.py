@@ -240,6 +240,70 @@ class TestBaseAPI(api_fakes.TestSession):
         ret = self.api.find_bulk('qaz', id='1')
         self.assertEqual([api_fakes.LIST_RESP[0]], ret)
 
+    def test_find_bulk_memoized(self):
+        self.requests_mock.register_uri(
+            'GET',
+            self.BASE_URL + '/qaz',
+            json=api_fakes.LIST_RESP,
+            status_code=200,
+        )
+        ret = self.api.find_bulk('qaz', id='1')
+        self.assertEqual([api_fakes.LIST_RESP[0]], ret)
+        # modifying a result doesn't affect the memoized listing
+        ret[0]['name'] = 'omega'
+
+        ret = self.api.find_bulk('qaz', name='alpha')
+        self.assertEqual([api_fakes.LIST_RESP[0]], ret)
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_find_bulk_invalidated(self):
+        self.requests_mock.register_uri(
+            'GET',
+            self.BASE_URL + '/qaz',
+            json=api_fakes.LIST_RESP,
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            self.BASE_URL + '/qaz/1',
+            status_code=204,
+        )
+        self.api.find_bulk('qaz', id='1')
+        self.api.delete('qaz/1')
+        self.api.find_bulk('qaz', id='1')
+        self.assertEqual(
+            ['GET', 'DELETE', 'GET'],
+            [r.method for r in self.requests_mock.request_history],
+        )
+
+    def test_find_bulk_server_side_filter(self):
+        self.api._find_filters = {
+            'qaz': {'name': lambda name: name if name != 'a.*' else None},
+        }
+        self.requests_mock.register_uri(
+            'GET',
+            self.BASE_URL + '/qaz?name=alpha',
+            json=[api_fakes.RESP_ITEM_1],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            self.BASE_URL + '/qaz',
+            json=api_fakes.LIST_RESP,
+            status_code=200,
+        )
+
+        ret = self.api.find_bulk('qaz', name='alpha', status='UP')
+        self.assertEqual([api_fakes.RESP_ITEM_1], ret)
+        self.assertEqual(
+            {'name': ['alpha']}, self.requests_mock.last_request.qs
+        )
+
+        # values that can't be searched for server-side use the listing
+        ret = self.api.find_bulk('qaz', name='a.*')
+        self.assertEqual([], ret)
+        self.assertEqual({}, self.requests_mock.last_request.qs)
+
     # list tests
 
     def test_list_no_body(self):
@@ -13,6 +13,8 @@
 
 """Compute v2 API Library Tests"""
 
+import re
+
 from keystoneauth1 import session
 from osc_lib import exceptions as osc_lib_exceptions
 from requests_mock.contrib import fixture
@@ -90,6 +92,31 @@ class TestFloatingIP(TestComputeAPIv2):
         ret = self.api.floating_ip_add('server1', '1.0.1.0')
         self.assertEqual(200, ret.status_code)
 
+    def test_floating_ip_add_name_filtered(self):
+        self.requests_mock.register_uri(
+            'POST',
+            FAKE_URL + '/servers/1/action',
+            json={'server': {}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/servers/server1',
+            status_code=404,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/servers?name=server1',
+            json={'servers': [self.FAKE_SERVER_RESP_1]},
+            status_code=200,
+        )
+        ret = self.api.floating_ip_add('server1', '1.0.1.0')
+        self.assertEqual(200, ret.status_code)
+        # the name filter is passed to the server
+        self.assertEqual(
+            {'name': ['server1']}, self.requests_mock.request_history[1].qs
+        )
+
     def test_floating_ip_create(self):
         self.requests_mock.register_uri(
             'POST',
@@ -608,6 +635,32 @@ class TestSecurityGroup(TestComputeAPIv2):
         ret = self.api.security_group_find('sg2')
         self.assertEqual(self.FAKE_SECURITY_GROUP_RESP_2, ret)
 
+    def test_security_group_find_name_memoized(self):
+        self.requests_mock.register_uri(
+            'GET',
+            re.compile(FAKE_URL + '/os-security-groups/sg[12]'),
+            status_code=404,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/os-security-groups',
+            json={'security_groups': self.LIST_SECURITY_GROUP_RESP},
+            status_code=200,
+        )
+        ret = self.api.security_group_find('sg1')
+        self.assertEqual(self.FAKE_SECURITY_GROUP_RESP, ret)
+        ret = self.api.security_group_find('sg2')
+        self.assertEqual(self.FAKE_SECURITY_GROUP_RESP_2, ret)
+        # the security groups are only listed once
+        self.assertEqual(
+            1,
+            sum(
+                1
+                for r in self.requests_mock.request_history
+                if r.path.endswith('/os-security-groups')
+            ),
+        )
+
     def test_security_group_find_not_found(self):
         self.requests_mock.register_uri(
             'GET',
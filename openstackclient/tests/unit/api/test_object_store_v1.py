@@ -13,10 +13,19 @@
 
 """Object Store v1 API Library Tests"""
 
+import hashlib
+import os
+import re
+import threading
 from unittest import mock
+import urllib
 
+import fixtures
+from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import session
+from osc_lib import exceptions
 from requests_mock.contrib import fixture
+import simplejson as json
 
 from openstackclient.api import object_store_v1 as object_store
 from openstackclient.tests.unit import utils
@@ -89,6 +98,111 @@ class TestContainer(TestObjectAPIv1):
         ret = self.api.container_delete(container='qaz')
         self.assertIsNone(ret)
 
+    def _register_listing(self, names):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz',
+            json=[{'name': name} for name in names],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=%s' % names[-1],
+            json=[],
+            status_code=200,
+        )
+
+    def test_container_empty_bulk_delete(self):
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            json={'bulk_delete': {'max_deletes_per_request': 2}},
+            status_code=200,
+        )
+        self._register_listing(['a', 'b', 'c d'])
+        self.requests_mock.register_uri(
+            'POST',
+            FAKE_URL + '?bulk-delete',
+            json={'Response Status': '200 OK', 'Errors': []},
+            status_code=200,
+        )
+
+        ret = self.api.container_empty('qaz')
+
+        self.assertEqual(3, ret)
+        bodies = [
+            r.body
+            for r in self.requests_mock.request_history
+            if r.method == 'POST'
+        ]
+        self.assertEqual([b'/qaz/a\n/qaz/b', b'/qaz/c%20d'], bodies)
+
+    def test_container_empty_bulk_delete_errors(self):
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            json={'bulk_delete': {}},
+            status_code=200,
+        )
+        self._register_listing(['a', 'b'])
+        self.requests_mock.register_uri(
+            'POST',
+            FAKE_URL + '?bulk-delete',
+            json={
+                'Response Status': '400 Bad Request',
+                'Errors': [['/qaz/b', '409 Conflict']],
+            },
+            status_code=200,
+        )
+
+        self.assertRaisesRegex(
+            exceptions.CommandError,
+            '1 objects of container qaz failed',
+            self.api.container_empty,
+            'qaz',
+        )
+
+    def test_container_empty_without_bulk_delete(self):
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            status_code=404,
+        )
+        self._register_listing(['a', 'b', 'c'])
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/a',
+            status_code=204,
+        )
+        # Already deleted
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/b',
+            status_code=404,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/c',
+            status_code=409,
+        )
+
+        self.assertRaisesRegex(
+            exceptions.CommandError,
+            '1 objects of container qaz failed',
+            self.api.container_empty,
+            'qaz',
+            max_workers=2,
+        )
+        deleted = [
+            r.path
+            for r in self.requests_mock.request_history
+            if r.method == 'DELETE'
+        ]
+        self.assertEqual(
+            ['/v1/q12we34r/qaz/a', '/v1/q12we34r/qaz/b', '/v1/q12we34r/qaz/c'],
+            sorted(deleted),
+        )
+
     def test_container_list_no_options(self):
         self.requests_mock.register_uri(
             'GET',
@@ -183,8 +297,12 @@ class TestObject(TestObjectAPIv1):
     def setUp(self):
         super(TestObject, self).setUp()
 
+    @mock.patch(
+        'openstackclient.api.object_store_v1.os.path.getsize',
+        return_value=12,
+    )
     @mock.patch('openstackclient.api.object_store_v1.io.open')
-    def base_object_create(self, file_contents, mock_open):
+    def base_object_create(self, file_contents, mock_open, mock_getsize):
         mock_open.read.return_value = file_contents
 
         headers = {
@@ -218,6 +336,378 @@ class TestObject(TestObjectAPIv1):
         self.base_object_create('111\n222\n333\n')
         self.base_object_create(bytes([0x31, 0x00, 0x0D, 0x0A, 0x7F, 0xFF]))
 
+    def _write_file(self, contents):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        with open(path, 'wb') as f:
+            f.write(contents)
+        return path
+
+    def _register_no_info(self):
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            status_code=404,
+        )
+
+    def test_object_create_segmented(self):
+        path = self._write_file(b'0123456789')
+        self._register_no_info()
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz_segments',
+            status_code=201,
+        )
+        segments = {}
+
+        def _upload_segment(request, context):
+            # the body is streamed from the file, read it while it is open
+            segments[request.path] = b''.join(request.body)
+            return ''
+
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments/big/slo/.*'),
+            headers={'etag': 'segment-etag'},
+            status_code=201,
+            text=_upload_segment,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/big?multipart-manifest=put',
+            headers={'etag': 'youreit', 'x-trans-id': '1qaz2wsx'},
+            status_code=201,
+        )
+
+        ret = self.api.object_create(
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+            max_workers=2,
+        )
+
+        data = {
+            'account': FAKE_ACCOUNT,
+            'container': 'qaz',
+            'object': 'big',
+            'etag': 'youreit',
+            'x-trans-id': '1qaz2wsx',
+        }
+        self.assertEqual(data, ret)
+
+        self.assertEqual(
+            [b'0123', b'4567', b'89'],
+            [body for _path, body in sorted(segments.items())],
+        )
+
+        manifest = json.loads(self.requests_mock.last_request.body)
+        self.assertEqual(
+            [4, 4, 2], [segment['size_bytes'] for segment in manifest]
+        )
+        self.assertEqual(
+            sorted(segments),
+            ['/v1/' + FAKE_ACCOUNT + segment['path'] for segment in manifest],
+        )
+        self.assertTrue(
+            all(
+                segment['path'].startswith('/qaz_segments/big/slo/')
+                and segment['etag'] == 'segment-etag'
+                for segment in manifest
+            )
+        )
+
+    def test_object_create_segmented_failure(self):
+        path = self._write_file(b'0123456789')
+        self._register_no_info()
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz_segments',
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments/big/slo/.*'),
+            headers={'etag': 'segment-etag'},
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments/big/slo/.*00000001$'),
+            status_code=500,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            re.compile(FAKE_URL + '/qaz_segments/big/slo/.*'),
+            status_code=204,
+        )
+
+        self.assertRaises(
+            ks_exceptions.HttpError,
+            self.api.object_create,
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+        )
+
+        # the first segment was uploaded and is cleaned up again, no
+        # manifest is created
+        methods = [
+            request.method for request in self.requests_mock.request_history
+        ]
+        self.assertEqual(['GET', 'PUT', 'PUT', 'PUT', 'DELETE'], methods)
+
+    def test_object_create_segmented_failure_in_flight(self):
+        path = self._write_file(b'0123456789')
+        self._register_no_info()
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments.*'),
+            status_code=201,
+        )
+        # all the segments are being uploaded when the second one fails
+        in_flight = threading.Barrier(3, timeout=10)
+        create = self.api.create
+
+        def _create(url, *args, **kwargs):
+            if '/slo/' in url:
+                in_flight.wait()
+                if url.endswith('00000001'):
+                    raise ks_exceptions.HttpError()
+            return create(url, *args, **kwargs)
+
+        self.useFixture(
+            fixtures.MockPatchObject(self.api, 'create', side_effect=_create)
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            re.compile(FAKE_URL + '/qaz_segments/big/slo/.*'),
+            status_code=204,
+        )
+
+        self.assertRaises(
+            ks_exceptions.HttpError,
+            self.api.object_create,
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+            max_workers=3,
+        )
+
+        # the segments uploaded concurrently with the failed one are
+        # cleaned up too
+        deleted = [
+            request.path[-8:]
+            for request in self.requests_mock.request_history
+            if request.method == 'DELETE'
+        ]
+        self.assertEqual(['00000000', '00000002'], sorted(deleted))
+
+    def test_object_create_segmented_too_many_segments(self):
+        path = self._write_file(b'0123456789')
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            json={'slo': {'max_manifest_segments': 2}},
+            status_code=200,
+        )
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.api.object_create,
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+        )
+        # nothing is uploaded
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    @mock.patch.object(object_store, 'DEFAULT_SEGMENT_SIZE', 2)
+    @mock.patch.object(object_store, 'MAX_OBJECT_SIZE', 4)
+    def test_object_create_segmented_default_size(self):
+        path = self._write_file(b'0123456789')
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/info',
+            json={'slo': {'max_manifest_segments': 3}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments.*'),
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/big?multipart-manifest=put',
+            status_code=201,
+        )
+
+        self.api.object_create(container='qaz', object=path, name='big')
+
+        # the segments are made larger to fit in the allowed number
+        manifest = json.loads(self.requests_mock.last_request.body)
+        self.assertEqual(
+            [4, 4, 2], [segment['size_bytes'] for segment in manifest]
+        )
+
+    def _register_ranged_object(self, content, etag=None):
+        """Serve ``content`` at qaz/big, honouring Range requests"""
+        etag = etag or hashlib.md5(content).hexdigest()
+        self.requests_mock.register_uri(
+            'HEAD',
+            FAKE_URL + '/qaz/big',
+            headers={'Content-Length': str(len(content)), 'Etag': etag},
+            status_code=200,
+        )
+
+        def _get_range(request, context):
+            self.assertEqual(etag, request.headers['If-Match'])
+            start, end = request.headers['Range'][len('bytes=') :].split('-')
+            context.status_code = 206
+            return content[int(start) : int(end) + 1]
+
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/big',
+            content=_get_range,
+        )
+
+    def _get_ranges(self):
+        return sorted(
+            request.headers['Range']
+            for request in self.requests_mock.request_history
+            if request.method == 'GET'
+        )
+
+    @mock.patch.object(object_store, 'DOWNLOAD_RANGE_SIZE', 4)
+    def test_object_save_ranged(self):
+        content = b'0123456789'
+        self._register_ranged_object(content)
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+
+        self.api.object_save(
+            container='qaz', object='big', file=path, max_workers=2
+        )
+
+        with open(path, 'rb') as f:
+            self.assertEqual(content, f.read())
+        self.assertEqual(
+            ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'], self._get_ranges()
+        )
+        self.assertFalse(
+            os.path.exists(path + object_store.DOWNLOAD_STATE_SUFFIX)
+        )
+
+    @mock.patch.object(object_store, 'DOWNLOAD_RANGE_SIZE', 4)
+    def test_object_save_ranged_resume(self):
+        content = b'0123456789'
+        etag = hashlib.md5(content).hexdigest()
+        self._register_ranged_object(content)
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        # an earlier download fetched the first and last ranges
+        with open(path, 'wb') as f:
+            f.write(b'0123\0\0\0\089')
+        with open(path + object_store.DOWNLOAD_STATE_SUFFIX, 'w') as f:
+            json.dump(
+                {'etag': etag, 'size': 10, 'range_size': 4, 'done': [0, 2]},
+                f,
+            )
+
+        self.api.object_save(
+            container='qaz', object='big', file=path, max_workers=2
+        )
+
+        with open(path, 'rb') as f:
+            self.assertEqual(content, f.read())
+        self.assertEqual(['bytes=4-7'], self._get_ranges())
+
+    @mock.patch.object(object_store, 'DOWNLOAD_RANGE_SIZE', 4)
+    def test_object_save_ranged_checksum_mismatch(self):
+        self._register_ranged_object(b'0123456789', etag='not-the-md5')
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.api.object_save,
+            container='qaz',
+            object='big',
+            file=path,
+            max_workers=2,
+        )
+        # the next attempt starts from scratch
+        self.assertFalse(
+            os.path.exists(path + object_store.DOWNLOAD_STATE_SUFFIX)
+        )
+
+    def test_container_save_parallel_nested(self):
+        names = ['dir/sub/o%d' % i for i in range(8)]
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz',
+            json=[{'name': name} for name in names],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            re.compile(re.escape(FAKE_URL + '/qaz/dir/sub/') + 'o[0-9]'),
+            content=b'data',
+            status_code=200,
+        )
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.useFixture(fixtures.TempDir()).path)
+
+        # hold the first two workers until both are creating the directory
+        barrier = threading.Barrier(2, timeout=5)
+        lock = threading.Lock()
+        waiting = []
+        makedirs = os.makedirs
+
+        def _makedirs(name, *args, **kwargs):
+            if name == os.path.join('dir', 'sub'):
+                with lock:
+                    wait = len(waiting) < 2
+                    waiting.append(name)
+                if wait:
+                    barrier.wait()
+            return makedirs(name, *args, **kwargs)
+
+        with mock.patch.object(object_store.os, 'makedirs', _makedirs):
+            self.api.container_save(container='qaz', max_workers=8)
+
+        for name in names:
+            with open(name, 'rb') as f:
+                self.assertEqual(b'data', f.read())
+
+    def test_object_create_account_id(self):
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/counter.txt',
+            headers={'etag': 'abc'},
+            status_code=201,
+        )
+        path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'counter.txt'
+        )
+        with open(path, 'wb') as f:
+            f.write(b'0')
+
+        with mock.patch.object(
+            object_store.urllib.parse, 'urlparse', wraps=urllib.parse.urlparse
+        ) as urlparse:
+            for _i in range(3):
+                ret = self.api.object_create(
+                    container='qaz', object=path, name='counter.txt'
+                )
+                self.assertEqual(FAKE_ACCOUNT, ret['account'])
+        # The account ID is only parsed from the endpoint once
+        self.assertEqual(1, urlparse.call_args_list.count(mock.call(FAKE_URL)))
+
+        self.api.endpoint = 'http://gopher.com/v1/other'
+        self.assertEqual('other', self.api._find_account_id())
+
     def test_object_delete(self):
         self.requests_mock.register_uri(
             'DELETE',
@@ -311,6 +801,142 @@ class TestObject(TestObjectAPIv1):
     #         )
     #         self.assertEqual(resp, data)
 
+    def test_object_iter(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?limit=1&format=json',
+            json=[LIST_OBJECT_RESP[0]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=fred&limit=1&format=json',
+            json=[LIST_OBJECT_RESP[1]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=wilma&limit=1&format=json',
+            json=[],
+            status_code=200,
+        )
+
+        objects = self.api.object_iter('qaz', limit=1)
+        # Nothing is fetched until the objects are consumed
+        self.assertEqual(0, self.requests_mock.call_count)
+        self.assertEqual(LIST_OBJECT_RESP[0], next(objects))
+        self.assertEqual(LIST_OBJECT_RESP[1:], list(objects))
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def _register_container(self, names):
+        """Serve the listings of a container holding ``names``"""
+        names = sorted(names)
+
+        def _listing(request, context):
+            query = dict(
+                urllib.parse.parse_qsl(
+                    urllib.parse.urlsplit(request.url).query
+                )
+            )
+            reverse = query.get('reverse') == 'true'
+            prefix = query.get('prefix', '')
+            delimiter = query.get('delimiter')
+            result = []
+            for name in reversed(names) if reverse else names:
+                if not name.startswith(prefix):
+                    continue
+                if 'marker' in query and (
+                    name >= query['marker']
+                    if reverse
+                    else name <= query['marker']
+                ):
+                    continue
+                if 'end_marker' in query and (
+                    name <= query['end_marker']
+                    if reverse
+                    else name >= query['end_marker']
+                ):
+                    continue
+                if delimiter and delimiter in name[len(prefix) :]:
+                    rest = name[len(prefix) :]
+                    subdir = prefix + rest[: rest.index(delimiter) + 1]
+                    # Like Swift, skip the subdir given as marker
+                    if subdir == query.get('marker') or (
+                        result and result[-1].get('subdir') == subdir
+                    ):
+                        continue
+                    result.append({'subdir': subdir})
+                else:
+                    result.append({'name': name})
+                if len(result) == int(query.get('limit', 10000)):
+                    break
+            return result
+
+        self.requests_mock.register_uri(
+            'GET', FAKE_URL + '/qaz', json=_listing, status_code=200
+        )
+
+    def test_object_iter_sharded(self):
+        names = ['%s/%03d' % (d, i) for d in 'abcd' for i in range(50)]
+        names += ['e', 'f g', 'z']
+        self._register_container(names)
+
+        objects = self.api.object_iter('qaz', limit=10, max_workers=4)
+
+        self.assertEqual(sorted(names), [o['name'] for o in objects])
+
+    def test_object_iter_sharded_range(self):
+        names = ['log-%04d' % i for i in range(300)]
+        self._register_container(names)
+
+        objects = self.api.object_iter(
+            'qaz',
+            prefix='log-0',
+            marker='log-0049',
+            end_marker='log-0250',
+            limit=20,
+            max_workers=3,
+        )
+
+        self.assertEqual(names[50:250], [o['name'] for o in objects])
+
+    def test_object_iter_sharded_by_delimiter(self):
+        names = ['top/%s/%03d' % (d, i) for d in 'abc' for i in range(30)]
+        names += ['top/x', 'top/y']
+        self._register_container(names)
+
+        objects = self.api.object_iter(
+            'qaz', limit=10, max_workers=2, shard_delimiter='/'
+        )
+
+        self.assertEqual(sorted(names), [o['name'] for o in objects])
+        prefixes = {
+            r.qs['prefix'][0]
+            for r in self.requests_mock.request_history
+            if 'prefix' in r.qs and 'delimiter' not in r.qs
+        }
+        # The lone top level directory is split in its subdirectories
+        self.assertEqual({'top/a/', 'top/b/', 'top/c/'}, prefixes)
+
+    def test_object_iter_delimiter(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?delimiter=%2f&format=json',
+            json=[{'subdir': 'dir/'}, LIST_OBJECT_RESP[0]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=fred&delimiter=%2f&format=json',
+            json=[],
+            status_code=200,
+        )
+
+        self.assertEqual(
+            [{'subdir': 'dir/'}, LIST_OBJECT_RESP[0]],
+            list(self.api.object_iter('qaz', delimiter='/', prefetch=False)),
+        )
+
     def test_object_show(self):
         headers = {
             'content-type': 'text/alpha',
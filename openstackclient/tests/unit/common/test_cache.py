@@ -0,0 +1,328 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+import time
+from unittest import mock
+
+import fixtures
+from openstack import exceptions as sdk_exceptions
+from osc_lib import exceptions
+from osc_lib import utils as common_utils
+
+from openstackclient.common import cache
+from openstackclient.tests.unit import utils
+
+
+class TestResourceCache(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'cache', 'r.json'
+        )
+        self.cache = cache.ResourceCache(self.path)
+
+    def test_disabled(self):
+        disabled = cache.ResourceCache()
+        self.assertFalse(disabled.enabled)
+        disabled.set('server', 'foo', 'id-1')
+        self.assertIsNone(disabled.get('server', 'foo'))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_zero_ttl_is_disabled(self):
+        self.assertFalse(cache.ResourceCache(self.path, ttl=0).enabled)
+
+    def test_set_get(self):
+        self.cache.set('server', 'foo', 'id-1')
+        self.assertEqual('id-1', self.cache.get('server', 'foo'))
+        self.assertIsNone(self.cache.get('network', 'foo'))
+
+        # A new instance reads the mapping back from disk
+        other = cache.ResourceCache(self.path)
+        self.assertEqual('id-1', other.get('server', 'foo'))
+
+    def test_set_many(self):
+        self.cache.set('server', 'foo', 'id-1')
+        self.cache.set_many('image_name', {'id-2': 'bar', 'id-3': 'baz'})
+
+        other = cache.ResourceCache(self.path)
+        self.assertEqual('id-1', other.get('server', 'foo'))
+        self.assertEqual('bar', other.get('image_name', 'id-2'))
+        self.assertEqual('baz', other.get('image_name', 'id-3'))
+
+    def test_expired(self):
+        self.cache.set('server', 'foo', 'id-1')
+        with mock.patch.object(time, 'time', return_value=time.time() + 301):
+            other = cache.ResourceCache(self.path)
+            self.assertIsNone(other.get('server', 'foo'))
+
+    def test_eviction(self):
+        small = cache.ResourceCache(self.path, max_entries=2)
+        small.set('server', 'a', 'id-a')
+        small.set('server', 'b', 'id-b')
+        small.set('server', 'c', 'id-c')
+        other = cache.ResourceCache(self.path)
+        self.assertIsNone(other.get('server', 'a'))
+        self.assertEqual('id-b', other.get('server', 'b'))
+        self.assertEqual('id-c', other.get('server', 'c'))
+
+    def test_invalidate(self):
+        self.cache.set('server', 'foo', 'id-1')
+        self.cache.set('network', 'bar', 'id-2')
+        self.cache.invalidate('server')
+        other = cache.ResourceCache(self.path)
+        self.assertIsNone(other.get('server', 'foo'))
+        self.assertEqual('id-2', other.get('network', 'bar'))
+
+        self.cache.invalidate()
+        other = cache.ResourceCache(self.path)
+        self.assertIsNone(other.get('network', 'bar'))
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(self.cache.get('server', 'foo'))
+        self.cache.set('server', 'foo', 'id-1')
+        self.assertEqual(
+            'id-1', cache.ResourceCache(self.path).get('server', 'foo')
+        )
+
+    def test_find_id(self):
+        finder = mock.Mock(return_value=mock.Mock(id='id-1'))
+
+        self.assertEqual('id-1', self.cache.find_id('server', 'foo', finder))
+        self.assertEqual('id-1', self.cache.find_id('server', 'foo', finder))
+        finder.assert_called_once_with('foo')
+
+    def test_find_id_not_found(self):
+        finder = mock.Mock(side_effect=ValueError)
+
+        self.assertRaises(
+            ValueError, self.cache.find_id, 'server', 'foo', finder
+        )
+        self.assertIsNone(self.cache.get('server', 'foo'))
+
+    def test_call_with_id_stale(self):
+        self.cache.set('server', 'foo', 'stale-id')
+        finder = mock.Mock(return_value=mock.Mock(id='id-1'))
+        func = mock.Mock(side_effect=[KeyError, 'result'])
+
+        self.assertEqual(
+            'result',
+            self.cache.call_with_id(
+                'server', 'foo', finder, func, stale=(KeyError,)
+            ),
+        )
+        func.assert_has_calls([mock.call('stale-id'), mock.call('id-1')])
+        finder.assert_called_once_with('foo')
+        self.assertEqual('id-1', self.cache.get('server', 'foo'))
+
+    def test_call_with_id_stale_once(self):
+        finder = mock.Mock(return_value=mock.Mock(id='id-1'))
+        func = mock.Mock(side_effect=KeyError)
+
+        # An ID that was just resolved is not retried
+        self.assertRaises(
+            KeyError,
+            self.cache.call_with_id,
+            'server',
+            'foo',
+            finder,
+            func,
+            stale=(KeyError,),
+        )
+        func.assert_called_once_with('id-1')
+
+    def test_delete(self):
+        self.cache.set_many('server', {'foo': 'id-1', 'bar': 'id-2'})
+        self.cache.delete('server', 'foo')
+
+        other = cache.ResourceCache(self.path)
+        self.assertIsNone(other.get('server', 'foo'))
+        self.assertEqual('id-2', other.get('server', 'bar'))
+
+    def _resource(self, resource_id, name):
+        resource = mock.Mock(id=resource_id)
+        resource.name = name
+        return resource
+
+    def test_find(self):
+        foo = self._resource('id-1', 'foo')
+        finder = mock.Mock(return_value=foo)
+
+        self.assertIs(foo, self.cache.find('server', 'foo', finder))
+        self.assertIs(foo, self.cache.find('server', 'foo', finder))
+        # The second lookup fetches the resource by its cached ID
+        finder.assert_has_calls([mock.call('foo'), mock.call('id-1')])
+
+    def test_find_by_id_not_cached(self):
+        finder = mock.Mock(return_value=self._resource('id-1', 'foo'))
+
+        self.cache.find('server', 'id-1', finder)
+        self.assertIsNone(self.cache.get('server', 'id-1'))
+
+    def test_find_deleted(self):
+        self.cache.set('server', 'foo', 'stale-id')
+        foo = self._resource('id-1', 'foo')
+        finder = mock.Mock(side_effect=[KeyError, foo])
+
+        self.assertIs(
+            foo, self.cache.find('server', 'foo', finder, stale=(KeyError,))
+        )
+        finder.assert_has_calls([mock.call('stale-id'), mock.call('foo')])
+        self.assertEqual('id-1', self.cache.get('server', 'foo'))
+
+    def test_find_renamed(self):
+        self.cache.set('server', 'foo', 'id-1')
+        foo = self._resource('id-2', 'foo')
+        finder = mock.Mock(side_effect=[self._resource('id-1', 'bar'), foo])
+
+        self.assertIs(foo, self.cache.find('server', 'foo', finder))
+        self.assertEqual('id-2', self.cache.get('server', 'foo'))
+
+    def test_find_scope(self):
+        finder = mock.Mock(return_value=self._resource('id-1', 'foo'))
+
+        self.cache.find('project', 'foo', finder, scope={'domain_id': 'd1'})
+        self.assertIsNone(self.cache.get('project', 'foo'))
+        self.cache.find('project', 'foo', finder, scope={'domain_id': 'd1'})
+        finder.assert_has_calls([mock.call('foo'), mock.call('id-1')])
+
+    def test_find_disabled(self):
+        disabled = cache.ResourceCache()
+        finder = mock.Mock(return_value=self._resource('id-1', 'foo'))
+
+        disabled.find('server', 'foo', finder)
+        disabled.find('server', 'foo', finder)
+        finder.assert_has_calls([mock.call('foo'), mock.call('foo')])
+
+    @mock.patch.object(common_utils, 'find_resource')
+    def test_find_resource(self, find_resource):
+        class Volume(object):
+            pass
+
+        manager = mock.Mock(resource_class=Volume)
+        find_resource.side_effect = [
+            self._resource('id-1', 'foo'),
+            exceptions.CommandError,
+            self._resource('id-2', 'foo'),
+        ]
+
+        self.cache.find_resource(manager, 'foo')
+        self.assertEqual('id-1', self.cache.get('volume', 'foo'))
+        # The volume was deleted since
+        self.cache.find_resource(manager, 'foo')
+        self.assertEqual('id-2', self.cache.get('volume', 'foo'))
+        find_resource.assert_has_calls(
+            [
+                mock.call(manager, 'foo'),
+                mock.call(manager, 'id-1'),
+                mock.call(manager, 'foo'),
+            ]
+        )
+
+    def test_find_sdk_resource(self):
+        network_client = mock.Mock(service_type='network')
+        network_client.find_security_group.__name__ = 'find_security_group'
+        network_client.find_security_group.side_effect = [
+            self._resource('id-1', 'foo'),
+            sdk_exceptions.ResourceNotFound,
+            self._resource('id-2', 'foo'),
+            self._resource('id-2', 'foo'),
+        ]
+        find = network_client.find_security_group
+        # Bound methods know their proxy
+        find.__self__ = network_client
+
+        for i in range(3):
+            self.cache.find_sdk_resource(find, 'foo', ignore_missing=False)
+        find.assert_has_calls(
+            [
+                mock.call('foo', ignore_missing=False),
+                mock.call('id-1', ignore_missing=False),
+                mock.call('foo', ignore_missing=False),
+                mock.call('id-2', ignore_missing=False),
+            ]
+        )
+
+    def test_invalidate_for_command(self):
+        self.cache.set('ip', '10.0.0.1', 'id-1')
+        self.cache.set('network', 'foo', 'id-2')
+        self.cache.set('server', 'bar', 'id-3')
+
+        self.cache.invalidate_for_command('server list')
+        self.cache.invalidate_for_command('floating ip delete')
+        self.cache.invalidate_for_command('network set')
+
+        other = cache.ResourceCache(self.path)
+        self.assertIsNone(other.get('ip', '10.0.0.1'))
+        self.assertIsNone(other.get('network', 'foo'))
+        self.assertEqual('id-3', other.get('server', 'bar'))
+
+
+class TestTokenCache(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'tokens'
+        )
+        self.cache = cache.TokenCache(self.path)
+
+    def test_disabled(self):
+        disabled = cache.TokenCache()
+        self.assertFalse(disabled.enabled)
+        disabled.set('cache-id', 'state')
+        self.assertIsNone(disabled.get('cache-id'))
+
+    def test_set_get(self):
+        self.cache.set('cache-id', '{"auth_token": "secret-token"}')
+
+        other = cache.TokenCache(self.path)
+        self.assertEqual(
+            '{"auth_token": "secret-token"}', other.get('cache-id')
+        )
+        self.assertIsNone(other.get('other-id'))
+        self.assertIsNone(other.get(None))
+
+    def test_encrypted(self):
+        self.cache.set('cache-id', '{"auth_token": "secret-token"}')
+
+        (name,) = [n for n in os.listdir(self.path) if n.endswith('.json')]
+        self.assertNotIn('cache-id', name)
+        path = os.path.join(self.path, name)
+        self.assertEqual(0o600, os.stat(path).st_mode & 0o777)
+        self.assertEqual(0o700, os.stat(self.path).st_mode & 0o777)
+        with open(path) as f:
+            self.assertNotIn('secret-token', f.read())
+
+    def test_tampered(self):
+        self.cache.set('cache-id', 'state')
+        (name,) = [n for n in os.listdir(self.path) if n.endswith('.json')]
+        with open(os.path.join(self.path, name), 'w') as f:
+            f.write('{"version": 1, "state": "garbage"}')
+
+        self.assertIsNone(self.cache.get('cache-id'))
+
+    def test_forget(self):
+        self.cache.set('cache-id', 'state')
+        self.cache.set('cache-id', None)
+        self.assertIsNone(self.cache.get('cache-id'))
+        # Forgetting twice is harmless
+        self.cache.set('cache-id', None)
+
+    def test_unwritable(self):
+        with open(self.path, 'w'):
+            pass
+        self.cache.set('cache-id', 'state')
+        self.assertIsNone(self.cache.get('cache-id'))
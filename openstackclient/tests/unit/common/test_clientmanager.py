@@ -14,10 +14,14 @@
 #
 
 import copy
+from unittest import mock
 
+import fixtures
 from keystoneauth1 import token_endpoint
+from openstack import utils as sdk_utils
 from osc_lib.tests import utils as osc_lib_test_utils
 
+from openstackclient.common import cache
 from openstackclient.common import clientmanager
 from openstackclient.tests.unit import fakes
 
@@ -70,3 +74,180 @@ class TestClientManager(osc_lib_test_utils.TestClientManager):
         # This is True because ClientManager.auth_ref returns None in this
         # test; "no service catalog" means use Network API by default now
         self.assertTrue(client_manager.is_network_endpoint_enabled())
+
+    def test_client_manager_resource_cache(self):
+        client_manager = self._make_clientmanager(
+            config_args={'resource_cache_ttl': 300},
+        )
+        self.assertTrue(client_manager.resource_cache.enabled)
+        self.assertIs(
+            client_manager.resource_cache, client_manager.resource_cache
+        )
+
+    def test_client_manager_resource_cache_disabled(self):
+        client_manager = self._make_clientmanager(
+            config_args={'resource_cache_ttl': 300, 'no_resource_cache': True},
+        )
+        self.assertFalse(client_manager.resource_cache.enabled)
+
+    def test_client_manager_resource_cache_opt_in(self):
+        client_manager = self._make_clientmanager()
+        self.assertFalse(client_manager.resource_cache.enabled)
+
+    def test_client_manager_invalidate_resource_cache(self):
+        client_manager = self._make_clientmanager()
+        resource_cache = mock.Mock()
+        client_manager._resource_cache = resource_cache
+
+        # Nothing can have changed without authenticating
+        client_manager._auth_setup_completed = False
+        client_manager.invalidate_resource_cache('server delete')
+        resource_cache.invalidate_for_command.assert_not_called()
+
+        client_manager._auth_setup_completed = True
+        client_manager.invalidate_resource_cache('server delete')
+        resource_cache.invalidate_for_command.assert_called_once_with(
+            'server delete'
+        )
+
+    def _restore_auth_state(
+        self, auth_states, expiring=False, token_cache=None
+    ):
+        client_manager = self._make_clientmanager()
+        client_manager.auth = mock.Mock()
+        client_manager.auth.get_cache_id.return_value = 'cache-id'
+        auth_ref = client_manager.auth.auth_ref
+        auth_ref.will_expire_soon.return_value = expiring
+        client_manager.auth_states = auth_states
+        client_manager._token_cache = token_cache or cache.TokenCache()
+        client_manager._restore_auth_state()
+        return client_manager
+
+    def test_client_manager_restore_auth_state(self):
+        client_manager = self._restore_auth_state({'cache-id': 'state'})
+        client_manager.auth.set_auth_state.assert_called_once_with('state')
+        self.assertIs(client_manager.auth.auth_ref, client_manager._auth_ref)
+
+    def test_client_manager_restore_auth_state_expiring(self):
+        client_manager = self._restore_auth_state(
+            {'cache-id': 'state'}, expiring=True
+        )
+        client_manager.auth.set_auth_state.assert_has_calls(
+            [mock.call('state'), mock.call(None)]
+        )
+        self.assertIsNone(client_manager._auth_ref)
+
+    def test_client_manager_restore_auth_state_unknown(self):
+        client_manager = self._restore_auth_state({'other-id': 'state'})
+        client_manager.auth.set_auth_state.assert_not_called()
+        self.assertIsNone(client_manager._auth_ref)
+
+    def test_client_manager_restore_auth_state_cached(self):
+        token_cache = cache.TokenCache(
+            self.useFixture(fixtures.TempDir()).path
+        )
+        token_cache.set('cache-id', 'state')
+
+        client_manager = self._restore_auth_state(
+            None, token_cache=token_cache
+        )
+
+        client_manager.auth.set_auth_state.assert_called_once_with('state')
+        self.assertIs(client_manager.auth.auth_ref, client_manager._auth_ref)
+
+        # An unchanged state isn't written again
+        with mock.patch.object(token_cache, 'set') as mock_set:
+            client_manager.auth.get_auth_state.return_value = 'state'
+            client_manager.save_auth_state()
+            mock_set.assert_not_called()
+
+            client_manager.auth.get_auth_state.return_value = 'new-state'
+            client_manager.save_auth_state()
+            mock_set.assert_called_once_with('cache-id', 'new-state')
+
+    def test_client_manager_restore_auth_state_disabled(self):
+        client_manager = self._restore_auth_state(None)
+        client_manager.auth.set_auth_state.assert_not_called()
+        self.assertIsNone(client_manager._auth_ref)
+
+    def test_client_manager_token_cache(self):
+        client_manager = self._make_clientmanager()
+        self.assertTrue(client_manager.token_cache.enabled)
+
+    def test_client_manager_token_cache_reused(self):
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                'openstackclient.common.cache.get_cache_dir',
+                mock.Mock(
+                    return_value=self.useFixture(fixtures.TempDir()).path
+                ),
+            )
+        )
+        client_manager = self._make_clientmanager(auth_required=True)
+        token = client_manager.auth_ref.auth_token
+        client_manager.save_auth_state()
+        call_count = self.requests.call_count
+
+        # A new invocation doesn't need to authenticate again
+        client_manager = self._make_clientmanager(auth_required=True)
+        self.assertEqual(token, client_manager.auth_ref.auth_token)
+        self.assertEqual(call_count, self.requests.call_count)
+
+    def test_client_manager_token_cache_disabled(self):
+        client_manager = self._make_clientmanager(
+            config_args={'no_token_cache': True},
+        )
+        self.assertFalse(client_manager.token_cache.enabled)
+
+    def _make_compute_client(self, default_microversion=None):
+        client = mock.Mock()
+        client.service_type = 'compute'
+        client.default_microversion = default_microversion
+        client.get_endpoint_data.return_value = mock.Mock(
+            min_microversion=(2, 1), max_microversion=(2, 60)
+        )
+        return client
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=True)
+    def test_client_manager_supports_microversion(self, mock_supports):
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                'openstackclient.common.cache.get_cache_dir',
+                mock.Mock(
+                    return_value=self.useFixture(fixtures.TempDir()).path
+                ),
+            )
+        )
+        client = self._make_compute_client()
+        client_manager = self._make_clientmanager()
+
+        self.assertTrue(client_manager.supports_microversion(client, '2.47'))
+        self.assertTrue(client_manager.supports_microversion(client, '2.47'))
+        mock_supports.assert_called_once_with(client, '2.47')
+        self.assertEqual(
+            ['2.1', '2.60'],
+            client_manager.feature_cache.get('microversions', 'compute'),
+        )
+
+        # a new invocation answers from the persisted range
+        client_manager = self._make_clientmanager()
+        client = self._make_compute_client(default_microversion='2.50')
+        self.assertTrue(client_manager.supports_microversion(client, '2.47'))
+        self.assertFalse(client_manager.supports_microversion(client, '2.53'))
+        self.assertFalse(client_manager.supports_microversion(client, '2.70'))
+        mock_supports.assert_called_once()
+        client.get_endpoint_data.assert_not_called()
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=False)
+    def test_client_manager_supports_microversion_no_cache(
+        self, mock_supports
+    ):
+        client = self._make_compute_client()
+        client_manager = self._make_clientmanager(
+            config_args={'no_resource_cache': True},
+        )
+
+        self.assertFalse(client_manager.supports_microversion(client, '2.47'))
+        self.assertIsInstance(client_manager.feature_cache, cache.FileCache)
+        self.assertFalse(client_manager.feature_cache.enabled)
+        mock_supports.assert_called_once_with(client, '2.47')
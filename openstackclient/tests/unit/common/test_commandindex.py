@@ -0,0 +1,283 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import argparse
+from importlib import metadata
+import io
+import json
+import os
+from unittest import mock
+
+from cliff import help as cliff_help
+import fixtures
+from osc_lib.command import command
+
+from openstackclient.common import commandindex
+from openstackclient.tests.unit import utils
+
+
+class FakeCommand(command.Command):
+    """Do something useful.
+
+    With a longer description.
+    """
+
+    def take_action(self, parsed_args):
+        pass
+
+
+class FakeDeprecatedCommand(command.Command):
+    """Do something deprecated"""
+
+    deprecated = True
+
+    def take_action(self, parsed_args):
+        pass
+
+
+def _fake_distribution(name, entry_points):
+    distribution = mock.Mock()
+    distribution.metadata = {'Name': name}
+    distribution.entry_points = [
+        metadata.EntryPoint(ep_name, value, group)
+        for group, ep_name, value in entry_points
+    ]
+    return distribution
+
+
+def _make_index():
+    index = commandindex.CommandIndex()
+    with mock.patch.object(
+        commandindex.metadata, 'distributions', return_value=_DISTRIBUTIONS
+    ):
+        index.get_descriptions()
+    return index
+
+
+_MODULE = __name__
+
+_DISTRIBUTIONS = [
+    _fake_distribution(
+        'python-openstackclient',
+        [
+            ('openstack.cli.base', 'fake', _MODULE),
+            ('openstack.fake.v1', 'thing_show', _MODULE + ':FakeCommand'),
+            ('openstack.fake.v1', 'thing_list', 'nonexistent.module:List'),
+            ('console_scripts', 'openstack', 'openstackclient.shell:main'),
+        ],
+    ),
+    _fake_distribution(
+        'other-lib',
+        [('other.group', 'thing', 'other.module:Thing')],
+    ),
+]
+
+
+class TestCommandIndex(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'cache', 'index.json'
+        )
+        self.distributions = mock.patch.object(
+            commandindex.metadata,
+            'distributions',
+            return_value=_DISTRIBUTIONS,
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_entry_points(self):
+        index = commandindex.CommandIndex(self.path)
+
+        entry_points = index.entry_points('openstack.fake.v1')
+        self.assertEqual(
+            [
+                ('thing_show', _MODULE + ':FakeCommand'),
+                ('thing_list', 'nonexistent.module:List'),
+            ],
+            [(ep.name, ep.value) for ep in entry_points],
+        )
+        self.assertEqual([], index.entry_points('other.group'))
+        self.assertEqual([], index.entry_points('console_scripts'))
+        self.assertEqual(
+            'openstackclient.tests.unit.common.test_commandindex',
+            commandindex.module_name(entry_points[0]),
+        )
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_duplicate_distribution(self):
+        self.distributions.return_value = _DISTRIBUTIONS + _DISTRIBUTIONS
+        index = commandindex.CommandIndex(self.path)
+        self.assertEqual(2, len(index.entry_points('openstack.fake.v1')))
+
+    def test_reused(self):
+        commandindex.CommandIndex(self.path).entry_points('openstack.fake.v1')
+        self.distributions.reset_mock()
+
+        index = commandindex.CommandIndex(self.path)
+        self.assertEqual(2, len(index.entry_points('openstack.fake.v1')))
+        self.distributions.assert_not_called()
+
+    def test_rebuilt_when_distributions_change(self):
+        commandindex.CommandIndex(self.path).entry_points('openstack.fake.v1')
+        self.distributions.return_value = _DISTRIBUTIONS[1:]
+
+        with mock.patch.object(
+            commandindex, '_fingerprint', return_value='changed'
+        ):
+            index = commandindex.CommandIndex(self.path)
+            self.assertEqual([], index.entry_points('openstack.fake.v1'))
+
+        with open(self.path) as f:
+            self.assertEqual('changed', json.load(f)['fingerprint'])
+
+    def test_fingerprint(self):
+        site = self.useFixture(fixtures.TempDir()).path
+        ep_dir = os.path.join(site, 'fake-1.0.dist-info')
+        os.mkdir(ep_dir)
+        ep_file = os.path.join(ep_dir, 'entry_points.txt')
+        with open(ep_file, 'w') as f:
+            f.write('[openstack.fake.v1]\n')
+
+        fingerprint = commandindex._fingerprint([site])
+        self.assertEqual(fingerprint, commandindex._fingerprint([site]))
+
+        os.utime(ep_file, ns=(0, 0))
+        self.assertNotEqual(fingerprint, commandindex._fingerprint([site]))
+
+    def test_unwritable(self):
+        with open(os.path.dirname(self.path), 'w'):
+            pass
+        index = commandindex.CommandIndex(self.path)
+        self.assertEqual(2, len(index.entry_points('openstack.fake.v1')))
+        index.set_descriptions({'module:Cmd': ['Do something', None]})
+        self.assertEqual(
+            {'module:Cmd': ['Do something', None]}, index.get_descriptions()
+        )
+
+    def test_descriptions(self):
+        index = commandindex.CommandIndex(self.path)
+        index.set_descriptions({'module:One': ['Do one thing', None]})
+
+        # Descriptions recorded concurrently by another invocation are kept
+        other = commandindex.CommandIndex(self.path)
+        other.set_descriptions({'module:Two': ['Do another thing', 'lib']})
+        index.set_descriptions({'module:Three': [None, None]})
+
+        self.assertEqual(
+            {
+                'module:One': ['Do one thing', None],
+                'module:Two': ['Do another thing', 'lib'],
+                'module:Three': [None, None],
+            },
+            commandindex.CommandIndex(self.path).get_descriptions(),
+        )
+
+
+class TestCommandManager(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.index = _make_index()
+
+    def test_add_command_group(self):
+        command_manager = commandindex.CommandManager(index=self.index)
+        # Commands aren't imported when their group is added
+        command_manager.add_command_group('openstack.fake.v1')
+
+        self.assertEqual(
+            ['openstack.fake.v1'], command_manager.get_command_groups()
+        )
+        self.assertEqual(
+            ['thing show', 'thing list'],
+            command_manager.get_command_names('openstack.fake.v1'),
+        )
+        cmd_factory, name, args = command_manager.find_command(
+            ['thing', 'show', 'foo']
+        )
+        self.assertIs(FakeCommand, cmd_factory)
+        self.assertEqual('thing show', name)
+        self.assertEqual(['foo'], args)
+
+        self.assertRaises(
+            ImportError, command_manager.find_command, ['thing', 'list']
+        )
+
+
+class TestHelpAction(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.index = _make_index()
+
+        self.app = mock.Mock()
+        self.app.stdout = io.StringIO()
+        self.app.command_manager = commandindex.CommandManager(
+            index=self.index
+        )
+        self.app.command_manager.add_command_group('openstack.fake.v1')
+        self.parser = argparse.ArgumentParser(prog='openstack')
+
+    def _print_help(self):
+        action = commandindex.HelpAction(
+            [], argparse.SUPPRESS, default=self.app
+        )
+        self.assertRaises(
+            cliff_help.HelpExit,
+            action,
+            self.parser,
+            argparse.Namespace(debug=False),
+            None,
+        )
+        return self.app.stdout.getvalue()
+
+    def test_help_described(self):
+        self.index.set_descriptions(
+            {
+                _MODULE + ':FakeCommand': ['Do something useful', None],
+                'nonexistent.module:List': ['List things', 'other-lib'],
+            }
+        )
+
+        output = self._print_help()
+
+        self.assertIn('usage: openstack', output)
+        self.assertIn('  thing list     List things (other-lib)\n', output)
+        self.assertIn('  thing show     Do something useful\n', output)
+
+    def test_help_learns_descriptions(self):
+        self.index.set_descriptions({'nonexistent.module:List': [None, None]})
+        self.app.command_manager.add_command(
+            'thing old', FakeDeprecatedCommand
+        )
+
+        output = self._print_help()
+
+        self.assertIn('  thing show     Do something useful\n', output)
+        self.assertNotIn('thing list', output)
+        self.assertNotIn('thing old', output)
+        descriptions = self.index.get_descriptions()
+        self.assertEqual(
+            ['Do something useful', None],
+            descriptions[_MODULE + ':FakeCommand'],
+        )
+        self.assertEqual(
+            [None, None],
+            descriptions[_MODULE + ':FakeDeprecatedCommand'],
+        )
+
+    def test_help_load_failure(self):
+        output = self._print_help()
+
+        self.assertIn('Could not load', output)
+        self.assertNotIn(
+            'nonexistent.module:List', self.index.get_descriptions()
+        )
@@ -0,0 +1,104 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import hashlib
+import json
+import os
+
+import fixtures
+from osc_lib import exceptions
+
+from openstackclient.common import download
+from openstackclient.common import hashing
+from openstackclient.tests.unit import utils
+
+
+class TestDownloadRanges(utils.TestCase):
+    content = bytes(range(256)) * 4
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'data'
+        )
+        self.fetched = []
+
+    def _fetch_range(self, start, end):
+        self.fetched.append((start, end))
+        return [self.content[start : end + 1]]
+
+    def test_download(self):
+        hasher = hashing.Hasher('sha512')
+
+        download.download_ranges(
+            self.path,
+            len(self.content),
+            self._fetch_range,
+            {'etag': 'abc'},
+            max_workers=4,
+            range_size=100,
+            hasher=hasher,
+        )
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        self.assertEqual(11, len(self.fetched))
+        self.assertEqual(
+            hashlib.sha512(self.content).hexdigest(), hasher.hexdigest()
+        )
+        self.assertFalse(os.path.exists(self.path + download.STATE_SUFFIX))
+
+    def test_download_incomplete_range(self):
+        def _fetch_range(start, end):
+            if start >= 500:
+                end -= 1
+            return [self.content[start : end + 1]]
+
+        self.assertRaises(
+            exceptions.CommandError,
+            download.download_ranges,
+            self.path,
+            len(self.content),
+            _fetch_range,
+            {'etag': 'abc'},
+            range_size=100,
+        )
+        # the progress is kept for a later attempt
+        with open(self.path + download.STATE_SUFFIX) as f:
+            self.assertEqual([0, 1, 2, 3, 4], json.load(f)['done'])
+
+    def test_download_changed_data_restarts(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * len(self.content))
+        with open(self.path + download.STATE_SUFFIX, 'w') as f:
+            json.dump(
+                {
+                    'etag': 'old',
+                    'size': len(self.content),
+                    'range_size': 100,
+                    'done': [0, 1, 2],
+                },
+                f,
+            )
+
+        download.download_ranges(
+            self.path,
+            len(self.content),
+            self._fetch_range,
+            {'etag': 'new'},
+            range_size=100,
+        )
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        self.assertEqual(11, len(self.fetched))
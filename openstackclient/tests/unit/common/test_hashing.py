@@ -0,0 +1,97 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import hashlib
+import io
+
+from openstackclient.common import hashing
+from openstackclient.tests.unit import utils
+
+
+class TestHasher(utils.TestCase):
+    def test_hexdigest(self):
+        hasher = hashing.Hasher('sha512')
+        for _ in range(10):
+            hasher.update(b'0123456789')
+
+        self.assertEqual(
+            hashlib.sha512(b'0123456789' * 10).hexdigest(),
+            hasher.hexdigest(),
+        )
+
+    def test_hexdigest_no_data(self):
+        hasher = hashing.Hasher('md5')
+
+        self.assertEqual(hashlib.md5().hexdigest(), hasher.hexdigest())
+
+
+class TestHashingReader(utils.TestCase):
+    data = bytes(range(256)) * 40
+
+    def test_read_small_chunks(self):
+        reader = hashing.HashingReader(
+            io.BytesIO(self.data), ('md5', 'sha512'), block_size=1000
+        )
+
+        chunks = []
+        while True:
+            chunk = reader.read(300)
+            if not chunk:
+                break
+            self.assertLessEqual(len(chunk), 300)
+            chunks.append(chunk)
+
+        self.assertEqual(self.data, b''.join(chunks))
+        self.assertEqual(
+            {
+                'md5': hashlib.md5(self.data).hexdigest(),
+                'sha512': hashlib.sha512(self.data).hexdigest(),
+            },
+            reader.hexdigests(),
+        )
+
+    def test_read_all(self):
+        reader = hashing.HashingReader(io.BytesIO(self.data), block_size=1000)
+
+        self.assertEqual(self.data[:10], reader.read(10))
+        self.assertEqual(self.data[10:], reader.read())
+        self.assertEqual(b'', reader.read(10))
+        self.assertEqual(
+            {'md5': hashlib.md5(self.data).hexdigest()}, reader.hexdigests()
+        )
+
+    def test_stop(self):
+        fp = io.BytesIO(self.data)
+        reader = hashing.HashingReader(fp, block_size=1000)
+        reader.read(10)
+
+        reader.stop()
+
+        self.assertFalse(fp.closed)
+        self.assertEqual(
+            {'md5': hashlib.md5(self.data[:1000]).hexdigest()},
+            reader.hexdigests(),
+        )
+
+    def test_seek_before_read(self):
+        reader = hashing.HashingReader(io.BytesIO(self.data))
+
+        self.assertTrue(reader.seekable())
+        self.assertEqual(len(self.data), reader.seek(0, io.SEEK_END))
+        reader.seek(0)
+
+        reader.read(1)
+
+        self.assertFalse(reader.seekable())
+        self.assertRaises(io.UnsupportedOperation, reader.seek, 0)
+        self.assertRaises(io.UnsupportedOperation, reader.tell)
@@ -0,0 +1,155 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import argparse
+import threading
+
+from openstackclient.common import parallel
+from openstackclient.tests.unit import utils
+
+
+def _double(item):
+    if item == 3:
+        raise ValueError('bad item')
+    return item * 2
+
+
+class TestRunConcurrently(utils.TestCase):
+    def test_serial(self):
+        result = list(parallel.run_concurrently(_double, [1, 2, 3, 4]))
+        self.assertEqual(
+            [(1, 2, None), (2, 4, None), (4, 8, None)],
+            [r for r in result if r[2] is None],
+        )
+        self.assertEqual([1, 2, 3, 4], [r[0] for r in result])
+        self.assertIsInstance(result[2][2], ValueError)
+
+    def test_concurrent(self):
+        result = list(
+            parallel.run_concurrently(_double, range(20), max_workers=4)
+        )
+        self.assertEqual(list(range(20)), sorted(r[0] for r in result))
+        errors = [r for r in result if r[2] is not None]
+        self.assertEqual(1, len(errors))
+        self.assertEqual(3, errors[0][0])
+        self.assertEqual(
+            {i: i * 2 for i in range(20) if i != 3},
+            {r[0]: r[1] for r in result if r[2] is None},
+        )
+
+    def test_concurrent_uses_threads(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _wait(item):
+            # Deadlocks (and times out) unless the calls run concurrently
+            barrier.wait()
+            return item
+
+        result = list(
+            parallel.run_concurrently(_wait, [1, 2, 3], max_workers=3)
+        )
+        self.assertEqual([None, None, None], [r[2] for r in result])
+
+    def test_lazy_items(self):
+        consumed = []
+
+        def _items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = parallel.run_concurrently(
+            lambda i: i, _items(), max_workers=2
+        )
+        next(results)
+        self.assertLess(len(consumed), 100)
+        results.close()
+
+
+class TestPrefetch(utils.TestCase):
+    def test_prefetch(self):
+        produced = []
+        consumed = threading.Event()
+
+        def _items():
+            for i in range(3):
+                if i == 2:
+                    # Produced while the caller handles the first item
+                    consumed.wait(timeout=5)
+                produced.append(i)
+                yield i
+
+        items = parallel.prefetch(_items())
+        self.assertEqual(0, next(items))
+        consumed.set()
+        self.assertEqual([1, 2], list(items))
+        self.assertEqual([0, 1, 2], produced)
+
+    def test_prefetch_error(self):
+        def _items():
+            yield 1
+            raise ValueError('bad item')
+
+        items = parallel.prefetch(_items())
+        self.assertEqual(1, next(items))
+        self.assertRaises(ValueError, next, items)
+
+
+class TestChainConcurrently(utils.TestCase):
+    def test_serial(self):
+        self.assertEqual(
+            [1, 2, 3],
+            list(parallel.chain_concurrently([[1, 2], [], [3]])),
+        )
+
+    def test_concurrent(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _items(i):
+            # Deadlocks (and times out) unless iterated concurrently
+            barrier.wait()
+            yield from range(i * 10, i * 10 + 10)
+
+        result = parallel.chain_concurrently(
+            [_items(i) for i in range(3)], max_workers=3, buffer_size=1
+        )
+        self.assertEqual(list(range(30)), list(result))
+
+    def test_error(self):
+        def _items():
+            yield 1
+            raise ValueError('bad item')
+
+        result = parallel.chain_concurrently([_items(), [2, 3]], max_workers=2)
+        self.assertEqual(1, next(result))
+        self.assertRaises(ValueError, next, result)
+
+    def test_close(self):
+        def _items():
+            while True:
+                yield 1
+
+        result = parallel.chain_concurrently(
+            [_items(), _items()], max_workers=2
+        )
+        self.assertEqual(1, next(result))
+        # Doesn't hang on the producers blocked on their full buffers
+        result.close()
+
+
+class TestParallelOption(utils.TestCase):
+    def test_default(self):
+        parser = argparse.ArgumentParser()
+        parallel.add_parallel_option_to_parser(parser)
+        self.assertEqual(1, parser.parse_args([]).parallel)
+        self.assertEqual(8, parser.parse_args(['--parallel', '8']).parallel)
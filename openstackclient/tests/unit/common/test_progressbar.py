@@ -12,7 +12,7 @@
 #
 
 import io
-import sys
+from unittest import mock
 
 from openstackclient.common import progressbar
 from openstackclient.tests.unit import utils
@@ -22,33 +22,111 @@ class TestProgressBarWrapper(utils.TestCase):
     def test_iter_file_display_progress_bar(self):
         size = 98304
         file_obj = io.StringIO('X' * size)
-        saved_stdout = sys.stdout
-        try:
-            sys.stdout = output = FakeTTYStdout()
+        output = FakeTTYStdout()
+        with mock.patch('sys.stderr', output):
             file_obj = progressbar.VerboseFileWrapper(file_obj, size)
-            chunksize = 1024
+        chunksize = 1024
+        chunk = file_obj.read(chunksize)
+        while chunk:
             chunk = file_obj.read(chunksize)
-            while chunk:
-                chunk = file_obj.read(chunksize)
-            self.assertEqual('[%s>] 100%%\n' % ('=' * 29), output.getvalue())
-        finally:
-            sys.stdout = saved_stdout
+        self.assertTrue(
+            output.getvalue().startswith('[%s>] 100%%' % ('=' * 29))
+        )
+        self.assertTrue(output.getvalue().endswith('\n'))
 
     def test_iter_file_no_tty(self):
         size = 98304
         file_obj = io.StringIO('X' * size)
-        saved_stdout = sys.stdout
-        try:
-            sys.stdout = output = FakeNoTTYStdout()
+        output = FakeNoTTYStdout()
+        with mock.patch('sys.stderr', output):
             file_obj = progressbar.VerboseFileWrapper(file_obj, size)
-            chunksize = 1024
+        chunksize = 1024
+        chunk = file_obj.read(chunksize)
+        while chunk:
             chunk = file_obj.read(chunksize)
-            while chunk:
-                chunk = file_obj.read(chunksize)
-            # If stdout is not a tty progress bar should do nothing.
-            self.assertEqual('', output.getvalue())
-        finally:
-            sys.stdout = saved_stdout
+        # If stderr is not a tty progress bar should do nothing.
+        self.assertEqual('', output.getvalue())
+
+    def test_iter_display_progress_bar(self):
+        output = FakeTTYStdout()
+        reporter = progressbar.ProgressReporter(4096, stream=output)
+
+        chunks = list(
+            progressbar.VerboseIteratorWrapper(
+                [b'X' * 1024] * 4, 4096, reporter=reporter
+            )
+        )
+
+        self.assertEqual(4, len(chunks))
+        self.assertTrue(
+            output.getvalue().startswith('[%s>] 100%%' % ('=' * 29))
+        )
+
+
+@mock.patch('time.monotonic')
+class TestProgressReporter(utils.TestCase):
+    def test_rate_limited(self, mock_monotonic):
+        output = mock.Mock()
+        output.isatty.return_value = True
+        reporter = progressbar.ProgressReporter(
+            1000, stream=output, interval=1
+        )
+
+        for now in (10, 10.1, 10.5, 10.9, 11.0, 11.5):
+            mock_monotonic.return_value = now
+            reporter.update(100)
+
+        # drawn at the first update and once a second after that
+        self.assertEqual(2, output.write.call_count)
+        self.assertEqual(600, reporter.done)
+
+    def test_throughput_and_eta(self, mock_monotonic):
+        output = FakeTTYStdout()
+        reporter = progressbar.ProgressReporter(
+            4000000, stream=output, interval=0
+        )
+
+        mock_monotonic.return_value = 100
+        reporter.update(0)
+        mock_monotonic.return_value = 102
+        reporter.update(2000000)
+
+        self.assertEqual(
+            '[%-30s] 50%% 1MB/s ETA 0:00:02' % ('=' * 14 + '>'),
+            output.getvalue(),
+        )
+
+    def test_resume(self, mock_monotonic):
+        output = FakeTTYStdout()
+        reporter = progressbar.ProgressReporter(
+            4000000, stream=output, interval=0
+        )
+
+        reporter.resume(2000000)
+        mock_monotonic.return_value = 100
+        reporter.update(0)
+        mock_monotonic.return_value = 101
+        reporter.update(1000000)
+        reporter.finish()
+
+        # resumed bytes count towards the progress but not the throughput
+        self.assertEqual(
+            '[%-30s] 75%% 1MB/s' % ('=' * 22 + '>'),
+            output.getvalue().rstrip(),
+        )
+
+    def test_unknown_total(self, mock_monotonic):
+        output = FakeTTYStdout()
+        reporter = progressbar.ProgressReporter(
+            None, stream=output, interval=0
+        )
+
+        mock_monotonic.return_value = 100
+        reporter.update(0)
+        mock_monotonic.return_value = 101
+        reporter.update(2000000)
+
+        self.assertEqual('2MB 2MB/s', output.getvalue())
 
 
 class FakeTTYStdout(io.StringIO):
@@ -416,6 +416,38 @@ class TestQuotaList(TestQuota):
             parsed_args,
         )
 
+    def test_quota_list_compute_parallel(self):
+        self.compute_client.quotas.get = mock.Mock(
+            side_effect=lambda p: {
+                self.projects[0].id: self.compute_quotas[0],
+                self.projects[
+                    1
+                ].id: compute_fakes.create_one_default_comp_quota(),
+            }[p],
+        )
+
+        arglist = [
+            '--compute',
+            '--parallel',
+            '4',
+        ]
+        verifylist = [
+            ('compute', True),
+            ('parallel', 4),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+        ret_quotas = list(data)
+
+        self.assertEqual(self.compute_column_header, columns)
+        self.assertEqual([self.compute_reference_data], ret_quotas)
+        self.compute_client.quotas.get.assert_has_calls(
+            [mock.call(p.id) for p in self.projects], any_order=True
+        )
+        # the defaults are the same for all projects
+        self.compute_client.quotas.defaults.assert_called_once()
+
     def test_quota_list_compute_by_project(self):
         # Two projects with non-default quotas
         self.compute_client.quotas.get = mock.Mock(
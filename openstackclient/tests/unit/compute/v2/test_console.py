@@ -51,7 +51,7 @@ class TestConsoleLog(compute_fakes.TestComputev2):
         self.cmd.take_action(parsed_args)
 
         self.compute_sdk_client.find_server.assert_called_with(
-            name_or_id='fake_server', ignore_missing=False
+            'fake_server', ignore_missing=False
         )
         self.compute_sdk_client.get_server_console_output.assert_called_with(
             self._server.id, length=None
@@ -69,7 +69,7 @@ class TestConsoleLog(compute_fakes.TestComputev2):
         self.cmd.take_action(parsed_args)
 
         self.compute_sdk_client.find_server.assert_called_with(
-            name_or_id='fake_server', ignore_missing=False
+            'fake_server', ignore_missing=False
         )
         self.compute_sdk_client.get_server_console_output.assert_called_with(
             self._server.id, length=15
@@ -17,10 +17,12 @@ import collections
 import copy
 import getpass
 import json
+import os
 import tempfile
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 import iso8601
 from novaclient import api_versions
 from openstack import exceptions as sdk_exceptions
@@ -29,6 +31,7 @@ from osc_lib.cli import format_columns
 from osc_lib import exceptions
 from osc_lib import utils as common_utils
 
+from openstackclient.common import cache
 from openstackclient.compute.v2 import server
 from openstackclient.tests.unit.compute.v2 import fakes as compute_fakes
 from openstackclient.tests.unit.image.v2 import fakes as image_fakes
@@ -4539,8 +4542,8 @@ class TestServerDelete(TestServer):
             all_tenants=True,
         )
 
-    @mock.patch.object(common_utils, 'wait_for_delete', return_value=True)
-    def test_server_delete_wait_ok(self, mock_wait_for_delete):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_server_delete_wait_ok(self, mock_wait_for_servers):
         servers = self.setup_servers_mock(count=1)
 
         arglist = [servers[0].id, '--wait']
@@ -4552,15 +4555,43 @@ class TestServerDelete(TestServer):
         result = self.cmd.take_action(parsed_args)
 
         self.servers_mock.delete.assert_called_with(servers[0].id)
-        mock_wait_for_delete.assert_called_once_with(
-            self.servers_mock,
-            servers[0].id,
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [servers[0].id],
+            wait_for_delete=True,
+            all_projects=False,
+            timeout=300,
             callback=mock.ANY,
         )
         self.assertIsNone(result)
 
-    @mock.patch.object(common_utils, 'wait_for_delete', return_value=False)
-    def test_server_delete_wait_fails(self, mock_wait_for_delete):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_server_delete_multi_servers_wait(self, mock_wait_for_servers):
+        servers = self.setup_servers_mock(count=3)
+
+        arglist = [s.id for s in servers] + ['--wait']
+        verifylist = [
+            ('server', [s.id for s in servers]),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.servers_mock.delete.assert_has_calls(
+            [call(s.id) for s in servers]
+        )
+        # all servers are waited for together, once deleted
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [s.id for s in servers],
+            wait_for_delete=True,
+            all_projects=False,
+            timeout=300,
+            callback=mock.ANY,
+        )
+
+    @mock.patch.object(server, '_wait_for_servers')
+    def test_server_delete_wait_fails(self, mock_wait_for_servers):
         servers = self.setup_servers_mock(count=1)
 
         arglist = [servers[0].id, '--wait']
@@ -4569,12 +4600,17 @@ class TestServerDelete(TestServer):
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
+        mock_wait_for_servers.return_value = [servers[0].id]
+
         self.assertRaises(SystemExit, self.cmd.take_action, parsed_args)
 
         self.servers_mock.delete.assert_called_with(servers[0].id)
-        mock_wait_for_delete.assert_called_once_with(
-            self.servers_mock,
-            servers[0].id,
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [servers[0].id],
+            wait_for_delete=True,
+            all_projects=False,
+            timeout=300,
             callback=mock.ANY,
         )
 
@@ -4744,6 +4780,52 @@ class TestServerList(_TestServerList):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, tuple(data))
 
+    @mock.patch.object(server, '_LIST_STREAM_BATCH_SIZE', 2)
+    def test_server_list_stream(self):
+        self.compute_sdk_client.servers.return_value = iter(self.servers)
+        Image = collections.namedtuple('Image', 'id name')
+        self.image_client.images.side_effect = lambda id: [
+            Image(id=i, name=self.image.name)
+            for i in id[len('in:') :].split(',')
+        ]
+        arglist = ['--stream']
+        verifylist = [
+            ('stream', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.compute_sdk_client.servers.assert_called_with(**self.kwargs)
+        # only the first batch has been resolved so far
+        self.image_client.images.assert_called_once()
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data, tuple(data))
+        # the second batch is resolved as it is output; the flavors are
+        # only listed once
+        self.assertEqual(2, self.image_client.images.call_count)
+        self.compute_sdk_client.flavors.assert_called_once()
+
+    @mock.patch.object(server, '_LIST_STREAM_BATCH_SIZE', 2)
+    def test_server_list_stream_flavors_unavailable(self):
+        self.compute_sdk_client.servers.return_value = iter(self.servers)
+        self.compute_sdk_client.flavors.side_effect = (
+            sdk_exceptions.ForbiddenException()
+        )
+        arglist = ['--stream']
+        verifylist = [
+            ('stream', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+        data = tuple(data)
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(len(self.servers), len(data))
+        # a failed listing isn't retried for the following batches
+        self.compute_sdk_client.flavors.assert_called_once()
+
     def test_server_list_no_servers(self):
         arglist = []
         verifylist = [
@@ -4950,6 +5032,69 @@ class TestServerList(_TestServerList):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, tuple(data))
 
+    @mock.patch.object(server, '_IMAGE_LOOKUP_CHUNK_SIZE', 2)
+    def test_server_list_image_lookup_chunked(self):
+        self.servers = self.setup_sdk_servers_mock(5)
+        self.compute_sdk_client.servers.return_value = self.servers
+        Image = collections.namedtuple('Image', 'id name')
+
+        def _images(id):
+            image_ids = id[len('in:') :].split(',')
+            if self.servers[0].image['id'] in image_ids:
+                raise Exception('URI too long')
+            return [Image(id=i, name=self.image.name) for i in image_ids]
+
+        self.image_client.images.side_effect = _images
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # 5 distinct images are looked up in chunks of 2
+        self.assertEqual(3, self.image_client.images.call_count)
+        for call_args in self.image_client.images.call_args_list:
+            self.assertLessEqual(len(call_args.kwargs['id'].split(',')), 2)
+
+        # only the names of the failed chunk are missing
+        failed_chunk = [
+            call_args.kwargs['id'][len('in:') :].split(',')
+            for call_args in self.image_client.images.call_args_list
+            if self.servers[0].image['id'] in call_args.kwargs['id']
+        ][0]
+        image_names = [row[4] for row in data]
+        self.assertEqual(
+            len(failed_chunk),
+            sum(1 for name in image_names if name != self.image.name),
+        )
+
+    def test_server_list_image_name_cached(self):
+        resource_cache = mock.Mock()
+        resource_cache.get.side_effect = lambda namespace, key: (
+            self.image.name if key == self.servers[0].image['id'] else None
+        )
+        self.app.client_manager.resource_cache = resource_cache
+        Image = collections.namedtuple('Image', 'id name')
+        self.image_client.images.side_effect = lambda id: [
+            Image(id=i, name=self.image.name)
+            for i in id[len('in:') :].split(',')
+        ]
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # only the images missing from the cache are looked up and cached
+        image_ids = {s.image['id'] for s in self.servers[1:]}
+        self.image_client.images.assert_called_once()
+        self.assertEqual(
+            image_ids,
+            set(
+                self.image_client.images.call_args.kwargs['id'][3:].split(',')
+            ),
+        )
+        resource_cache.set_many.assert_called_once_with(
+            'image_name', {i: self.image.name for i in image_ids}
+        )
+        self.assertEqual(self.data, tuple(data))
+
     def test_server_list_with_flavor(self):
         arglist = ['--flavor', self.flavor.id]
         verifylist = [('flavor', self.flavor.id)]
@@ -5949,8 +6094,8 @@ class TestServerMigrate(TestServer):
             str(mock_warning.call_args[0][0]),
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
-    def test_server_migrate_with_wait(self, mock_wait_for_status):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_server_migrate_with_wait(self, mock_wait_for_servers):
         arglist = [
             '--wait',
             self.server.id,
@@ -5968,10 +6113,18 @@ class TestServerMigrate(TestServer):
         self.servers_mock.get.assert_called_with(self.server.id)
         self.server.migrate.assert_called_with()
         self.assertNotCalled(self.servers_mock.live_migrate)
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
+            success_status=('active', 'verify_resize'),
+            callback=mock.ANY,
+        )
         self.assertIsNone(result)
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=False)
-    def test_server_migrate_with_wait_fails(self, mock_wait_for_status):
+    @mock.patch.object(
+        server, '_wait_for_servers', return_value=['fake-server']
+    )
+    def test_server_migrate_with_wait_fails(self, mock_wait_for_servers):
         arglist = [
             '--wait',
             self.server.id,
@@ -7463,8 +7616,8 @@ class TestServerResize(TestServer):
             str(mock_warning.call_args[0][0]),
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
-    def test_server_resize_with_wait_ok(self, mock_wait_for_status):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_server_resize_with_wait_ok(self, mock_wait_for_servers):
         arglist = [
             '--flavor',
             self.flavors_get_return_value.id,
@@ -7487,12 +7640,11 @@ class TestServerResize(TestServer):
             self.server.id,
         )
 
-        kwargs = dict(
-            success_status=['active', 'verify_resize'],
-        )
-
-        mock_wait_for_status.assert_called_once_with(
-            self.servers_mock.get, self.server.id, callback=mock.ANY, **kwargs
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
+            success_status=('active', 'verify_resize'),
+            callback=mock.ANY,
         )
 
         self.servers_mock.resize.assert_called_with(
@@ -7501,8 +7653,10 @@ class TestServerResize(TestServer):
         self.assertNotCalled(self.servers_mock.confirm_resize)
         self.assertNotCalled(self.servers_mock.revert_resize)
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=False)
-    def test_server_resize_with_wait_fails(self, mock_wait_for_status):
+    @mock.patch.object(
+        server, '_wait_for_servers', return_value=['fake-server']
+    )
+    def test_server_resize_with_wait_fails(self, mock_wait_for_servers):
         arglist = [
             '--flavor',
             self.flavors_get_return_value.id,
@@ -7525,12 +7679,11 @@ class TestServerResize(TestServer):
             self.server.id,
         )
 
-        kwargs = dict(
-            success_status=['active', 'verify_resize'],
-        )
-
-        mock_wait_for_status.assert_called_once_with(
-            self.servers_mock.get, self.server.id, callback=mock.ANY, **kwargs
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
+            success_status=('active', 'verify_resize'),
+            callback=mock.ANY,
         )
 
         self.servers_mock.resize.assert_called_with(
@@ -8061,6 +8214,7 @@ class TestServerShelve(TestServer):
         )
 
         self.compute_sdk_client.find_server.return_value = self.server
+        self.compute_sdk_client.get_server.return_value = self.server
         self.compute_sdk_client.shelve_server.return_value = None
 
         # Get the command object to test
@@ -8108,8 +8262,8 @@ class TestServerShelve(TestServer):
         self.compute_sdk_client.shelve_server.assert_not_called()
         self.compute_sdk_client.shelve_offload_server.assert_not_called()
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
-    def test_shelve_with_wait(self, mock_wait_for_status):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_shelve_with_wait(self, mock_wait_for_servers):
         arglist = ['--wait', self.server.name]
         verifylist = [
             ('servers', [self.server.name]),
@@ -8129,15 +8283,15 @@ class TestServerShelve(TestServer):
             self.server.id
         )
         self.compute_sdk_client.shelve_offload_server.assert_not_called()
-        mock_wait_for_status.assert_called_once_with(
-            self.compute_sdk_client.get_server,
-            self.server.id,
-            callback=mock.ANY,
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
             success_status=('shelved', 'shelved_offloaded'),
+            callback=mock.ANY,
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
-    def test_shelve_offload(self, mock_wait_for_status):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_shelve_offload(self, mock_wait_for_servers):
         arglist = ['--offload', self.server.name]
         verifylist = [
             ('servers', [self.server.name]),
@@ -8149,13 +8303,13 @@ class TestServerShelve(TestServer):
         result = self.cmd.take_action(parsed_args)
         self.assertIsNone(result)
 
-        # two calls - one to retrieve the server state before shelving and
-        # another to do this before offloading
-        self.compute_sdk_client.find_server.assert_has_calls(
-            [
-                mock.call(self.server.name, ignore_missing=False),
-                mock.call(self.server.name, ignore_missing=False),
-            ]
+        # one call to retrieve the server state before shelving and another
+        # to refresh it by ID before offloading
+        self.compute_sdk_client.find_server.assert_called_once_with(
+            self.server.name, ignore_missing=False
+        )
+        self.compute_sdk_client.get_server.assert_called_once_with(
+            self.server.id
         )
         self.compute_sdk_client.shelve_server.assert_called_with(
             self.server.id
@@ -8163,11 +8317,11 @@ class TestServerShelve(TestServer):
         self.compute_sdk_client.shelve_offload_server.assert_called_once_with(
             self.server.id,
         )
-        mock_wait_for_status.assert_called_once_with(
-            self.compute_sdk_client.get_server,
-            self.server.id,
-            callback=mock.ANY,
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
             success_status=('shelved', 'shelved_offloaded'),
+            callback=mock.ANY,
         )
 
 
@@ -8259,6 +8413,31 @@ class TestServerShow(TestServer):
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, data)
 
+    def test_show_cached(self):
+        self.app.client_manager.resource_cache = cache.ResourceCache(
+            os.path.join(
+                self.useFixture(fixtures.TempDir()).path, 'resources.json'
+            )
+        )
+        self.compute_sdk_client.find_server.__name__ = 'find_server'
+        self.compute_sdk_client.find_server.return_value = self.server
+
+        arglist = [
+            '--diagnostics',
+            self.server.name,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.cmd.take_action(parsed_args)
+        self.cmd.take_action(parsed_args)
+
+        # The second lookup is by the ID of the server found by the first
+        self.compute_sdk_client.find_server.assert_has_calls(
+            [
+                call(self.server.name, ignore_missing=False),
+                call(self.server.id, ignore_missing=False),
+            ]
+        )
+
     def test_show_embedded_flavor(self):
         # Tests using --os-compute-api-version >= 2.47 where the flavor
         # details are embedded in the server response body excluding the id.
@@ -8514,6 +8693,100 @@ class TestServerStop(TestServer):
     def test_server_stop_multi_servers(self):
         self.run_method_with_sdk_servers('stop_server', 3)
 
+    def test_server_stop_parallel(self):
+        servers = compute_fakes.create_sdk_servers(count=5)
+        servers_by_id = {s.id: s for s in servers}
+        self.compute_sdk_client.find_server.side_effect = (
+            lambda name_or_id, **kwargs: servers_by_id[name_or_id]
+        )
+
+        arglist = ['--parallel', '3'] + [s.id for s in servers]
+        verifylist = [
+            ('server', [s.id for s in servers]),
+            ('parallel', 3),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.compute_sdk_client.stop_server.assert_has_calls(
+            [call(s.id) for s in servers], any_order=True
+        )
+        self.assertIsNone(result)
+
+    def test_server_stop_multi_servers_with_exception(self):
+        servers = compute_fakes.create_sdk_servers(count=2)
+        self.compute_sdk_client.find_server.side_effect = [
+            servers[0],
+            sdk_exceptions.ResourceNotFound(),
+            servers[1],
+        ]
+
+        arglist = [servers[0].id, 'unexist_server', servers[1].id]
+        verifylist = [
+            ('server', arglist),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.assertEqual('1 of 3 servers failed to stop.', str(ex))
+        self.compute_sdk_client.stop_server.assert_has_calls(
+            [call(servers[0].id), call(servers[1].id)]
+        )
+
+    def _use_resource_cache(self, mappings):
+        resource_cache = cache.ResourceCache(
+            os.path.join(
+                self.useFixture(fixtures.TempDir()).path, 'resources.json'
+            )
+        )
+        resource_cache.set_many('server', mappings)
+        self.app.client_manager.resource_cache = resource_cache
+        return resource_cache
+
+    def test_server_stop_cached(self):
+        self._use_resource_cache({'foo': 'cached-id'})
+
+        arglist = ['foo']
+        verifylist = [
+            ('server', ['foo']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.compute_sdk_client.find_server.assert_not_called()
+        self.compute_sdk_client.stop_server.assert_called_once_with(
+            'cached-id'
+        )
+
+    def test_server_stop_cached_stale(self):
+        resource_cache = self._use_resource_cache({'foo': 'stale-id'})
+        servers = compute_fakes.create_sdk_servers(count=1)
+        self.compute_sdk_client.find_server.return_value = servers[0]
+        self.compute_sdk_client.stop_server.side_effect = [
+            sdk_exceptions.NotFoundException(),
+            None,
+        ]
+
+        arglist = ['foo']
+        verifylist = [
+            ('server', ['foo']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.compute_sdk_client.find_server.assert_called_once_with(
+            'foo', ignore_missing=False, details=False, all_projects=False
+        )
+        self.compute_sdk_client.stop_server.assert_has_calls(
+            [call('stale-id'), call(servers[0].id)]
+        )
+        self.assertEqual(servers[0].id, resource_cache.get('server', 'foo'))
+
     def test_server_start_with_all_projects(self):
         servers = self.setup_servers_mock(count=1)
 
@@ -8912,8 +9185,8 @@ class TestServerUnshelve(TestServer):
             str(ex),
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
-    def test_unshelve_with_wait(self, mock_wait_for_status):
+    @mock.patch.object(server, '_wait_for_servers', return_value=[])
+    def test_unshelve_with_wait(self, mock_wait_for_servers):
         arglist = [
             '--wait',
             self.server.name,
@@ -8934,13 +9207,97 @@ class TestServerUnshelve(TestServer):
         self.compute_sdk_client.unshelve_server.assert_called_with(
             self.server.id
         )
-        mock_wait_for_status.assert_called_once_with(
-            self.compute_sdk_client.get_server,
-            self.server.id,
-            callback=mock.ANY,
+        mock_wait_for_servers.assert_called_once_with(
+            self.compute_sdk_client,
+            [self.server.id],
             success_status=('active', 'shutoff'),
+            callback=mock.ANY,
+        )
+
+
+@mock.patch.object(server.time, 'sleep')
+class TestWaitForServers(TestServer):
+    def test_single_server(self, mock_sleep):
+        self.compute_sdk_client.get_server.side_effect = [
+            compute_fakes.create_one_sdk_server(
+                attrs={'id': 'a', 'status': 'RESIZE', 'progress': 50}
+            ),
+            compute_fakes.create_one_sdk_server(
+                attrs={'id': 'a', 'status': 'ACTIVE'}
+            ),
+        ]
+        callback = mock.Mock()
+
+        failed = server._wait_for_servers(
+            self.compute_sdk_client, ['a'], callback=callback
         )
 
+        self.assertEqual([], failed)
+        # a single server is fetched directly rather than listed
+        self.compute_sdk_client.servers.assert_not_called()
+        callback.assert_has_calls([call(50), call(100)])
+        mock_sleep.assert_called_once_with(server._WAIT_INITIAL_INTERVAL)
+
+    def test_multiple_servers(self, mock_sleep):
+        def _server(id, status):
+            return compute_fakes.create_one_sdk_server(
+                attrs={'id': id, 'status': status}
+            )
+
+        self.compute_sdk_client.servers.side_effect = [
+            [_server('a', 'SHELVED'), _server('b', 'ACTIVE')],
+            [_server('b', 'ERROR'), _server('c', 'SHELVED')],
+        ]
+        # 'c' is missing from the first listing
+        self.compute_sdk_client.get_server.return_value = _server('c', 'BUSY')
+
+        failed = server._wait_for_servers(
+            self.compute_sdk_client,
+            ['a', 'b', 'c'],
+            success_status=('shelved',),
+        )
+
+        self.assertEqual(['b'], failed)
+        self.assertEqual(2, self.compute_sdk_client.servers.call_count)
+        self.compute_sdk_client.servers.assert_called_with(
+            details=True, all_projects=False, changes_since=mock.ANY
+        )
+        self.compute_sdk_client.get_server.assert_called_once_with('c')
+        mock_sleep.assert_called_once_with(server._WAIT_INITIAL_INTERVAL)
+
+    def test_delete(self, mock_sleep):
+        self.compute_sdk_client.servers.side_effect = [
+            [
+                compute_fakes.create_one_sdk_server(
+                    attrs={'id': 'a', 'status': 'DELETED'}
+                ),
+            ],
+        ]
+        self.compute_sdk_client.get_server.side_effect = (
+            sdk_exceptions.NotFoundException()
+        )
+
+        failed = server._wait_for_servers(
+            self.compute_sdk_client, ['a', 'b'], wait_for_delete=True
+        )
+
+        self.assertEqual([], failed)
+        mock_sleep.assert_not_called()
+
+    def test_timeout(self, mock_sleep):
+        self.compute_sdk_client.get_server.return_value = (
+            compute_fakes.create_one_sdk_server(
+                attrs={'id': 'a', 'status': 'ACTIVE'}
+            )
+        )
+
+        failed = server._wait_for_servers(
+            self.compute_sdk_client, ['a'], wait_for_delete=True, timeout=0
+        )
+
+        self.assertEqual(['a'], failed)
+        mock_sleep.assert_not_called()
+
 
 class TestServerGeneral(TestServer):
     OLD = {
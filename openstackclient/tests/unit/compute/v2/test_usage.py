@@ -45,7 +45,7 @@ class TestUsageList(TestUsage):
     data = [
         (
             usage_cmds.ProjectColumn(usages[0].project_id),
-            usage_cmds.CountColumn(usages[0].server_usages),
+            usage_cmds.CountColumn(len(usages[0].server_usages)),
             usage_cmds.FloatColumn(usages[0].total_memory_mb_usage),
             usage_cmds.FloatColumn(usages[0].total_vcpus_usage),
             usage_cmds.FloatColumn(usages[0].total_local_gb_usage),
@@ -57,7 +57,7 @@ class TestUsageList(TestUsage):
 
         self.compute_sdk_client.usages.return_value = self.usages
 
-        self.projects_mock.list.return_value = [self.project]
+        self.projects_mock.get.return_value = self.project
         # Get the command object to test
         self.cmd = usage_cmds.ListUsage(self.app, None)
 
@@ -72,7 +72,8 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.get.assert_called_once_with(self.project.name)
+        self.projects_mock.list.assert_not_called()
 
         self.assertCountEqual(self.columns, columns)
         self.assertCountEqual(tuple(self.data), tuple(data))
@@ -93,7 +94,8 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.get.assert_called_once_with(self.project.name)
+        self.projects_mock.list.assert_not_called()
         self.compute_sdk_client.usages.assert_called_with(
             start=datetime.datetime(2016, 11, 11, 0, 0),
             end=datetime.datetime(2016, 12, 20, 0, 0),
@@ -114,13 +116,76 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.get.assert_called_once_with(self.project.name)
+        self.projects_mock.list.assert_not_called()
         self.compute_sdk_client.usages.assert_has_calls(
             [mock.call(start=mock.ANY, end=mock.ANY, detailed=True)]
         )
         self.assertCountEqual(self.columns, columns)
         self.assertCountEqual(tuple(self.data), tuple(data))
 
+    def test_usage_list_merges_pages(self):
+        project = identity_fakes.FakeProject.create_one_project()
+        # The same project shows up on two pages, split by server
+        usages = compute_fakes.create_usages(
+            attrs={'project_id': project.id}, count=2
+        )
+        other_usage = compute_fakes.create_one_usage()
+        self.compute_sdk_client.usages.return_value = iter(
+            [usages[0], other_usage, usages[1]]
+        )
+
+        def _get_project(project_id):
+            if project_id == project.id:
+                return project
+            raise Exception('boom')
+
+        self.projects_mock.get.side_effect = _get_project
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertCountEqual(
+            [
+                mock.call(project.id),
+                mock.call(other_usage.project_id),
+            ],
+            self.projects_mock.get.call_args_list,
+        )
+        data = list(data)
+        self.assertEqual(2, len(data))
+        self.assertEqual(project.name, data[0][0].human_readable())
+        self.assertEqual(2, data[0][1].human_readable())
+        self.assertEqual(
+            usages[0].total_memory_mb_usage + usages[1].total_memory_mb_usage,
+            data[0][2].human_readable(),
+        )
+        # Projects that can't be looked up are shown by ID
+        self.assertEqual(other_usage.project_id, data[1][0].human_readable())
+        self.assertEqual(1, data[1][1].human_readable())
+
+    def test_usage_list_machine_readable(self):
+        usages = compute_fakes.create_usages(
+            attrs={'project_id': self.project.id}, count=2
+        )
+
+        # The value formatter prints the machine readable form too
+        for formatter in ('json', 'value'):
+            self.compute_sdk_client.usages.return_value = iter(usages)
+            parsed_args = self.check_parser(
+                self.cmd, ['-f', formatter], [('formatter', formatter)]
+            )
+
+            columns, data = self.cmd.take_action(parsed_args)
+
+            data = list(data)
+            self.assertEqual(1, len(data))
+            self.assertEqual(
+                usages[0].server_usages + usages[1].server_usages,
+                data[0][1].machine_readable(),
+            )
+
 
 class TestUsageShow(TestUsage):
     project = identity_fakes.FakeProject.create_one_project()
@@ -17,8 +17,10 @@ import sys
 from unittest import mock
 
 from keystoneauth1 import fixture
+from openstack import utils as sdk_utils
 import requests
 
+from openstackclient.common import cache
 
 AUTH_TOKEN = "foobar"
 AUTH_URL = "http://0.0.0.0"
@@ -116,6 +118,8 @@ class FakeClientManager(object):
         self.volume = None
         self.network = None
         self.sdk_connection = mock.Mock()
+        # A disabled cache: every lookup goes through to the (fake) API
+        self.resource_cache = cache.ResourceCache()
 
         self.session = None
         self.auth_ref = None
@@ -157,6 +161,9 @@ class FakeClientManager(object):
     def is_volume_endpoint_enabled(self, client):
         return self.volume_endpoint_enabled
 
+    def supports_microversion(self, client, microversion):
+        return sdk_utils.supports_microversion(client, microversion)
+
 
 class FakeModule(object):
     def __init__(self, name, version):
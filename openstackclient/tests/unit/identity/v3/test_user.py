@@ -16,6 +16,7 @@
 import contextlib
 from unittest import mock
 
+from keystoneauth1 import exceptions as ks_exc
 from osc_lib import exceptions
 from osc_lib import utils
 
@@ -1112,10 +1113,48 @@ class TestUserList(TestUser):
         }
 
         self.role_assignments_mock.list.assert_called_with(**kwargs)
-        self.users_mock.get.assert_called_with(self.user.id)
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
+        # users are fetched as the rows are consumed
+        self.users_mock.get.assert_called_with(self.user.id)
+
+    def test_user_list_project_multiple_roles(self):
+        deleted_user_id = 'deleted-user-id'
+        self.role_assignments_mock.list.return_value = [
+            self.role_assignment,
+            identity_fakes.FakeRoleAssignment.create_one_role_assignment(
+                attrs={'user': {'id': self.user.id}}
+            ),
+            identity_fakes.FakeRoleAssignment.create_one_role_assignment(
+                attrs={'user': {'id': deleted_user_id}}
+            ),
+        ]
+
+        def _get(user_id):
+            if user_id == deleted_user_id:
+                raise ks_exc.NotFound()
+            return self.user
+
+        self.users_mock.get.side_effect = _get
+        arglist = [
+            '--project',
+            self.project.name,
+        ]
+        verifylist = [
+            ('project', self.project.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # each user is only fetched once and deleted users are skipped
+        self.assertEqual(self.datalist, tuple(data))
+        self.users_mock.get.assert_has_calls(
+            [mock.call(self.user.id), mock.call(deleted_user_id)],
+            any_order=True,
+        )
+        self.assertEqual(2, self.users_mock.get.call_count)
 
 
 class TestUserSet(TestUser):
@@ -13,15 +13,20 @@
 #   under the License.
 
 import copy
+import hashlib
 import io
+import os
+import json
 import tempfile
 from unittest import mock
 
 from cinderclient import api_versions
+import fixtures
 from openstack import exceptions as sdk_exceptions
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
 
+from openstackclient.common import download
 from openstackclient.image.v2 import image as _image
 from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
 from openstackclient.tests.unit.image.v2 import fakes as image_fakes
@@ -55,6 +60,7 @@ class TestImageCreate(TestImage):
         self.new_image = image_fakes.create_one_image()
         self.image_client.create_image.return_value = self.new_image
         self.image_client.update_image.return_value = self.new_image
+        self.image_client.get_image.return_value = self.new_image
 
         self.project_mock.get.return_value = self.project
 
@@ -241,8 +247,10 @@ class TestImageCreate(TestImage):
             Alpha='1',
             Beta='2',
             tags=self.new_image.tags,
-            filename=imagefile.name,
+            data=mock.ANY,
+            validate_checksum=False,
         )
+        self.image_client.get_image.assert_called_once_with(self.new_image.id)
 
         self.assertEqual(self.expected_columns, columns)
         self.assertCountEqual(self.expected_data, data)
@@ -272,13 +280,102 @@ class TestImageCreate(TestImage):
             allow_duplicates=True,
             container_format=_image.DEFAULT_CONTAINER_FORMAT,
             disk_format=_image.DEFAULT_DISK_FORMAT,
-            data=fake_stdin,
+            data=mock.ANY,
             validate_checksum=False,
         )
 
         self.assertEqual(self.expected_columns, columns)
         self.assertCountEqual(self.expected_data, data)
 
+    def _upload(self, data, image_attrs, arglist=(), create_image=None):
+        def _create_image(**kwargs):
+            # Consume the data like the upload would
+            while kwargs['data'].read(3):
+                pass
+            return self.new_image
+
+        self.image_client.create_image.side_effect = (
+            create_image or _create_image
+        )
+        self.image_client.get_image.return_value = (
+            image_fakes.create_one_image(
+                dict(id=self.new_image.id, **image_attrs)
+            )
+        )
+
+        imagefile = tempfile.NamedTemporaryFile(delete=False)
+        self.addCleanup(os.unlink, imagefile.name)
+        imagefile.write(data)
+        imagefile.close()
+
+        arglist = list(arglist) + [
+            '--file',
+            imagefile.name,
+            self.new_image.name,
+        ]
+        verifylist = [
+            ('filename', imagefile.name),
+            ('name', self.new_image.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        return self.cmd.take_action(parsed_args)
+
+    @mock.patch('sys.stderr.isatty', return_value=False)
+    def test_image_create_file_validated_with_progress(self, mock_isatty):
+        data = b'some image data'
+
+        columns, data = self._upload(
+            data,
+            {
+                'checksum': hashlib.md5(data).hexdigest(),
+                'hash_algo': 'sha512',
+                'hash_value': hashlib.sha512(data).hexdigest(),
+                'status': 'active',
+            },
+            arglist=['--progress'],
+        )
+
+        self.assertEqual(
+            hashlib.md5(b'some image data').hexdigest(),
+            dict(zip(columns, data))['checksum'],
+        )
+        self.image_client.delete_image.assert_not_called()
+
+    def test_image_create_file_checksum_mismatch(self):
+        self.assertRaises(
+            exceptions.CommandError,
+            self._upload,
+            b'some image data',
+            {
+                'checksum': hashlib.md5(b'other data').hexdigest(),
+                'hash_algo': 'sha512',
+                'hash_value': hashlib.sha512(b'other data').hexdigest(),
+            },
+        )
+        self.image_client.delete_image.assert_called_once_with(
+            self.new_image.id
+        )
+
+    def test_image_create_file_upload_failure(self):
+        readers = []
+
+        def _create_image(**kwargs):
+            readers.append(kwargs['data'])
+            kwargs['data'].read(4)
+            raise sdk_exceptions.HttpException()
+
+        self.assertRaises(
+            sdk_exceptions.HttpException,
+            self._upload,
+            b'some image data',
+            {},
+            create_image=_create_image,
+        )
+        # the hashing workers are stopped
+        self.assertTrue(
+            all(hasher._thread is None for hasher in readers[0]._hashers)
+        )
+
     def test_image_create_dead_options(self):
         arglist = [
             '--store',
@@ -2089,6 +2186,186 @@ class TestImageSave(TestImage):
             self.image.id, stream=True, output='/path/to/file'
         )
 
+    @mock.patch('sys.stderr')
+    def test_save_data_progress(self, mock_stderr):
+        mock_stderr.isatty.return_value = True
+        self.image = image_fakes.create_one_image({'size': 10})
+        self.image_client.find_image.return_value = self.image
+        response = mock.Mock()
+        response.iter_content.return_value = [b'01234', b'56789']
+        self.image_client.download_image.return_value = response
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+
+        arglist = ['--file', path, '--progress', self.image.id]
+        verifylist = [
+            ('filename', path),
+            ('progress', True),
+            ('image', self.image.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.image_client.download_image.assert_called_once_with(
+            self.image.id, stream=True
+        )
+        with open(path, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+        output = ''.join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertIn('100%', output)
+
+    def _save_with_progress(self, **attrs):
+        self.image = image_fakes.create_one_image(dict(attrs, size=10))
+        self.image_client.find_image.return_value = self.image
+        response = mock.Mock()
+        response.iter_content.return_value = [b'01234', b'56789']
+        self.image_client.download_image.return_value = response
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+
+        arglist = ['--file', path, '--progress', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.cmd.take_action(parsed_args)
+        return path
+
+    @mock.patch('sys.stderr')
+    def test_save_data_progress_hash(self, mock_stderr):
+        mock_stderr.isatty.return_value = False
+        path = self._save_with_progress(
+            hash_algo='sha512',
+            hash_value=hashlib.sha512(b'0123456789').hexdigest(),
+        )
+
+        with open(path, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch('sys.stderr')
+    def test_save_data_progress_checksum_mismatch(self, mock_stderr):
+        mock_stderr.isatty.return_value = False
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self._save_with_progress,
+            checksum=hashlib.md5(b'other data').hexdigest(),
+        )
+
+    def _serve_ranges(self, content, **attrs):
+        self.image = image_fakes.create_one_image(
+            dict(attrs, size=len(content))
+        )
+        self.image_client.find_image.return_value = self.image
+
+        def _get(url, headers, stream):
+            self.assertEqual('/images/%s/file' % self.image.id, url)
+            start, end = headers['Range'][len('bytes=') :].split('-')
+            response = mock.Mock(status_code=206, headers={})
+            response.iter_content.return_value = [
+                content[int(start) : int(end) + 1]
+            ]
+            return response
+
+        self.image_client.get.side_effect = _get
+
+    def _get_ranges(self):
+        return sorted(
+            call_args.kwargs['headers']['Range']
+            for call_args in self.image_client.get.call_args_list
+        )
+
+    @mock.patch.object(download, 'DEFAULT_RANGE_SIZE', 4)
+    def test_save_data_parallel(self):
+        content = b'0123456789'
+        self._serve_ranges(
+            content,
+            hash_algo='sha512',
+            hash_value=hashlib.sha512(content).hexdigest(),
+        )
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+
+        arglist = ['--file', path, '--parallel', '2', self.image.id]
+        verifylist = [
+            ('filename', path),
+            ('parallel', 2),
+            ('image', self.image.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(content, f.read())
+        self.assertEqual(
+            ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'], self._get_ranges()
+        )
+        self.image_client.download_image.assert_not_called()
+
+    @mock.patch.object(download, 'DEFAULT_RANGE_SIZE', 4)
+    def test_save_data_parallel_resume(self):
+        content = b'0123456789'
+        self._serve_ranges(content, checksum=hashlib.md5(content).hexdigest())
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+        # an earlier download fetched the first and last ranges
+        with open(path, 'wb') as f:
+            f.write(b'0123\0\0\0\089')
+        with open(path + download.STATE_SUFFIX, 'w') as f:
+            json.dump(
+                {
+                    'image': self.image.id,
+                    'checksum': self.image.checksum,
+                    'size': 10,
+                    'range_size': 4,
+                    'done': [0, 2],
+                },
+                f,
+            )
+
+        arglist = ['--file', path, '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.cmd.take_action(parsed_args)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(content, f.read())
+        self.assertEqual(['bytes=4-7'], self._get_ranges())
+        self.assertFalse(os.path.exists(path + download.STATE_SUFFIX))
+
+    @mock.patch.object(download, 'DEFAULT_RANGE_SIZE', 4)
+    def test_save_data_parallel_hash_mismatch(self):
+        self._serve_ranges(
+            b'0123456789',
+            hash_algo='sha512',
+            hash_value=hashlib.sha512(b'other data').hexdigest(),
+        )
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+
+        arglist = ['--file', path, '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+    def test_save_data_parallel_without_file(self):
+        arglist = ['--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.image_client.find_image.assert_not_called()
+
+    @mock.patch.object(_image.LOG, 'warning')
+    def test_save_data_parallel_unknown_size(self, mock_warning):
+        arglist = ['--file', '/path/to/file', '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.cmd.take_action(parsed_args)
+
+        mock_warning.assert_called_once()
+        self.image_client.get.assert_not_called()
+        self.image_client.download_image.assert_called_once_with(
+            self.image.id, stream=True, output='/path/to/file'
+        )
+
 
 class TestImageGetData(TestImage):
     def test_get_data_from_stdin(self):
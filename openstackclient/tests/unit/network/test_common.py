@@ -12,6 +12,7 @@
 #
 
 import argparse
+import threading
 from unittest import mock
 
 import openstack
@@ -99,6 +100,20 @@ class FakeNetworkAndComputeShowOne(common.NetworkAndComputeShowOne):
         return client.compute_action(parsed_args)
 
 
+class FakeNetworkAndComputeDelete(common.NetworkAndComputeDelete):
+    resource = 'thing'
+
+    def update_parser_common(self, parser):
+        parser.add_argument('thing', metavar='<thing>', nargs='+')
+        return parser
+
+    def take_action_network(self, client, parsed_args):
+        client.delete_thing(self.r)
+
+    def take_action_compute(self, client, parsed_args):
+        client.delete_thing(self.r)
+
+
 class FakeCreateNeutronCommandWithExtraArgs(
     common.NeutronCommandWithExtraArgs
 ):
@@ -203,6 +218,68 @@ class TestNetworkAndComputeShowOne(TestNetworkAndCompute):
             )
 
 
+class TestNetworkAndComputeDelete(utils.TestCommand):
+    def setUp(self):
+        super(TestNetworkAndComputeDelete, self).setUp()
+
+        self.namespace = argparse.Namespace()
+        self.app.client_manager.network = mock.Mock()
+        self.network_client = self.app.client_manager.network
+        self.app.client_manager.compute = mock.Mock()
+        self.compute_client = self.app.client_manager.compute
+
+        self.cmd = FakeNetworkAndComputeDelete(self.app, self.namespace)
+
+    def test_delete_parallel(self):
+        things = ['thing%d' % i for i in range(8)]
+        barrier = threading.Barrier(4, timeout=10)
+        mismatches = []
+
+        def _delete_thing(name):
+            # Wait for the other workers to be deleting their own thing
+            barrier.wait()
+            if self.cmd.r != name:
+                mismatches.append(name)
+            if name == 'thing3':
+                raise openstack.exceptions.NotFoundException()
+
+        self.network_client.delete_thing.side_effect = _delete_thing
+        parsed_args = self.check_parser(
+            self.cmd,
+            ['--parallel', '4'] + things,
+            [('thing', things), ('parallel', 4)],
+        )
+
+        with mock.patch.object(
+            self.app.client_manager,
+            'is_network_endpoint_enabled',
+            return_value=True,
+        ) as endpoint_enabled:
+            self.assertRaisesRegex(
+                exceptions.CommandError,
+                '1 of 8 things failed to delete.',
+                self.cmd.take_action,
+                parsed_args,
+            )
+
+        endpoint_enabled.assert_called_once_with()
+        self.assertEqual(8, self.network_client.delete_thing.call_count)
+        self.assertEqual([], mismatches)
+
+    def test_delete_compute(self):
+        self.app.client_manager.network_endpoint_enabled = False
+        parsed_args = self.check_parser(
+            self.cmd, ['thing1', 'thing2'], [('thing', ['thing1', 'thing2'])]
+        )
+
+        self.cmd.take_action(parsed_args)
+
+        self.compute_client.delete_thing.assert_has_calls(
+            [mock.call('thing1'), mock.call('thing2')]
+        )
+        self.network_client.delete_thing.assert_not_called()
+
+
 class TestNeutronCommandWithExtraArgs(utils.TestCommand):
     def setUp(self):
         super(TestNeutronCommandWithExtraArgs, self).setUp()
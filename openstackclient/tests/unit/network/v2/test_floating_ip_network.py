@@ -304,6 +304,7 @@ class TestDeleteFloatingIPNetwork(TestFloatingIPNetwork):
         super(TestDeleteFloatingIPNetwork, self).setUp()
 
         self.network_client.delete_ip = mock.Mock(return_value=None)
+        self.network_client.ips = mock.Mock(return_value=[])
 
         # Get the command object to test
         self.cmd = fip.DeleteFloatingIP(self.app, self.namespace)
@@ -464,6 +464,7 @@ class TestDeleteNetwork(TestNetwork):
         self._networks = network_fakes.create_networks(count=3)
 
         self.network_client.delete_network = mock.Mock(return_value=None)
+        self.network_client.networks = mock.Mock(return_value=[])
 
         self.network_client.find_network = network_fakes.get_networks(
             networks=self._networks
@@ -543,6 +544,45 @@ class TestDeleteNetwork(TestNetwork):
         ]
         self.network_client.delete_network.assert_has_calls(calls)
 
+    def test_delete_multiple_networks_found_in_one_pass(self):
+        duplicates = network_fakes.create_networks(
+            attrs={'name': 'duplicate'}, count=2
+        )
+        by_attr = {
+            'id': [self._networks[0]],
+            'name': [self._networks[1]] + duplicates,
+        }
+        self.network_client.networks.side_effect = lambda **query: by_attr[
+            list(query)[0]
+        ]
+        self.network_client.find_network = mock.Mock(
+            return_value=self._networks[2]
+        )
+        arglist = [
+            self._networks[0].id,
+            self._networks[1].name,
+            'duplicate',
+        ]
+        parsed_args = self.check_parser(
+            self.cmd, arglist, [('network', arglist)]
+        )
+
+        self.cmd.take_action(parsed_args)
+
+        self.network_client.networks.assert_has_calls(
+            [
+                call(id=arglist),
+                call(name=arglist[1:]),
+            ]
+        )
+        # Ambiguous names are still looked up one by one
+        self.network_client.find_network.assert_called_once_with(
+            'duplicate', ignore_missing=False
+        )
+        self.network_client.delete_network.assert_has_calls(
+            [call(n) for n in self._networks]
+        )
+
 
 class TestListNetwork(TestNetwork):
     # The networks going to be listed up.
@@ -182,6 +182,7 @@ class TestDeleteSecurityGroupNetwork(TestSecurityGroupNetwork):
         self.network_client.delete_security_group = mock.Mock(
             return_value=None
         )
+        self.network_client.security_groups = mock.Mock(return_value=[])
 
         self.network_client.find_security_group = (
             network_fakes.FakeSecurityGroup.get_security_groups(
@@ -977,6 +977,7 @@ class TestDeleteSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         self.network_client.delete_security_group_rule = mock.Mock(
             return_value=None
         )
+        self.network_client.security_group_rules = mock.Mock(return_value=[])
 
         self.network_client.find_security_group_rule = (
             network_fakes.FakeSecurityGroupRule.get_security_group_rules(
@@ -43,8 +43,7 @@ class TestContainer(object_fakes.TestObjectv1):
         self.api = self.app.client_manager.object_store
 
 
-@mock.patch('openstackclient.api.object_store_v1.APIv1.object_delete')
-@mock.patch('openstackclient.api.object_store_v1.APIv1.object_list')
+@mock.patch('openstackclient.api.object_store_v1.APIv1.container_empty')
 @mock.patch('openstackclient.api.object_store_v1.APIv1.container_delete')
 class TestContainerDelete(TestContainer):
     def setUp(self):
@@ -53,7 +52,7 @@ class TestContainerDelete(TestContainer):
         # Get the command object to test
         self.cmd = container.DeleteContainer(self.app, None)
 
-    def test_container_delete(self, c_mock, o_list_mock, o_delete_mock):
+    def test_container_delete(self, c_mock, empty_mock):
         c_mock.return_value = None
 
         arglist = [
@@ -71,13 +70,11 @@ class TestContainerDelete(TestContainer):
         c_mock.assert_called_with(
             container=object_fakes.container_name, **kwargs
         )
-        self.assertFalse(o_list_mock.called)
-        self.assertFalse(o_delete_mock.called)
+        self.assertFalse(empty_mock.called)
 
-    def test_recursive_delete(self, c_mock, o_list_mock, o_delete_mock):
+    def test_recursive_delete(self, c_mock, empty_mock):
         c_mock.return_value = None
-        o_list_mock.return_value = [object_fakes.OBJECT]
-        o_delete_mock.return_value = None
+        empty_mock.return_value = 1
 
         arglist = [
             '--recursive',
@@ -95,24 +92,24 @@ class TestContainerDelete(TestContainer):
         c_mock.assert_called_with(
             container=object_fakes.container_name, **kwargs
         )
-        o_list_mock.assert_called_with(container=object_fakes.container_name)
-        o_delete_mock.assert_called_with(
-            container=object_fakes.container_name,
-            object=object_fakes.OBJECT['name'],
+        empty_mock.assert_called_with(
+            object_fakes.container_name, max_workers=1
         )
 
-    def test_r_delete(self, c_mock, o_list_mock, o_delete_mock):
+    def test_r_delete(self, c_mock, empty_mock):
         c_mock.return_value = None
-        o_list_mock.return_value = [object_fakes.OBJECT]
-        o_delete_mock.return_value = None
+        empty_mock.return_value = 1
 
         arglist = [
             '-r',
+            '--parallel',
+            '8',
             object_fakes.container_name,
         ]
         verifylist = [
             ('containers', [object_fakes.container_name]),
             ('recursive', True),
+            ('parallel', 8),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
@@ -122,10 +119,8 @@ class TestContainerDelete(TestContainer):
         c_mock.assert_called_with(
             container=object_fakes.container_name, **kwargs
         )
-        o_list_mock.assert_called_with(container=object_fakes.container_name)
-        o_delete_mock.assert_called_with(
-            container=object_fakes.container_name,
-            object=object_fakes.OBJECT['name'],
+        empty_mock.assert_called_with(
+            object_fakes.container_name, max_workers=8
         )
 
 
@@ -307,12 +302,15 @@ class TestContainerList(TestContainer):
         )
         self.assertEqual(datalist, tuple(data))
 
-    def test_object_list_containers_all(self, c_mock):
-        c_mock.return_value = [
-            copy.deepcopy(object_fakes.CONTAINER),
-            copy.deepcopy(object_fakes.CONTAINER_2),
-            copy.deepcopy(object_fakes.CONTAINER_3),
-        ]
+    @mock.patch('openstackclient.api.object_store_v1.APIv1.container_iter')
+    def test_object_list_containers_all(self, iter_mock, c_mock):
+        iter_mock.return_value = iter(
+            [
+                copy.deepcopy(object_fakes.CONTAINER),
+                copy.deepcopy(object_fakes.CONTAINER_2),
+                copy.deepcopy(object_fakes.CONTAINER_3),
+            ]
+        )
 
         arglist = [
             '--all',
@@ -328,10 +326,8 @@ class TestContainerList(TestContainer):
         columns, data = self.cmd.take_action(parsed_args)
 
         # Set expected values
-        kwargs = {
-            'full_listing': True,
-        }
-        c_mock.assert_called_with(**kwargs)
+        iter_mock.assert_called_with()
+        c_mock.assert_not_called()
 
         self.assertEqual(self.columns, columns)
         datalist = (
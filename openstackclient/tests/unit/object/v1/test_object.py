@@ -16,6 +16,8 @@
 import copy
 from unittest import mock
 
+from osc_lib import exceptions
+
 from openstackclient.api import object_store_v1 as object_store
 from openstackclient.object.v1 import object as obj
 from openstackclient.tests.unit.object.v1 import fakes as object_fakes
@@ -283,11 +285,14 @@ class TestObjectList(TestObject):
         )
         self.assertEqual(datalist, tuple(data))
 
-    def test_object_list_objects_all(self, o_mock):
-        o_mock.return_value = [
-            copy.deepcopy(object_fakes.OBJECT),
-            copy.deepcopy(object_fakes.OBJECT_2),
-        ]
+    @mock.patch('openstackclient.api.object_store_v1.APIv1.object_iter')
+    def test_object_list_objects_all(self, iter_mock, o_mock):
+        iter_mock.return_value = iter(
+            [
+                copy.deepcopy(object_fakes.OBJECT),
+                copy.deepcopy(object_fakes.OBJECT_2),
+            ]
+        )
 
         arglist = [
             '--all',
@@ -305,12 +310,8 @@ class TestObjectList(TestObject):
         columns, data = self.cmd.take_action(parsed_args)
 
         # Set expected values
-        kwargs = {
-            'full_listing': True,
-        }
-        o_mock.assert_called_with(
-            container=object_fakes.container_name, **kwargs
-        )
+        iter_mock.assert_called_with(object_fakes.container_name)
+        o_mock.assert_not_called()
 
         self.assertEqual(self.columns, columns)
         datalist = (
@@ -319,6 +320,64 @@ class TestObjectList(TestObject):
         )
         self.assertEqual(datalist, tuple(data))
 
+    @mock.patch('openstackclient.api.object_store_v1.APIv1.object_iter')
+    def test_object_list_objects_all_parallel(self, iter_mock, o_mock):
+        iter_mock.return_value = iter([copy.deepcopy(object_fakes.OBJECT)])
+
+        arglist = [
+            '--all',
+            '--parallel',
+            '4',
+            '--shard-delimiter',
+            '/',
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('all', True),
+            ('parallel', 4),
+            ('shard_delimiter', '/'),
+            ('container', object_fakes.container_name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        iter_mock.assert_called_with(
+            object_fakes.container_name, max_workers=4, shard_delimiter='/'
+        )
+        self.assertEqual(((object_fakes.object_name_1,),), tuple(data))
+
+    def test_object_list_objects_parallel_without_all(self, o_mock):
+        for arglist in (
+            ['--parallel', '4'],
+            ['--shard-delimiter', '/'],
+            ['--all', '--shard-delimiter', '/'],
+        ):
+            parsed_args = self.check_parser(
+                self.cmd, arglist + [object_fakes.container_name], []
+            )
+
+            self.assertRaises(
+                exceptions.CommandError, self.cmd.take_action, parsed_args
+            )
+        o_mock.assert_not_called()
+
+    def test_object_list_objects_parallel_with_delimiter(self, o_mock):
+        arglist = [
+            '--all',
+            '--parallel',
+            '4',
+            '--delimiter',
+            '/',
+            object_fakes.container_name,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        o_mock.assert_not_called()
+
 
 @mock.patch('openstackclient.api.object_store_v1.APIv1.object_show')
 class TestObjectShow(TestObject):
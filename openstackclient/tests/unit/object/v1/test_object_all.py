@@ -13,8 +13,11 @@
 
 import copy
 import io
+import os
+import re
 from unittest import mock
 
+import fixtures
 from osc_lib import exceptions
 from requests_mock.contrib import fixture
 
@@ -60,6 +63,140 @@ class TestObjectCreate(TestObjectAll):
             exceptions.CommandError, self.cmd.take_action, parsed_args
         )
 
+    def test_object_create_parallel(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        objects = [
+            os.path.join(tmp_dir, name)
+            for name in ('a', 'b', 'c', object_fakes.object_name_1)
+        ]
+        for path in objects:
+            with open(path, 'wb') as f:
+                f.write(object_fakes.object_1_content)
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(
+                object_fakes.ENDPOINT + '/' + object_fakes.container_name
+            ),
+            headers={'etag': object_fakes.object_hash_1},
+            status_code=201,
+        )
+
+        arglist = [
+            object_fakes.container_name,
+            *objects,
+            '--parallel',
+            '3',
+        ]
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('objects', objects),
+            ('parallel', 3),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('object', 'container', 'etag'), columns)
+        # Files are listed in the order their upload completes
+        self.assertEqual(
+            [
+                (path, object_fakes.container_name, object_fakes.object_hash_1)
+                for path in objects
+            ],
+            sorted(data),
+        )
+        self.assertEqual(4, self.requests_mock.call_count)
+
+    def test_object_create_parallel_workers(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        objects = [os.path.join(tmp_dir, name) for name in ('a', 'b')]
+        object_create = self.useFixture(
+            fixtures.MockPatchObject(
+                self.app.client_manager.object_store,
+                'object_create',
+                return_value={},
+            )
+        ).mock
+
+        # A single file uploads its segments concurrently, several files
+        # are uploaded concurrently one segment at a time
+        for paths, segment_workers in ((objects[:1], 3), (objects, 1)):
+            object_create.reset_mock()
+            parsed_args = self.check_parser(
+                self.cmd,
+                [object_fakes.container_name, *paths, '--parallel', '3'],
+                [('objects', paths), ('parallel', 3)],
+            )
+
+            columns, data = self.cmd.take_action(parsed_args)
+            list(data)
+
+            self.assertEqual(len(paths), object_create.call_count)
+            for call in object_create.call_args_list:
+                self.assertEqual(segment_workers, call[1]['max_workers'])
+
+    def test_object_create_directory(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        files = [
+            os.path.join(tmp_dir, 'dir', 'a'),
+            os.path.join(tmp_dir, 'dir', 'sub', 'b'),
+            os.path.join(tmp_dir, 'dir', 'sub', 'c'),
+            os.path.join(tmp_dir, 'd'),
+        ]
+        os.makedirs(os.path.join(tmp_dir, 'dir', 'sub'))
+        for path in files:
+            with open(path, 'wb') as f:
+                f.write(object_fakes.object_1_content)
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(
+                object_fakes.ENDPOINT + '/' + object_fakes.container_name
+            ),
+            headers={'etag': object_fakes.object_hash_1},
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile('.*/sub/c$'),
+            status_code=503,
+        )
+
+        arglist = [
+            object_fakes.container_name,
+            os.path.join(tmp_dir, 'dir'),
+            os.path.join(tmp_dir, 'd'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+        # Nothing is uploaded until the results are consumed
+        self.assertEqual(0, self.requests_mock.call_count)
+
+        self.assertEqual(files[0], next(data)[0])
+        self.assertEqual(files[1], next(data)[0])
+        self.assertEqual(files[3], next(data)[0])
+        self.assertRaisesRegex(
+            exceptions.CommandError,
+            '1 of 4 objects failed to upload',
+            next,
+            data,
+        )
+        self.assertEqual(4, self.requests_mock.call_count)
+
+    def test_object_create_directory_with_object_name(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        arglist = [
+            object_fakes.container_name,
+            tmp_dir,
+            '--name',
+            object_fakes.object_upload_name,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
 
 class TestObjectList(TestObjectAll):
     columns = ('Name',)
@@ -0,0 +1,195 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import io
+import os
+import selectors
+import socket
+import sys
+import tempfile
+import threading
+from unittest import mock
+
+from cliff import app as cliff_app
+import fixtures
+
+import openstackclient
+from openstackclient import daemon
+from openstackclient import shell
+from openstackclient.tests.unit import utils
+
+
+class TestSocketPath(utils.TestCase):
+    def test_socket_path_from_env(self):
+        self.useFixture(
+            fixtures.EnvironmentVariable(daemon.SOCKET_ENV, '/tmp/osc.sock')
+        )
+        self.assertEqual('/tmp/osc.sock', daemon.get_socket_path())
+
+    def test_socket_path_runtime_dir(self):
+        self.useFixture(fixtures.EnvironmentVariable(daemon.SOCKET_ENV))
+        self.useFixture(
+            fixtures.EnvironmentVariable('XDG_RUNTIME_DIR', '/run/user/1000')
+        )
+        self.assertEqual(
+            '/run/user/1000/openstackclient.sock', daemon.get_socket_path()
+        )
+
+
+class TestForward(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'osc.sock'
+        )
+
+    def test_forward_no_server(self):
+        self.assertIsNone(daemon.forward(['server', 'list'], self.path))
+
+    @mock.patch('openstackclient.shell.main', return_value=3)
+    def test_main_no_server(self, shell_main):
+        with mock.patch.object(daemon, 'forward', return_value=None):
+            self.assertEqual(3, daemon.main(['server', 'list']))
+        shell_main.assert_called_once_with(['server', 'list'])
+
+    @mock.patch('openstackclient.shell.main')
+    def test_main_forwarded(self, shell_main):
+        with mock.patch.object(daemon, 'forward', return_value=2):
+            self.assertEqual(2, daemon.main(['server', 'list']))
+        shell_main.assert_not_called()
+
+    def test_forward_round_trip(self):
+        server = daemon.Server(self.path)
+        listener = server._listen()
+        self.addCleanup(listener.close)
+        received = {}
+
+        def _serve():
+            conn, _addr = listener.accept()
+            with conn:
+                request, fds = server._receive_request(conn)
+                received['request'] = request
+                received['fds'] = len(fds)
+                for fd in fds:
+                    os.close(fd)
+                conn.sendall(daemon._STATUS.pack(os.getpid()))
+                conn.sendall(daemon._STATUS.pack(4))
+
+        thread = threading.Thread(target=_serve)
+        thread.start()
+        with mock.patch('signal.signal'):
+            status = daemon.forward(['server', 'list'], self.path)
+        thread.join()
+
+        self.assertEqual(4, status)
+        self.assertEqual(3, received['fds'])
+        self.assertEqual(['server', 'list'], received['request']['argv'])
+        self.assertEqual(os.getcwd(), received['request']['cwd'])
+        self.assertEqual(dict(os.environ), received['request']['env'])
+
+
+class TestServer(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'run', 'osc.sock'
+        )
+
+    def test_listen_private(self):
+        listener = daemon.Server(self.path)._listen()
+        self.addCleanup(listener.close)
+        self.assertEqual(0o600, os.stat(self.path).st_mode & 0o777)
+        self.assertEqual(
+            0o700, os.stat(os.path.dirname(self.path)).st_mode & 0o777
+        )
+
+    def test_listen_stale_socket(self):
+        os.makedirs(os.path.dirname(self.path))
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.path)
+        stale.close()
+
+        listener = daemon.Server(self.path)._listen()
+        self.addCleanup(listener.close)
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_listen_already_running(self):
+        listener = daemon.Server(self.path)._listen()
+        self.addCleanup(listener.close)
+        self.assertRaises(RuntimeError, daemon.Server(self.path)._listen)
+
+    def test_receive_request_without_streams(self):
+        server = daemon.Server(self.path)
+        left, right = socket.socketpair()
+        self.addCleanup(left.close)
+        self.addCleanup(right.close)
+        left.sendall(daemon._HEADER.pack(2) + b'{}')
+        self.assertRaises(ValueError, server._receive_request, right)
+
+    def test_read_report(self):
+        server = daemon.Server(self.path)
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'{"auth_states": {"id": "state"}}')
+        os.close(write_fd)
+        server._selector.register(read_fd, selectors.EVENT_READ, [])
+        key = server._selector.get_key(read_fd)
+
+        server._read_report(key)
+        server._read_report(key)
+
+        self.assertEqual({'id': 'state'}, server.auth_states)
+        self.assertRaises(KeyError, server._selector.get_key, read_fd)
+
+    def test_report(self):
+        server = daemon.Server(self.path)
+        server.auth_states['known'] = 'old'
+        app = mock.Mock()
+        app.client_manager.auth.get_cache_id.return_value = 'id'
+        app.client_manager.auth.get_auth_state.return_value = 'state'
+
+        with tempfile.TemporaryFile() as f:
+            server._report(app, os.dup(f.fileno()))
+            f.seek(0)
+            self.assertEqual(b'{"auth_states": {"id": "state"}}', f.read())
+
+    def test_warm_up_program_name(self):
+        # cliff was imported by the server, named after its own program
+        self.useFixture(
+            fixtures.MonkeyPatch('sys.argv', ['/usr/bin/openstack-daemon'])
+        )
+        self.useFixture(
+            fixtures.MonkeyPatch('cliff.app.App.NAME', 'openstack-daemon')
+        )
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                'openstackclient.common.clientmanager.'
+                'ClientManager.auth_states',
+                None,
+            )
+        )
+        stdout = self.useFixture(
+            fixtures.MonkeyPatch('sys.stdout', io.StringIO())
+        ).new_value
+
+        with mock.patch.object(daemon, '_iter_entry_points', return_value=[]):
+            daemon.Server(self.path).warm_up()
+
+        self.assertEqual('openstack', cliff_app.App.NAME)
+        self.assertEqual('openstack', sys.argv[0])
+        self.assertRaises(
+            SystemExit, shell.OpenStackShell().run, ['--version']
+        )
+        self.assertEqual(
+            'openstack %s\n' % openstackclient.__version__,
+            stdout.getvalue(),
+        )
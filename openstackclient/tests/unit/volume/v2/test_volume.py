@@ -1294,6 +1294,58 @@ class TestVolumeList(TestVolume):
         )
         self.assertCountEqual(datalist, tuple(data))
 
+    def test_volume_list_attached_servers(self):
+        server_id = self.mock_volume.attachments[0]['server_id']
+        volumes = [
+            self.mock_volume,
+            volume_fakes.create_one_volume(
+                {'attachments': self.mock_volume.attachments}
+            ),
+            volume_fakes.create_one_volume({'attachments': []}),
+        ]
+        self.volumes_mock.list.return_value = volumes
+        fake_server = mock.Mock()
+        fake_server.name = 'fake-server-name'
+        compute_client = mock.Mock()
+        compute_client.servers.get.return_value = fake_server
+        self.app.client_manager.compute = compute_client
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # only the attached server is looked up, and only once
+        compute_client.servers.list.assert_not_called()
+        compute_client.servers.get.assert_called_once_with(server_id)
+        self.assertIn(
+            'Attached to fake-server-name on ',
+            list(data)[0][4].human_readable(),
+        )
+
+    def test_volume_list_no_attached_servers(self):
+        self.volumes_mock.list.return_value = [
+            volume_fakes.create_one_volume({'attachments': []}),
+        ]
+        compute_client = mock.Mock()
+        self.app.client_manager.compute = compute_client
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        self.cmd.take_action(parsed_args)
+
+        compute_client.servers.get.assert_not_called()
+
+    def test_volume_list_attachments_not_shown(self):
+        compute_client = mock.Mock()
+        self.app.client_manager.compute = compute_client
+        arglist = ['-c', 'ID', '-c', 'Name']
+        verifylist = [('columns', ['ID', 'Name'])]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        compute_client.servers.get.assert_not_called()
+
     def test_volume_list_with_marker_and_limit(self):
         arglist = [
             "--marker",
@@ -48,10 +48,10 @@ class AssociateQos(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        qos_spec = utils.find_resource(
+        qos_spec = self.app.client_manager.resource_cache.find_resource(
             volume_client.qos_specs, parsed_args.qos_spec
         )
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types, parsed_args.volume_type
         )
 
@@ -137,7 +137,11 @@ class DeleteQos(command.Command):
 
         for i in parsed_args.qos_specs:
             try:
-                qos_spec = utils.find_resource(volume_client.qos_specs, i)
+                qos_spec = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.qos_specs, i
+                    )
+                )
                 volume_client.qos_specs.delete(qos_spec.id, parsed_args.force)
             except Exception as e:
                 result += 1
@@ -185,12 +189,12 @@ class DisassociateQos(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        qos_spec = utils.find_resource(
+        qos_spec = self.app.client_manager.resource_cache.find_resource(
             volume_client.qos_specs, parsed_args.qos_spec
         )
 
         if parsed_args.volume_type:
-            volume_type = utils.find_resource(
+            volume_type = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volume_types, parsed_args.volume_type
             )
             volume_client.qos_specs.disassociate(qos_spec.id, volume_type.id)
@@ -278,7 +282,7 @@ class SetQos(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        qos_spec = utils.find_resource(
+        qos_spec = self.app.client_manager.resource_cache.find_resource(
             volume_client.qos_specs, parsed_args.qos_spec
         )
 
@@ -321,7 +325,7 @@ class ShowQos(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        qos_spec = utils.find_resource(
+        qos_spec = self.app.client_manager.resource_cache.find_resource(
             volume_client.qos_specs, parsed_args.qos_spec
         )
 
@@ -367,7 +371,7 @@ class UnsetQos(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        qos_spec = utils.find_resource(
+        qos_spec = self.app.client_manager.resource_cache.find_resource(
             volume_client.qos_specs, parsed_args.qos_spec
         )
 
@@ -186,28 +186,31 @@ class CreateVolume(command.ShowOne):
 
         source_volume = None
         if parsed_args.source:
-            source_volume = utils.find_resource(
-                volume_client.volumes,
-                parsed_args.source,
-            ).id
+            source_volume = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.volumes,
+                    parsed_args.source,
+                ).id
+            )
 
         project = None
         if parsed_args.project:
-            project = utils.find_resource(
+            project = self.app.client_manager.resource_cache.find_resource(
                 identity_client.tenants,
                 parsed_args.project,
             ).id
 
         user = None
         if parsed_args.user:
-            user = utils.find_resource(
+            user = self.app.client_manager.resource_cache.find_resource(
                 identity_client.users,
                 parsed_args.user,
             ).id
 
         image = None
         if parsed_args.image:
-            image = image_client.find_image(
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image,
                 parsed_args.image,
                 ignore_missing=False,
             ).id
@@ -322,7 +325,11 @@ class DeleteVolume(command.Command):
 
         for i in parsed_args.volumes:
             try:
-                volume_obj = utils.find_resource(volume_client.volumes, i)
+                volume_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volumes, i
+                    )
+                )
                 if parsed_args.force:
                     volume_client.volumes.force_delete(volume_obj.id)
                 else:
@@ -492,7 +499,9 @@ class MigrateVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
         volume_client.volumes.migrate_volume(
             volume.id,
             parsed_args.host,
@@ -572,7 +581,9 @@ class SetVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
 
         result = 0
         if parsed_args.size:
@@ -673,7 +684,9 @@ class ShowVolume(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
         # Map 'metadata' column to 'properties'
         volume._info.update(
             {
@@ -725,7 +738,9 @@ class UnsetVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
 
         if parsed_args.property:
             volume_client.volumes.delete_metadata(
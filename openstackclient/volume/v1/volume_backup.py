@@ -87,7 +87,7 @@ class CreateVolumeBackup(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_id = utils.find_resource(
+        volume_id = self.app.client_manager.resource_cache.find_resource(
             volume_client.volumes, parsed_args.volume
         ).id
         backup = volume_client.backups.create(
@@ -120,7 +120,11 @@ class DeleteVolumeBackup(command.Command):
 
         for i in parsed_args.backups:
             try:
-                backup_id = utils.find_resource(volume_client.backups, i).id
+                backup_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.backups, i
+                    ).id
+                )
                 volume_client.backups.delete(backup_id)
             except Exception as e:
                 result += 1
@@ -224,9 +228,11 @@ class ListVolumeBackup(command.Lister):
 
         filter_volume_id = None
         if parsed_args.volume:
-            filter_volume_id = utils.find_resource(
-                volume_client.volumes, parsed_args.volume
-            ).id
+            filter_volume_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.volumes, parsed_args.volume
+                ).id
+            )
         search_opts = {
             'name': parsed_args.name,
             'status': parsed_args.status,
@@ -270,13 +276,13 @@ class RestoreVolumeBackup(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        backup = utils.find_resource(
+        backup = self.app.client_manager.resource_cache.find_resource(
             volume_client.backups,
             parsed_args.backup,
         )
         volume_id = None
         if parsed_args.volume is not None:
-            volume_id = utils.find_resource(
+            volume_id = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volumes,
                 parsed_args.volume,
             ).id
@@ -297,6 +303,8 @@ class ShowVolumeBackup(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        backup = utils.find_resource(volume_client.backups, parsed_args.backup)
+        backup = self.app.client_manager.resource_cache.find_resource(
+            volume_client.backups, parsed_args.backup
+        )
         backup._info.pop('links')
         return zip(*sorted(backup._info.items()))
@@ -99,7 +99,9 @@ class CreateVolumeSnapshot(command.ShowOne):
         volume = parsed_args.volume
         if not parsed_args.volume:
             volume = parsed_args.snapshot_name
-        volume_id = utils.find_resource(volume_client.volumes, volume).id
+        volume_id = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, volume
+        ).id
         snapshot = volume_client.volume_snapshots.create(
             volume_id,
             parsed_args.force,
@@ -137,9 +139,11 @@ class DeleteVolumeSnapshot(command.Command):
 
         for i in parsed_args.snapshots:
             try:
-                snapshot_id = utils.find_resource(
-                    volume_client.volume_snapshots, i
-                ).id
+                snapshot_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_snapshots, i
+                    ).id
+                )
                 volume_client.volume_snapshots.delete(snapshot_id)
             except Exception as e:
                 result += 1
@@ -251,7 +255,7 @@ class ListVolumeSnapshot(command.Lister):
 
         volume_id = None
         if parsed_args.volume:
-            volume_id = utils.find_resource(
+            volume_id = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volumes, parsed_args.volume
             ).id
 
@@ -321,7 +325,7 @@ class SetVolumeSnapshot(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
 
@@ -384,7 +388,7 @@ class ShowVolumeSnapshot(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
 
@@ -422,7 +426,7 @@ class UnsetVolumeSnapshot(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
 
@@ -47,9 +47,11 @@ class AcceptTransferRequest(command.ShowOne):
         volume_client = self.app.client_manager.volume
 
         try:
-            transfer_request_id = utils.find_resource(
-                volume_client.transfers, parsed_args.transfer_request
-            ).id
+            transfer_request_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.transfers, parsed_args.transfer_request
+                ).id
+            )
         except exceptions.CommandError:
             # Non-admin users will fail to lookup name -> ID so we just
             # move on and attempt with the user-supplied information
@@ -87,7 +89,7 @@ class CreateTransferRequest(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_id = utils.find_resource(
+        volume_id = self.app.client_manager.resource_cache.find_resource(
             volume_client.volumes,
             parsed_args.volume,
         ).id
@@ -119,10 +121,12 @@ class DeleteTransferRequest(command.Command):
 
         for t in parsed_args.transfer_request:
             try:
-                transfer_request_id = utils.find_resource(
-                    volume_client.transfers,
-                    t,
-                ).id
+                transfer_request_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.transfers,
+                        t,
+                    ).id
+                )
                 volume_client.transfers.delete(transfer_request_id)
             except Exception as e:
                 result += 1
@@ -191,9 +195,11 @@ class ShowTransferRequest(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_transfer_request = utils.find_resource(
-            volume_client.transfers,
-            parsed_args.transfer_request,
+        volume_transfer_request = (
+            self.app.client_manager.resource_cache.find_resource(
+                volume_client.transfers,
+                parsed_args.transfer_request,
+            )
         )
         volume_transfer_request._info.pop("links", None)
 
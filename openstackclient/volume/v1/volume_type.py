@@ -206,8 +206,10 @@ class DeleteVolumeType(command.Command):
 
         for volume_type in parsed_args.volume_types:
             try:
-                vol_type = utils.find_resource(
-                    volume_client.volume_types, volume_type
+                vol_type = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_types, volume_type
+                    )
                 )
 
                 volume_client.volume_types.delete(vol_type)
@@ -369,7 +371,7 @@ class SetVolumeType(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types, parsed_args.volume_type
         )
 
@@ -429,7 +431,7 @@ class ShowVolumeType(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types, parsed_args.volume_type
         )
         properties = format_columns.DictColumn(
@@ -489,7 +491,7 @@ class UnsetVolumeType(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types,
             parsed_args.volume_type,
         )
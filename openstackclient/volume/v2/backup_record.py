@@ -17,7 +17,6 @@
 import logging
 
 from osc_lib.command import command
-from osc_lib import utils
 
 from openstackclient.i18n import _
 
@@ -44,7 +43,9 @@ restore."""
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        backup = utils.find_resource(volume_client.backups, parsed_args.backup)
+        backup = self.app.client_manager.resource_cache.find_resource(
+            volume_client.backups, parsed_args.backup
+        )
         backup_data = volume_client.backups.export_record(backup.id)
 
         # We only want to show "friendly" display names, but also want to keep
@@ -28,12 +28,14 @@ from openstackclient.i18n import _
 LOG = logging.getLogger(__name__)
 
 
-def _find_volumes(parsed_args_volumes, volume_client):
+def _find_volumes(parsed_args_volumes, volume_client, resource_cache):
     result = 0
     uuid = ''
     for volume in parsed_args_volumes:
         try:
-            volume_id = utils.find_resource(volume_client.volumes, volume).id
+            volume_id = resource_cache.find_resource(
+                volume_client.volumes, volume
+            ).id
             uuid += volume_id + ','
         except Exception as e:
             result += 1
@@ -71,7 +73,11 @@ class AddVolumeToConsistencyGroup(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        result, add_uuid = _find_volumes(parsed_args.volumes, volume_client)
+        result, add_uuid = _find_volumes(
+            parsed_args.volumes,
+            volume_client,
+            self.app.client_manager.resource_cache,
+        )
 
         if result > 0:
             total = len(parsed_args.volumes)
@@ -82,9 +88,12 @@ class AddVolumeToConsistencyGroup(command.Command):
 
         if add_uuid:
             add_uuid = add_uuid.rstrip(',')
-            consistency_group_id = utils.find_resource(
-                volume_client.consistencygroups, parsed_args.consistency_group
-            ).id
+            consistency_group_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.consistencygroups,
+                    parsed_args.consistency_group,
+                ).id
+            )
             volume_client.consistencygroups.update(
                 consistency_group_id, add_volumes=add_uuid
             )
@@ -150,9 +159,11 @@ class CreateConsistencyGroup(command.ShowOne):
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
         if parsed_args.volume_type:
-            volume_type_id = utils.find_resource(
-                volume_client.volume_types, parsed_args.volume_type
-            ).id
+            volume_type_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.volume_types, parsed_args.volume_type
+                ).id
+            )
             consistency_group = volume_client.consistencygroups.create(
                 volume_type_id,
                 name=parsed_args.name,
@@ -170,15 +181,19 @@ class CreateConsistencyGroup(command.ShowOne):
             consistency_group_id = None
             consistency_group_snapshot = None
             if parsed_args.source:
-                consistency_group_id = utils.find_resource(
-                    volume_client.consistencygroups,
-                    parsed_args.source,
-                ).id
+                consistency_group_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.consistencygroups,
+                        parsed_args.source,
+                    ).id
+                )
             elif parsed_args.snapshot:
-                consistency_group_snapshot = utils.find_resource(
-                    volume_client.cgsnapshots,
-                    parsed_args.snapshot,
-                ).id
+                consistency_group_snapshot = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.cgsnapshots,
+                        parsed_args.snapshot,
+                    ).id
+                )
 
             consistency_group = (
                 volume_client.consistencygroups.create_from_src(
@@ -217,9 +232,11 @@ class DeleteConsistencyGroup(command.Command):
 
         for i in parsed_args.consistency_groups:
             try:
-                consistency_group_id = utils.find_resource(
-                    volume_client.consistencygroups, i
-                ).id
+                consistency_group_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.consistencygroups, i
+                    ).id
+                )
                 volume_client.consistencygroups.delete(
                     consistency_group_id, parsed_args.force
                 )
@@ -318,7 +335,11 @@ class RemoveVolumeFromConsistencyGroup(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        result, remove_uuid = _find_volumes(parsed_args.volumes, volume_client)
+        result, remove_uuid = _find_volumes(
+            parsed_args.volumes,
+            volume_client,
+            self.app.client_manager.resource_cache,
+        )
 
         if result > 0:
             total = len(parsed_args.volumes)
@@ -329,9 +350,12 @@ class RemoveVolumeFromConsistencyGroup(command.Command):
 
         if remove_uuid:
             remove_uuid = remove_uuid.rstrip(',')
-            consistency_group_id = utils.find_resource(
-                volume_client.consistencygroups, parsed_args.consistency_group
-            ).id
+            consistency_group_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.consistencygroups,
+                    parsed_args.consistency_group,
+                ).id
+            )
             volume_client.consistencygroups.update(
                 consistency_group_id, remove_volumes=remove_uuid
             )
@@ -367,9 +391,12 @@ class SetConsistencyGroup(command.Command):
         if parsed_args.description:
             kwargs['description'] = parsed_args.description
         if kwargs:
-            consistency_group_id = utils.find_resource(
-                volume_client.consistencygroups, parsed_args.consistency_group
-            ).id
+            consistency_group_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.consistencygroups,
+                    parsed_args.consistency_group,
+                ).id
+            )
             volume_client.consistencygroups.update(
                 consistency_group_id, **kwargs
             )
@@ -389,7 +416,9 @@ class ShowConsistencyGroup(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        consistency_group = utils.find_resource(
-            volume_client.consistencygroups, parsed_args.consistency_group
+        consistency_group = (
+            self.app.client_manager.resource_cache.find_resource(
+                volume_client.consistencygroups, parsed_args.consistency_group
+            )
         )
         return zip(*sorted(consistency_group._info.items()))
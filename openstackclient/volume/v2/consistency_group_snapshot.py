@@ -61,9 +61,11 @@ class CreateConsistencyGroupSnapshot(command.ShowOne):
             # If "--consistency-group" not specified, then consistency_group
             # will be the same as the new consistency group snapshot name
             consistency_group = parsed_args.snapshot_name
-        consistency_group_id = utils.find_resource(
-            volume_client.consistencygroups, consistency_group
-        ).id
+        consistency_group_id = (
+            self.app.client_manager.resource_cache.find_resource(
+                volume_client.consistencygroups, consistency_group
+            ).id
+        )
         consistency_group_snapshot = volume_client.cgsnapshots.create(
             consistency_group_id,
             name=parsed_args.snapshot_name,
@@ -94,9 +96,11 @@ class DeleteConsistencyGroupSnapshot(command.Command):
 
         for snapshot in parsed_args.consistency_group_snapshot:
             try:
-                snapshot_id = utils.find_resource(
-                    volume_client.cgsnapshots, snapshot
-                ).id
+                snapshot_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.cgsnapshots, snapshot
+                    ).id
+                )
 
                 volume_client.cgsnapshots.delete(snapshot_id)
             except Exception as e:
@@ -175,10 +179,12 @@ class ListConsistencyGroupSnapshot(command.Lister):
         volume_client = self.app.client_manager.volume
         consistency_group_id = None
         if parsed_args.consistency_group:
-            consistency_group_id = utils.find_resource(
-                volume_client.consistencygroups,
-                parsed_args.consistency_group,
-            ).id
+            consistency_group_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.consistencygroups,
+                    parsed_args.consistency_group,
+                ).id
+            )
         search_opts = {
             'all_tenants': parsed_args.all_projects,
             'status': parsed_args.status,
@@ -214,7 +220,10 @@ class ShowConsistencyGroupSnapshot(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        consistency_group_snapshot = utils.find_resource(
-            volume_client.cgsnapshots, parsed_args.consistency_group_snapshot
+        consistency_group_snapshot = (
+            self.app.client_manager.resource_cache.find_resource(
+                volume_client.cgsnapshots,
+                parsed_args.consistency_group_snapshot,
+            )
         )
         return zip(*sorted(consistency_group_snapshot._info.items()))
@@ -27,12 +27,17 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.common import pagination
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
 
 LOG = logging.getLogger(__name__)
 
+# Number of servers looked up concurrently when resolving the names of the
+# servers volumes are attached to
+_SERVER_LOOKUP_WORKERS = 8
+
 
 class KeyValueHintAction(argparse.Action):
     """Uses KeyValueAction or KeyValueAppendAction based on the given key"""
@@ -88,6 +93,45 @@ class AttachmentsColumn(cliff_columns.FormattableColumn):
         return msg
 
 
+def _get_attached_servers(client_manager, volumes):
+    """Look up the servers that volumes are attached to.
+
+    Only the servers referenced by the volumes' attachments are fetched,
+    concurrently, rather than listing every server. The server names are
+    only used for display, so any failure is logged and ignored.
+
+    :param client_manager: The client manager.
+    :param volumes: The volumes whose attachments to resolve.
+    :returns: A dict of server ID to server, for use with
+        ``AttachmentsColumn``.
+    """
+    server_ids = {
+        attachment['server_id']
+        for volume in volumes
+        for attachment in getattr(volume, 'attachments', None) or []
+        if attachment.get('server_id')
+    }
+    if not server_ids:
+        return {}
+
+    server_cache = {}
+    try:
+        compute_client = client_manager.compute
+        for server_id, server, exc in parallel.run_concurrently(
+            compute_client.servers.get,
+            server_ids,
+            max_workers=_SERVER_LOOKUP_WORKERS,
+        ):
+            if exc is not None:
+                LOG.debug('Unable to get server %s: %s', server_id, exc)
+                continue
+            server_cache[server_id] = server
+    except Exception as e:
+        # Just forget it if there's any trouble
+        LOG.debug('Unable to look up attached servers: %s', e)
+    return server_cache
+
+
 def _check_size_arg(args):
     """Check whether --size option is required or not.
 
@@ -240,28 +284,37 @@ class CreateVolume(command.ShowOne):
 
         source_volume = None
         if parsed_args.source:
-            source_volume_obj = utils.find_resource(
-                volume_client.volumes, parsed_args.source
+            source_volume_obj = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.volumes, parsed_args.source
+                )
             )
             source_volume = source_volume_obj.id
             size = max(size or 0, source_volume_obj.size)
 
         consistency_group = None
         if parsed_args.consistency_group:
-            consistency_group = utils.find_resource(
-                volume_client.consistencygroups, parsed_args.consistency_group
-            ).id
+            consistency_group = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.consistencygroups,
+                    parsed_args.consistency_group,
+                ).id
+            )
 
         image = None
         if parsed_args.image:
-            image = image_client.find_image(
-                parsed_args.image, ignore_missing=False
+            image = self.app.client_manager.resource_cache.find_sdk_resource(
+                image_client.find_image,
+                parsed_args.image,
+                ignore_missing=False,
             ).id
 
         snapshot = None
         if parsed_args.snapshot:
-            snapshot_obj = utils.find_resource(
-                volume_client.volume_snapshots, parsed_args.snapshot
+            snapshot_obj = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.volume_snapshots, parsed_args.snapshot
+                )
             )
             snapshot = snapshot_obj.id
             # Cinder requires a value for size when creating a volume
@@ -274,7 +327,7 @@ class CreateVolume(command.ShowOne):
 
         backup = None
         if parsed_args.backup:
-            backup_obj = utils.find_resource(
+            backup_obj = self.app.client_manager.resource_cache.find_resource(
                 volume_client.backups, parsed_args.backup
             )
             backup = backup_obj.id
@@ -392,7 +445,11 @@ class DeleteVolume(command.Command):
 
         for i in parsed_args.volumes:
             try:
-                volume_obj = utils.find_resource(volume_client.volumes, i)
+                volume_obj = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volumes, i
+                    )
+                )
                 if parsed_args.force:
                     volume_client.volumes.force_delete(volume_obj.id)
                 else:
@@ -490,31 +547,22 @@ class ListVolume(command.Lister):
             column_headers = copy.deepcopy(columns)
             column_headers[4] = 'Attached to'
 
-        # Cache the server list
-        server_cache = {}
-        try:
-            compute_client = self.app.client_manager.compute
-            for s in compute_client.servers.list():
-                server_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-        AttachmentsColumnWithCache = functools.partial(
-            AttachmentsColumn, server_cache=server_cache
-        )
-
         project_id = None
         if parsed_args.project:
             project_id = identity_common.find_project(
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         user_id = None
         if parsed_args.user:
             user_id = identity_common.find_user(
-                identity_client, parsed_args.user, parsed_args.user_domain
+                identity_client,
+                parsed_args.user,
+                parsed_args.user_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         # set value of 'all_tenants' when using project option
@@ -537,6 +585,15 @@ class ListVolume(command.Lister):
             column_headers, parsed_args.columns, {'Display Name': 'Name'}
         )
 
+        # Only look up the servers the listed volumes are attached to, and
+        # only if they are going to be shown
+        server_cache = {}
+        if not parsed_args.columns or 'Attached to' in parsed_args.columns:
+            server_cache = _get_attached_servers(self.app.client_manager, data)
+        AttachmentsColumnWithCache = functools.partial(
+            AttachmentsColumn, server_cache=server_cache
+        )
+
         return (
             column_headers,
             (
@@ -592,7 +649,9 @@ class MigrateVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
         volume_client.volumes.migrate_volume(
             volume.id,
             parsed_args.host,
@@ -743,7 +802,9 @@ class SetVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
 
         result = 0
         if parsed_args.size:
@@ -846,8 +907,10 @@ class SetVolume(command.Command):
                 migration_policy = parsed_args.retype_policy
             try:
                 # find the volume type
-                volume_type = utils.find_resource(
-                    volume_client.volume_types, parsed_args.type
+                volume_type = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_types, parsed_args.type
+                    )
                 )
                 # reset to the new volume type
                 volume_client.volumes.retype(
@@ -903,7 +966,9 @@ class ShowVolume(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
 
         # Special mapping for columns to make the output easier to read:
         # 'metadata' --> 'properties'
@@ -954,7 +1019,9 @@ class UnsetVolume(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume = utils.find_resource(volume_client.volumes, parsed_args.volume)
+        volume = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, parsed_args.volume
+        )
 
         result = 0
         if parsed_args.property:
@@ -129,7 +129,8 @@ class CreateVolumeBackup(command.ShowOne):
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.sdk_connection.volume
 
-        volume_id = volume_client.find_volume(
+        volume_id = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_volume,
             parsed_args.volume,
             ignore_missing=False,
         ).id
@@ -137,7 +138,10 @@ class CreateVolumeBackup(command.ShowOne):
         kwargs = {}
 
         if parsed_args.snapshot:
-            kwargs['snapshot_id'] = volume_client.find_snapshot(
+            kwargs[
+                'snapshot_id'
+            ] = self.app.client_manager.resource_cache.find_sdk_resource(
+                volume_client.find_snapshot,
                 parsed_args.snapshot,
                 ignore_missing=False,
             ).id
@@ -205,9 +209,11 @@ class DeleteVolumeBackup(command.Command):
 
         for i in parsed_args.backups:
             try:
-                backup_id = volume_client.find_backup(
-                    i, ignore_missing=False
-                ).id
+                backup_id = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        volume_client.find_backup, i, ignore_missing=False
+                    ).id
+                )
                 volume_client.delete_backup(
                     backup_id,
                     ignore_missing=False,
@@ -334,10 +340,13 @@ class ListVolumeBackup(command.Lister):
         filter_volume_id = None
         if parsed_args.volume:
             try:
-                filter_volume_id = volume_client.find_volume(
-                    parsed_args.volume,
-                    ignore_missing=False,
-                ).id
+                filter_volume_id = (
+                    self.app.client_manager.resource_cache.find_sdk_resource(
+                        volume_client.find_volume,
+                        parsed_args.volume,
+                        ignore_missing=False,
+                    ).id
+                )
             except exceptions.CommandError:
                 # Volume with that ID does not exist, but search for backups
                 # for that volume nevertheless
@@ -350,10 +359,13 @@ class ListVolumeBackup(command.Lister):
 
         marker_backup_id = None
         if parsed_args.marker:
-            marker_backup_id = volume_client.find_backup(
-                parsed_args.marker,
-                ignore_missing=False,
-            ).id
+            marker_backup_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    volume_client.find_backup,
+                    parsed_args.marker,
+                    ignore_missing=False,
+                ).id
+            )
 
         data = volume_client.backups(
             name=parsed_args.name,
@@ -410,7 +422,8 @@ class RestoreVolumeBackup(command.ShowOne):
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.sdk_connection.volume
 
-        backup = volume_client.find_backup(
+        backup = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_backup,
             parsed_args.backup,
             ignore_missing=False,
         )
@@ -418,10 +431,13 @@ class RestoreVolumeBackup(command.ShowOne):
         volume_name = None
         volume_id = None
         try:
-            volume_id = volume_client.find_volume(
-                parsed_args.volume,
-                ignore_missing=False,
-            ).id
+            volume_id = (
+                self.app.client_manager.resource_cache.find_sdk_resource(
+                    volume_client.find_volume,
+                    parsed_args.volume,
+                    ignore_missing=False,
+                ).id
+            )
         except Exception:
             volume_name = parsed_args.volume
         else:
@@ -503,7 +519,9 @@ class SetVolumeBackup(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        backup = utils.find_resource(volume_client.backups, parsed_args.backup)
+        backup = self.app.client_manager.resource_cache.find_resource(
+            volume_client.backups, parsed_args.backup
+        )
 
         result = 0
         if parsed_args.state:
@@ -607,7 +625,9 @@ class UnsetVolumeBackup(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        backup = utils.find_resource(volume_client.backups, parsed_args.backup)
+        backup = self.app.client_manager.resource_cache.find_resource(
+            volume_client.backups, parsed_args.backup
+        )
         metadata = copy.deepcopy(backup.metadata)
 
         for key in parsed_args.properties:
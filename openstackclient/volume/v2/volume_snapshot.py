@@ -119,7 +119,9 @@ class CreateVolumeSnapshot(command.ShowOne):
         volume = parsed_args.volume
         if not parsed_args.volume:
             volume = parsed_args.snapshot_name
-        volume_id = utils.find_resource(volume_client.volumes, volume).id
+        volume_id = self.app.client_manager.resource_cache.find_resource(
+            volume_client.volumes, volume
+        ).id
         if parsed_args.remote_source:
             # Create a new snapshot from an existing remote snapshot source
             if parsed_args.force:
@@ -182,9 +184,11 @@ class DeleteVolumeSnapshot(command.Command):
 
         for i in parsed_args.snapshots:
             try:
-                snapshot_id = utils.find_resource(
-                    volume_client.volume_snapshots, i
-                ).id
+                snapshot_id = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_snapshots, i
+                    ).id
+                )
                 volume_client.volume_snapshots.delete(
                     snapshot_id, parsed_args.force
                 )
@@ -296,7 +300,7 @@ class ListVolumeSnapshot(command.Lister):
 
         volume_id = None
         if parsed_args.volume:
-            volume_id = utils.find_resource(
+            volume_id = self.app.client_manager.resource_cache.find_resource(
                 volume_client.volumes, parsed_args.volume
             ).id
 
@@ -306,6 +310,7 @@ class ListVolumeSnapshot(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         # set value of 'all_tenants' when using project option
@@ -402,7 +407,7 @@ class SetVolumeSnapshot(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
 
@@ -471,7 +476,7 @@ class ShowVolumeSnapshot(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
         snapshot._info.update(
@@ -508,7 +513,7 @@ class UnsetVolumeSnapshot(command.Command):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        snapshot = utils.find_resource(
+        snapshot = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_snapshots, parsed_args.snapshot
         )
 
@@ -267,6 +267,7 @@ class CreateVolumeType(command.ShowOne):
                     identity_client,
                     parsed_args.project,
                     parsed_args.project_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 ).id
                 volume_client.volume_type_access.add_project_access(
                     volume_type.id, project_id
@@ -346,8 +347,10 @@ class DeleteVolumeType(command.Command):
 
         for volume_type in parsed_args.volume_types:
             try:
-                vol_type = utils.find_resource(
-                    volume_client.volume_types, volume_type
+                vol_type = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.volume_types, volume_type
+                    )
                 )
 
                 volume_client.volume_types.delete(vol_type)
@@ -706,7 +709,7 @@ class SetVolumeType(command.Command):
         volume_client = self.app.client_manager.volume
         identity_client = self.app.client_manager.identity
 
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types,
             parsed_args.volume_type,
         )
@@ -765,6 +768,7 @@ class SetVolumeType(command.Command):
                     identity_client,
                     parsed_args.project,
                     parsed_args.project_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
 
                 volume_client.volume_type_access.add_project_access(
@@ -822,7 +826,7 @@ class ShowVolumeType(command.ShowOne):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types, parsed_args.volume_type
         )
         properties = format_columns.DictColumn(
@@ -914,7 +918,7 @@ class UnsetVolumeType(command.Command):
         volume_client = self.app.client_manager.volume
         identity_client = self.app.client_manager.identity
 
-        volume_type = utils.find_resource(
+        volume_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.volume_types,
             parsed_args.volume_type,
         )
@@ -934,6 +938,7 @@ class UnsetVolumeType(command.Command):
                     identity_client,
                     parsed_args.project,
                     parsed_args.project_domain,
+                    resource_cache=self.app.client_manager.resource_cache,
                 )
 
                 volume_client.volume_type_access.remove_project_access(
@@ -103,11 +103,13 @@ class VolumeRevertToSnapshot(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        snapshot = volume_client.find_snapshot(
+        snapshot = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_snapshot,
             parsed_args.snapshot,
             ignore_missing=False,
         )
-        volume = volume_client.find_volume(
+        volume = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_volume,
             snapshot.volume_id,
             ignore_missing=False,
         )
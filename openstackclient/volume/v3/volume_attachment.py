@@ -218,11 +218,11 @@ class CreateVolumeAttachment(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-        volume = utils.find_resource(
+        volume = self.app.client_manager.resource_cache.find_resource(
             volume_client.volumes,
             parsed_args.volume,
         )
-        server = utils.find_resource(
+        server = self.app.client_manager.resource_cache.find_resource(
             compute_client.servers,
             parsed_args.server,
         )
@@ -445,6 +445,7 @@ class ListVolumeAttachment(command.Lister):
                 identity_client,
                 parsed_args.project,
                 parsed_args.project_domain,
+                resource_cache=self.app.client_manager.resource_cache,
             ).id
 
         search_opts = {
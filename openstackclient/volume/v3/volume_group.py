@@ -199,14 +199,16 @@ class CreateVolumeGroup(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-            volume_group_type_id = utils.find_resource(
-                volume_client.group_types,
-                volume_group_type,
-            ).id
+            volume_group_type_id = (
+                self.app.client_manager.resource_cache.find_resource(
+                    volume_client.group_types,
+                    volume_group_type,
+                ).id
+            )
             volume_types_ids = []
             for volume_type in volume_types:
                 volume_types_ids.append(
-                    utils.find_resource(
+                    self.app.client_manager.resource_cache.find_resource(
                         volume_client.volume_types,
                         volume_type,
                     ).id
@@ -251,13 +253,18 @@ class CreateVolumeGroup(command.ShowOne):
 
             source_group = None
             if parsed_args.source_group:
-                source_group = utils.find_resource(
-                    volume_client.groups, parsed_args.source_group
+                source_group = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.groups, parsed_args.source_group
+                    )
                 )
             group_snapshot = None
             if parsed_args.group_snapshot:
-                group_snapshot = utils.find_resource(
-                    volume_client.group_snapshots, parsed_args.group_snapshot
+                group_snapshot = (
+                    self.app.client_manager.resource_cache.find_resource(
+                        volume_client.group_snapshots,
+                        parsed_args.group_snapshot,
+                    )
                 )
             group = volume_client.groups.create_from_src(
                 group_snapshot.id if group_snapshot else None,
@@ -303,7 +310,7 @@ class DeleteVolumeGroup(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        group = utils.find_resource(
+        group = self.app.client_manager.resource_cache.find_resource(
             volume_client.groups,
             parsed_args.group,
         )
@@ -365,7 +372,7 @@ class SetVolumeGroup(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group = utils.find_resource(
+        group = self.app.client_manager.resource_cache.find_resource(
             volume_client.groups,
             parsed_args.group,
         )
@@ -546,7 +553,7 @@ class ShowVolumeGroup(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-        group = utils.find_resource(
+        group = self.app.client_manager.resource_cache.find_resource(
             volume_client.groups,
             parsed_args.group,
         )
@@ -612,7 +619,7 @@ class FailoverVolumeGroup(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        group = utils.find_resource(
+        group = self.app.client_manager.resource_cache.find_resource(
             volume_client.groups,
             parsed_args.group,
         )
@@ -84,7 +84,8 @@ class CreateVolumeGroupSnapshot(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group = volume_client.find_group(
+        group = self.app.client_manager.resource_cache.find_sdk_resource(
+            volume_client.find_group,
             parsed_args.volume_group,
             ignore_missing=False,
             details=False,
@@ -124,10 +125,13 @@ class DeleteVolumeGroupSnapshot(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        group_snapshot = volume_client.find_group_snapshot(
-            parsed_args.snapshot,
-            ignore_missing=False,
-            details=False,
+        group_snapshot = (
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                volume_client.find_group_snapshot,
+                parsed_args.snapshot,
+                ignore_missing=False,
+                details=False,
+            )
         )
 
         volume_client.delete_group_snapshot(group_snapshot.id)
@@ -220,10 +224,13 @@ class ShowVolumeGroupSnapshot(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group_snapshot = volume_client.find_group_snapshot(
-            parsed_args.snapshot,
-            ignore_missing=False,
-            details=True,
+        group_snapshot = (
+            self.app.client_manager.resource_cache.find_sdk_resource(
+                volume_client.find_group_snapshot,
+                parsed_args.snapshot,
+                ignore_missing=False,
+                details=True,
+            )
         )
 
         return _format_group_snapshot(group_snapshot)
@@ -132,7 +132,7 @@ class DeleteVolumeGroupType(command.Command):
             )
             raise exceptions.CommandError(msg)
 
-        group_type = utils.find_resource(
+        group_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.group_types,
             parsed_args.group_type,
         )
@@ -209,7 +209,7 @@ class SetVolumeGroupType(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group_type = utils.find_resource(
+        group_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.group_types,
             parsed_args.group_type,
         )
@@ -292,14 +292,14 @@ class UnsetVolumeGroupType(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group_type = utils.find_resource(
+        group_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.group_types,
             parsed_args.group_type,
         )
 
         group_type.unset_keys(parsed_args.properties)
 
-        group_type = utils.find_resource(
+        group_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.group_types,
             parsed_args.group_type,
         )
@@ -397,7 +397,7 @@ class ShowVolumeGroupType(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        group_type = utils.find_resource(
+        group_type = self.app.client_manager.resource_cache.find_resource(
             volume_client.group_types,
             parsed_args.group,
         )
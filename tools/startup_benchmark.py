@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+
+"""Measure the startup cost of the openstack command
+
+Three kinds of measurements are taken, each in fresh interpreters:
+
+* ``import:openstackclient.shell``: the cumulative import time of the
+  shell module.
+* ``import:<module>``: the import time of a command module on top of the
+  shell, which is what running one of its commands adds to startup.
+* ``run:<arguments>``: the wall clock time of running ``openstack`` with
+  the given arguments against a stubbed cloud that is never contacted.
+
+Each measurement is repeated and the fastest run kept, which is the least
+noisy estimate of the cost.
+
+To check a change for startup regressions, save the results of the parent
+commit and compare the change against them::
+
+    $ git checkout HEAD~1 && tox -e startup -- --save base.json
+    $ git checkout - && tox -e startup -- --baseline base.json
+
+The comparison fails when a measurement grows by more than both
+``--budget-ms`` and ``--budget-percent``.
+
+``--tree-dir`` writes the import tree of every import measurement in the
+folded stack format understood by flamegraph.pl and speedscope, and
+``--tree`` prints the heaviest part of the tree of the shell.
+"""
+
+import argparse
+import configparser
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHELL_MODULE = 'openstackclient.shell'
+
+DEFAULT_RUNS = (['--version'], ['command', 'list'])
+
+CLOUDS_YAML = """\
+clouds:
+  benchmark:
+    auth_type: none
+    auth:
+      endpoint: http://127.0.0.1:9/
+    region_name: RegionOne
+"""
+
+
+class ImportNode(object):
+    """A module in an import tree, with times in microseconds"""
+
+    def __init__(self, name, self_us, cumulative_us):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = []
+
+
+def parse_importtime(output):
+    """Build the import trees from the output of ``python -X importtime``
+
+    Modules are reported once they are imported, after the modules they
+    import, indented by their depth.
+
+    :returns: The list of the top level :class:`ImportNode`.
+    """
+    pending = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:') :].split(
+                '|'
+            )
+            self_us = int(self_us)
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            # The header, or a line mangled by other output
+            continue
+
+        stripped = name.lstrip(' ')
+        depth = (len(name) - len(stripped) - 1) // 2
+        node = ImportNode(stripped.strip(), self_us, cumulative_us)
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def find_node(nodes, name):
+    for node in nodes:
+        if node.name == name:
+            return node
+    return None
+
+
+def iter_folded(nodes, prefix=()):
+    """Yield the lines of the folded stack format of import trees"""
+    for node in nodes:
+        stack = prefix + (node.name,)
+        yield '%s %d' % (';'.join(stack), node.self_us)
+        yield from iter_folded(node.children, stack)
+
+
+def iter_tree(nodes, min_us, depth=0):
+    """Yield the lines of an indented tree of the heavy imports"""
+    for node in sorted(nodes, key=lambda n: n.cumulative_us, reverse=True):
+        if node.cumulative_us < min_us:
+            continue
+        yield '%8.1f ms %s%s' % (
+            node.cumulative_us / 1000,
+            '  ' * depth,
+            node.name,
+        )
+        yield from iter_tree(node.children, min_us, depth + 1)
+
+
+def get_command_modules():
+    """Return the modules of the commands declared in setup.cfg"""
+    config = configparser.ConfigParser()
+    config.read(os.path.join(ROOT, 'setup.cfg'))
+    modules = set()
+    for group, value in config.items('entry_points'):
+        if not group.startswith('openstack.') or group.startswith(
+            'openstack.cli'
+        ):
+            continue
+        for line in value.splitlines():
+            _name, sep, target = line.partition('=')
+            if sep:
+                modules.add(target.strip().partition(':')[0])
+    return sorted(modules)
+
+
+class Benchmark(object):
+    """Run the measurements in an isolated environment
+
+    The environment has its own home directory, so that neither the clouds
+    nor the caches of the user are used, and the cloud is configured to
+    not require authentication.
+    """
+
+    def __init__(self, workdir, repeat):
+        self.repeat = repeat
+        self.env = {
+            key: value
+            for key, value in os.environ.items()
+            if not key.startswith('OS_')
+        }
+        clouds = os.path.join(workdir, 'clouds.yaml')
+        with open(clouds, 'w') as f:
+            f.write(CLOUDS_YAML)
+        self.env.update(
+            HOME=workdir,
+            XDG_CACHE_HOME=os.path.join(workdir, 'cache'),
+            OS_CLIENT_CONFIG_FILE=clouds,
+            OS_CLOUD='benchmark',
+        )
+
+    def _python(self, args, **kwargs):
+        return subprocess.run(
+            [sys.executable] + args,
+            cwd=ROOT,
+            env=self.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            **kwargs,
+        )
+
+    def measure_import(self, module):
+        """Return the import time in ms and the import tree of the module
+
+        Command modules are imported after the shell so that only their
+        own cost is measured.
+        """
+        code = 'import %s' % SHELL_MODULE
+        if module != SHELL_MODULE:
+            code += '; import %s' % module
+
+        best = None
+        for _i in range(self.repeat):
+            result = self._python(['-X', 'importtime', '-c', code])
+            if result.returncode:
+                raise RuntimeError(
+                    'Failed to import %s:\n%s' % (module, result.stderr)
+                )
+            roots = parse_importtime(result.stderr)
+            node = find_node(roots, module)
+            # Already imported by the shell
+            cost = node.cumulative_us if node else 0
+            if best is None or cost < best[0]:
+                best = (cost, roots)
+        return best[0] / 1000, best[1]
+
+    def measure_run(self, args):
+        """Return the wall clock time in ms of running the command"""
+        cmd = ['-m', SHELL_MODULE] + args
+        # Let the command fill the on-disk caches first
+        self._python(cmd)
+
+        best = None
+        for _i in range(self.repeat):
+            start = time.perf_counter()
+            result = self._python(cmd)
+            elapsed = time.perf_counter() - start
+            if result.returncode:
+                raise RuntimeError(
+                    'Failed to run openstack %s:\n%s'
+                    % (' '.join(args), result.stderr)
+                )
+            if best is None or elapsed < best:
+                best = elapsed
+        return best * 1000
+
+
+def compare(results, baseline, budget_ms, budget_percent):
+    """Return the measurements that exceed the budget, with the report"""
+    regressions = []
+    lines = []
+    for name in sorted(results):
+        current = results[name]
+        base = baseline.get(name)
+        if base is None:
+            lines.append('%-60s %10s %10.1f' % (name, '-', current))
+            continue
+
+        delta = current - base
+        allowed = max(budget_ms, base * budget_percent / 100)
+        flag = ''
+        if delta > allowed:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        lines.append(
+            '%-60s %10.1f %10.1f %+9.1f%s' % (name, base, current, delta, flag)
+        )
+    return regressions, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        epilog='Times are in milliseconds.',
+    )
+    parser.add_argument(
+        '--module',
+        metavar='<module>',
+        action='append',
+        dest='modules',
+        help='Measure the import of this module on top of the shell, '
+        'repeat to measure several (default: all command modules)',
+    )
+    parser.add_argument(
+        '--no-modules',
+        action='store_true',
+        help='Only measure the shell import and the commands',
+    )
+    parser.add_argument(
+        '--run',
+        metavar='<arguments>',
+        action='append',
+        dest='runs',
+        help='Measure running openstack with these arguments, repeat to '
+        'measure several (default: "--version" and "command list")',
+    )
+    parser.add_argument(
+        '--repeat',
+        metavar='<count>',
+        type=int,
+        default=3,
+        help='Number of times to take each measurement (default: 3)',
+    )
+    parser.add_argument(
+        '--save',
+        metavar='<file>',
+        help='Write the results as JSON to this file',
+    )
+    parser.add_argument(
+        '--baseline',
+        metavar='<file>',
+        help='Compare the results to those saved in this file and fail '
+        'when a measurement exceeds the budget',
+    )
+    parser.add_argument(
+        '--budget-ms',
+        metavar='<ms>',
+        type=float,
+        default=50.0,
+        help='Tolerated absolute growth of a measurement (default: 50)',
+    )
+    parser.add_argument(
+        '--budget-percent',
+        metavar='<percent>',
+        type=float,
+        default=10.0,
+        help='Tolerated relative growth of a measurement (default: 10)',
+    )
+    parser.add_argument(
+        '--tree-dir',
+        metavar='<directory>',
+        help='Write the import trees in folded stack format to this '
+        'directory',
+    )
+    parser.add_argument(
+        '--tree',
+        action='store_true',
+        help='Print the import tree of the shell',
+    )
+    parser.add_argument(
+        '--tree-min-ms',
+        metavar='<ms>',
+        type=float,
+        default=5.0,
+        help='Omit the imports faster than this from the printed tree '
+        '(default: 5)',
+    )
+    args = parser.parse_args(argv)
+
+    if args.no_modules:
+        modules = []
+    elif args.modules:
+        modules = args.modules
+    else:
+        modules = get_command_modules()
+    runs = [arg.split() for arg in args.runs] if args.runs else DEFAULT_RUNS
+
+    results = {}
+    trees = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmark = Benchmark(workdir, args.repeat)
+        for module in [SHELL_MODULE] + modules:
+            name = 'import:%s' % module
+            results[name], trees[module] = benchmark.measure_import(module)
+            print('%-60s %10.1f' % (name, results[name]), flush=True)
+        for run in runs:
+            name = 'run:%s' % ' '.join(run)
+            results[name] = benchmark.measure_run(run)
+            print('%-60s %10.1f' % (name, results[name]), flush=True)
+
+    if args.tree:
+        print()
+        for line in iter_tree(trees[SHELL_MODULE], args.tree_min_ms * 1000):
+            print(line)
+
+    if args.tree_dir:
+        os.makedirs(args.tree_dir, exist_ok=True)
+        for module, roots in trees.items():
+            path = os.path.join(args.tree_dir, '%s.folded' % module)
+            with open(path, 'w') as f:
+                for line in iter_folded(roots):
+                    f.write(line + '\n')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(
+                {'python': sys.version, 'results': results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions, lines = compare(
+            results, baseline, args.budget_ms, args.budget_percent
+        )
+        print()
+        print('%-60s %10s %10s %9s' % ('', 'baseline', 'current', 'delta'))
+        for line in lines:
+            print(line)
+        if regressions:
+            print(
+                '\n%d measurement(s) exceed the budget of %.0f ms / %.0f%%'
+                % (len(regressions), args.budget_ms, args.budget_percent)
+            )
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())